@@ -12,15 +12,28 @@ Usage:
 """
 
 import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Literal
 
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field
 
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Keep the shared HTTP connections open across tool calls."""
+    from parser.acquisition.transport import shared_transport
+
+    async with shared_transport():
+        yield
+
+
 # Initialize MCP server
 mcp = FastMCP(
     name="parser-mcp",
+    lifespan=lifespan,
     instructions="""
 Parser MCP Server
 
@@ -244,18 +257,17 @@ async def retrieve_paper(input: RetrieveInput) -> RetrieveResult:
     output_dir = Path(input.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    retriever = PaperRetriever(config)
-
     # Parse identifier to determine DOI vs title
     doi, title = _parse_identifier(input.identifier)
 
     try:
-        result = await retriever.retrieve(
-            doi=doi,
-            title=title,
-            output_dir=output_dir,
-            verbose=input.verbose,
-        )
+        async with PaperRetriever(config) as retriever:
+            result = await retriever.retrieve(
+                doi=doi,
+                title=title,
+                output_dir=output_dir,
+                verbose=input.verbose,
+            )
 
         if result.status == RetrievalStatus.SUCCESS:
             return RetrieveResult(
@@ -352,8 +364,9 @@ async def batch_retrieve(input: BatchInput) -> BatchResult:
                 failed += 1
                 return {"identifier": doi or title, "status": "failed", "error": str(e)}
 
-    tasks = [process_item(item) for item in items]
-    results = await asyncio.gather(*tasks)
+    async with retriever:
+        tasks = [process_item(item) for item in items]
+        results = await asyncio.gather(*tasks)
 
     return BatchResult(
         total=len(items),
@@ -631,19 +644,18 @@ async def verify_citations(input: VerifyInput) -> VerifyResult:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     skip_set = set(input.skip_keys)
-    verifier = CitationVerifier(email=input.email)
-
     try:
-        if input_path.is_dir():
-            # Directory mode
-            stats, results = await verifier.verify_directory(
-                input_path, output_dir, skip_keys=skip_set, dry_run=input.dry_run
-            )
-        else:
-            # Single file mode
-            stats, results = await verifier.verify_file(
-                input_path, output_dir, skip_keys=skip_set, dry_run=input.dry_run
-            )
+        async with CitationVerifier(email=input.email) as verifier:
+            if input_path.is_dir():
+                # Directory mode
+                stats, results = await verifier.verify_directory(
+                    input_path, output_dir, skip_keys=skip_set, dry_run=input.dry_run
+                )
+            else:
+                # Single file mode
+                stats, results = await verifier.verify_file(
+                    input_path, output_dir, skip_keys=skip_set, dry_run=input.dry_run
+                )
 
         result = VerifyResult(
             success=True,
@@ -689,11 +701,11 @@ async def get_citations(input: CitationsInput) -> CitationsResult:
         get_citations(identifier="arXiv:2005.11401", direction="citations", limit=100)
     """
     try:
-        from parser.acquisition.clients import SemanticScholarClient
+        from parser.acquisition.clients.registry import get_client
         from parser.doi2bib.resolver import resolve_identifier
 
         ident = resolve_identifier(input.identifier)
-        s2 = SemanticScholarClient(api_key=input.s2_api_key)
+        s2 = get_client("semantic_scholar", api_key=input.s2_api_key)
 
         # Build paper ID for Semantic Scholar
         if ident.doi:
@@ -10,6 +10,7 @@ Key Features:
 - Detailed logging per paper
 - Batch retrieval with progress tracking
 - API clients for various sources
+- Shared pooled HTTP transport for all clients and downloads
 """
 
 from .config import Config
@@ -25,6 +26,16 @@ from .retriever import (
     RetrievalResult,
     RetrievalStatus,
 )
+from .transport import (
+    HttpSession,
+    TransportSettings,
+    close_transport,
+    configure_transport,
+    get_http_client,
+    open_transport,
+    shared_transport,
+    transport_stats,
+)
 
 __all__ = [
     # Retriever
@@ -40,4 +51,13 @@ __all__ = [
     # Config
     "Config",
     "RateLimiter",
+    # HTTP transport
+    "HttpSession",
+    "TransportSettings",
+    "configure_transport",
+    "get_http_client",
+    "open_transport",
+    "close_transport",
+    "shared_transport",
+    "transport_stats",
 ]
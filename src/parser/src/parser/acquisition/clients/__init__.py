@@ -14,6 +14,8 @@ Provides clients for:
 - WebSearch: Claude Agent SDK web search for legal PDFs
 - Sci-Hub: Unofficial PDF access (⚠️ legal concerns)
 - LibGen: Unofficial PDF access (⚠️ legal concerns)
+
+Entry points get shared instances (and rate limiters) from ``registry``.
 """
 
 from .acl_anthology import ACLAnthologyClient
@@ -26,6 +28,13 @@ from .institutional import InstitutionalAccessClient
 from .libgen import LibGenClient
 from .openalex import OpenAlexClient
 from .pmc import PMCClient
+from .registry import (
+    get_client,
+    registry_stats,
+    reset_registry,
+    set_rate_limit,
+    shared_source_limiter,
+)
 from .scihub import ScihubClient
 from .semantic_scholar import SemanticScholarClient
 from .unpaywall import UnpaywallClient
@@ -47,4 +56,10 @@ __all__ = [
     "WebSearchClient",
     "ScihubClient",
     "LibGenClient",
+    # Registry
+    "get_client",
+    "set_rate_limit",
+    "shared_source_limiter",
+    "registry_stats",
+    "reset_registry",
 ]
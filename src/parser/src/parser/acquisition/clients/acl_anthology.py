@@ -15,7 +15,7 @@ import time
 from pathlib import Path
 from typing import Any
 
-import httpx
+from ..transport import HttpSession
 
 
 class ACLAnthologyClient:
@@ -148,7 +148,7 @@ class ACLAnthologyClient:
         }
 
         try:
-            async with httpx.AsyncClient(
+            async with HttpSession(
                 timeout=self.timeout,
                 follow_redirects=True,
             ) as client:
@@ -205,7 +205,7 @@ class ACLAnthologyClient:
         search_url = f"{self.BASE_URL}/search/"
 
         try:
-            async with httpx.AsyncClient(
+            async with HttpSession(
                 timeout=self.timeout,
                 follow_redirects=True,
             ) as client:
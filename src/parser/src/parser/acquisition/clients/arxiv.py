@@ -7,8 +7,7 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
-import httpx
-
+from ..transport import HttpSession
 from .base import BaseClient, RateLimiter
 
 
@@ -78,7 +77,7 @@ class ArxivClient(BaseClient):
             "max_results": 1,
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with HttpSession(timeout=self.timeout) as client:
             try:
                 response = await client.get(url, params=params)
                 response.raise_for_status()
@@ -216,7 +215,7 @@ class ArxivClient(BaseClient):
             "sortOrder": "descending",
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with HttpSession(timeout=self.timeout) as client:
             try:
                 response = await client.get(url, params=params)
                 response.raise_for_status()
@@ -310,7 +309,7 @@ class ArxivClient(BaseClient):
 
         await self.rate_limiter.wait()
 
-        async with httpx.AsyncClient(timeout=60, follow_redirects=True) as client:
+        async with HttpSession(timeout=60, follow_redirects=True) as client:
             try:
                 response = await client.get(pdf_url)
                 response.raise_for_status()
@@ -10,6 +10,8 @@ from typing import Any
 
 import httpx
 
+from ..transport import HttpSession
+
 
 @dataclass
 class RateLimiter:
@@ -22,10 +24,15 @@ class RateLimiter:
 
     calls_per_second: float = 1.0
     min_delay: float = 0.1
-    _last_call: float = field(default=0.0, repr=False)
+    _last_call: float = field(default=0.0, repr=False)  # Time of the last claimed slot
 
     async def wait(self) -> None:
-        """Wait if necessary to respect rate limit."""
+        """Wait if necessary to respect rate limit.
+
+        The caller claims the next free slot before sleeping, so coroutines
+        sharing the limiter (see ``registry``) are spaced out, not released
+        together.
+        """
         if self.calls_per_second <= 0:
             return
 
@@ -33,12 +40,11 @@ class RateLimiter:
         delay = max(delay, self.min_delay)
 
         now = time.monotonic()
-        elapsed = now - self._last_call
-
-        if elapsed < delay:
-            await asyncio.sleep(delay - elapsed)
+        slot = max(now, self._last_call + delay)
+        self._last_call = slot
 
-        self._last_call = time.monotonic()
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
 
 class BaseClient(ABC):
@@ -99,7 +105,7 @@ class BaseClient(ABC):
 
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with HttpSession(timeout=self.timeout) as client:
             try:
                 response = await client.request(
                     method,
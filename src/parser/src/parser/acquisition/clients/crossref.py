@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from ..transport import HttpSession
 from .base import BaseClient, RateLimiter
 
 
@@ -186,8 +187,6 @@ class CrossRefClient(BaseClient):
         """
         await self.rate_limiter.wait()
 
-        import httpx
-
         # Clean DOI
         if doi.startswith("https://doi.org/"):
             doi = doi[16:]
@@ -196,7 +195,7 @@ class CrossRefClient(BaseClient):
 
         url = f"https://doi.org/{doi}"
 
-        async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
+        async with HttpSession(timeout=30, follow_redirects=True) as client:
             try:
                 response = await client.get(
                     url,
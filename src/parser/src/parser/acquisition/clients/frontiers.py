@@ -16,7 +16,7 @@ import time
 from pathlib import Path
 from typing import Any
 
-import httpx
+from ..transport import HttpSession
 
 
 class FrontiersClient:
@@ -124,7 +124,7 @@ class FrontiersClient:
         }
 
         try:
-            async with httpx.AsyncClient(
+            async with HttpSession(
                 timeout=self.timeout,
                 follow_redirects=True,
             ) as client:
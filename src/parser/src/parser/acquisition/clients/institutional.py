@@ -442,7 +442,7 @@ class InstitutionalAccessClient:
 
         # VPN mode - try direct download with httpx
         if self.vpn_enabled:
-            import httpx
+            from ..transport import HttpSession
 
             doi_url = f"https://doi.org/{doi}"
             output_path = Path(output_path) if output_path else self.download_dir / f"{doi.replace('/', '_')}.pdf"
@@ -456,7 +456,7 @@ class InstitutionalAccessClient:
             }
 
             try:
-                async with httpx.AsyncClient(
+                async with HttpSession(
                     timeout=60.0,
                     follow_redirects=True,
                     headers=headers,
@@ -543,6 +543,8 @@ class InstitutionalAccessClient:
         try:
             proxied_url = self.doi_to_proxied_url(doi)
 
+            # Own client, not the shared transport: the proxy session cookies
+            # and disabled certificate checks must not reach other requests
             async with httpx.AsyncClient(
                 timeout=60.0,
                 follow_redirects=True,
@@ -20,6 +20,8 @@ from urllib.parse import quote_plus
 
 import httpx
 
+from ..transport import HttpSession
+
 
 class LibGenClient:
     """Client for downloading papers from Library Genesis.
@@ -170,7 +172,7 @@ class LibGenClient:
             Result dict or None
         """
         # Use shorter timeout to avoid hanging
-        async with httpx.AsyncClient(
+        async with HttpSession(
             timeout=httpx.Timeout(15.0, connect=10.0),  # 15s total, 10s connect
             follow_redirects=True,
         ) as client:
@@ -243,7 +245,7 @@ class LibGenClient:
 
     async def _resolve_download_link(
         self,
-        client: httpx.AsyncClient,
+        client: HttpSession,
         download_info: dict[str, str],
     ) -> str | None:
         """Resolve a download page to get direct PDF link.
@@ -314,7 +316,7 @@ class LibGenClient:
 
     async def _download_pdf(
         self,
-        client: httpx.AsyncClient,
+        client: HttpSession,
         pdf_url: str,
         output_path: Path,
     ) -> dict[str, Any] | None:
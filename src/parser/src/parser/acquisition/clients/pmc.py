@@ -5,8 +5,7 @@ from __future__ import annotations
 import xml.etree.ElementTree as ET
 from typing import Any
 
-import httpx
-
+from ..transport import HttpSession
 from .base import BaseClient, RateLimiter
 
 
@@ -56,11 +55,6 @@ class PMCClient(BaseClient):
         Returns:
             PMCID or None if not found.
         """
-        import asyncio
-        import json
-        import urllib.parse
-        import urllib.request
-
         params = {
             "ids": doi,
             "format": "json",
@@ -70,27 +64,18 @@ class PMCClient(BaseClient):
         if self.api_key:
             params["api_key"] = self.api_key
 
-        query = urllib.parse.urlencode(params)
-        url = f"{self.IDCONV_URL}?{query}"
-
-        def fetch():
-            try:
-                req = urllib.request.Request(
-                    url,
-                    headers={"User-Agent": "parser/1.0"}
-                )
-                with urllib.request.urlopen(req, timeout=30) as response:
-                    data = json.loads(response.read().decode())
-                    records = data.get("records", [])
-                    if records and "pmcid" in records[0]:
-                        return records[0]["pmcid"]
-            except Exception:
-                pass
-            return None
-
-        # Run synchronous urllib in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, fetch)
+        try:
+            async with HttpSession(
+                timeout=30, follow_redirects=True, headers={"User-Agent": "parser/1.0"}
+            ) as client:
+                response = await client.get(self.IDCONV_URL, params=params)
+                response.raise_for_status()
+                records = response.json().get("records", [])
+                if records and "pmcid" in records[0]:
+                    return records[0]["pmcid"]
+        except Exception:
+            pass
+        return None
 
     async def get_pdf_url(self, pmcid: str) -> str | None:
         """Get PDF URL for a PMCID.
@@ -108,7 +93,7 @@ class PMCClient(BaseClient):
         params: dict[str, Any] = {"id": pmcid, "format": "pdf"}
 
         try:
-            async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
+            async with HttpSession(timeout=30, follow_redirects=True) as client:
                 response = await client.get(self.OA_URL, params=params)
                 response.raise_for_status()
 
@@ -131,7 +116,7 @@ class PMCClient(BaseClient):
 
         # Try OA API without format to get tar.gz (will be handled by download method)
         try:
-            async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
+            async with HttpSession(timeout=30, follow_redirects=True) as client:
                 response = await client.get(self.OA_URL, params={"id": pmcid})
                 response.raise_for_status()
                 root = ET.fromstring(response.text)
@@ -174,7 +159,7 @@ class PMCClient(BaseClient):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=60, follow_redirects=True) as client:
+            async with HttpSession(timeout=60, follow_redirects=True) as client:
                 response = await client.get(url, headers=headers)
                 response.raise_for_status()
                 content = response.content
@@ -230,7 +215,7 @@ class PMCClient(BaseClient):
             params["email"] = self.email
 
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
+            async with HttpSession(timeout=30) as client:
                 # First search for IDs
                 search_url = f"{self.EUTILS_BASE}/esearch.fcgi"
                 response = await client.get(search_url, params=params)
@@ -290,7 +275,7 @@ class PMCClient(BaseClient):
             params["api_key"] = self.api_key
 
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
+            async with HttpSession(timeout=30) as client:
                 url = f"{self.EUTILS_BASE}/esummary.fcgi"
                 response = await client.get(url, params=params)
                 response.raise_for_status()
@@ -0,0 +1,131 @@
+"""Process-wide registry of API clients.
+
+Entry points used to build their own clients (``get_metadata`` on every
+call, the MCP tools on every request), each with a fresh ``RateLimiter``,
+so concurrent callers ignored each other's limits and ran into 429s. They
+now ask the registry instead:
+
+- ``get_client`` returns one instance per source and options (credentials,
+  flags), created on first use and reused by every caller
+- Rate limiters of API clients are shared per source and API key, so
+  clients differing only in e.g. contact email still take turns
+- ``shared_source_limiter`` is the one per-source delay limiter that all
+  ``PaperRetriever`` instances wait on
+
+Registries are module-level, like the shared HTTP transport.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from ..rate_limiter import RateLimiter as SourceRateLimiter
+from .acl_anthology import ACLAnthologyClient
+from .arxiv import ArxivClient
+from .base import RateLimiter
+from .biorxiv import BioRxivClient
+from .crossref import CrossRefClient
+from .frontiers import FrontiersClient
+from .institutional import InstitutionalAccessClient
+from .libgen import LibGenClient
+from .openalex import OpenAlexClient
+from .pmc import PMCClient
+from .scihub import ScihubClient
+from .semantic_scholar import SemanticScholarClient
+from .unpaywall import UnpaywallClient
+from .web_search import WebSearchClient
+
+CLIENT_CLASSES: dict[str, Callable[..., Any]] = {
+    "arxiv": ArxivClient,
+    "crossref": CrossRefClient,
+    "semantic_scholar": SemanticScholarClient,
+    "openalex": OpenAlexClient,
+    "unpaywall": UnpaywallClient,
+    "pmc": PMCClient,
+    "biorxiv": BioRxivClient,
+    "acl_anthology": ACLAnthologyClient,
+    "frontiers": FrontiersClient,
+    "institutional": InstitutionalAccessClient,
+    "web_search": WebSearchClient,
+    "scihub": ScihubClient,
+    "libgen": LibGenClient,
+}
+
+# Global registries (lazy populated)
+_clients: dict[tuple[str, tuple[tuple[str, Any], ...]], Any] = {}
+_limiters: dict[tuple[str, str | None], RateLimiter] = {}
+_source_limiter: SourceRateLimiter | None = None
+
+
+def get_client(source: str, **options: Any) -> Any:
+    """Get the shared client of a source.
+
+    Args:
+        source: Source name (see ``CLIENT_CLASSES``)
+        **options: Constructor arguments; each distinct set gets its own
+            instance (e.g. ``email``, ``api_key``)
+
+    Returns:
+        Client instance shared by every caller with the same options
+
+    Raises:
+        ValueError: If the source is unknown
+    """
+    if source not in CLIENT_CLASSES:
+        raise ValueError(f"Unknown source: {source}")
+    key = (source, tuple(sorted(options.items())))
+    if key not in _clients:
+        client = CLIENT_CLASSES[source](**options)
+        limiter = getattr(client, "rate_limiter", None)
+        if isinstance(limiter, RateLimiter):
+            # API keys change the quota; other options share the source's limit
+            client.rate_limiter = _limiters.setdefault((source, options.get("api_key")), limiter)
+        _clients[key] = client
+    return _clients[key]
+
+
+def set_rate_limit(source: str, delay: float) -> None:
+    """Set the delay between calls to a source for every shared client.
+
+    Args:
+        source: Source name
+        delay: Seconds between calls (0 or less: up to 10 calls per second)
+    """
+    calls_per_second = 1.0 / delay if delay > 0 else 10.0
+    for (name, _), limiter in _limiters.items():
+        if name == source:
+            limiter.calls_per_second = calls_per_second
+
+
+def shared_source_limiter(rate_limits: dict[str, Any] | None = None) -> SourceRateLimiter:
+    """Get the per-source delay limiter shared by all retrievers.
+
+    Args:
+        rate_limits: ``rate_limits`` config section; its delays are applied
+            to the shared limiter, keeping the time of past calls
+
+    Returns:
+        The process-wide source limiter
+    """
+    global _source_limiter
+    if _source_limiter is None:
+        _source_limiter = SourceRateLimiter(rate_limits)
+    elif rate_limits:
+        updated = SourceRateLimiter(rate_limits)
+        _source_limiter.delays.update(updated.delays)
+        _source_limiter.global_delay = updated.global_delay
+    return _source_limiter
+
+
+def registry_stats() -> dict[str, int]:
+    """Get the number of shared clients and rate limiters."""
+    return {"clients": len(_clients), "limiters": len(_limiters)}
+
+
+def reset_registry() -> None:
+    """Drop all shared clients and limiters. Useful for testing."""
+    global _source_limiter
+    _clients.clear()
+    _limiters.clear()
+    _source_limiter = None
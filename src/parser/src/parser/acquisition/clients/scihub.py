@@ -19,6 +19,8 @@ from typing import Any
 
 import httpx
 
+from ..transport import HttpSession
+
 
 class ScihubClient:
     """Client for downloading papers from Sci-Hub.
@@ -257,7 +259,7 @@ class ScihubClient:
         """
         url = f"{mirror}/{doi}"
 
-        async with httpx.AsyncClient(
+        async with HttpSession(
             timeout=httpx.Timeout(15.0, connect=10.0),  # 15s total, 10s connect
             follow_redirects=True,
         ) as client:
@@ -25,6 +25,7 @@ class Config:
     download: dict[str, Any] = field(default_factory=dict)
     rate_limits: dict[str, Any] = field(default_factory=dict)
     batch: dict[str, Any] = field(default_factory=dict)
+    http: dict[str, Any] = field(default_factory=dict)
     logging: dict[str, Any] = field(default_factory=dict)
 
     @classmethod
@@ -150,6 +151,20 @@ class Config:
             if key not in batch:
                 batch[key] = value
 
+        # Default shared HTTP transport configuration
+        default_http: dict[str, Any] = {
+            "max_connections": 100,
+            "max_keepalive_connections": 20,
+            "keepalive_expiry": 30.0,
+            "per_host_connections": 6,
+            "http2": True,
+            "timeout": 30.0,
+        }
+        http: dict[str, Any] = data.get("http", {})
+        for key, value in default_http.items():
+            if key not in http:
+                http[key] = value
+
         # Default institutional configuration
         default_institutional: dict[str, Any] = {
             "enabled": False,
@@ -185,6 +200,7 @@ class Config:
             download=download,
             rate_limits=rate_limits,
             batch=batch,
+            http=http,
             logging=logging_config,
         )
 
@@ -230,5 +246,6 @@ class Config:
             "download": self.download,
             "rate_limits": self.rate_limits,
             "batch": self.batch,
+            "http": self.http,
             "logging": self.logging,
         }
@@ -157,9 +157,9 @@ class PaperDownloader:
 
     async def _get_references(self, identifier, output_dir: Path) -> Path | None:
         """Get references from Semantic Scholar."""
-        from .clients import SemanticScholarClient
+        from .clients.registry import get_client
 
-        s2 = SemanticScholarClient(api_key=self.config.s2_api_key)
+        s2 = get_client("semantic_scholar", api_key=self.config.s2_api_key)
         paper_id = identifier.doi or (f"ARXIV:{identifier.arxiv_id}" if identifier.arxiv_id else None)
         if not paper_id:
             return None
@@ -32,23 +32,28 @@ class RateLimiter:
         })
         self.global_delay = config.get("global_delay", 1.0)
         self.last_call: dict[str, float] = {}
-        self._lock = asyncio.Lock()
+
+    def _reserve(self, source: str) -> float:
+        """Claim the next free call slot of a source; return seconds until it."""
+        delay = self.delays.get(source, self.global_delay)
+        now = time.time()
+        slot = max(now, self.last_call.get(source, 0) + delay)
+        self.last_call[source] = slot
+        return slot - now
 
     async def wait(self, source: str) -> None:
         """Wait appropriate time before next call to a source.
 
+        Each caller claims its slot before sleeping, so concurrent callers
+        are spaced out without a lock (which would also hold calls to fast
+        sources behind a slow one).
+
         Args:
             source: The source identifier to rate limit.
         """
-        async with self._lock:
-            delay = self.delays.get(source, self.global_delay)
-            last = self.last_call.get(source, 0)
-            elapsed = time.time() - last
-
-            if elapsed < delay:
-                await asyncio.sleep(delay - elapsed)
-
-            self.last_call[source] = time.time()
+        remaining = self._reserve(source)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
 
     def wait_sync(self, source: str) -> None:
         """Synchronous version of wait.
@@ -56,14 +61,9 @@ class RateLimiter:
         Args:
             source: The source identifier to rate limit.
         """
-        delay = self.delays.get(source, self.global_delay)
-        last = self.last_call.get(source, 0)
-        elapsed = time.time() - last
-
-        if elapsed < delay:
-            time.sleep(delay - elapsed)
-
-        self.last_call[source] = time.time()
+        remaining = self._reserve(source)
+        if remaining > 0:
+            time.sleep(remaining)
 
     def get_delay(self, source: str) -> float:
         """Get the delay for a specific source.
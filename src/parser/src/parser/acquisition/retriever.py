@@ -13,11 +13,9 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
-import httpx
-
 from .config import Config
 from .logger import RetrievalLogger
-from .rate_limiter import RateLimiter
+from .transport import HttpSession, close_transport, configure_transport, open_transport
 
 
 class RetrievalStatus(Enum):
@@ -45,12 +43,14 @@ class RetrievalResult:
 class PaperRetriever:
     """Main orchestrator for paper PDF retrieval.
 
-    Tries multiple sources in priority order to find PDFs.
+    Tries multiple sources in priority order to find PDFs. All sources and
+    downloads share the pooled connections of ``transport``; using the
+    retriever as an async context manager keeps them open until it exits.
 
     Example:
         >>> config = Config.load("config.yaml")
-        >>> retriever = PaperRetriever(config)
-        >>> result = await retriever.retrieve(doi="10.1234/example")
+        >>> async with PaperRetriever(config) as retriever:
+        ...     result = await retriever.retrieve(doi="10.1234/example")
         >>> print(result.pdf_path)
     """
 
@@ -60,65 +60,71 @@ class PaperRetriever:
         Args:
             config: Configuration object (loads default if None)
         """
+        from .clients.registry import shared_source_limiter
+
         self.config = config or Config.load()
-        self.rate_limiter = RateLimiter(self.config.rate_limits)
+        self.rate_limiter = shared_source_limiter(self.config.rate_limits)
+        configure_transport(self.config.http)
         self.clients = self._init_clients()
+        self._transport_open = False
+
+    async def open(self) -> None:
+        """Hold the shared HTTP connections open until ``close``."""
+        if not self._transport_open:
+            await open_transport()
+            self._transport_open = True
+
+    async def close(self) -> None:
+        """Release the shared HTTP connections (closed with their last owner)."""
+        if self._transport_open:
+            self._transport_open = False
+            await close_transport()
+
+    async def __aenter__(self) -> PaperRetriever:
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
 
     def _init_clients(self) -> dict[str, Any]:
-        """Initialize all API clients with config-based rate limits."""
-        from .clients import (
-            ACLAnthologyClient,
-            ArxivClient,
-            BioRxivClient,
-            CrossRefClient,
-            FrontiersClient,
-            OpenAlexClient,
-            PMCClient,
-            SemanticScholarClient,
-            UnpaywallClient,
-        )
-        from .clients.base import RateLimiter as ClientRateLimiter
+        """Get the shared API clients and apply config-based rate limits."""
+        from .clients.registry import get_client, set_rate_limit
 
         # Get rate limits from config
         per_source_delays = self.config.rate_limits.get("per_source_delays", {})
 
         clients: dict[str, Any] = {
-            "arxiv": ArxivClient(),
-            "crossref": CrossRefClient(email=self.config.email),
-            "semantic_scholar": SemanticScholarClient(
-                api_key=self.config.api_keys.get("semantic_scholar")
+            "arxiv": get_client("arxiv"),
+            "crossref": get_client("crossref", email=self.config.email),
+            "semantic_scholar": get_client(
+                "semantic_scholar", api_key=self.config.api_keys.get("semantic_scholar")
             ),
-            "pmc": PMCClient(
+            "pmc": get_client(
+                "pmc",
                 api_key=self.config.api_keys.get("ncbi"),
                 email=self.config.email,
             ),
-            "biorxiv": BioRxivClient(use_selenium=True),
-            "openalex": OpenAlexClient(email=self.config.email),
-            "acl_anthology": ACLAnthologyClient(),
-            "frontiers": FrontiersClient(use_selenium=True),
+            "biorxiv": get_client("biorxiv", use_selenium=True),
+            "openalex": get_client("openalex", email=self.config.email),
+            "acl_anthology": get_client("acl_anthology"),
+            "frontiers": get_client("frontiers", use_selenium=True),
         }
 
-        # Apply config rate limits to clients
-        for name, client in clients.items():
-            if hasattr(client, 'rate_limiter') and name in per_source_delays:
-                delay = per_source_delays[name]
-                # Convert delay (seconds) to calls_per_second
-                calls_per_second = 1.0 / delay if delay > 0 else 10.0
-                client.rate_limiter = ClientRateLimiter(calls_per_second=calls_per_second)
-
         # Unpaywall requires email
         if self.config.email:
-            clients["unpaywall"] = UnpaywallClient(email=self.config.email)
-            if "unpaywall" in per_source_delays:
-                delay = per_source_delays["unpaywall"]
-                calls_per_second = 1.0 / delay if delay > 0 else 10.0
-                clients["unpaywall"].rate_limiter = ClientRateLimiter(calls_per_second=calls_per_second)
+            clients["unpaywall"] = get_client("unpaywall", email=self.config.email)
+
+        # Apply config rate limits to the (shared) client limiters
+        for name in clients:
+            if name in per_source_delays:
+                set_rate_limit(name, per_source_delays[name])
 
         # Initialize institutional client if configured
         inst_config = self.config.institutional
         if inst_config.get("enabled"):
-            from .clients import InstitutionalAccessClient
-            clients["institutional"] = InstitutionalAccessClient(
+            clients["institutional"] = get_client(
+                "institutional",
                 proxy_url=inst_config.get("proxy_url"),
                 vpn_enabled=inst_config.get("vpn_enabled", False),
                 vpn_script=inst_config.get("vpn_script"),
@@ -129,33 +135,26 @@ class PaperRetriever:
 
         # Initialize web search client
         if self.config.is_source_enabled("web_search"):
-            from .clients import WebSearchClient
-            clients["web_search"] = WebSearchClient(enabled=True)
+            clients["web_search"] = get_client("web_search", enabled=True)
 
         # Initialize unofficial clients if disclaimer accepted
         if self.config.is_unofficial_enabled():
-            unofficial_config = self.config.unofficial
-
             if self.config.is_source_enabled("scihub"):
-                from .clients import ScihubClient
-                unofficial_config.get("scihub", {})
-                scihub_delay = per_source_delays.get("scihub", 5.0)
-                clients["scihub"] = ScihubClient(
+                clients["scihub"] = get_client(
+                    "scihub",
                     enabled=True,
                     timeout=60.0,
                     max_retries=self.config.batch.get("max_retries", 2),
-                    rate_limit=scihub_delay,
+                    rate_limit=per_source_delays.get("scihub", 5.0),
                 )
 
             if self.config.is_source_enabled("libgen"):
-                from .clients import LibGenClient
-                unofficial_config.get("libgen", {})
-                libgen_delay = per_source_delays.get("libgen", 3.0)
-                clients["libgen"] = LibGenClient(
+                clients["libgen"] = get_client(
+                    "libgen",
                     enabled=True,
                     timeout=60.0,
                     max_retries=self.config.batch.get("max_retries", 2),
-                    rate_limit=libgen_delay,
+                    rate_limit=per_source_delays.get("libgen", 3.0),
                 )
 
         return clients
@@ -948,8 +947,7 @@ class PaperRetriever:
 
         # For other landing pages, try to parse HTML for PDF links
         try:
-            import httpx
-            async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as http_client:
+            async with HttpSession(follow_redirects=True, timeout=30.0) as http_client:
                 response = await http_client.get(url)
                 if response.status_code == 200:
                     html = response.text
@@ -1218,7 +1216,7 @@ class PaperRetriever:
         }
 
         try:
-            async with httpx.AsyncClient(follow_redirects=True, timeout=60) as client:
+            async with HttpSession(follow_redirects=True, timeout=60) as client:
                 response = await client.get(url, headers=headers)
                 response.raise_for_status()
 
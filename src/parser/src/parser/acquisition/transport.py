@@ -0,0 +1,312 @@
+"""Shared HTTP transport for acquisition clients.
+
+API clients and PDF downloads used to open a new ``httpx.AsyncClient`` per
+call, paying DNS, TCP and TLS setup on every request to the same handful
+of hosts. They now share one client per event loop:
+
+- Keep-alive connections pooled across all sources (``max_connections``,
+  ``max_keepalive_connections``, ``keepalive_expiry``)
+- HTTP/2 when the ``h2`` package is installed and ``http2`` is set,
+  HTTP/1.1 otherwise
+- At most ``per_host_connections`` requests in flight per host, shared by
+  every client and download talking to that host
+- Timeouts, headers and redirect handling set per request through
+  ``HttpSession``, so each caller keeps its own
+
+Owners (``PaperRetriever``, ``CitationVerifier``, parser-mcp) hold the
+transport with ``open_transport`` and release it with ``close_transport``;
+a loop's client is closed when its last owner releases it. Code running
+without an owner still gets a client, closed by ``close_transport(force=True)``
+or dropped once its loop is closed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib.util
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, fields
+from typing import Any
+
+import httpx
+
+
+@dataclass
+class TransportSettings:
+    """Connection pool settings shared by every acquisition client."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0  # Seconds an idle connection is kept
+    per_host_connections: int = 6  # Requests in flight per host
+    http2: bool = True  # Only used if h2 is installed
+    timeout: float = 30.0  # Default request timeout in seconds
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> TransportSettings:
+        """Build settings from a config section, ignoring unknown keys."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (data or {}).items() if k in known})
+
+
+@dataclass
+class _LoopClient:
+    """The shared client of one event loop."""
+
+    loop: asyncio.AbstractEventLoop
+    client: httpx.AsyncClient
+    owners: int = 0
+
+
+# Global state (lazy populated)
+_settings = TransportSettings()
+_base_transport: httpx.AsyncBaseTransport | None = None
+_clients: dict[int, _LoopClient] = {}
+_host_limits: dict[tuple[str, int], asyncio.Semaphore] = {}
+_counters = {"clients_created": 0, "requests": 0, "host_waits": 0}
+
+
+class _SlotStream(httpx.AsyncByteStream):
+    """Response body that frees its host slot when closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, slot: asyncio.Semaphore):
+        self._stream = stream
+        self._slot = slot
+        self._held = True
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._held:
+                self._held = False
+                self._slot.release()
+
+
+class _HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport holding a per-host slot from send until the body is closed."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        slot = _host_limit(request.url.host)
+        if slot.locked():
+            _counters["host_waits"] += 1
+        await slot.acquire()
+        _counters["requests"] += 1
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            slot.release()
+            raise
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_SlotStream(response.stream, slot),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _host_limit(host: str) -> asyncio.Semaphore:
+    """Request slots of a host on the running loop."""
+    key = (host, id(asyncio.get_running_loop()))
+    if key not in _host_limits:
+        _host_limits[key] = asyncio.Semaphore(max(_settings.per_host_connections, 1))
+    return _host_limits[key]
+
+
+def http2_available() -> bool:
+    """Check whether HTTP/2 support (the ``h2`` package) is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _create_client() -> httpx.AsyncClient:
+    """Create a pooled client from the current settings."""
+    transport = _base_transport or httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(
+            max_connections=_settings.max_connections,
+            max_keepalive_connections=_settings.max_keepalive_connections,
+            keepalive_expiry=_settings.keepalive_expiry,
+        ),
+        http2=_settings.http2 and http2_available(),
+    )
+    _counters["clients_created"] += 1
+    return httpx.AsyncClient(
+        transport=_HostLimitedTransport(transport),
+        timeout=_settings.timeout,
+    )
+
+
+def _drop(loop_id: int) -> _LoopClient | None:
+    """Forget a loop's client and host slots."""
+    for key in [key for key in _host_limits if key[1] == loop_id]:
+        del _host_limits[key]
+    return _clients.pop(loop_id, None)
+
+
+def configure_transport(
+    settings: TransportSettings | dict[str, Any] | None = None,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> None:
+    """Set pool settings for clients created from now on.
+
+    Clients already open keep their settings (the first caller on a loop
+    wins), matching the other shared pools.
+
+    Args:
+        settings: Pool settings, or the ``http`` config section
+        transport: Transport to send requests through instead of the
+            network (e.g. ``httpx.MockTransport``)
+    """
+    global _settings, _base_transport
+    if settings is not None:
+        _settings = (
+            settings
+            if isinstance(settings, TransportSettings)
+            else TransportSettings.from_dict(settings)
+        )
+    if transport is not None:
+        _base_transport = transport
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared client of the running event loop.
+
+    Returns:
+        Pooled client (do not close it; see ``close_transport``)
+    """
+    loop = asyncio.get_running_loop()
+    for loop_id, entry in list(_clients.items()):
+        if entry.loop.is_closed():
+            # Its connections went with the loop
+            _drop(loop_id)
+
+    entry = _clients.get(id(loop))
+    if entry is None or entry.loop is not loop or entry.client.is_closed:
+        owners = entry.owners if entry is not None and entry.loop is loop else 0
+        entry = _LoopClient(loop=loop, client=_create_client(), owners=owners)
+        _clients[id(loop)] = entry
+    return entry.client
+
+
+async def open_transport() -> httpx.AsyncClient:
+    """Hold the shared client of the running loop open until ``close_transport``.
+
+    Returns:
+        Pooled client
+    """
+    client = get_http_client()
+    _clients[id(asyncio.get_running_loop())].owners += 1
+    return client
+
+
+async def close_transport(force: bool = False) -> None:
+    """Release the shared client of the running loop.
+
+    Args:
+        force: Close the client even if other owners still hold it
+    """
+    loop = asyncio.get_running_loop()
+    entry = _clients.get(id(loop))
+    if entry is None or entry.loop is not loop:
+        return
+    entry.owners = max(entry.owners - 1, 0)
+    if entry.owners and not force:
+        return
+    _drop(id(loop))
+    with contextlib.suppress(Exception):
+        await entry.client.aclose()
+
+
+@contextlib.asynccontextmanager
+async def shared_transport() -> AsyncIterator[httpx.AsyncClient]:
+    """Hold the shared client of the running loop open for a block."""
+    client = await open_transport()
+    try:
+        yield client
+    finally:
+        await close_transport()
+
+
+def transport_stats() -> dict[str, Any]:
+    """Get the number of shared clients, owners, hosts and requests."""
+    return {
+        "clients": len(_clients),
+        "owners": sum(entry.owners for entry in _clients.values()),
+        "hosts": len(_host_limits),
+        "http2": _settings.http2 and http2_available(),
+        **_counters,
+    }
+
+
+def reset_transport() -> None:
+    """Drop shared clients and settings without closing them. Useful for testing."""
+    global _settings, _base_transport
+    _clients.clear()
+    _host_limits.clear()
+    _settings = TransportSettings()
+    _base_transport = None
+    for key in _counters:
+        _counters[key] = 0
+
+
+class HttpSession:
+    """Per-caller request defaults on top of the shared client.
+
+    Used like a short-lived ``httpx.AsyncClient``::
+
+        async with HttpSession(timeout=60, follow_redirects=True) as client:
+            response = await client.get(url)
+
+    Leaving the block keeps the pooled connections open.
+    """
+
+    def __init__(
+        self,
+        timeout: float | httpx.Timeout | None = None,
+        follow_redirects: bool = False,
+        headers: dict[str, str] | None = None,
+    ):
+        """Initialize session.
+
+        Args:
+            timeout: Request timeout (None: the pool default)
+            follow_redirects: Follow redirects
+            headers: Headers sent with every request of the session
+        """
+        self.timeout = timeout
+        self.follow_redirects = follow_redirects
+        self.headers = headers or {}
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the shared client."""
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+        kwargs.setdefault("follow_redirects", self.follow_redirects)
+        if self.headers:
+            kwargs["headers"] = {**self.headers, **(kwargs.get("headers") or {})}
+        return await get_http_client().request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET request."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a POST request."""
+        return await self.request("POST", url, **kwargs)
+
+    async def __aenter__(self) -> HttpSession:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
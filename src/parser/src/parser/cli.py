@@ -146,12 +146,16 @@ def retrieve_paper(
         click.echo(f"Retrieving: {final_identifier}")
         click.echo(f"Output: {output_dir}")
 
-    result = asyncio.run(retriever.retrieve(
-        doi=doi,
-        title=title,
-        output_dir=output_dir,
-        verbose=verbose,
-    ))
+    async def run():
+        async with retriever:
+            return await retriever.retrieve(
+                doi=doi,
+                title=title,
+                output_dir=output_dir,
+                verbose=verbose,
+            )
+
+    result = asyncio.run(run())
 
     if result.status == RetrievalStatus.SUCCESS:
         click.echo(click.style("✓ Downloaded: ", fg="green") + str(result.pdf_path))
@@ -243,27 +247,28 @@ def batch(
 
     import httpx
 
-    for i, paper in enumerate(pdf_only, 1):
-        pdf_url: str = paper["pdf_url"] or ""
-        if verbose:
-            click.echo(f"\n[{i}/{len(pdf_only)}] Downloading direct PDF: {pdf_url[:60]}...")
+    # One client (and its keep-alive connections) for all direct downloads
+    with httpx.Client(follow_redirects=True, timeout=60.0) as client:
+        for i, paper in enumerate(pdf_only, 1):
+            pdf_url: str = paper["pdf_url"] or ""
+            if verbose:
+                click.echo(f"\n[{i}/{len(pdf_only)}] Downloading direct PDF: {pdf_url[:60]}...")
 
-        try:
-            parsed = urlparse(pdf_url)
-            filename = Path(parsed.path).name
-            if not filename.endswith('.pdf'):
-                filename = f"downloaded_{hash(pdf_url) % 10000}.pdf"
+            try:
+                parsed = urlparse(pdf_url)
+                filename = Path(parsed.path).name
+                if not filename.endswith('.pdf'):
+                    filename = f"downloaded_{hash(pdf_url) % 10000}.pdf"
 
-            output_path = output_dir / filename
+                output_path = output_dir / filename
 
-            with httpx.Client(follow_redirects=True, timeout=60.0) as client:
                 response = client.get(pdf_url)
                 response.raise_for_status()
                 output_path.write_bytes(response.content)
 
-            click.echo(click.style("✓ Downloaded: ", fg="green") + str(output_path))
-        except Exception as e:
-            click.echo(click.style("✗ Failed: ", fg="red") + str(e))
+                click.echo(click.style("✓ Downloaded: ", fg="green") + str(output_path))
+            except Exception as e:
+                click.echo(click.style("✗ Failed: ", fg="red") + str(e))
 
     # If no searchable papers left, we're done
     if not searchable:
@@ -272,12 +277,13 @@ def batch(
     retriever = PaperRetriever(config)
 
     async def run():
-        return await retriever.retrieve_batch(
-            searchable,
-            output_dir=output_dir,
-            verbose=verbose,
-            max_concurrent=max_concurrent,
-        )
+        async with retriever:
+            return await retriever.retrieve_batch(
+                searchable,
+                output_dir=output_dir,
+                verbose=verbose,
+                max_concurrent=max_concurrent,
+            )
 
     results = asyncio.run(run())
 
@@ -651,12 +657,14 @@ def doi2bib(
         parser doi2bib -i dois.txt -o references.bib
         parser doi2bib -i batch.json -o references.bib
     """
+    from .acquisition.transport import shared_transport
     from .doi2bib.metadata import get_metadata as fetch_metadata
     from .doi2bib.resolver import resolve_identifier
 
     async def get_metadata(ident_str: str):
         ident = resolve_identifier(ident_str)
-        return await fetch_metadata(ident, email=email, s2_api_key=s2_key)
+        async with shared_transport():
+            return await fetch_metadata(ident, email=email, s2_api_key=s2_key)
 
     def format_result(result) -> str:
         if output_format == "bibtex":
@@ -707,14 +715,20 @@ def doi2bib(
         click.echo(f"Processing {len(identifiers)} identifiers...", err=True)
         results = []
         failed = []
-        for ident in identifiers:
-            click.echo(f"  {ident}...", err=True)
-            result = asyncio.run(get_metadata(ident))
-            if result:
-                results.append(format_result(result))
-            else:
-                failed.append(ident)
-                click.echo("    ✗ Failed", err=True)
+
+        async def get_all():
+            # One event loop, so all lookups share pooled connections
+            async with shared_transport():
+                for ident in identifiers:
+                    click.echo(f"  {ident}...", err=True)
+                    result = await get_metadata(ident)
+                    if result:
+                        results.append(format_result(result))
+                    else:
+                        failed.append(ident)
+                        click.echo("    ✗ Failed", err=True)
+
+        asyncio.run(get_all())
 
         separator = "\n\n" if output_format == "bibtex" else "\n---\n"
         output = separator.join(results)
@@ -813,9 +827,10 @@ def verify(
         click.echo()
 
         async def run_dir():
-            return await verifier.verify_directory(
-                input_p, output_dir, skip_keys=skip_set, dry_run=dry_run
-            )
+            async with verifier:
+                return await verifier.verify_directory(
+                    input_p, output_dir, skip_keys=skip_set, dry_run=dry_run
+                )
 
         stats, results = asyncio.run(run_dir())
     else:
@@ -834,9 +849,10 @@ def verify(
         click.echo()
 
         async def run_file():
-            return await verifier.verify_file(
-                input_p, output_dir, skip_keys=skip_set, manual_path=manual_p, dry_run=dry_run
-            )
+            async with verifier:
+                return await verifier.verify_file(
+                    input_p, output_dir, skip_keys=skip_set, manual_path=manual_p, dry_run=dry_run
+                )
 
         stats, results = asyncio.run(run_file())
 
@@ -1355,11 +1371,11 @@ def citations(
         parser citations "10.1038/nature12373" --direction citations -n 100
         parser citations "10.1038/nature12373" --format bibtex -o refs.bib
     """
-    from .acquisition.clients import SemanticScholarClient
+    from .acquisition.clients.registry import get_client
     from .doi2bib.resolver import resolve_identifier
 
     ident = resolve_identifier(identifier)
-    s2 = SemanticScholarClient(api_key=s2_key)
+    s2 = get_client("semantic_scholar", api_key=s2_key)
 
     # Build paper ID for Semantic Scholar
     if ident.doi:
@@ -395,12 +395,7 @@ async def get_metadata(
     Returns:
         PaperMetadata or None
     """
-    from ..acquisition.clients import (
-        ArxivClient,
-        CrossRefClient,
-        OpenAlexClient,
-        SemanticScholarClient,
-    )
+    from ..acquisition.clients.registry import get_client
 
     metadata: dict[str, Any] | None = None
 
@@ -410,12 +405,12 @@ async def get_metadata(
         arxiv_id = identifier.arxiv_id or identifier.value
 
         # Try arXiv first
-        arxiv = ArxivClient()
+        arxiv = get_client("arxiv")
         metadata = await arxiv.get_paper_metadata(arxiv_id)
 
         # Enhance with Semantic Scholar
         if metadata:
-            s2 = SemanticScholarClient(api_key=s2_api_key)
+            s2 = get_client("semantic_scholar", api_key=s2_api_key)
             s2_meta = await s2.get_paper_metadata(f"ARXIV:{arxiv_id}")
             if s2_meta:
                 # Merge citation info
@@ -427,31 +422,31 @@ async def get_metadata(
 
         # Try CrossRef first
         if email:
-            crossref = CrossRefClient(email=email)
+            crossref = get_client("crossref", email=email)
             metadata = await crossref.get_paper_metadata(doi)
 
         # Fallback to Semantic Scholar
         if not metadata:
-            s2 = SemanticScholarClient(api_key=s2_api_key)
+            s2 = get_client("semantic_scholar", api_key=s2_api_key)
             metadata = await s2.get_paper_metadata(doi)
 
         # Fallback to OpenAlex
         if not metadata and email:
-            openalex = OpenAlexClient(email=email)
+            openalex = get_client("openalex", email=email)
             metadata = await openalex.get_paper_metadata(doi)
 
     elif identifier.type == IdentifierType.SEMANTIC_SCHOLAR:
-        s2 = SemanticScholarClient(api_key=s2_api_key)
+        s2 = get_client("semantic_scholar", api_key=s2_api_key)
         metadata = await s2.get_paper_metadata(identifier.value)
 
     elif identifier.type == IdentifierType.OPENALEX:
         if email:
-            openalex = OpenAlexClient(email=email)
+            openalex = get_client("openalex", email=email)
             metadata = await openalex.get_paper_metadata(identifier.value)
 
     elif identifier.type == IdentifierType.TITLE:
         # Search by title
-        s2 = SemanticScholarClient(api_key=s2_api_key)
+        s2 = get_client("semantic_scholar", api_key=s2_api_key)
         results = await s2.search(identifier.value, limit=1)
         if results:
             # Get full metadata for top result
@@ -14,15 +14,15 @@ Outputs:
 from __future__ import annotations
 
 import asyncio
-import json
 import re
 import urllib.parse
-import urllib.request
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+from ..acquisition.transport import HttpSession, close_transport, open_transport
+
 # Website URL patterns (no DOI expected)
 WEBSITE_PATTERNS = [
     r"github\.com",
@@ -253,7 +253,11 @@ def parse_bib_file(bib_path: Path) -> list[BibEntry]:
 
 
 class CitationVerifier:
-    """Verifies BibTeX citations against academic databases."""
+    """Verifies BibTeX citations against academic databases.
+
+    Lookups go through the shared HTTP transport; use the verifier as an
+    async context manager to keep its connections open across entries.
+    """
 
     def __init__(
         self,
@@ -269,9 +273,38 @@ class CitationVerifier:
         self.email = email
         self.rate_limit = rate_limit
         self._last_request = 0.0
-
-    async def _rate_limit_wait(self):
-        """Wait to respect rate limits."""
+        self._http = HttpSession(timeout=10, follow_redirects=True)
+        self._transport_open = False
+
+        from ..acquisition.clients.registry import get_client
+
+        # Limiters shared with every other CrossRef/arXiv caller in the process
+        self._source_limiters = {
+            "crossref": get_client("crossref", email=email).rate_limiter,
+            "arxiv": get_client("arxiv").rate_limiter,
+        }
+
+    async def open(self) -> None:
+        """Hold the shared HTTP connections open until ``close``."""
+        if not self._transport_open:
+            await open_transport()
+            self._transport_open = True
+
+    async def close(self) -> None:
+        """Release the shared HTTP connections (closed with their last owner)."""
+        if self._transport_open:
+            self._transport_open = False
+            await close_transport()
+
+    async def __aenter__(self) -> CitationVerifier:
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def _rate_limit_wait(self, source: str):
+        """Wait to respect rate limits (the verifier's own and the source's)."""
         import time
 
         now = time.time()
@@ -279,6 +312,7 @@ class CitationVerifier:
         if elapsed < self.rate_limit:
             await asyncio.sleep(self.rate_limit - elapsed)
         self._last_request = time.time()
+        await self._source_limiters[source].wait()
 
     async def get_bibtex_from_doi(self, doi: str) -> tuple[str, str | None]:
         """Fetch BibTeX from DOI.
@@ -289,7 +323,7 @@ class CitationVerifier:
         Returns:
             Tuple of (bibtex, title)
         """
-        await self._rate_limit_wait()
+        await self._rate_limit_wait("crossref")
 
         try:
             # Try doi.org content negotiation
@@ -299,9 +333,9 @@ class CitationVerifier:
                 "User-Agent": "ingestor/1.0 (mailto:research@example.com)",
             }
 
-            req = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                bibtex = response.read().decode("utf-8")
+            response = await self._http.get(url, headers=headers)
+            response.raise_for_status()
+            bibtex = response.text
 
             if not bibtex or not bibtex.strip().startswith("@"):
                 return "", None
@@ -329,7 +363,7 @@ class CitationVerifier:
         Returns:
             Tuple of (bibtex, title)
         """
-        await self._rate_limit_wait()
+        await self._rate_limit_wait("arxiv")
 
         # Clean arxiv ID
         arxiv_id = arxiv_id.replace("arXiv:", "").replace("arxiv:", "").strip()
@@ -338,9 +372,9 @@ class CitationVerifier:
         headers = {"User-Agent": "ingestor/1.0"}
 
         try:
-            req = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                xml_data = response.read().decode()
+            response = await self._http.get(url, headers=headers)
+            response.raise_for_status()
+            xml_data = response.text
 
             # Parse XML
             root = ET.fromstring(xml_data)
@@ -404,7 +438,7 @@ class CitationVerifier:
         Returns:
             List of results with 'doi' and 'title' keys
         """
-        await self._rate_limit_wait()
+        await self._rate_limit_wait("crossref")
 
         query = re.sub(r"[{}\\]", "", title or "")
         if not query:
@@ -419,9 +453,9 @@ class CitationVerifier:
         headers = {"User-Agent": f"ingestor/1.0 (mailto:{self.email or 'research@example.com'})"}
 
         try:
-            req = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode())
+            response = await self._http.get(url, headers=headers)
+            response.raise_for_status()
+            data = response.json()
 
             return [
                 {
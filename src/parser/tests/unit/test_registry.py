@@ -0,0 +1,99 @@
+"""Unit tests for the shared client registry."""
+
+import asyncio
+import time
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from parser.acquisition.clients.registry import (
+    get_client,
+    registry_stats,
+    reset_registry,
+    set_rate_limit,
+    shared_source_limiter,
+)
+from parser.acquisition.transport import configure_transport, reset_transport
+from parser.doi2bib.metadata import get_metadata
+from parser.doi2bib.resolver import resolve_identifier
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry() -> Iterator[None]:
+    """Start each test without shared clients."""
+    reset_registry()
+    reset_transport()
+    yield
+    reset_registry()
+    reset_transport()
+
+
+class TestGetClient:
+    """Test instances and limiters are shared."""
+
+    def test_one_instance_per_options(self) -> None:
+        """Test equal options share an instance, credentials split it."""
+        first = get_client("semantic_scholar", api_key=None)
+
+        assert get_client("semantic_scholar", api_key=None) is first
+        assert get_client("semantic_scholar", api_key="key") is not first
+        assert registry_stats() == {"clients": 2, "limiters": 2}
+
+    def test_limiter_shared_across_emails(self) -> None:
+        """Test clients differing only by contact email share a limiter."""
+        first = get_client("crossref", email="a@example.com")
+        second = get_client("crossref", email="b@example.com")
+
+        assert first is not second
+        assert first.rate_limiter is second.rate_limiter
+
+    def test_set_rate_limit(self) -> None:
+        """Test a configured delay applies to every shared limiter of a source."""
+        clients = [get_client("semantic_scholar", api_key=k) for k in (None, "key")]
+
+        set_rate_limit("semantic_scholar", 2.0)
+
+        assert {c.rate_limiter.calls_per_second for c in clients} == {0.5}
+
+    def test_unknown_source(self) -> None:
+        """Test an unknown source is rejected."""
+        with pytest.raises(ValueError, match="Unknown source"):
+            get_client("nowhere")
+
+    def test_source_limiter_keeps_state(self) -> None:
+        """Test new retriever configs update, not replace, the shared limiter."""
+        limiter = shared_source_limiter({"per_source_delays": {"arxiv": 3.0}})
+        limiter.last_call["arxiv"] = 123.0
+
+        again = shared_source_limiter({"per_source_delays": {"arxiv": 5.0}})
+
+        assert again is limiter
+        assert again.get_delay("arxiv") == 5.0 and again.last_call["arxiv"] == 123.0
+
+
+class TestSharedRateLimit:
+    """Test concurrent entry points take turns on one limiter."""
+
+    async def test_concurrent_get_metadata_spaced(self) -> None:
+        """Test parallel doi2bib lookups respect one CrossRef limit."""
+        sent: list[float] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(time.monotonic())
+            doi = request.url.path.split("/works/", 1)[1]
+            return httpx.Response(200, json={"message": {"DOI": doi, "title": [doi]}})
+
+        configure_transport(transport=httpx.MockTransport(handler))
+        get_client("crossref", email="me@example.com").rate_limiter.calls_per_second = 20
+
+        results = await asyncio.gather(
+            *(
+                get_metadata(resolve_identifier(f"10.1000/{i}"), email="me@example.com")
+                for i in range(4)
+            )
+        )
+
+        assert all(r is not None for r in results)
+        gaps = [b - a for a, b in zip(sent, sent[1:], strict=False)]
+        assert len(sent) == 4 and min(gaps) >= 0.045
@@ -0,0 +1,130 @@
+"""Unit tests for the shared HTTP transport."""
+
+import asyncio
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from parser.acquisition.clients import CrossRefClient, PMCClient
+from parser.acquisition.transport import (
+    HttpSession,
+    close_transport,
+    configure_transport,
+    get_http_client,
+    open_transport,
+    reset_transport,
+    shared_transport,
+    transport_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_transport() -> Iterator[None]:
+    """Start each test without shared clients."""
+    reset_transport()
+    yield
+    reset_transport()
+
+
+class TestSharedClient:
+    """Test one pooled client is shared and closed with its owners."""
+
+    async def test_clients_share_connections(self) -> None:
+        """Test API clients and sessions reuse one client per loop."""
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"message": {"DOI": "10.1/x"}})
+
+        configure_transport(transport=httpx.MockTransport(handler))
+        client = CrossRefClient(email="me@example.com")
+        client.rate_limiter.calls_per_second = 0
+
+        for _ in range(3):
+            assert await client.get("works/10.1/x") == {"message": {"DOI": "10.1/x"}}
+        async with HttpSession(headers={"Accept": "application/pdf"}) as session:
+            await session.get("https://example.org/paper.pdf")
+
+        assert transport_stats()["clients_created"] == 1
+        assert transport_stats()["requests"] == 4
+        assert "mailto:me@example.com" in seen[0].headers["User-Agent"]
+        assert seen[-1].headers["Accept"] == "application/pdf"
+
+    async def test_pmc_id_conversion(self) -> None:
+        """Test DOI to PMCID conversion goes through the shared client."""
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"records": [{"doi": "10.1/x", "pmcid": "PMC42"}]})
+
+        configure_transport(transport=httpx.MockTransport(handler))
+
+        assert await PMCClient(email="me@example.com").doi_to_pmcid("10.1/x") == "PMC42"
+        assert seen[0].url.params["ids"] == "10.1/x"
+        assert seen[0].url.params["email"] == "me@example.com"
+        assert transport_stats()["requests"] == 1
+
+    async def test_closed_with_last_owner(self) -> None:
+        """Test the client stays open until every owner has released it."""
+        configure_transport(transport=httpx.MockTransport(lambda r: httpx.Response(204)))
+
+        async with shared_transport() as client:
+            await open_transport()
+            await close_transport()
+            assert not client.is_closed
+        assert client.is_closed
+        assert transport_stats()["clients"] == 0
+        assert get_http_client() is not client
+
+    async def test_force_close(self) -> None:
+        """Test force closes a client other owners still hold."""
+        client = await open_transport()
+        await open_transport()
+
+        await close_transport(force=True)
+
+        assert client.is_closed and transport_stats()["owners"] == 0
+
+
+class TestHostLimits:
+    """Test requests in flight are capped per host."""
+
+    async def test_per_host_limit(self) -> None:
+        """Test one host is limited while another proceeds independently."""
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            host = request.url.host
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+            return httpx.Response(200, content=b"%PDF-1.4")
+
+        configure_transport({"per_host_connections": 2}, transport=httpx.MockTransport(handler))
+        session = HttpSession(timeout=5)
+
+        responses = await asyncio.gather(
+            *(session.get(f"https://a.example/{i}") for i in range(6)),
+            *(session.get(f"https://b.example/{i}") for i in range(2)),
+        )
+
+        assert all(r.content == b"%PDF-1.4" for r in responses)
+        assert peak == {"a.example": 2, "b.example": 2}
+        assert transport_stats()["host_waits"] >= 4
+
+    async def test_slot_freed_on_error(self) -> None:
+        """Test a failed request gives its host slot back."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        configure_transport({"per_host_connections": 1}, transport=httpx.MockTransport(handler))
+
+        for _ in range(3):
+            with pytest.raises(httpx.ConnectError):
+                await asyncio.wait_for(HttpSession().get("https://down.example/"), 1)
@@ -2,19 +2,164 @@
 
 A simple FastAPI server that wraps LanceDB for remote access.
 Supports vector search, hybrid search, and table listing.
+
+Vectors are never returned unless requested (``include_vectors`` or
+``columns``). Query vectors may be sent as JSON lists or as base64
+little-endian float32, and results may be returned as JSON or as an
+Arrow IPC stream (``format: "arrow"``), which avoids encoding floats as
+text entirely.
+
+The ``/search/text-query`` endpoints embed raw query text on the server
+with the Ollama models recorded in the database ``_metadata`` table.
+Concurrent queries are coalesced into batched embedding calls, and the
+models are kept loaded (``OLLAMA_KEEP_ALIVE``).
+
+``/rows`` pages with a ``version:rowid`` cursor instead of an offset, so
+each page costs the same wherever it is in the table and every page reads
+the table version of the first one; it can stream pages as
+newline-delimited JSON or Arrow record batches.
 """
 
+import asyncio
+import base64
+import contextlib
+import io
+import json
 import os
+import time
+from contextlib import asynccontextmanager
+from typing import Literal
 
+import httpx
 import lancedb
-from fastapi import FastAPI, HTTPException
+import numpy as np
+import pyarrow as pa
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
+
+# Server-side query embedding
+OLLAMA_HOST = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
+OLLAMA_KEEP_ALIVE = os.environ.get("OLLAMA_KEEP_ALIVE", "30m")
+EMBED_BATCH_WINDOW_MS = float(os.environ.get("EMBED_BATCH_WINDOW_MS", "5"))
+EMBED_MAX_BATCH = int(os.environ.get("EMBED_MAX_BATCH", "64"))
+MAX_QUERY_CHARS = 8000  # Same truncation as the processor's OllamaEmbedder
+
+
+class QueryEmbedder:
+    """Warm Ollama client that coalesces concurrent queries into batched calls.
+
+    The first query for a model opens a short window (EMBED_BATCH_WINDOW_MS);
+    all queries for that model arriving within it are embedded with a single
+    /api/embed request.
+    """
+
+    def __init__(self, host: str, batch_window_ms: float, max_batch: int):
+        self.host = host.rstrip("/")
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch = max_batch
+        self.batches = 0
+        self.texts = 0
+        self.warm_models: list[str] = []
+        self._client: httpx.AsyncClient | None = None
+        self._pending: dict[str, list[tuple[str, asyncio.Future]]] = {}
+        self._timers: dict[str, asyncio.Task] = {}
+        self._flushes: set[asyncio.Task] = set()  # Keep early flushes referenced
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=120.0)
+        return self._client
+
+    async def embed(self, model: str, text: str) -> list[float]:
+        """Embed one query, batched with other concurrent queries."""
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending.setdefault(model, [])
+        pending.append((text[:MAX_QUERY_CHARS], future))
+
+        if len(pending) >= self.max_batch:
+            task = asyncio.create_task(self._flush(model))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+        elif model not in self._timers:
+            self._timers[model] = asyncio.create_task(self._flush_later(model))
+
+        return await future
+
+    async def _flush_later(self, model: str) -> None:
+        """Flush a model's pending queries after the batch window."""
+        await asyncio.sleep(self.batch_window)
+        await self._flush(model)
+
+    async def _flush(self, model: str) -> None:
+        """Embed all pending queries for a model in one request."""
+        batch = self._pending.pop(model, [])
+        timer = self._timers.pop(model, None)
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+        if not batch:
+            return
+
+        try:
+            embeddings = await self.embed_texts(model, [text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), embedding in zip(batch, embeddings, strict=True):
+            if not future.done():
+                future.set_result(embedding)
+
+    async def embed_texts(self, model: str, texts: list[str]) -> list[list[float]]:
+        """Embed texts with one Ollama /api/embed call."""
+        response = await self._get_client().post(
+            f"{self.host}/api/embed",
+            json={"model": model, "input": texts, "keep_alive": OLLAMA_KEEP_ALIVE},
+        )
+        response.raise_for_status()
+        self.batches += 1
+        self.texts += len(texts)
+        return response.json()["embeddings"]
+
+    async def warm(self, models: list[str]) -> None:
+        """Load models into Ollama ahead of the first query."""
+        for model in models:
+            with contextlib.suppress(Exception):
+                await self.embed_texts(model, ["warm-up"])
+                self.warm_models.append(model)
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+embedder = QueryEmbedder(OLLAMA_HOST, EMBED_BATCH_WINDOW_MS, EMBED_MAX_BATCH)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the query embedding models in the background on startup."""
+    models = list(dict.fromkeys(
+        m for m in (embedding_model("text"), embedding_model("code")) if m
+    ))
+    warm_task = asyncio.create_task(embedder.warm(models))
+    yield
+    warm_task.cancel()
+    await embedder.close()
+
 
 app = FastAPI(
     title="LanceDB Server",
     description="REST API for LanceDB vector database",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -38,25 +183,228 @@ def get_db() -> lancedb.DBConnection:
     return db
 
 
-class SearchRequest(BaseModel):
+def open_table(table_name: str):
+    """Open a table of the database (404 if it does not exist)."""
+    connection = get_db()
+    if table_name not in connection.table_names():
+        raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
+    return connection.open_table(table_name)
+
+
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+
+
+class OutputOptions(BaseModel):
+    """Column projection and response encoding shared by search requests."""
+    columns: list[str] | None = None  # Columns to return (default: all but vectors)
+    include_vectors: bool = False  # Also return vector columns
+    vector_encoding: Literal["list", "base64"] = "list"  # JSON encoding of vectors
+    format: Literal["json", "arrow"] = "json"  # Response format
+
+
+class SearchRequest(OutputOptions):
     """Search request body."""
-    query_vector: list[float]
+    query_vector: list[float] | None = None
+    query_vector_b64: str | None = None  # Base64 little-endian float32
     limit: int = 10
     filter: str | None = None
+    prefilter: bool = True  # Filter before the vector search (uses scalar indexes)
 
 
-class HybridSearchRequest(BaseModel):
+class HybridSearchRequest(OutputOptions):
     """Hybrid search request body."""
-    query_vector: list[float]
+    query_vector: list[float] | None = None
+    query_vector_b64: str | None = None
     query_text: str
     limit: int = 10
     filter: str | None = None
+    prefilter: bool = True
 
 
-class TextSearchRequest(BaseModel):
+class TextSearchRequest(OutputOptions):
     """Full-text search request body."""
     query_text: str
     limit: int = 10
+    filter: str | None = None
+    prefilter: bool = True
+
+
+class BatchSearchRequest(OutputOptions):
+    """Batch vector search request body (one result list per query)."""
+    query_vectors: list[list[float]] | None = None
+    query_vectors_b64: list[str] | None = None
+    limit: int = 10
+    filter: str | None = None
+    prefilter: bool = True
+
+
+class TextQueryRequest(OutputOptions):
+    """Text query request body (embedded on the server)."""
+    query: str
+    limit: int = 10
+    filter: str | None = None
+    prefilter: bool = True
+    hybrid: bool = False  # Also use the query text for BM25 (needs an FTS index)
+    domain: Literal["text", "code"] | None = None  # Default: code for code_chunks
+    vector_column: str | None = None  # Default: text_vector if present, else vector
+
+
+class BatchTextQueryRequest(OutputOptions):
+    """Batch text query request body (embedded on the server)."""
+    queries: list[str]
+    limit: int = 10
+    filter: str | None = None
+    prefilter: bool = True
+    domain: Literal["text", "code"] | None = None
+    vector_column: str | None = None
+
+
+METADATA_TTL = 30.0  # Seconds between _metadata re-reads
+_metadata_cache: tuple[float, dict[str, str]] | None = None
+
+
+def read_metadata() -> dict[str, str]:
+    """Read the _metadata table (cached for METADATA_TTL seconds)."""
+    global _metadata_cache
+    if _metadata_cache is not None and time.monotonic() - _metadata_cache[0] < METADATA_TTL:
+        return _metadata_cache[1]
+
+    connection = get_db()
+    metadata: dict[str, str] = {}
+    if "_metadata" in connection.table_names():
+        rows = connection.open_table("_metadata").to_arrow().to_pylist()
+        metadata = {row["key"]: row["value"] for row in rows}
+
+    _metadata_cache = (time.monotonic(), metadata)
+    return metadata
+
+
+def embedding_model(domain: str) -> str | None:
+    """Ollama model the database was built with for a 'text' or 'code' domain."""
+    with contextlib.suppress(Exception):
+        return read_metadata().get(f"{domain}_ollama_model") or None
+    return None
+
+
+def truncate_dims(table, vector_column: str | None) -> int | None:
+    """Matryoshka dimension query embeddings must be truncated to.
+
+    Taken from the searched column's width, like the processor's
+    ``read_truncate_dims``, so it always matches the stored vectors.
+    """
+    with contextlib.suppress(Exception):
+        column_type = table.schema.field(vector_column or "vector").type
+        list_size = getattr(column_type, "list_size", -1)
+        return list_size if list_size > 0 else None
+    return None
+
+
+def truncate_query(vector: list[float], dims: int | None) -> np.ndarray:
+    """Cut a query embedding like the stored vectors and re-normalise it."""
+    vector = np.asarray(vector, dtype=np.float32)
+    if dims is None or len(vector) <= dims:
+        return vector
+    vector = vector[:dims]
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm > 0 else vector
+
+
+def text_query_target(table, table_name: str, domain: str | None, vector_column: str | None):
+    """Resolve the embedding model, vector column and truncation for a text query."""
+    domain = domain or ("code" if table_name == "code_chunks" else "text")
+    model = embedding_model(domain)
+    if not model:
+        raise HTTPException(
+            status_code=409,
+            detail=(
+                f"Database _metadata records no {domain} embedding model. "
+                "Rebuild it with a current processor or search with query_vector."
+            ),
+        )
+
+    if vector_column is None and "text_vector" in table.schema.names:
+        vector_column = "text_vector"
+    return model, vector_column, truncate_dims(table, vector_column)
+
+
+def decode_vector(encoded: str) -> np.ndarray:
+    """Decode a base64 little-endian float32 vector."""
+    try:
+        return np.frombuffer(base64.b64decode(encoded), dtype="<f4")
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid base64 vector: {e}") from e
+
+
+def query_vector(vector: list[float] | None, vector_b64: str | None) -> np.ndarray:
+    """Get the query vector from either its JSON or base64 form."""
+    if (vector is None) == (vector_b64 is None):
+        raise HTTPException(
+            status_code=422,
+            detail="Provide exactly one of query_vector or query_vector_b64",
+        )
+    if vector_b64 is not None:
+        return decode_vector(vector_b64)
+    return np.asarray(vector, dtype=np.float32)
+
+
+def vector_columns(schema: pa.Schema) -> list[str]:
+    """Names of fixed-size-list (vector) columns in a schema."""
+    return [f.name for f in schema if pa.types.is_fixed_size_list(f.type)]
+
+
+def projection(table, options: OutputOptions) -> list[str] | None:
+    """Columns to select for a request (None selects everything)."""
+    names = table.schema.names
+    if options.columns:
+        unknown = [c for c in options.columns if c not in names]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown columns: {unknown}")
+        return options.columns
+    if options.include_vectors:
+        return None
+    vectors = set(vector_columns(table.schema))
+    return [n for n in names if n not in vectors]
+
+
+def rows_to_json(result: pa.Table, vector_encoding: str) -> list[dict]:
+    """Convert Arrow results to JSON rows, optionally base64-encoding vectors."""
+    rows = result.to_pylist()
+    if vector_encoding != "base64":
+        return rows
+
+    for name in vector_columns(result.schema):
+        column = result.column(name).combine_chunks()
+        dims = column.type.list_size
+        values = column.flatten().to_numpy(zero_copy_only=False).astype("<f4")
+        for i, row in enumerate(rows):
+            if row[name] is not None:
+                row[name] = base64.b64encode(values[i * dims:(i + 1) * dims].tobytes()).decode()
+    return rows
+
+
+def arrow_response(result: pa.Table) -> Response:
+    """Serialize Arrow results as an IPC stream response."""
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, result.schema) as writer:
+        writer.write_table(result)
+    return Response(content=sink.getvalue().to_pybytes(), media_type=ARROW_STREAM)
+
+
+def search_response(query, table, options: OutputOptions):
+    """Run a search query with projection and encode it in the requested format."""
+    columns = projection(table, options)
+    if columns is not None:
+        query = query.select(columns)
+    result = query.to_arrow()
+
+    if options.format == "arrow":
+        return arrow_response(result)
+
+    results = rows_to_json(result, options.vector_encoding)
+    return {
+        "results": results,
+        "count": len(results),
+    }
 
 
 @app.get("/")
@@ -90,14 +438,10 @@ async def list_tables():
 async def table_info(table_name: str):
     """Get table information."""
     try:
-        connection = get_db()
-        if table_name not in connection.table_names():
-            raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
-
-        table = connection.open_table(table_name)
+        table = await run_in_threadpool(open_table, table_name)
         return {
             "name": table_name,
-            "row_count": table.count_rows(),
+            "row_count": await run_in_threadpool(table.count_rows),
             "schema": str(table.schema),
         }
     except HTTPException:
@@ -110,11 +454,7 @@ async def table_info(table_name: str):
 async def table_schema(table_name: str):
     """Get table schema."""
     try:
-        connection = get_db()
-        if table_name not in connection.table_names():
-            raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
-
-        table = connection.open_table(table_name)
+        table = await run_in_threadpool(open_table, table_name)
         schema = table.schema
         columns = []
         for field in schema:
@@ -133,22 +473,14 @@ async def table_schema(table_name: str):
 async def vector_search(table_name: str, request: SearchRequest):
     """Perform vector search on a table."""
     try:
-        connection = get_db()
-        if table_name not in connection.table_names():
-            raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
+        table = await run_in_threadpool(open_table, table_name)
+        vector = query_vector(request.query_vector, request.query_vector_b64)
 
-        table = connection.open_table(table_name)
-
-        query = table.search(request.query_vector).limit(request.limit)
+        query = table.search(vector).limit(request.limit)
         if request.filter:
-            query = query.where(request.filter)
-
-        results = query.to_list()
+            query = query.where(request.filter, prefilter=request.prefilter)
 
-        return {
-            "results": results,
-            "count": len(results),
-        }
+        return await run_in_threadpool(search_response, query, table, request)
     except HTTPException:
         raise
     except Exception as e:
@@ -159,27 +491,19 @@ async def vector_search(table_name: str, request: SearchRequest):
 async def hybrid_search(table_name: str, request: HybridSearchRequest):
     """Perform hybrid (vector + FTS) search on a table."""
     try:
-        connection = get_db()
-        if table_name not in connection.table_names():
-            raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
-
-        table = connection.open_table(table_name)
+        table = await run_in_threadpool(open_table, table_name)
+        vector = query_vector(request.query_vector, request.query_vector_b64)
 
         query = (
             table.search(query_type="hybrid")
-            .vector(request.query_vector)
+            .vector(vector)
             .text(request.query_text)
             .limit(request.limit)
         )
         if request.filter:
-            query = query.where(request.filter)
-
-        results = query.to_list()
+            query = query.where(request.filter, prefilter=request.prefilter)
 
-        return {
-            "results": results,
-            "count": len(results),
-        }
+        return await run_in_threadpool(search_response, query, table, request)
     except HTTPException:
         raise
     except Exception as e:
@@ -190,52 +514,362 @@ async def hybrid_search(table_name: str, request: HybridSearchRequest):
 async def text_search(table_name: str, request: TextSearchRequest):
     """Perform full-text search on a table."""
     try:
-        connection = get_db()
-        if table_name not in connection.table_names():
-            raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
+        table = await run_in_threadpool(open_table, table_name)
+
+        query = table.search(request.query_text, query_type="fts").limit(request.limit)
+        if request.filter:
+            query = query.where(request.filter, prefilter=request.prefilter)
 
-        table = connection.open_table(table_name)
+        return await run_in_threadpool(search_response, query, table, request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
-        results = (
-            table.search(request.query_text, query_type="fts")
-            .limit(request.limit)
-            .to_list()
+
+async def parse_batch_request(http_request: Request) -> BatchSearchRequest:
+    """Parse a batch search from JSON or from an Arrow IPC stream.
+
+    An Arrow body must hold one query per row in a ``query_vector``
+    column; the remaining options are taken from the query string
+    (``columns`` as a comma-separated list).
+    """
+    try:
+        if http_request.headers.get("content-type", "").startswith(ARROW_STREAM):
+            body = await http_request.body()
+            queries = pa.ipc.open_stream(body).read_all()
+            if "query_vector" not in queries.schema.names:
+                raise HTTPException(
+                    status_code=400, detail="Arrow body needs a query_vector column"
+                )
+            params = dict(http_request.query_params)
+            if "columns" in params:
+                params["columns"] = params["columns"].split(",")
+            return BatchSearchRequest(
+                query_vectors=queries.column("query_vector").to_pylist(), **params
+            )
+        return BatchSearchRequest.model_validate(await http_request.json())
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors()) from e
+    except (ValueError, pa.ArrowInvalid) as e:
+        # Malformed JSON (JSONDecodeError is a ValueError) or Arrow IPC body
+        raise HTTPException(status_code=400, detail=f"Malformed request body: {e}") from e
+
+
+@app.post("/tables/{table_name}/search/batch")
+async def batch_search(table_name: str, http_request: Request):
+    """Perform several vector searches in one request.
+
+    Accepts a JSON body (query_vectors or query_vectors_b64) or an Arrow
+    IPC stream. JSON responses hold one result list per query; Arrow
+    responses are a single table with a query_index column.
+    """
+    try:
+        request = await parse_batch_request(http_request)
+
+        table = await run_in_threadpool(open_table, table_name)
+
+        if request.query_vectors_b64 is not None:
+            vectors = [decode_vector(v) for v in request.query_vectors_b64]
+        elif request.query_vectors is not None:
+            vectors = [np.asarray(v, dtype=np.float32) for v in request.query_vectors]
+        else:
+            raise HTTPException(
+                status_code=422,
+                detail="Provide query_vectors, query_vectors_b64 or an Arrow body",
+            )
+        return await run_in_threadpool(batch_response, table, vectors, request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+def batch_response(
+    table,
+    vectors: list[np.ndarray],
+    request: BatchSearchRequest | BatchTextQueryRequest,
+    vector_column: str | None = None,
+):
+    """Run a multi-vector search and group the results per query."""
+    if not vectors:
+        return {"results": [], "count": []}
+
+    query = table.search(np.stack(vectors), vector_column_name=vector_column).limit(
+        request.limit
+    )
+    if request.filter:
+        query = query.where(request.filter, prefilter=request.prefilter)
+
+    columns = projection(table, request)
+    if columns is not None:
+        query = query.select(columns)
+    result = query.to_arrow()
+    if "query_index" not in result.schema.names:
+        # Single query: LanceDB omits the index column
+        result = result.append_column(
+            "query_index", pa.array([0] * result.num_rows, pa.int32())
         )
 
-        return {
-            "results": results,
-            "count": len(results),
-        }
+    if request.format == "arrow":
+        return arrow_response(result)
+
+    grouped: list[list[dict]] = [[] for _ in vectors]
+    for row in rows_to_json(result, request.vector_encoding):
+        grouped[row.pop("query_index")].append(row)
+
+    return {
+        "results": grouped,
+        "count": [len(rows) for rows in grouped],
+    }
+
+
+@app.post("/tables/{table_name}/search/text-query")
+async def text_query_search(table_name: str, request: TextQueryRequest):
+    """Embed query text on the server and perform vector (or hybrid) search.
+
+    Uses the embedding model recorded in _metadata for the table's domain,
+    so clients need neither Ollama access nor the right profile.
+    """
+    try:
+        table = await run_in_threadpool(open_table, table_name)
+        model, vector_column, dims = await run_in_threadpool(
+            text_query_target, table, table_name, request.domain, request.vector_column
+        )
+        vector = truncate_query(await embedder.embed(model, request.query), dims)
+
+        if request.hybrid:
+            query = (
+                table.search(query_type="hybrid", vector_column_name=vector_column)
+                .vector(vector)
+                .text(request.query)
+                .limit(request.limit)
+            )
+        else:
+            query = table.search(vector, vector_column_name=vector_column).limit(
+                request.limit
+            )
+        if request.filter:
+            query = query.where(request.filter, prefilter=request.prefilter)
+
+        response = await run_in_threadpool(search_response, query, table, request)
+        if isinstance(response, dict):
+            response["model"] = model
+        return response
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-@app.get("/tables/{table_name}/rows")
-async def get_rows(table_name: str, limit: int = 50, offset: int = 0):
-    """Get rows from a table (paginated)."""
+@app.post("/tables/{table_name}/search/text-query/batch")
+async def batch_text_query_search(table_name: str, request: BatchTextQueryRequest):
+    """Embed several query texts on the server (one embedding call) and search."""
     try:
-        connection = get_db()
-        if table_name not in connection.table_names():
-            raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
+        table = await run_in_threadpool(open_table, table_name)
+        model, vector_column, dims = await run_in_threadpool(
+            text_query_target, table, table_name, request.domain, request.vector_column
+        )
+        embeddings = await asyncio.gather(
+            *(embedder.embed(model, q) for q in request.queries)
+        )
+        vectors = [truncate_query(e, dims) for e in embeddings]
 
-        table = connection.open_table(table_name)
+        response = await run_in_threadpool(
+            batch_response, table, vectors, request, vector_column
+        )
+        if isinstance(response, dict):
+            response["model"] = model
+        return response
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
-        # Use Arrow for efficient pagination
-        arrow_table = table.to_arrow()
-        total = arrow_table.num_rows
 
-        # Slice for pagination
-        sliced = arrow_table.slice(offset, limit)
-        rows = sliced.to_pylist()
+@app.get("/embedder")
+async def embedder_stats():
+    """Server-side embedder status and batching counters."""
+    return {
+        "ollama_host": embedder.host,
+        "text_model": embedding_model("text"),
+        "code_model": embedding_model("code"),
+        "warm_models": embedder.warm_models,
+        "batches": embedder.batches,
+        "texts": embedder.texts,
+    }
 
-        return {
-            "rows": rows,
-            "total": total,
-            "offset": offset,
-            "limit": limit,
-        }
+
+MAX_PAGE_ROWS = int(os.environ.get("MAX_PAGE_ROWS", "10000"))
+
+
+def parse_cursor(cursor: str) -> tuple[int, int]:
+    """Split a ``version:rowid`` cursor."""
+    try:
+        version, row_id = (int(part) for part in cursor.split(":"))
+    except ValueError:
+        raise HTTPException(
+            status_code=400, detail="cursor must be a next_cursor value (version:rowid)"
+        ) from None
+    return version, row_id
+
+
+def checkout_version(table, version: int) -> None:
+    """Pin a table to the version a cursor was issued for.
+
+    Row ids are only stable within one version: compaction
+    (``table.optimize()``) rewrites fragments and renumbers rows. Old
+    versions stay readable until they are cleaned up, after which the
+    cursor has expired.
+    """
+    try:
+        table.checkout(version)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=410,
+            detail=f"Table version {version} of this cursor no longer exists; restart paging",
+        ) from e
+
+
+def page_query(table, filter: str | None, after_row_id: int | None, offset: int | None):
+    """Build a scan for one page of rows.
+
+    Cursor pages continue after the last returned ``_rowid``. LanceDB checks
+    the ``_rowid > cursor`` predicate on row ids alone and then reads only
+    the page's rows, so no column data of earlier rows or fragments is read
+    however deep the page is.
+    """
+    clauses = []
+    if after_row_id is not None:
+        clauses.append(f"_rowid > {after_row_id}")
+    if filter:
+        clauses.append(f"({filter})")
+
+    query = table.search()
+    if clauses:
+        query = query.where(" AND ".join(clauses))
+    return query.offset(offset) if offset is not None else query.with_row_id(True)
+
+
+def page_end(query, limit: int) -> int | None:
+    """``_rowid`` of the last row of a full page (None on the last page).
+
+    Reads row ids only, so streamed pages can send the next cursor in a
+    header before any of their rows are read.
+    """
+    row_ids = query.select(["_rowid"]).limit(limit).to_arrow().column("_rowid")
+    return row_ids[-1].as_py() if len(row_ids) == limit else None
+
+
+def ndjson_stream(query, vector_encoding: str):
+    """Yield a page as newline-delimited JSON, one record batch at a time."""
+    for batch in query.to_batches():
+        rows = rows_to_json(pa.Table.from_batches([batch]), vector_encoding)
+        yield "".join(json.dumps(row, default=str) + "\n" for row in rows)
+
+
+def arrow_stream(query):
+    """Yield a page as an Arrow IPC stream, one record batch per chunk."""
+    reader = query.to_batches()
+    buffer = io.BytesIO()
+    with pa.ipc.new_stream(buffer, reader.schema) as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()  # End-of-stream marker
+
+
+@app.get("/tables/{table_name}/rows")
+async def get_rows(
+    table_name: str,
+    limit: int = 50,
+    cursor: str | None = None,
+    offset: int | None = None,
+    columns: str | None = None,
+    filter: str | None = None,
+    include_vectors: bool = False,
+    vector_encoding: Literal["list", "base64"] = "list",
+    format: Literal["json", "ndjson", "arrow"] = "json",
+):
+    """Page through a table.
+
+    Pass the ``next_cursor`` of one page as ``cursor`` to get the next;
+    it is null on the last page. Rows carry their ``_rowid``. ``offset``
+    selects the older offset pagination, whose cost grows with the offset.
+
+    A cursor is ``version:rowid``: later pages read the table version the
+    first page was taken from, so writes and compaction between pages
+    neither skip nor repeat rows (they show up in the next full pass).
+    Once that version has been cleaned up the cursor expires with 410.
+    Streaming formats (``ndjson``, ``arrow``) return the next cursor in the
+    ``X-Next-Cursor`` header.
+    """
+    if not 0 < limit <= MAX_PAGE_ROWS:
+        raise HTTPException(
+            status_code=400, detail=f"limit must be between 1 and {MAX_PAGE_ROWS}"
+        )
+    if cursor is not None and offset is not None:
+        raise HTTPException(status_code=400, detail="Use either cursor or offset")
+    version, after_row_id = parse_cursor(cursor) if cursor is not None else (None, None)
+
+    def open_page():
+        """Open the table (at the cursor's version) and build the page scan."""
+        table = open_table(table_name)
+        if version is not None:
+            checkout_version(table, version)
+        elif offset is None:
+            # Pin the version so a streamed page and its cursor agree
+            table.checkout(table.version)
+        options = OutputOptions(
+            columns=columns.split(",") if columns else None,
+            include_vectors=include_vectors,
+            vector_encoding=vector_encoding,
+        )
+        query = page_query(table, filter, after_row_id, offset).limit(limit)
+        selected = projection(table, options)
+        if selected is not None:
+            query = query.select(selected)
+        return table, query
+
+    try:
+        table, query = await run_in_threadpool(open_page)
+        if offset is not None:
+            result = await run_in_threadpool(query.to_arrow)
+            return {
+                "rows": rows_to_json(result, vector_encoding),
+                "total": await run_in_threadpool(table.count_rows, filter),
+                "offset": offset,
+                "limit": limit,
+            }
+
+        version = table.version
+
+        if format == "json":
+            result = await run_in_threadpool(query.to_arrow)
+            next_cursor = None
+            if result.num_rows == limit:
+                next_cursor = f"{version}:{result.column('_rowid')[-1].as_py()}"
+            return {
+                "rows": rows_to_json(result, vector_encoding),
+                "next_cursor": next_cursor,
+                "limit": limit,
+            }
+
+        # Streamed pages are read batch by batch (in the threadpool) as
+        # the response is sent; the cursor comes from a row-id-only scan
+        last_row_id = await run_in_threadpool(
+            page_end, page_query(table, filter, after_row_id, None), limit
+        )
+        headers = {"X-Next-Cursor": f"{version}:{last_row_id}" if last_row_id is not None else ""}
+        if format == "ndjson":
+            return StreamingResponse(
+                ndjson_stream(query, vector_encoding),
+                media_type="application/x-ndjson",
+                headers=headers,
+            )
+        return StreamingResponse(arrow_stream(query), media_type=ARROW_STREAM, headers=headers)
     except HTTPException:
         raise
     except Exception as e:
@@ -252,7 +886,7 @@ async def get_metadata():
             return {"metadata": {}}
 
         table = connection.open_table("_metadata")
-        rows = table.to_pandas()
+        rows = await run_in_threadpool(table.to_pandas)
         metadata = dict(zip(rows["key"], rows["value"], strict=False))
 
         return {"metadata": metadata}
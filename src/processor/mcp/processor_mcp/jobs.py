@@ -0,0 +1,207 @@
+"""Background processing jobs for processor-mcp.
+
+``process_documents`` blocks the calling agent for the whole run and loses
+the work if the tool call times out. ``start_processing`` instead submits
+a job to the ``JobManager`` and returns its id at once:
+
+- Each job runs as an asyncio task on the server's event loop, so
+  ``cancel_job`` cancels it at its next await (between files or batches).
+  The pipeline's blocking steps (scanning, chunking, table writes and
+  index builds) run in worker threads, so status and cancel calls are
+  answered while they run.
+- At most ``max_concurrent`` jobs run at once; jobs writing the same
+  database queue behind each other (they share its incremental state)
+- Progress counters (files, chunks, embedded, loaded) are written to
+  ``<jobs_dir>/<job_id>.json`` on every state change and at most every
+  ``flush_interval`` seconds while running, so ``job_status`` survives
+  a server restart. Jobs that were queued or running when the server
+  stopped are reported as ``interrupted``.
+"""
+
+import asyncio
+import contextlib
+import json
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+from processor.types import PipelineProgress
+
+JobState = Literal["queued", "running", "completed", "failed", "cancelled", "interrupted"]
+
+# Work of a job: receives a progress callback, returns the pipeline result
+JobWork = Callable[[Callable[[PipelineProgress], None]], Awaitable[dict[str, Any]]]
+
+FINISHED_STATES = ("completed", "failed", "cancelled", "interrupted")
+
+
+class JobStatus(BaseModel):
+    """Persisted state of a processing job."""
+
+    job_id: str
+    state: JobState = "queued"
+    request: dict[str, Any] = Field(default_factory=dict, description="Job input")
+    progress: dict[str, Any] = Field(
+        default_factory=lambda: asdict(PipelineProgress()),
+        description="Pipeline stage and counters",
+    )
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    created_at: str = Field(default_factory=lambda: datetime.now().isoformat())
+    started_at: str | None = None
+    finished_at: str | None = None
+
+
+class JobManager:
+    """Runs, tracks and persists background processing jobs."""
+
+    def __init__(
+        self,
+        jobs_dir: Path,
+        max_concurrent: int = 2,
+        flush_interval: float = 1.0,
+        keep_finished: int = 100,
+    ):
+        """Initialize the manager and restore persisted jobs.
+
+        Args:
+            jobs_dir: Directory of job records
+            max_concurrent: Jobs running at once
+            flush_interval: Minimum seconds between progress writes of a job
+            keep_finished: Finished job records kept on disk (oldest dropped)
+        """
+        self.jobs_dir = Path(jobs_dir)
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        self.max_concurrent = max(max_concurrent, 1)
+        self.flush_interval = flush_interval
+        self.jobs: dict[str, JobStatus] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._flushed_at: dict[str, float] = {}
+        self._slots: asyncio.Semaphore | None = None
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._restore(keep_finished)
+
+    def _path(self, job_id: str) -> Path:
+        """Record file of a job."""
+        return self.jobs_dir / f"{job_id}.json"
+
+    def _save(self, job: JobStatus) -> None:
+        """Write a job record atomically."""
+        path = self._path(job.job_id)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(job.model_dump_json(indent=2))
+        tmp.replace(path)
+        self._flushed_at[job.job_id] = time.monotonic()
+
+    def _restore(self, keep_finished: int) -> None:
+        """Load job records; mark jobs left unfinished by a previous server as interrupted."""
+        records = []
+        for path in self.jobs_dir.glob("*.json"):
+            try:
+                records.append(JobStatus(**json.loads(path.read_text())))
+            except (OSError, ValueError, TypeError):
+                continue
+        records.sort(key=lambda job: job.created_at)
+
+        cut = max(len(records) - keep_finished, 0)
+        for job in records[:cut]:
+            self._path(job.job_id).unlink(missing_ok=True)
+        for job in records[cut:]:
+            if job.state not in FINISHED_STATES:
+                job.state = "interrupted"
+                job.error = "Server stopped before the job finished"
+                job.finished_at = datetime.now().isoformat()
+                self._save(job)
+            self.jobs[job.job_id] = job
+
+    def submit(self, request: dict[str, Any], work: JobWork, lock_key: str) -> JobStatus:
+        """Queue a job and return its initial status.
+
+        Must be called from the event loop the job should run on.
+
+        Args:
+            request: Job input (stored in the record)
+            work: Coroutine function running the pipeline
+            lock_key: Jobs with the same key never run at the same time
+
+        Returns:
+            Status of the queued job
+        """
+        job = JobStatus(job_id=uuid.uuid4().hex[:12], request=request)
+        self.jobs[job.job_id] = job
+        self._save(job)
+        self._tasks[job.job_id] = asyncio.create_task(self._run(job, work, lock_key))
+        return job
+
+    async def _run(self, job: JobStatus, work: JobWork, lock_key: str) -> None:
+        """Wait for the job's database and a free slot, then run it."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrent)
+        lock = self._locks.setdefault(lock_key, asyncio.Lock())
+
+        def on_progress(progress: PipelineProgress) -> None:
+            job.progress = asdict(progress)
+            if time.monotonic() - self._flushed_at.get(job.job_id, 0.0) >= self.flush_interval:
+                self._save(job)
+
+        try:
+            async with lock, self._slots:
+                job.state = "running"
+                job.started_at = datetime.now().isoformat()
+                self._save(job)
+                job.result = await work(on_progress)
+            job.state = "completed"
+        except asyncio.CancelledError:
+            job.state = "cancelled"
+        except Exception as e:
+            job.state = "failed"
+            job.error = f"{type(e).__name__}: {e}"
+        finally:
+            job.finished_at = datetime.now().isoformat()
+            self._save(job)
+            self._tasks.pop(job.job_id, None)
+
+    def status(self, job_id: str) -> JobStatus:
+        """Get the status of a job.
+
+        Raises:
+            ValueError: If the job is unknown
+        """
+        if job_id not in self.jobs:
+            raise ValueError(f"Unknown job: {job_id}")
+        return self.jobs[job_id]
+
+    def list_jobs(self) -> list[JobStatus]:
+        """All known jobs, newest first."""
+        return sorted(self.jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    async def cancel(self, job_id: str, timeout: float = 10.0) -> JobStatus:
+        """Cancel a queued or running job and wait for it to stop.
+
+        Finished jobs are returned unchanged.
+
+        Args:
+            job_id: Job to cancel
+            timeout: Seconds to wait for the job to reach its next await
+
+        Raises:
+            ValueError: If the job is unknown
+        """
+        job = self.status(job_id)
+        task = self._tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.shield(task), timeout)
+        return job
+
+    async def shutdown(self) -> None:
+        """Cancel all unfinished jobs."""
+        for job_id in list(self._tasks):
+            await self.cancel(job_id)
@@ -0,0 +1,106 @@
+"""Shared embedder pool for processor-mcp.
+
+Every processing run used to build its own embedders, so two jobs against
+the same Ollama server each opened an HTTP client and sent full-corpus
+batches at once, and two transformers jobs each loaded the model onto the
+GPU. The server instead keeps:
+
+- One embedder per (backend, model, host or device, event loop), reused
+  across jobs and closed only by ``close_pools``
+- One request limit per host or device (``embedding.max_concurrent``),
+  shared by every model on it, so concurrent jobs take turns batch by batch
+
+Pools are module-level, matching the rag-mcp resource pools.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import Callable
+
+from processor.embedders.base import BaseEmbedder
+
+# Global pools (lazy populated)
+_embedders: dict[tuple[str, str, str, int], BaseEmbedder] = {}
+_limits: dict[tuple[str, int], asyncio.Semaphore] = {}
+
+
+class PooledEmbedder(BaseEmbedder):
+    """Shared embedder whose requests wait for a slot on their endpoint.
+
+    ``close`` is a no-op: the pool owns the underlying embedder.
+    """
+
+    def __init__(self, embedder: BaseEmbedder, limit: asyncio.Semaphore):
+        """Wrap a pooled embedder.
+
+        Args:
+            embedder: Embedder shared by all jobs
+            limit: Request slots of the embedder's host or device
+        """
+        self.embedder = embedder
+        self.limit = limit
+        self.model_name = embedder.model_name
+        self.dimensions = embedder.dimensions
+
+    async def embed(self, text: str) -> list[float]:
+        """Generate embedding for a single text."""
+        async with self.limit:
+            return await self.embedder.embed(text)
+
+    async def embed_batch(
+        self,
+        texts: list[str],
+        batch_size: int = 32,
+    ) -> list[list[float]]:
+        """Generate embeddings for multiple texts (one slot for the whole call)."""
+        async with self.limit:
+            return await self.embedder.embed_batch(texts, batch_size=batch_size)
+
+    async def is_available(self) -> bool:
+        """Check if the pooled embedder is available."""
+        return await self.embedder.is_available()
+
+    async def close(self) -> None:
+        """Leave the pooled embedder open for other jobs."""
+
+
+def embedder_pool(max_concurrent: int) -> Callable[..., BaseEmbedder]:
+    """Build a ``Pipeline`` embedder source backed by the shared pool.
+
+    Args:
+        max_concurrent: Request slots per host or device (first caller wins)
+
+    Returns:
+        Callable taking (key, create) and returning a PooledEmbedder
+    """
+
+    def get(key: tuple[str, str, str], create: Callable[[], BaseEmbedder]) -> BaseEmbedder:
+        # Ollama embedders hold an httpx.AsyncClient bound to the running loop
+        loop_id = id(asyncio.get_running_loop())
+        backend, model, endpoint = key
+        pool_key = (backend, model, endpoint, loop_id)
+        if pool_key not in _embedders:
+            _embedders[pool_key] = create()
+        limit = _limits.setdefault((endpoint, loop_id), asyncio.Semaphore(max(max_concurrent, 1)))
+        return PooledEmbedder(_embedders[pool_key], limit)
+
+    return get
+
+
+def pool_stats() -> dict[str, int]:
+    """Get the number of pooled embedders and endpoints."""
+    return {"embedders": len(_embedders), "endpoints": len(_limits)}
+
+
+async def close_pools() -> None:
+    """Close pooled embedders and drop them."""
+    for embedder in _embedders.values():
+        with contextlib.suppress(Exception):
+            await embedder.close()
+    reset_pools()
+
+
+def reset_pools() -> None:
+    """Drop all pooled embedders without closing them. Useful for testing."""
+    _embedders.clear()
+    _limits.clear()
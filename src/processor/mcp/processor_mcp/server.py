@@ -2,6 +2,7 @@
 
 This server exposes tools for:
 - Processing files/directories into LanceDB vector database
+- Running processing as background jobs (start, status, cancel)
 - Checking embedding service availability
 - Managing embedding model setup
 - Database statistics and export/import
@@ -10,15 +11,40 @@ Usage:
     uv run processor-mcp
 """
 
+import shutil
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field
 
+from .jobs import JobManager, JobStatus
+
+if TYPE_CHECKING:
+    from processor.config import ProcessorConfig
+    from processor.pipeline.processor import Pipeline
+    from processor.types import PipelineProgress
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Cancel unfinished jobs and close pooled embedders when the server stops."""
+    try:
+        yield
+    finally:
+        from .pool import close_pools
+
+        if _job_manager is not None:
+            await _job_manager.shutdown()
+        await close_pools()
+
+
 # Initialize MCP server
 mcp = FastMCP(
     name="processor-mcp",
+    lifespan=lifespan,
     instructions="""
 Document Processing MCP Server
 
@@ -31,7 +57,10 @@ Before processing, ensure:
 Workflow:
 1. check_services - Verify backends are available
 2. setup_models - Download embedding models if needed
-3. process_documents - Process files into LanceDB
+3. start_processing - Process files into LanceDB in the background (returns a job id)
+   - job_status - Poll stage and counters (files, chunks, embedded, loaded)
+   - cancel_job - Stop a queued or running job
+   (process_documents does the same but blocks until done; use it for small inputs)
 4. get_db_stats - Verify results
 
 Key concepts:
@@ -40,10 +69,15 @@ Key concepts:
   - text: low (0.6B), medium (4B), high (8B)
   - code: low (0.5B), high (1.5B)
 - Table modes: 'separate' (text/code/image tables), 'unified' (single table), 'both'
-- Incremental: Skip unchanged files (default True)
+- Incremental: Skip unchanged files (default True); state is kept per output database
+- Jobs: run concurrently on different databases, queue on the same one, and share
+  embedders so they take turns on the Ollama server
 """
 )
 
+# Job manager (created on first use, from the processor config)
+_job_manager: JobManager | None = None
+
 
 # =============================================================================
 # Tool Input/Output Models
@@ -116,6 +150,84 @@ class SetupResult(BaseModel):
     results: dict[str, dict]
 
 
+# =============================================================================
+# Pipeline Helpers
+# =============================================================================
+
+
+def _state_path(configured: Path, default: Path, output_db: Path) -> Path:
+    """Where a job keeps one of its incremental state files.
+
+    A path set in the config file is kept. Otherwise the file lives inside
+    the output database; one left at the default path by earlier runs is
+    copied there first, so the next incremental run picks up where it left off.
+    """
+    if configured != default:
+        return configured
+    path = output_db / default.name
+    if not path.exists() and configured.is_file():
+        shutil.copy2(configured, path)
+    return path
+
+
+def _pipeline_config(input: ProcessInput) -> "ProcessorConfig":
+    """Processor config for a processing request.
+
+    Unless configured otherwise, incremental state and the corpus manifest
+    live inside the output database, so runs against different databases
+    never share them.
+    """
+    from processor.config import ProcessingConfig, load_config
+
+    output_db = Path(input.output_db)
+    output_db.mkdir(parents=True, exist_ok=True)
+    config = load_config().merge_cli_args(
+        output=input.output_db,
+        embedder=input.embedder,
+        text_profile=input.text_profile,
+        code_profile=input.code_profile,
+        table_mode=input.table_mode,
+        batch_size=input.batch_size,
+        incremental=input.incremental,
+    )
+    defaults = ProcessingConfig()
+    processing = config.processing
+    processing.state_file = _state_path(processing.state_file, defaults.state_file, output_db)
+    processing.manifest_file = _state_path(
+        processing.manifest_file, defaults.manifest_file, output_db
+    )
+    return config
+
+
+def _create_pipeline(
+    config: "ProcessorConfig",
+    on_progress: Callable[["PipelineProgress"], None] | None = None,
+) -> "Pipeline":
+    """Pipeline drawing its text/code embedders from the shared pool."""
+    from processor.pipeline.processor import Pipeline
+
+    from .pool import embedder_pool
+
+    return Pipeline(
+        config,
+        embedder_pool=embedder_pool(config.embedding.max_concurrent),
+        on_progress=on_progress,
+    )
+
+
+def get_job_manager() -> JobManager:
+    """Get the server's job manager."""
+    global _job_manager
+    if _job_manager is None:
+        from processor.config import load_config
+
+        processing = load_config().processing
+        _job_manager = JobManager(
+            processing.jobs_dir, max_concurrent=processing.max_concurrent_jobs
+        )
+    return _job_manager
+
+
 # =============================================================================
 # Tools
 # =============================================================================
@@ -141,24 +253,12 @@ async def process_documents(input: ProcessInput) -> ProcessResult:
     Example:
         process_documents(input_path="./my-codebase", output_db="./db", content_type="code")
     """
-    from processor.config import load_config
-    from processor.pipeline.processor import Pipeline
-
-    # Load and configure
-    config = load_config()
-    config = config.merge_cli_args(
-        output=input.output_db,
-        embedder=input.embedder,
-        text_profile=input.text_profile,
-        code_profile=input.code_profile,
-        table_mode=input.table_mode,
-        batch_size=input.batch_size,
-        incremental=input.incremental,
-    )
-
     # Run pipeline
-    pipeline = Pipeline(config)
-    result = await pipeline.process(Path(input.input_path), content_type=input.content_type)
+    pipeline = _create_pipeline(_pipeline_config(input))
+    try:
+        result = await pipeline.process(Path(input.input_path), content_type=input.content_type)
+    finally:
+        await pipeline.close()
 
     return ProcessResult(
         files_processed=result.get("files_processed", 0),
@@ -169,6 +269,78 @@ async def process_documents(input: ProcessInput) -> ProcessResult:
     )
 
 
+@mcp.tool()
+async def start_processing(input: ProcessInput) -> JobStatus:
+    """Start processing documents in the background and return a job id at once.
+
+    Runs the same pipeline as process_documents without blocking. Poll
+    job_status for progress; the job keeps running if a tool call times
+    out. Jobs on the same output_db run one after another.
+
+    Args:
+        input: Processing configuration
+
+    Returns:
+        Status of the queued job (use its job_id with job_status/cancel_job)
+
+    Example:
+        start_processing(input_path="./papers", output_db="./db")
+    """
+    input_path = Path(input.input_path)
+    if not input_path.exists():
+        raise ValueError(f"Input not found at {input.input_path}")
+    config = _pipeline_config(input)
+
+    async def work(on_progress: Callable[["PipelineProgress"], None]) -> dict:
+        pipeline = _create_pipeline(config, on_progress)
+        try:
+            return await pipeline.process(input_path, content_type=input.content_type)
+        finally:
+            await pipeline.close()
+
+    lock_key = str(Path(input.output_db).resolve())
+    return get_job_manager().submit(input.model_dump(), work, lock_key)
+
+
+@mcp.tool()
+async def job_status(job_id: str | None = None) -> list[JobStatus]:
+    """Get the state and progress of processing jobs.
+
+    Progress holds the pipeline stage (scanning, chunking, embedding,
+    loading, images, done) and counters: files_total, files_processed,
+    chunks_created, chunks_embedded, chunks_loaded, images_total,
+    images_embedded, images_loaded, errors. Job records persist across
+    server restarts.
+
+    Args:
+        job_id: Job to inspect (None = all jobs, newest first)
+
+    Returns:
+        Job statuses (result holds process_documents-style totals when completed)
+    """
+    manager = get_job_manager()
+    if job_id is None:
+        return manager.list_jobs()
+    return [manager.status(job_id)]
+
+
+@mcp.tool()
+async def cancel_job(job_id: str) -> JobStatus:
+    """Cancel a queued or running processing job.
+
+    The job stops at its next file or embedding batch. Chunks not yet
+    loaded are discarded; incremental state is only saved by completed
+    runs, so the next run reprocesses the same files.
+
+    Args:
+        job_id: Job to cancel
+
+    Returns:
+        Final status of the job
+    """
+    return await get_job_manager().cancel(job_id)
+
+
 @mcp.tool()
 async def check_services(ollama_host: str = "http://localhost:11434") -> ServiceStatus:
     """Check availability of embedding backends.
@@ -0,0 +1,267 @@
+"""Tests for processor-mcp background jobs and the shared embedder pool."""
+
+import asyncio
+import json
+import threading
+from pathlib import Path
+
+import lancedb
+import pytest
+
+from processor.embedders.base import BaseEmbedder
+from processor.pipeline import processor as pipeline_module
+from processor.pipeline.processor import Pipeline
+from processor.types import PipelineProgress
+from processor_mcp import server
+from processor_mcp.jobs import JobManager, JobStatus
+from processor_mcp.pool import embedder_pool, pool_stats, reset_pools
+from processor_mcp.server import ProcessInput, cancel_job, job_status, start_processing
+
+
+class FakeEmbedder(BaseEmbedder):
+    """Embedder stand-in counting its requests."""
+
+    def __init__(self, dimensions: int = 4) -> None:
+        self.model_name = "fake"
+        self.dimensions = dimensions
+        self.requests = 0
+        self.closed = False
+
+    async def embed(self, text: str) -> list[float]:
+        return [1.0] + [0.0] * (self.dimensions - 1)
+
+    async def embed_batch(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
+        self.requests += 1
+        return [await self.embed(t) for t in texts]
+
+    async def is_available(self) -> bool:
+        return True
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+async def wait_for_state(manager: JobManager, job_id: str, *states: str) -> JobStatus:
+    """Poll a job until it reaches one of the given states."""
+    for _ in range(500):
+        job = manager.status(job_id)
+        if job.state in states:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Job {job_id} stuck in {manager.status(job_id).state}")
+
+
+class TestJobManager:
+    """Test job lifecycle, queueing and persistence."""
+
+    async def test_completed_job_persists_progress(self, tmp_path: Path) -> None:
+        """Test a finished job's counters and result are written to disk."""
+        manager = JobManager(tmp_path / "jobs", flush_interval=0)
+
+        async def work(on_progress):
+            on_progress(PipelineProgress(stage="embedding", files_total=2, chunks_embedded=5))
+            return {"files_processed": 2}
+
+        job = manager.submit({"input_path": "x"}, work, lock_key="db")
+        assert job.state == "queued"
+
+        job = await wait_for_state(manager, job.job_id, "completed")
+        record = json.loads((tmp_path / "jobs" / f"{job.job_id}.json").read_text())
+        assert record["state"] == "completed"
+        assert record["progress"]["chunks_embedded"] == 5
+        assert record["result"] == {"files_processed": 2}
+
+    async def test_same_database_queues(self, tmp_path: Path) -> None:
+        """Test jobs on one database run one at a time; others run alongside."""
+        manager = JobManager(tmp_path / "jobs", max_concurrent=2)
+        release = asyncio.Event()
+
+        async def blocked(on_progress):
+            await release.wait()
+            return {}
+
+        first = manager.submit({}, blocked, lock_key="db1")
+        second = manager.submit({}, blocked, lock_key="db1")
+        other = manager.submit({}, blocked, lock_key="db2")
+        await wait_for_state(manager, first.job_id, "running")
+        await wait_for_state(manager, other.job_id, "running")
+        assert manager.status(second.job_id).state == "queued"
+
+        release.set()
+        await wait_for_state(manager, second.job_id, "completed")
+
+    async def test_cancel_and_failure(self, tmp_path: Path) -> None:
+        """Test cancelling a running job and recording a failing one."""
+        manager = JobManager(tmp_path / "jobs")
+
+        async def forever(on_progress):
+            await asyncio.Event().wait()
+
+        async def broken(on_progress):
+            raise RuntimeError("Ollama down")
+
+        running = manager.submit({}, forever, lock_key="a")
+        failing = manager.submit({}, broken, lock_key="b")
+        await wait_for_state(manager, running.job_id, "running")
+
+        assert (await manager.cancel(running.job_id)).state == "cancelled"
+        failed = await wait_for_state(manager, failing.job_id, "failed")
+        assert failed.error == "RuntimeError: Ollama down"
+        with pytest.raises(ValueError, match="Unknown job"):
+            manager.status("missing")
+
+    def test_restore_marks_interrupted(self, tmp_path: Path) -> None:
+        """Test jobs left running by a stopped server are reported as interrupted."""
+        jobs_dir = tmp_path / "jobs"
+        jobs_dir.mkdir()
+        stale = JobStatus(job_id="abc", state="running")
+        (jobs_dir / "abc.json").write_text(stale.model_dump_json())
+
+        manager = JobManager(jobs_dir)
+
+        assert manager.status("abc").state == "interrupted"
+        assert json.loads((jobs_dir / "abc.json").read_text())["state"] == "interrupted"
+
+
+class TestEmbedderPool:
+    """Test embedders are shared and owned by the pool."""
+
+    async def test_shared_across_pipelines(self) -> None:
+        """Test two requests for one model share an embedder that callers cannot close."""
+        reset_pools()
+        get = embedder_pool(max_concurrent=1)
+        created = []
+
+        def create() -> FakeEmbedder:
+            created.append(FakeEmbedder())
+            return created[-1]
+
+        first = get(("ollama", "m", "http://h"), create)
+        second = get(("ollama", "m", "http://h"), create)
+        await first.embed_batch(["a"])
+        await second.close()
+
+        assert len(created) == 1
+        assert first.embedder is second.embedder
+        assert first.limit is second.limit
+        assert created[0].requests == 1 and not created[0].closed
+        assert pool_stats() == {"embedders": 1, "endpoints": 1}
+        reset_pools()
+
+
+class TestProcessingTools:
+    """Test start_processing/job_status/cancel_job end to end."""
+
+    @pytest.fixture(autouse=True)
+    def offline(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Use a temporary job manager and fake embedders."""
+        reset_pools()
+        embedder = FakeEmbedder(dimensions=1024)
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(server, "_job_manager", JobManager(tmp_path / "jobs"))
+        monkeypatch.setattr(
+            Pipeline, "_create_backend_embedder", lambda self, profile, backend: embedder
+        )
+        yield embedder
+        reset_pools()
+
+    async def test_background_run(self, tmp_path: Path, offline: FakeEmbedder) -> None:
+        """Test a job processes a corpus while the tool call returns immediately."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        for i in range(3):
+            (docs / f"note{i}.md").write_text(f"# Note {i}\n\nSome text about topic {i}.\n")
+        db = tmp_path / "db"
+
+        job = await start_processing(ProcessInput(input_path=str(docs), output_db=str(db)))
+        manager = server.get_job_manager()
+        done = await wait_for_state(manager, job.job_id, "completed", "failed")
+
+        [status] = await job_status(job.job_id)
+        assert done.error is None
+        assert status.progress["stage"] == "done"
+        assert status.progress["files_processed"] == 3
+        assert status.progress["chunks_embedded"] == status.progress["chunks_created"] > 0
+        assert status.progress["chunks_loaded"] == status.progress["chunks_created"]
+        assert status.result["files_processed"] == 3
+        assert lancedb.connect(str(db)).open_table("text_chunks").count_rows() > 0
+        assert (db / ".processor_state.json").exists()
+        assert not offline.closed  # Pooled embedders outlive the job
+
+    async def test_closed_with_server(self, tmp_path: Path, offline: FakeEmbedder) -> None:
+        """Test the server lifespan cancels unfinished jobs and closes pooled embedders."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "a.md").write_text("# A\n\nText.\n")
+
+        async def forever(on_progress):
+            await asyncio.Event().wait()
+
+        async with server.lifespan(server.mcp):
+            manager = server.get_job_manager()
+            job = await start_processing(
+                ProcessInput(input_path=str(docs), output_db=str(tmp_path / "db"))
+            )
+            await wait_for_state(manager, job.job_id, "completed")
+            running = manager.submit({}, forever, lock_key="other")
+            await wait_for_state(manager, running.job_id, "running")
+
+        assert manager.status(running.job_id).state == "cancelled"
+        assert offline.closed
+        assert pool_stats()["embedders"] == 0
+
+    async def test_responsive_while_scanning(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test status and cancel answer while a blocking scan is in progress."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        scanning, release = threading.Event(), threading.Event()
+        scan_corpus = pipeline_module.scan_corpus
+
+        def slow_scan(*args, **kwargs):
+            scanning.set()
+            release.wait(5)
+            return scan_corpus(*args, **kwargs)
+
+        monkeypatch.setattr(pipeline_module, "scan_corpus", slow_scan)
+        job = await start_processing(ProcessInput(input_path=str(docs)))
+        await asyncio.to_thread(scanning.wait, 5)
+        try:
+            [status] = await job_status(job.job_id)
+            assert status.state == "running" and status.progress["stage"] == "scanning"
+            assert (await cancel_job(job.job_id)).state == "cancelled"
+        finally:
+            release.set()
+
+    def test_state_paths(self, tmp_path: Path) -> None:
+        """Test default state moves into the database and configured paths are kept."""
+        (tmp_path / ".processor_state.json").write_text('{"processed_files": {}}')
+        db = tmp_path / "db"
+
+        config = server._pipeline_config(ProcessInput(input_path="x", output_db=str(db)))
+        (tmp_path / "processor.yaml").write_text(
+            "processing:\n  state_file: custom/state.json\n"
+        )
+        custom = server._pipeline_config(ProcessInput(input_path="x", output_db=str(db)))
+
+        assert config.processing.state_file == db / ".processor_state.json"
+        assert config.processing.state_file.read_text() == '{"processed_files": {}}'
+        assert config.processing.manifest_file == db / ".processor_manifest.json"
+        assert custom.processing.state_file == Path("custom/state.json")
+        assert custom.processing.manifest_file == db / ".processor_manifest.json"
+
+    async def test_cancel_tool(self, tmp_path: Path) -> None:
+        """Test cancel_job on a finished job returns it unchanged."""
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "a.md").write_text("# A\n\nText.\n")
+
+        job = await start_processing(
+            ProcessInput(input_path=str(docs), output_db=str(tmp_path / "db"))
+        )
+        await wait_for_state(server.get_job_manager(), job.job_id, "completed", "failed")
+
+        assert (await cancel_job(job.job_id)).state == "completed"
+        with pytest.raises(ValueError, match="Input not found"):
+            await start_processing(ProcessInput(input_path=str(tmp_path / "missing")))
@@ -0,0 +1,422 @@
+"""Query-embedding and HyDE result caches for the RAG MCP server.
+
+Agents repeat and paraphrase queries constantly. Re-embedding a repeated
+query costs an Ollama round trip, and re-running HyDE costs a full LLM
+generation (200-500ms). This module provides a two-level cache:
+
+1. In-memory LRU (always on when caching is enabled)
+2. Optional on-disk SQLite store with TTL (survives server restarts)
+
+The async lookups used by the server (``aget``/``aput`` and their
+``_many`` forms) answer memory hits inline and run SQLite reads and
+writes in a worker thread, so a slow disk never stalls the event loop.
+
+Two kinds of entries are stored:
+- embedding: (query text, embedding model) -> query vector
+- hyde: (query, HyDE backend, generation model, prompt template) -> document
+
+All keys include a fingerprint of the active RAGConfig, so any config
+change invalidates previously cached results.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from .config import RAGConfig
+
+KINDS = ("embedding", "hyde")
+SQL_BATCH = 500  # Keys per SELECT (SQLite caps bound parameters)
+
+
+def config_fingerprint(config: RAGConfig) -> str:
+    """Compute a stable fingerprint of a RAG configuration.
+
+    Args:
+        config: RAG configuration
+
+    Returns:
+        Short hex digest that changes whenever any config value changes
+    """
+    data = config.model_dump_json()
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+class QueryCache:
+    """Two-level (memory LRU + optional SQLite) cache with hit-rate metrics."""
+
+    def __init__(
+        self,
+        fingerprint: str,
+        max_entries: int = 1024,
+        disk_path: str | None = None,
+        ttl_seconds: float = 86400.0,
+    ):
+        """Initialize cache.
+
+        Args:
+            fingerprint: Config fingerprint mixed into every key
+            max_entries: Maximum entries held in memory (per cache, all kinds)
+            disk_path: SQLite file for the on-disk level (None disables it)
+            ttl_seconds: Time-to-live for on-disk entries
+        """
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self.disk_path = disk_path
+        self.ttl_seconds = ttl_seconds
+
+        self._memory: OrderedDict[str, Any] = OrderedDict()
+        self._db: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()  # Disk access comes from worker threads
+        self._stats = {
+            kind: {"memory_hits": 0, "disk_hits": 0, "misses": 0} for kind in KINDS
+        }
+
+        if disk_path:
+            self._open_disk(Path(disk_path))
+
+    def _open_disk(self, path: Path) -> None:
+        """Open (or create) the on-disk store."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS query_cache ("
+            "key TEXT PRIMARY KEY, kind TEXT, value TEXT, created_at REAL)"
+        )
+        self._db.commit()
+
+    def _key(self, kind: str, parts: tuple[str, ...]) -> str:
+        """Build a cache key from the entry kind and its identifying parts."""
+        raw = json.dumps([self.fingerprint, kind, *parts])
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, kind: str, parts: tuple[str, ...]) -> Any | None:
+        """Look up a cached value (blocking on the disk level, see ``aget``).
+
+        Args:
+            kind: Entry kind ('embedding' or 'hyde')
+            parts: Identifying parts of the entry (query, model, ...)
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        keys = [self._key(kind, parts)]
+        memory = self._from_memory(keys)
+        disk = {} if memory else self._read_disk(keys)
+        return self._record(kind, keys, memory, disk)[0]
+
+    async def aget(self, kind: str, parts: tuple[str, ...]) -> Any | None:
+        """Look up a cached value, reading the disk level in a worker thread."""
+        return (await self.aget_many(kind, [parts]))[0]
+
+    async def aget_many(self, kind: str, parts_list: list[tuple[str, ...]]) -> list[Any | None]:
+        """Look up several values with at most one disk read.
+
+        Args:
+            kind: Entry kind ('embedding' or 'hyde')
+            parts_list: Identifying parts of each entry
+
+        Returns:
+            Cached value (or None on a miss) per entry, in input order
+        """
+        keys = [self._key(kind, parts) for parts in parts_list]
+        memory = self._from_memory(keys)
+        missing = [key for key in keys if key not in memory]
+        disk = {}
+        if missing and self._db is not None:
+            disk = await asyncio.to_thread(self._read_disk, missing)
+        return self._record(kind, keys, memory, disk)
+
+    def put(self, kind: str, parts: tuple[str, ...], value: Any) -> None:
+        """Store a value in both cache levels (blocking on the disk level, see ``aput``).
+
+        Args:
+            kind: Entry kind ('embedding' or 'hyde')
+            parts: Identifying parts of the entry (query, model, ...)
+            value: JSON-serialisable value to cache
+        """
+        self._write_disk(self._store(kind, [(parts, value)]))
+
+    async def aput(self, kind: str, parts: tuple[str, ...], value: Any) -> None:
+        """Store a value, writing the disk level in a worker thread."""
+        await self.aput_many(kind, [(parts, value)])
+
+    async def aput_many(self, kind: str, items: list[tuple[tuple[str, ...], Any]]) -> None:
+        """Store several values with one disk write.
+
+        Args:
+            kind: Entry kind ('embedding' or 'hyde')
+            items: (parts, JSON-serialisable value) per entry
+        """
+        rows = self._store(kind, items)
+        if rows and self._db is not None:
+            await asyncio.to_thread(self._write_disk, rows)
+
+    def _from_memory(self, keys: list[str]) -> dict[str, Any]:
+        """Values of keys held in memory, refreshing their LRU position."""
+        found: dict[str, Any] = {}
+        for key in keys:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                found[key] = self._memory[key]
+        return found
+
+    def _record(
+        self, kind: str, keys: list[str], memory: dict[str, Any], disk: dict[str, Any]
+    ) -> list[Any | None]:
+        """Count hits and misses and promote disk hits into memory."""
+        values: list[Any | None] = []
+        for key in keys:
+            if key in memory:
+                self._stats[kind]["memory_hits"] += 1
+                values.append(memory[key])
+            elif key in disk:
+                self._remember(key, disk[key])
+                self._stats[kind]["disk_hits"] += 1
+                values.append(disk[key])
+            else:
+                self._stats[kind]["misses"] += 1
+                values.append(None)
+        return values
+
+    def _store(self, kind: str, items: list[tuple[tuple[str, ...], Any]]) -> list[tuple]:
+        """Remember values in memory and build their disk rows."""
+        now = time.time()
+        rows = []
+        for parts, value in items:
+            key = self._key(kind, parts)
+            self._remember(key, value)
+            rows.append((key, kind, json.dumps(value), now))
+        return rows
+
+    def _read_disk(self, keys: list[str]) -> dict[str, Any]:
+        """Unexpired disk values of keys; expired rows are deleted."""
+        found: dict[str, Any] = {}
+        with self._db_lock:
+            if self._db is None:
+                return found
+            unique = list(dict.fromkeys(keys))
+            expired = []
+            for start in range(0, len(unique), SQL_BATCH):
+                batch = unique[start:start + SQL_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._db.execute(
+                    "SELECT key, value, created_at FROM query_cache "
+                    f"WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+                for key, value_json, created_at in rows:
+                    if time.time() - created_at <= self.ttl_seconds:
+                        found[key] = json.loads(value_json)
+                    else:
+                        expired.append((key,))
+            if expired:
+                self._db.executemany("DELETE FROM query_cache WHERE key = ?", expired)
+                self._db.commit()
+        return found
+
+    def _write_disk(self, rows: list[tuple]) -> None:
+        """Insert or replace disk rows."""
+        with self._db_lock:
+            if self._db is None:
+                return
+            self._db.executemany("INSERT OR REPLACE INTO query_cache VALUES (?, ?, ?, ?)", rows)
+            self._db.commit()
+
+    def _remember(self, key: str, value: Any) -> None:
+        """Insert into the memory LRU, evicting the oldest entry if full."""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get hit/miss counters and hit rate per entry kind."""
+        result: dict[str, dict[str, Any]] = {}
+        for kind, counts in self._stats.items():
+            hits = counts["memory_hits"] + counts["disk_hits"]
+            lookups = hits + counts["misses"]
+            result[kind] = {
+                **counts,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            }
+        return result
+
+    @property
+    def memory_entries(self) -> int:
+        """Number of entries currently held in memory."""
+        return len(self._memory)
+
+    def clear(self) -> None:
+        """Drop all entries from both levels (counters are kept)."""
+        self._memory.clear()
+        with self._db_lock:
+            if self._db is not None:
+                self._db.execute("DELETE FROM query_cache")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the on-disk store."""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+# Global cache (rebuilt when the config fingerprint changes)
+_cache: QueryCache | None = None
+
+
+def get_query_cache(config: RAGConfig) -> QueryCache | None:
+    """Get the process-wide query cache for a configuration.
+
+    A config change produces a new fingerprint, which drops the in-memory
+    level and makes all on-disk entries written under the old config miss.
+
+    Args:
+        config: RAG configuration with cache settings
+
+    Returns:
+        QueryCache instance, or None if caching is disabled
+    """
+    global _cache
+
+    if not config.cache.enabled:
+        return None
+
+    fingerprint = config_fingerprint(config)
+    if _cache is None or _cache.fingerprint != fingerprint:
+        if _cache is not None:
+            _cache.close()
+        _cache = QueryCache(
+            fingerprint=fingerprint,
+            max_entries=config.cache.max_entries,
+            disk_path=config.cache.disk_path or None,
+            ttl_seconds=config.cache.ttl_seconds,
+        )
+    return _cache
+
+
+def _embedding_key(embedder: Any, text: str) -> tuple[str, ...]:
+    """Cache key parts for embedding ``text`` with ``embedder``.
+
+    OpenCLIP models share architecture names across pretrained weight sets,
+    so CLIP embedders are keyed on their ``pretrained`` tag as well.
+    """
+    pretrained = getattr(embedder, "pretrained", None)
+    if pretrained is None:
+        return (text, embedder.model_name)
+    return (text, embedder.model_name, pretrained)
+
+
+async def cached_embed(embedder: Any, text: str, config: RAGConfig) -> list[float]:
+    """Embed a query, reusing a cached vector for (text, model) when available.
+
+    Args:
+        embedder: Embedder with an async embed() method and model_name
+        text: Query text to embed
+        config: RAG configuration
+
+    Returns:
+        Query embedding vector
+    """
+    cache = get_query_cache(config)
+    if cache is None:
+        return await embedder.embed(text)
+
+    parts = _embedding_key(embedder, text)
+    vector = await cache.aget("embedding", parts)
+    if vector is None:
+        vector = await embedder.embed(text)
+        await cache.aput("embedding", parts, vector)
+    return vector
+
+
+async def cached_embed_many(
+    embedder: Any,
+    texts: list[str],
+    config: RAGConfig,
+) -> list[list[float]]:
+    """Embed several queries, sending only cache misses to the embedder.
+
+    Misses are embedded together in one ``embed_texts`` call when the
+    embedder supports it.
+
+    Args:
+        embedder: Embedder with embed_texts() (or embed()) and model_name
+        texts: Query texts to embed
+        config: RAG configuration
+
+    Returns:
+        Query embedding vectors in input order
+    """
+    cache = get_query_cache(config)
+    vectors: list[list[float] | None] = [None] * len(texts)
+
+    if cache is not None:
+        vectors = await cache.aget_many(
+            "embedding", [_embedding_key(embedder, text) for text in texts]
+        )
+
+    missing = [i for i, v in enumerate(vectors) if v is None]
+    if missing:
+        miss_texts = [texts[i] for i in missing]
+        if hasattr(embedder, "embed_texts"):
+            new_vectors = await embedder.embed_texts(miss_texts)
+        else:
+            new_vectors = [await embedder.embed(t) for t in miss_texts]
+
+        for i, vector in zip(missing, new_vectors, strict=True):
+            vectors[i] = vector
+        if cache is not None:
+            await cache.aput_many(
+                "embedding",
+                [(_embedding_key(embedder, texts[i]), vectors[i]) for i in missing],
+            )
+
+    return [v for v in vectors if v is not None]
+
+
+async def cached_hyde_transform(query: str, config: RAGConfig) -> str:
+    """Run HyDE, reusing a cached hypothetical document when available.
+
+    Failed generations fall back to the original query inside
+    hyde_transform; those results are not cached.
+
+    Args:
+        query: Original user query
+        config: RAG configuration with HyDE settings
+
+    Returns:
+        Hypothetical document text to embed instead of the query
+    """
+    from .optimizations.hyde import hyde_transform
+
+    cache = get_query_cache(config)
+    if cache is None:
+        return await hyde_transform(query, config)
+
+    backend = config.hyde.backend.lower()
+    model = config.hyde.ollama_model if backend == "ollama" else config.hyde.claude_model
+    parts = (query, backend, model, config.hyde.prompt_template)
+
+    document = await cache.aget("hyde", parts)
+    if document is None:
+        document = await hyde_transform(query, config)
+        if document != query:
+            await cache.aput("hyde", parts, document)
+    return document
+
+
+def reset_query_cache() -> None:
+    """Drop the global cache. Useful for testing."""
+    global _cache
+    if _cache is not None:
+        _cache.close()
+    _cache = None
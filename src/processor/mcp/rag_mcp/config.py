@@ -4,6 +4,7 @@ Provides configuration schema for the RAG MCP server, including
 settings for retrieval-time optimizations like HyDE and reranking.
 """
 
+import json
 from pathlib import Path
 
 import yaml
@@ -60,6 +61,24 @@ class RerankerConfig(BaseModel):
     top_k: int = Field(default=20, description="Retrieve this many candidates")
     top_n: int = Field(default=5, description="Return this many after reranking")
     device: str = Field(default="auto", description="Device for inference (auto/cuda/cpu)")
+    backend: str = Field(
+        default="torch",
+        description="Inference backend: torch, or onnx (CPU, optionally quantized)",
+    )
+    onnx_file: str = Field(
+        default="onnx/model_qint8_avx512_vnni.onnx",
+        description="ONNX file inside the model repo (onnx backend; empty exports model.onnx)",
+    )
+    batch_window_ms: float = Field(
+        default=5.0,
+        description="Time the worker waits to coalesce pairs from concurrent searches",
+    )
+    max_batch_size: int = Field(
+        default=64, description="Maximum (query, document) pairs per model call"
+    )
+    score_cache_size: int = Field(
+        default=4096, description="Cached (query, content_hash) scores (0 disables)"
+    )
 
 
 class QueryExpansionConfig(BaseModel):
@@ -91,6 +110,47 @@ class QueryExpansionConfig(BaseModel):
     )
 
 
+class CacheConfig(BaseModel):
+    """Query-embedding and HyDE result cache configuration.
+
+    Repeated queries reuse their embedding and hypothetical document
+    instead of calling the embedder or the HyDE backend again. The
+    in-memory LRU is always used when enabled; the on-disk store is
+    optional and survives server restarts.
+    """
+
+    enabled: bool = Field(default=True, description="Enable query caching")
+    max_entries: int = Field(default=1024, description="Max in-memory entries")
+    disk_path: str = Field(
+        default="", description="SQLite file for on-disk cache (empty disables)"
+    )
+    ttl_seconds: float = Field(
+        default=86400.0, description="Time-to-live for on-disk entries"
+    )
+
+
+class VectorCacheConfig(BaseModel):
+    """In-memory vector search tier for small and medium tables.
+
+    Hot tables are loaded once into a contiguous float32 matrix (or a
+    memory-mapped copy) and searched exactly with a vectorised dot
+    product, skipping LanceDB's disk path. Tables are reloaded when their
+    dataset version changes.
+    """
+
+    enabled: bool = Field(default=False, description="Enable the in-memory search tier")
+    memory_budget_mb: float = Field(
+        default=512.0, description="Memory for pinned tables (least recently used evicted)"
+    )
+    max_rows: int = Field(default=300_000, description="Never pin tables larger than this")
+    tables: list[str] = Field(
+        default_factory=list, description="Tables eligible for pinning (empty = all)"
+    )
+    mmap_dir: str = Field(
+        default="", description="Directory for memory-mapped matrices (empty = in RAM)"
+    )
+
+
 class RAGConfig(BaseModel):
     """Main RAG MCP configuration.
 
@@ -113,6 +173,13 @@ class RAGConfig(BaseModel):
     ollama_host: str = Field(
         default="http://localhost:11434", description="Ollama server URL"
     )
+    multimodal_profile: str = Field(
+        default="low",
+        description="OpenCLIP profile (low/high) when the database does not record one",
+    )
+    clip_device: str = Field(
+        default="auto", description="Device for the OpenCLIP query encoder (auto/cuda/cpu)"
+    )
 
     # Search defaults
     default_limit: int = Field(default=5, description="Default number of results")
@@ -124,12 +191,20 @@ class RAGConfig(BaseModel):
     hyde: HyDEConfig = Field(default_factory=HyDEConfig)
     reranker: RerankerConfig = Field(default_factory=RerankerConfig)
     query_expansion: QueryExpansionConfig = Field(default_factory=QueryExpansionConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+    vector_cache: VectorCacheConfig = Field(default_factory=VectorCacheConfig)
 
     # Parent expansion
     expand_parents: bool = Field(
         default=False, description="Expand to parent documents by default"
     )
 
+    # Resource pooling
+    table_refresh_interval: float = Field(
+        default=1.0,
+        description="Seconds between dataset version checks for pooled tables",
+    )
+
     @classmethod
     def from_yaml(cls, path: Path) -> "RAGConfig":
         """Load configuration from YAML file.
@@ -165,6 +240,8 @@ default_db_path: "{self.default_db_path}"
 text_profile: "{self.text_profile}"  # low (0.6B), medium (4B), high (8B)
 code_profile: "{self.code_profile}"  # low (0.5B), high (1.5B)
 ollama_host: "{self.ollama_host}"
+multimodal_profile: "{self.multimodal_profile}"  # OpenCLIP for image search (if not in _metadata)
+clip_device: "{self.clip_device}"  # auto, cuda, or cpu
 
 # Default Search Behavior
 default_limit: {self.default_limit}
@@ -193,6 +270,11 @@ reranker:
   top_k: {self.reranker.top_k}  # Retrieve this many candidates
   top_n: {self.reranker.top_n}  # Return this many after reranking
   device: "{self.reranker.device}"  # auto, cuda, or cpu
+  backend: "{self.reranker.backend}"  # torch, or onnx (quantized CPU inference)
+  onnx_file: "{self.reranker.onnx_file}"  # ONNX file in the model repo (onnx backend)
+  batch_window_ms: {self.reranker.batch_window_ms}  # Coalesce concurrent searches
+  max_batch_size: {self.reranker.max_batch_size}  # Pairs per model call
+  score_cache_size: {self.reranker.score_cache_size}  # Cached (query, content) scores
 
 # Query Expansion
 # Expands query with related terms for better recall.
@@ -206,9 +288,33 @@ query_expansion:
   claude_model: "{self.query_expansion.claude_model}"  # haiku, sonnet, opus
   ollama_model: "{self.query_expansion.ollama_model}"  # Ollama model (fallback)
 
+# Query Cache
+# Caches query embeddings and HyDE documents. Entries are invalidated
+# whenever any value in this config changes.
+cache:
+  enabled: {str(self.cache.enabled).lower()}
+  max_entries: {self.cache.max_entries}  # In-memory LRU size
+  disk_path: "{self.cache.disk_path}"  # SQLite file, empty = memory only
+  ttl_seconds: {self.cache.ttl_seconds}  # Expiry for on-disk entries
+
+# In-Memory Vector Tier
+# Pins small/medium tables in memory and answers unfiltered vector searches
+# with an exact dot-product scan. Reloaded when the table changes.
+vector_cache:
+  enabled: {str(self.vector_cache.enabled).lower()}
+  memory_budget_mb: {self.vector_cache.memory_budget_mb}  # LRU tables evicted beyond this
+  max_rows: {self.vector_cache.max_rows}  # Larger tables always use LanceDB
+  tables: {json.dumps(self.vector_cache.tables)}  # Eligible tables, [] = all
+  mmap_dir: "{self.vector_cache.mmap_dir}"  # Memory-map matrices from here (empty = RAM)
+
 # Parent Document Expansion
 # After retrieving chunks, expand to their parent documents.
 expand_parents: {str(self.expand_parents).lower()}
+
+# Resource Pooling
+# Connections, tables and embedders are kept warm between searches.
+# Pooled tables are checked for new dataset versions at most this often.
+table_refresh_interval: {self.table_refresh_interval}  # seconds
 """
         path.write_text(content)
 
@@ -0,0 +1,306 @@
+"""Retrieval quality and latency evaluation for rag-mcp optimizations.
+
+Runs a labelled query set through the ``search`` tool once for every
+combination of optimization flags and reports, per combination:
+
+- recall@k, MRR and nDCG@k against the labelled relevant chunk ids
+- p50/p95/p99 latency of each pipeline stage (setup, hyde, embed,
+  search, rerank, parent_expansion) and of the whole search
+
+Query set format (JSON lines, or a YAML list under ``queries:``)::
+
+    {"query": "how is the index built?", "relevant": ["chunk-id-1", "chunk-id-2"]}
+    {"query": "cache eviction", "relevant": {"chunk-id-3": 2, "chunk-id-4": 1}, "table": "code_chunks"}
+
+``relevant`` is either a list of ids (all grade 1) or a mapping of id to
+graded relevance, used for nDCG. After parent expansion a result also
+counts as a hit for the chunks it was expanded from.
+
+Usage:
+    uv run rag-mcp --evaluate queries.jsonl --db ./lancedb --k 10
+"""
+
+import argparse
+import itertools
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+import yaml
+from pydantic import BaseModel, Field, field_validator
+
+# Flags evaluated by default (every on/off combination is run)
+FLAGS = ("hybrid", "use_hyde", "rerank", "expand_parents")
+
+PERCENTILES = (50, 95, 99)
+
+
+class QueryCase(BaseModel):
+    """A labelled query."""
+
+    query: str
+    relevant: dict[str, float] = Field(description="Relevant chunk id -> relevance grade")
+    table: str | None = Field(default=None, description="Table (default: the runner's)")
+
+    @field_validator("relevant", mode="before")
+    @classmethod
+    def _grades(cls, value):
+        """Accept a plain list of ids as grade-1 labels."""
+        if isinstance(value, list):
+            return dict.fromkeys(value, 1.0)
+        return value
+
+
+class StageLatency(BaseModel):
+    """Latency percentiles of one stage, in milliseconds."""
+
+    p50: float
+    p95: float
+    p99: float
+
+
+class CombinationResult(BaseModel):
+    """Quality and latency of one flag combination."""
+
+    flags: dict[str, bool]
+    recall: float
+    mrr: float
+    ndcg: float
+    latency_ms: dict[str, StageLatency]
+
+
+class EvaluationReport(BaseModel):
+    """Results of all evaluated flag combinations."""
+
+    db_path: str
+    k: int
+    queries: int
+    results: list[CombinationResult]
+
+    def to_markdown(self) -> str:
+        """Render the report as a Markdown table (latency as p50/p95/p99)."""
+        stages = sorted(
+            {stage for r in self.results for stage in r.latency_ms} - {"total"},
+            key=_stage_order,
+        )
+        header = [
+            "flags",
+            f"recall@{self.k}",
+            "MRR",
+            f"nDCG@{self.k}",
+            "total",
+            *stages,
+        ]
+        lines = [
+            "| " + " | ".join(header) + " |",
+            "|" + "---|" * len(header),
+        ]
+        for r in self.results:
+            enabled = "+".join(f for f, on in r.flags.items() if on) or "baseline"
+            cells = [
+                enabled,
+                f"{r.recall:.3f}",
+                f"{r.mrr:.3f}",
+                f"{r.ndcg:.3f}",
+                *(_format_latency(r.latency_ms.get(s)) for s in ["total", *stages]),
+            ]
+            lines.append("| " + " | ".join(cells) + " |")
+        return "\n".join(lines)
+
+
+def _stage_order(stage: str) -> int:
+    """Order stages as they run in the search pipeline."""
+    order = ["setup", "hyde", "embed", "search", "rerank", "parent_expansion"]
+    return order.index(stage) if stage in order else len(order)
+
+
+def _format_latency(latency: StageLatency | None) -> str:
+    """Format stage percentiles as p50/p95/p99."""
+    if latency is None:
+        return "-"
+    return f"{latency.p50:.1f}/{latency.p95:.1f}/{latency.p99:.1f}"
+
+
+def load_query_set(path: Path) -> list[QueryCase]:
+    """Load a labelled query set.
+
+    Args:
+        path: JSON lines file, or YAML file with a ``queries`` list
+
+    Returns:
+        Parsed query cases
+    """
+    path = Path(path)
+    if path.suffix in (".yaml", ".yml"):
+        with open(path) as f:
+            data = yaml.safe_load(f) or {}
+        entries = data.get("queries", []) if isinstance(data, dict) else data
+    else:
+        with open(path) as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+    return [QueryCase.model_validate(entry) for entry in entries]
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+
+def _hits(ranked: list[set[str]], relevant: dict[str, float], k: int) -> list[float]:
+    """Grade of each of the top-k results (ids already credited score 0)."""
+    seen: set[str] = set()
+    grades = []
+    for ids in ranked[:k]:
+        new = (ids & relevant.keys()) - seen
+        seen |= new
+        grades.append(max((relevant[i] for i in new), default=0.0))
+    return grades
+
+
+def recall_at_k(ranked: list[set[str]], relevant: dict[str, float], k: int) -> float:
+    """Fraction of relevant ids found in the top k results."""
+    if not relevant:
+        return 0.0
+    found = set().union(*ranked[:k]) & relevant.keys()
+    return len(found) / len(relevant)
+
+
+def reciprocal_rank(ranked: list[set[str]], relevant: dict[str, float], k: int) -> float:
+    """1 / rank of the first relevant result in the top k (0 if none)."""
+    for rank, ids in enumerate(ranked[:k], start=1):
+        if ids & relevant.keys():
+            return 1.0 / rank
+    return 0.0
+
+
+def ndcg_at_k(ranked: list[set[str]], relevant: dict[str, float], k: int) -> float:
+    """Normalized discounted cumulative gain of the top k results."""
+    dcg = sum(g / math.log2(i + 2) for i, g in enumerate(_hits(ranked, relevant, k)))
+    ideal = sorted(relevant.values(), reverse=True)[:k]
+    idcg = sum(g / math.log2(i + 2) for i, g in enumerate(ideal))
+    return dcg / idcg if idcg > 0 else 0.0
+
+
+def latency_percentiles(values: list[float]) -> StageLatency:
+    """p50/p95/p99 of a list of latencies."""
+    p50, p95, p99 = (float(np.percentile(values, p)) for p in PERCENTILES)
+    return StageLatency(p50=round(p50, 2), p95=round(p95, 2), p99=round(p99, 2))
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+
+def flag_combinations(flags: tuple[str, ...] = FLAGS) -> list[dict[str, bool]]:
+    """Every on/off combination of the given flags, baseline first."""
+    return [
+        dict(zip(flags, values, strict=True))
+        for values in itertools.product([False, True], repeat=len(flags))
+    ]
+
+
+async def evaluate(
+    queries: list[QueryCase],
+    db_path: str = "./lancedb",
+    table: str = "text_chunks",
+    k: int = 10,
+    flags: tuple[str, ...] = FLAGS,
+    repeat: int = 1,
+) -> EvaluationReport:
+    """Run every flag combination over a query set.
+
+    Searches go through the ``search`` tool, so they use the active
+    RAGConfig, the shared pools and the production code path. Query
+    caches and cached rerank scores are cleared before each combination
+    (the reranker model stays loaded); with ``repeat`` > 1 the later runs
+    measure warm-cache latency.
+
+    Args:
+        queries: Labelled queries
+        db_path: LanceDB database path
+        table: Table for queries that do not name one
+        k: Cutoff for recall, MRR and nDCG (also the search limit)
+        flags: SearchInput flags to combine
+        repeat: Times each query is run per combination (for latency)
+
+    Returns:
+        Evaluation report with one result per combination
+    """
+    from .cache import reset_query_cache
+    from .optimizations.reranker import clear_score_cache
+    from .server import SearchInput, search
+
+    results = []
+    for combination in flag_combinations(flags):
+        reset_query_cache()
+        clear_score_cache()
+        recalls, rrs, ndcgs = [], [], []
+        latencies: dict[str, list[float]] = {}
+
+        for case in queries:
+            for _ in range(repeat):
+                response = await search(
+                    SearchInput(
+                        query=case.query,
+                        db_path=db_path,
+                        table=case.table or table,
+                        limit=k,
+                        **combination,
+                    )
+                )
+                latencies.setdefault("total", []).append(response.total_time_ms)
+                for stage, ms in response.stage_times_ms.items():
+                    latencies.setdefault(stage, []).append(ms)
+
+            ranked = [
+                {r.chunk_id, *r.metadata.get("_expanded_from", [])} for r in response.results
+            ]
+            recalls.append(recall_at_k(ranked, case.relevant, k))
+            rrs.append(reciprocal_rank(ranked, case.relevant, k))
+            ndcgs.append(ndcg_at_k(ranked, case.relevant, k))
+
+        results.append(
+            CombinationResult(
+                flags=combination,
+                recall=round(float(np.mean(recalls)), 4) if recalls else 0.0,
+                mrr=round(float(np.mean(rrs)), 4) if rrs else 0.0,
+                ndcg=round(float(np.mean(ndcgs)), 4) if ndcgs else 0.0,
+                latency_ms={s: latency_percentiles(v) for s, v in latencies.items()},
+            )
+        )
+
+    return EvaluationReport(db_path=db_path, k=k, queries=len(queries), results=results)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run an evaluation from the command line (``rag-mcp --evaluate``)."""
+    import asyncio
+
+    parser = argparse.ArgumentParser(prog="rag-mcp --evaluate")
+    parser.add_argument("--evaluate", required=True, type=Path, help="Labelled query set")
+    parser.add_argument("--db", default="./lancedb", help="LanceDB database path")
+    parser.add_argument("--table", default="text_chunks", help="Default table")
+    parser.add_argument("--k", type=int, default=10, help="Metric cutoff / result limit")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per query and combination")
+    parser.add_argument(
+        "--flags", default=",".join(FLAGS), help="Comma-separated SearchInput flags to combine"
+    )
+    parser.add_argument("--output", type=Path, help="Also write the report as JSON")
+    args, _ = parser.parse_known_args(argv)
+
+    report = asyncio.run(
+        evaluate(
+            load_query_set(args.evaluate),
+            db_path=args.db,
+            table=args.table,
+            k=args.k,
+            flags=tuple(f for f in args.flags.split(",") if f),
+            repeat=args.repeat,
+        )
+    )
+    print(report.to_markdown())
+    if args.output:
+        args.output.write_text(report.model_dump_json(indent=2))
+        print(f"\nWrote {args.output}")
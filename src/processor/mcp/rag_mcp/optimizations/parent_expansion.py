@@ -1,4 +1,4 @@
-"""Parent document expansion for context retrieval.
+"""Parent document and sibling chunk expansion for context retrieval.
 
 When chunks are indexed with parent_id references, this module
 expands retrieved chunks to their parent documents. This provides:
@@ -7,16 +7,36 @@ expands retrieved chunks to their parent documents. This provides:
 2. Deduplication when multiple chunks from same parent match
 3. Better results for questions requiring full sections
 
-The expansion process:
-1. Group results by parent_id
-2. Keep the best score per parent
-3. Return deduplicated results sorted by score
+Sibling expansion adds the chunks immediately before and after each hit
+(same source_file, adjacent start_line), which helps when an answer
+spans a chunk boundary.
+
+Both expansions fetch everything they need with a single batched lookup:
+``id IN (...)`` for parents, and for siblings the chunks of each hit's
+file starting within a line window around it (sized from the hit's own
+length), so long files are not read whole. The loader creates scalar
+indexes on id, source_file and parent_id, so these lookups are index
+hits rather than table scans, even on million-row tables.
 
 Latency: +5-20ms (metadata lookup only)
 """
 
+import asyncio
 from typing import Any
 
+from processor.database.search import fetch_rows, in_filter
+
+# Score fields carried over from a matched chunk to its expansion
+_SCORE_FIELDS = ("_distance", "_relevance_score", "_rerank_score", "_rrf_score")
+
+# Columns needed to stitch sibling chunks together
+_SIBLING_COLUMNS = ["id", "content", "source_file", "start_line", "end_line"]
+
+# Lines searched on each side of a hit, per sibling, in multiples of the
+# hit's own length (chunks of one file are sized alike; the slack covers
+# shorter and overlapping neighbours)
+_SIBLING_SPAN = 2
+
 
 async def expand_to_parents(
     results: list[dict],
@@ -24,23 +44,23 @@ async def expand_to_parents(
 ) -> list[dict]:
     """Expand retrieved chunks to their parent documents.
 
-    Deduplicates by parent_id, keeping the best match score per parent.
-    Results without parent_id are kept as-is.
+    Deduplicates by parent_id, keeping the best-ranked match per parent,
+    and replaces it with the parent record when one exists in the table.
+    Results without parent_id (or whose parent is missing) are kept as-is.
 
     Args:
-        results: List of retrieved chunks (with optional parent_id)
-        table: LanceDB table for fetching parents (currently unused,
-               but available for future parent content retrieval)
+        results: Ranked list of retrieved chunks (with optional parent_id)
+        table: LanceDB table for fetching parents
 
     Returns:
-        Deduplicated results representing parent documents
+        Deduplicated results representing parent documents, in rank order
     """
     if not results:
         return []
 
-    # Track best score per parent/document
-    best_scores: dict[str, float] = {}
+    # Keep the best-ranked chunk per parent/document (results are ranked)
     best_docs: dict[str, dict] = {}
+    children: dict[str, list[str]] = {}
 
     for r in results:
         parent_id = r.get("parent_id")
@@ -49,20 +69,31 @@ async def expand_to_parents(
         if not doc_id:
             continue
 
-        # Use distance (lower is better) or relevance score (higher is better)
-        distance = r.get("_distance", float("inf"))
-
-        # Keep document with lowest distance (best match)
-        if doc_id not in best_scores or distance < best_scores[doc_id]:
-            best_scores[doc_id] = distance
+        if doc_id not in best_docs:
             best_docs[doc_id] = r.copy()
+        children.setdefault(doc_id, []).append(r.get("id", ""))
+
+    parent_ids = [r["parent_id"] for r in best_docs.values() if r.get("parent_id")]
+    parents = {
+        row["id"]: row
+        for row in await asyncio.to_thread(fetch_rows, table, "id", parent_ids)
+    }
+
+    expanded = []
+    for doc_id, best in best_docs.items():
+        parent = parents.get(doc_id)
+        if parent is None:
+            expanded.append(best)
+            continue
 
-    # Sort by score and return
-    sorted_results = sorted(
-        best_docs.values(), key=lambda x: x.get("_distance", float("inf"))
-    )
+        doc = dict(parent)
+        for field in _SCORE_FIELDS:
+            if field in best:
+                doc[field] = best[field]
+        doc["_expanded_from"] = children[doc_id]
+        expanded.append(doc)
 
-    return sorted_results
+    return expanded
 
 
 async def expand_with_siblings(
@@ -72,8 +103,10 @@ async def expand_with_siblings(
 ) -> list[dict]:
     """Expand results to include sibling chunks.
 
-    Retrieves chunks immediately before and after each result
-    to provide more context.
+    Retrieves chunks immediately before and after each result (same
+    source_file, ordered by start_line) and stitches their content
+    around the hit. Only chunks starting within a line window around
+    each hit are read; hits without a line range are returned as-is.
 
     Args:
         results: List of retrieved chunks
@@ -81,14 +114,67 @@ async def expand_with_siblings(
         window: Number of siblings on each side (default: 1)
 
     Returns:
-        Results with expanded context
-
-    Note: This is a placeholder for future implementation.
-    Requires additional indexing of chunk sequences.
+        Results with expanded content, line range and ``_sibling_ids``
     """
-    # TODO: Implement sibling expansion when chunk sequence
-    # indexing is added to the database schema
-    return results
+    if not results or window < 1:
+        return results
+
+    clauses = []
+    for r in results:
+        start, end = r.get("start_line"), r.get("end_line")
+        if not r.get("source_file") or start is None or end is None:
+            continue
+        start, end = int(start), int(end)
+        span = _SIBLING_SPAN * window * (end - start + 1)
+        clauses.append(
+            f"({in_filter('source_file', [r['source_file']])} "
+            f"AND start_line >= {start - span} AND start_line <= {end + span})"
+        )
+    if not clauses:
+        return results
+    rows = await asyncio.to_thread(_fetch_windows, table, clauses)
+
+    # Order chunks of each file by position
+    by_file: dict[str, list[dict]] = {}
+    for row in rows:
+        by_file.setdefault(row["source_file"], []).append(row)
+    for chunks in by_file.values():
+        chunks.sort(key=lambda c: (c.get("start_line") or 0, c["id"]))
+
+    positions = {
+        row["id"]: (source_file, i)
+        for source_file, chunks in by_file.items()
+        for i, row in enumerate(chunks)
+    }
+
+    expanded = []
+    for r in results:
+        location = positions.get(r.get("id"))
+        if location is None:
+            expanded.append(r)
+            continue
+
+        source_file, pos = location
+        chunks = by_file[source_file]
+        span = chunks[max(0, pos - window) : pos + window + 1]
+
+        doc = r.copy()
+        doc["content"] = "\n".join(
+            r.get("content", "") if c["id"] == r["id"] else c.get("content", "")
+            for c in span
+        )
+        doc["start_line"] = span[0].get("start_line")
+        doc["end_line"] = span[-1].get("end_line")
+        doc["_sibling_ids"] = [c["id"] for c in span if c["id"] != r["id"]]
+        expanded.append(doc)
+
+    return expanded
+
+
+def _fetch_windows(table: Any, clauses: list[str]) -> list[dict]:
+    """Fetch the sibling columns of rows matching any of the window clauses."""
+    columns = [c for c in _SIBLING_COLUMNS if c in table.schema.names]
+    return table.search().where(" OR ".join(clauses)).select(columns).limit(None).to_list()
 
 
 async def get_parent_content(
@@ -103,9 +189,6 @@ async def get_parent_content(
 
     Returns:
         Dictionary mapping parent_id to content
-
-    Note: This is a placeholder for future implementation.
-    Requires parent content storage in database.
     """
-    # TODO: Implement when parent content storage is added
-    return {}
+    rows = await asyncio.to_thread(fetch_rows, table, "id", parent_ids, ["id", "content"])
+    return {row["id"]: row.get("content", "") for row in rows}
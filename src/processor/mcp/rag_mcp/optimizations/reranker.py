@@ -11,25 +11,45 @@ This significantly improves precision but adds latency:
 - GPU: ~50-200ms for 20 candidates
 - CPU: ~500ms+ for 20 candidates
 
+Inference runs on a dedicated worker thread so it never blocks the MCP
+event loop. The worker waits ``batch_window_ms`` after the first request
+to collect (query, document) pairs from concurrent searches, then scores
+them in a single model call. Scores are cached per (query, content_hash),
+so repeated or overlapping searches only score new candidates.
+
+With ``backend: onnx`` the model runs through ONNX Runtime on CPU,
+optionally using a quantized export (``onnx_file``).
+
 Best for: High-precision requirements, final ranking
 Models: BAAI/bge-reranker-v2-m3 (recommended), ms-marco-MiniLM-L-6-v2
 
 Reference: https://www.sbert.net/docs/cross_encoder/cross_encoder_usage.html
 """
 
+import asyncio
+import contextlib
+import hashlib
+import queue
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 from ..config import RAGConfig
 
-# Global reranker cache (lazy loaded)
-_reranker: Any | None = None
-_reranker_model: str | None = None
+# Global reranker worker and score cache (lazy created)
+_worker: "RerankWorker | None" = None
+_worker_key: tuple[str, str, str, str] | None = None
+_score_cache: OrderedDict[tuple[str, str, str], float] = OrderedDict()
 
 
-def _get_reranker(config: RAGConfig):
-    """Lazy load cross-encoder model.
+def _load_model(config: RAGConfig):
+    """Load the cross-encoder model.
 
-    The model is cached globally to avoid reloading on every request.
+    Called on the worker thread so the (slow) first load does not block
+    the event loop.
 
     Args:
         config: RAG configuration with reranker settings
@@ -37,12 +57,6 @@ def _get_reranker(config: RAGConfig):
     Returns:
         CrossEncoder instance
     """
-    global _reranker, _reranker_model
-
-    # Return cached if same model
-    if _reranker is not None and _reranker_model == config.reranker.model:
-        return _reranker
-
     try:
         from sentence_transformers import CrossEncoder
     except ImportError as e:
@@ -51,6 +65,19 @@ def _get_reranker(config: RAGConfig):
             "Install with: uv sync --extra reranker"
         ) from e
 
+    if config.reranker.backend == "onnx":
+        if config.reranker.onnx_file:
+            try:
+                return CrossEncoder(
+                    config.reranker.model,
+                    device="cpu",
+                    backend="onnx",
+                    model_kwargs={"file_name": config.reranker.onnx_file},
+                )
+            except Exception:
+                pass  # Repo has no such export - fall back to exporting model.onnx
+        return CrossEncoder(config.reranker.model, device="cpu", backend="onnx")
+
     # Determine device
     device = config.reranker.device
     if device == "auto":
@@ -61,10 +88,202 @@ def _get_reranker(config: RAGConfig):
         except ImportError:
             device = "cpu"
 
-    _reranker = CrossEncoder(config.reranker.model, device=device)
-    _reranker_model = config.reranker.model
+    return CrossEncoder(config.reranker.model, device=device)
+
+
+@dataclass
+class _Request:
+    """Pairs submitted by one search, with the future awaiting their scores."""
+
+    pairs: list[list[str]]
+    future: asyncio.Future
+    loop: asyncio.AbstractEventLoop
+
+
+def _resolve(
+    future: asyncio.Future, result: Any = None, error: BaseException | None = None
+) -> None:
+    """Complete a future from the event loop thread (ignores cancelled ones)."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+def _hand_off(request: _Request, result: Any = None, error: BaseException | None = None) -> None:
+    """Pass a result to the requesting loop (skipped if that loop has closed)."""
+    # A closed loop raises RuntimeError: nobody is waiting, and the worker must keep running
+    with contextlib.suppress(RuntimeError):
+        request.loop.call_soon_threadsafe(_resolve, request.future, result, error)
+
+
+class RerankWorker:
+    """Background thread that scores (query, document) pairs in micro-batches."""
+
+    def __init__(
+        self,
+        loader: Callable[[], Any],
+        batch_window_ms: float = 5.0,
+        max_batch_size: int = 64,
+    ):
+        """Start the worker.
+
+        Args:
+            loader: Callable returning a model with a predict(pairs) method
+            batch_window_ms: Time to wait for more requests after the first one
+            max_batch_size: Stop collecting once this many pairs are queued
+        """
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self.batches = 0
+        self.pairs_scored = 0
+        self.load_error: BaseException | None = None
+
+        self._loader = loader
+        self._queue: queue.Queue[_Request | None] = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="rerank-worker", daemon=True
+        )
+        self._thread.start()
+
+    async def score(self, pairs: list[list[str]]) -> list[float]:
+        """Score pairs on the worker thread.
+
+        Args:
+            pairs: [query, document] pairs
+
+        Returns:
+            Cross-encoder scores in input order
+        """
+        if not pairs:
+            return []
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.put(_Request(pairs=pairs, future=future, loop=loop))
+        return await future
+
+    def close(self) -> None:
+        """Stop the worker after the queued requests are processed."""
+        self._queue.put(None)
+
+    def is_alive(self) -> bool:
+        """Check whether the worker thread is still running."""
+        return self._thread.is_alive()
+
+    def _run(self) -> None:
+        """Worker loop: load the model, then collect and score micro-batches."""
+        try:
+            model = self._loader()
+        except Exception as e:
+            self._fail_all(e)
+            return
+
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+
+            batch = [first]
+            size = len(first.pairs)
+            stop = False
+            deadline = time.monotonic() + self.batch_window
+
+            while size < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if request is None:
+                    stop = True
+                    break
+                batch.append(request)
+                size += len(request.pairs)
+
+            self._score_batch(model, batch)
+            if stop:
+                return
+
+    def _score_batch(self, model: Any, batch: list[_Request]) -> None:
+        """Score all pairs of a micro-batch in one model call."""
+        pairs = [pair for request in batch for pair in request.pairs]
+        try:
+            scores = [float(s) for s in model.predict(pairs, batch_size=self.max_batch_size)]
+        except Exception as e:
+            for request in batch:
+                _hand_off(request, None, e)
+            return
+
+        self.batches += 1
+        self.pairs_scored += len(pairs)
+
+        offset = 0
+        for request in batch:
+            n = len(request.pairs)
+            _hand_off(request, scores[offset : offset + n])
+            offset += n
+
+    def _fail_all(self, error: BaseException) -> None:
+        """Fail every request with a model load error (including future ones)."""
+        self.load_error = error
+        while True:
+            request = self._queue.get()
+            if request is None:
+                return
+            _hand_off(request, None, error)
+
+
+def _get_worker(config: RAGConfig) -> RerankWorker:
+    """Get the reranking worker for the configured model.
+
+    The worker is cached globally and restarted when the model or
+    inference backend changes, when the previous model load failed, or
+    when its thread has died.
+
+    Args:
+        config: RAG configuration with reranker settings
 
-    return _reranker
+    Returns:
+        RerankWorker instance
+    """
+    global _worker, _worker_key
+
+    key = (
+        config.reranker.model,
+        config.reranker.backend,
+        config.reranker.onnx_file,
+        config.reranker.device,
+    )
+    if (
+        _worker is not None
+        and _worker_key == key
+        and _worker.load_error is None
+        and _worker.is_alive()
+    ):
+        return _worker
+
+    if _worker is not None:
+        _worker.close()
+
+    _worker = RerankWorker(
+        lambda: _load_model(config),
+        batch_window_ms=config.reranker.batch_window_ms,
+        max_batch_size=config.reranker.max_batch_size,
+    )
+    _worker_key = key
+    return _worker
+
+
+def _content_hash(doc: dict) -> str:
+    """Get a stable hash of a candidate's content."""
+    content_hash = doc.get("content_hash")
+    if content_hash:
+        return content_hash
+    return hashlib.sha256(doc.get("content", "").encode()).hexdigest()
 
 
 async def rerank_results(
@@ -76,7 +295,8 @@ async def rerank_results(
     """Rerank candidates using cross-encoder.
 
     Scores each query-document pair and returns the top-N by
-    cross-encoder score.
+    cross-encoder score. Previously scored (query, content) pairs are
+    served from the score cache; the rest are sent to the worker.
 
     Args:
         query: Original query
@@ -93,16 +313,32 @@ async def rerank_results(
     if not config.reranker.enabled and len(candidates) <= top_n:
         return candidates[:top_n]
 
-    reranker = _get_reranker(config)
-
-    # Prepare query-document pairs
-    pairs = [[query, doc.get("content", "")] for doc in candidates]
-
-    # Get reranking scores (sync operation, but fast)
-    scores = reranker.predict(pairs)
+    cache_size = config.reranker.score_cache_size
+    keys = [(config.reranker.model, query, _content_hash(doc)) for doc in candidates]
+    scores: list[float | None] = []
+    for key in keys:
+        score = _score_cache.get(key)
+        if score is not None:
+            _score_cache.move_to_end(key)
+        scores.append(score)
+
+    missing = [i for i, score in enumerate(scores) if score is None]
+    if missing:
+        worker = _get_worker(config)
+        pairs = [[query, candidates[i].get("content", "")] for i in missing]
+        new_scores = await worker.score(pairs)
+
+        for i, score in zip(missing, new_scores, strict=True):
+            scores[i] = score
+            if cache_size > 0:
+                _score_cache[keys[i]] = score
+                _score_cache.move_to_end(keys[i])
+
+        while len(_score_cache) > cache_size:
+            _score_cache.popitem(last=False)
 
     # Combine with original documents
-    scored = list(zip(candidates, scores, strict=False))
+    scored = list(zip(candidates, scores, strict=True))
 
     # Sort by reranking score (higher is better)
     scored.sort(key=lambda x: x[1], reverse=True)
@@ -117,11 +353,28 @@ async def rerank_results(
     return results
 
 
+def reranker_stats() -> dict[str, int]:
+    """Get micro-batching and score cache counters."""
+    return {
+        "batches": _worker.batches if _worker is not None else 0,
+        "pairs_scored": _worker.pairs_scored if _worker is not None else 0,
+        "cached_scores": len(_score_cache),
+    }
+
+
+def clear_score_cache() -> None:
+    """Forget cached scores, keeping the worker and its model loaded."""
+    _score_cache.clear()
+
+
 def clear_reranker_cache() -> None:
-    """Clear the reranker model cache.
+    """Stop the reranker worker and clear the score cache.
 
     Useful for testing or when switching models.
     """
-    global _reranker, _reranker_model
-    _reranker = None
-    _reranker_model = None
+    global _worker, _worker_key
+    if _worker is not None:
+        _worker.close()
+    _worker = None
+    _worker_key = None
+    _score_cache.clear()
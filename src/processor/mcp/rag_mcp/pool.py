@@ -0,0 +1,248 @@
+"""Process-wide resource pools for the RAG MCP server.
+
+Every search used to reconnect to LanceDB, reopen the table and build a
+fresh embedder (with its own HTTP client). For agents issuing dozens of
+searches per task this setup dominated latency, so the server keeps:
+
+- One LanceDB connection per database path
+- One opened table handle per (db_path, table), re-checked against the
+  latest dataset version at most every ``table_refresh_interval`` seconds
+- One warm embedder per (model, host, event loop); entries of closed
+  loops are dropped
+- One loaded OpenCLIP model per (model, pretrained, device), for image search
+- The tuned ANN parameters of each table (from ``_metadata``), re-read
+  on the same refresh interval as table handles
+
+Pools are module-level, matching the reranker model cache. The RAG
+config is cached by ``load_rag_config`` and reset along with the pools.
+"""
+
+import asyncio
+import contextlib
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .config import RAGConfig, reset_config_cache
+
+# Global pools (lazy populated)
+_connections: dict[str, Any] = {}
+_tables: dict[tuple[str, str], "_PooledTable"] = {}
+_embedders: dict[tuple[str, str, int], "_LoopEmbedder"] = {}
+_clip_embedders: dict[tuple[str, str, str], Any] = {}
+_ann_params: dict[tuple[str, str], tuple[float, dict[str, int]]] = {}
+
+
+class _PooledTable:
+    """Opened table handle plus the time its version was last checked."""
+
+    def __init__(self, table: Any):
+        self.table = table
+        self.version = table.version
+        self.checked_at = time.monotonic()
+
+
+@dataclass
+class _LoopEmbedder:
+    """A pooled embedder and the event loop its HTTP client is bound to."""
+
+    loop: asyncio.AbstractEventLoop
+    embedder: Any
+
+
+def _db_key(db_path: str) -> str:
+    """Normalise a database path so equivalent paths share a pool entry."""
+    return str(Path(db_path).resolve())
+
+
+def get_connection(db_path: str) -> Any:
+    """Get the pooled LanceDB connection for a database.
+
+    Args:
+        db_path: LanceDB database path
+
+    Returns:
+        LanceDB connection
+    """
+    import lancedb
+
+    key = _db_key(db_path)
+    if key not in _connections:
+        _connections[key] = lancedb.connect(db_path)
+    return _connections[key]
+
+
+def get_table(db_path: str, table_name: str, config: RAGConfig) -> Any:
+    """Get a pooled table handle, refreshed when the dataset version changes.
+
+    Args:
+        db_path: LanceDB database path
+        table_name: Table to open
+        config: RAG configuration (for the refresh interval)
+
+    Returns:
+        LanceDB table at the latest known version
+
+    Raises:
+        ValueError: If the table does not exist
+    """
+    key = (_db_key(db_path), table_name)
+    pooled = _tables.get(key)
+
+    if pooled is not None:
+        now = time.monotonic()
+        if now - pooled.checked_at < config.table_refresh_interval:
+            return pooled.table
+        try:
+            pooled.table.checkout_latest()
+            pooled.version = pooled.table.version
+            pooled.checked_at = now
+            return pooled.table
+        except Exception:
+            # Table was dropped or recreated - reopen below
+            _tables.pop(key, None)
+
+    db = get_connection(db_path)
+    if table_name not in db.table_names():
+        available = ", ".join(db.table_names())
+        raise ValueError(
+            f"Table '{table_name}' not found. Available tables: {available}"
+        )
+
+    pooled = _PooledTable(db.open_table(table_name))
+    _tables[key] = pooled
+    return pooled.table
+
+
+def get_embedder(model: str, host: str) -> Any:
+    """Get a warm Ollama embedder for a model.
+
+    Embedders hold an ``httpx.AsyncClient`` which is bound to the event
+    loop it was created on, so the pool is also keyed by the running loop.
+    Entries of closed loops are dropped (their connections went with the
+    loop), so a new loop reusing a closed loop's id gets a fresh embedder.
+
+    Args:
+        model: Ollama model name
+        host: Ollama server URL
+
+    Returns:
+        OllamaEmbedder instance with a reusable HTTP client
+    """
+    from processor.embedders.ollama import OllamaEmbedder
+
+    loop = asyncio.get_running_loop()
+    for stale in [key for key, entry in _embedders.items() if entry.loop.is_closed()]:
+        del _embedders[stale]
+
+    key = (model, host, id(loop))
+    entry = _embedders.get(key)
+    if entry is None or entry.loop is not loop:
+        entry = _LoopEmbedder(loop=loop, embedder=OllamaEmbedder(model=model, host=host))
+        _embedders[key] = entry
+    return entry.embedder
+
+
+def get_clip_embedder(model_name: str, pretrained: str, device: str = "auto") -> Any:
+    """Get a pooled OpenCLIP embedder.
+
+    The model is loaded on first use and kept for the life of the process
+    (loading CLIP takes seconds). OpenCLIP runs inference in the default
+    executor, so the instance is not bound to an event loop.
+
+    Args:
+        model_name: OpenCLIP model name (e.g. 'ViT-L-14')
+        pretrained: Pretrained weights name (e.g. 'laion2b_s32b_b82k')
+        device: Device to run on ('auto', 'cuda', 'cpu')
+
+    Returns:
+        OpenCLIPEmbedder instance
+    """
+    from processor.embedders import get_openclip_embedder
+
+    key = (model_name, pretrained, device)
+    if key not in _clip_embedders:
+        OpenCLIPEmbedder = get_openclip_embedder()
+        _clip_embedders[key] = OpenCLIPEmbedder(
+            model_name=model_name, pretrained=pretrained, device=device
+        )
+    return _clip_embedders[key]
+
+
+def get_ann_params(db_path: str, table_name: str, config: RAGConfig) -> dict[str, int]:
+    """Get the tuned nprobes/refine_factor/max_nprobes of a table.
+
+    Args:
+        db_path: LanceDB database path
+        table_name: Table the parameters were tuned for
+        config: RAG configuration (for the refresh interval)
+
+    Returns:
+        Tuned parameters (empty if the table has none recorded)
+    """
+    from processor.database.search import read_ann_params
+
+    key = (_db_key(db_path), table_name)
+    cached = _ann_params.get(key)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < config.table_refresh_interval:
+        return cached[1]
+
+    try:
+        params = read_ann_params(get_connection(db_path), table_name)
+    except Exception:
+        params = {}
+    _ann_params[key] = (now, params)
+    return params
+
+
+def get_truncate_dims(
+    db_path: str, table_name: str, config: RAGConfig, vector_column: str = "vector"
+) -> int | None:
+    """Get the dimension query embeddings must be truncated to (Matryoshka).
+
+    Read from the vector column of the pooled table's schema (see
+    ``processor.database.read_truncate_dims``).
+
+    Args:
+        db_path: LanceDB database path
+        table_name: Table being searched
+        config: RAG configuration (for the refresh interval)
+        vector_column: Vector column being searched
+
+    Returns:
+        Stored vector dimension, or None if the column is not fixed-size
+    """
+    from processor.database.search import read_truncate_dims
+
+    return read_truncate_dims(get_table(db_path, table_name, config), vector_column)
+
+
+def pool_stats() -> dict[str, int]:
+    """Get the number of pooled resources of each kind."""
+    return {
+        "connections": len(_connections),
+        "tables": len(_tables),
+        "embedders": len(_embedders),
+        "clip_embedders": len(_clip_embedders),
+    }
+
+
+async def close_pools() -> None:
+    """Close pooled embedders and drop all pooled handles."""
+    embedders = [entry.embedder for entry in _embedders.values() if not entry.loop.is_closed()]
+    for embedder in [*embedders, *_clip_embedders.values()]:
+        with contextlib.suppress(Exception):
+            await embedder.close()
+    reset_pools()
+
+
+def reset_pools() -> None:
+    """Drop all pooled handles without closing them. Useful for testing."""
+    _connections.clear()
+    _tables.clear()
+    _embedders.clear()
+    _clip_embedders.clear()
+    _ann_params.clear()
+    reset_config_cache()
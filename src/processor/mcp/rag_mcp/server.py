@@ -9,25 +9,64 @@ Features:
 - HyDE query transformation
 - Cross-encoder reranking
 - Parent document expansion
+- Batch search (many queries, one embedding call, optional RRF fusion)
+- Federated search (text, code and image tables fused with weighted RRF)
+- In-memory hot-table tier (exact scan of pinned tables, optional)
 
 Usage:
     uv run rag-mcp                    # Start server
     uv run rag-mcp --config_generate  # Generate config template
 """
 
+import asyncio
 import sys
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field
 
+from processor.database.search import (
+    DEFAULT_NPROBES,
+    build_filter,
+    fetch_rows,
+    reciprocal_rank_fusion,
+    search_table_adaptive_async,
+    search_table_async,
+    search_table_quantized_async,
+)
+from processor.embedders.matryoshka import truncate_embedding
+
+from .cache import cached_embed, cached_embed_many, cached_hyde_transform, get_query_cache
 from .config import RAGConfig, load_rag_config
+from .pool import (
+    close_pools,
+    get_ann_params,
+    get_clip_embedder,
+    get_connection,
+    get_embedder,
+    get_table,
+    get_truncate_dims,
+)
+from .vector_cache import get_hot_table, vector_cache_stats
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close pooled embedders (and their HTTP clients) when the server stops."""
+    try:
+        yield
+    finally:
+        await close_pools()
+
 
 # Initialize MCP server
 mcp = FastMCP(
     name="rag-mcp",
+    lifespan=lifespan,
     instructions="""
 RAG Search MCP Server
 
@@ -38,6 +77,18 @@ Available optimizations (can be combined):
 - use_hyde: Generate hypothetical answer, embed that instead of query (+200-500ms)
 - rerank: Retrieve more candidates, rerank with cross-encoder (+50-200ms GPU)
 - expand_parents: Deduplicate by parent document, return broader context (+5-20ms)
+- expand_siblings: Add neighbouring chunks from the same file around each hit (+5-20ms)
+
+To restrict a search to one language, source type or directory, pass
+language, source_type, source_prefix or a SQL filter; these are applied
+before the vector search, so all returned results match.
+
+To search papers, code and figures together, use search_federated: it
+queries all tables concurrently and returns one fused ranking with the
+source table of every result.
+
+For several sub-queries at once, use search_batch instead of repeated
+search calls: queries are embedded together and searched concurrently.
 
 Recommended combinations:
 - Fast search: No optimizations (default)
@@ -83,6 +134,53 @@ class SearchInput(BaseModel):
     expand_parents: bool = Field(
         default=False, description="Expand to parent documents"
     )
+    expand_siblings: bool = Field(
+        default=False, description="Include neighbouring chunks from the same file"
+    )
+    sibling_window: int = Field(
+        default=1, ge=1, le=5, description="Sibling chunks on each side of a hit"
+    )
+
+    # Metadata pre-filters (served from scalar indexes)
+    filter: str | None = Field(
+        default=None,
+        description="SQL filter expression, e.g. \"start_line > 100\"",
+    )
+    language: str | None = Field(
+        default=None, description="Only chunks in this language (e.g. 'cpp')"
+    )
+    source_type: str | None = Field(
+        default=None, description="Only chunks of this source type (e.g. 'paper')"
+    )
+    source_prefix: str | None = Field(
+        default=None, description="Only chunks whose source_file starts with this"
+    )
+
+    # ANN knobs (defaults: values tuned per table when the index was built)
+    nprobes: int | None = Field(
+        default=None, ge=1, description="IVF partitions to probe (more = better recall, slower)"
+    )
+    refine_factor: int | None = Field(
+        default=None,
+        ge=0,
+        description="Re-rank limit * refine_factor candidates with exact distances (0 = off)",
+    )
+    adaptive_nprobes: bool = Field(
+        default=False,
+        description="Raise nprobes when the top-k distances look unreliable",
+    )
+    latency_budget_ms: float | None = Field(
+        default=None, gt=0, description="Time allowed for adaptive nprobes escalation"
+    )
+
+    # Compressed first stage (tables loaded with database.quantization)
+    quantized: Literal["binary", "int8"] | None = Field(
+        default=None,
+        description="Scan binary/int8 vectors first, then rescore exactly (not with hybrid)",
+    )
+    rescore_factor: int | None = Field(
+        default=None, ge=1, description="Quantized candidates rescored per result (default 10)"
+    )
 
 
 class SearchResult(BaseModel):
@@ -102,6 +200,122 @@ class SearchResponse(BaseModel):
     query: str
     optimizations_used: list[str]
     total_time_ms: float
+    setup_time_ms: float = Field(
+        default=0.0,
+        description="Part of total_time_ms spent acquiring connection, table and embedder",
+    )
+    stage_times_ms: dict[str, float] = Field(
+        default_factory=dict,
+        description="Time per pipeline stage (setup, hyde, embed, search, rerank, ...)",
+    )
+    nprobes: int | None = Field(
+        default=None, description="IVF partitions probed (after adaptive escalation)"
+    )
+
+
+class SearchBatchInput(BaseModel):
+    """Input for batch search operation."""
+
+    queries: list[str] = Field(
+        min_length=1, max_length=100, description="Search queries"
+    )
+    db_path: str = Field(default="./lancedb", description="LanceDB database path")
+    table: Literal["text_chunks", "code_chunks", "chunks", "image_chunks"] = Field(
+        default="text_chunks", description="Table to search"
+    )
+    limit: int = Field(default=5, ge=1, le=100, description="Results per query")
+    hybrid: bool = Field(
+        default=False, description="Use hybrid search (vector + BM25)"
+    )
+    fuse: bool = Field(
+        default=False, description="Also fuse all query results with RRF"
+    )
+    rrf_k: int = Field(default=60, ge=1, description="RRF smoothing constant")
+
+    # Metadata pre-filters (served from scalar indexes)
+    filter: str | None = Field(
+        default=None,
+        description="SQL filter expression, e.g. \"start_line > 100\"",
+    )
+    language: str | None = Field(
+        default=None, description="Only chunks in this language (e.g. 'cpp')"
+    )
+    source_type: str | None = Field(
+        default=None, description="Only chunks of this source type (e.g. 'paper')"
+    )
+    source_prefix: str | None = Field(
+        default=None, description="Only chunks whose source_file starts with this"
+    )
+
+
+class QueryResults(BaseModel):
+    """Results for one query of a batch."""
+
+    query: str
+    results: list[SearchResult]
+    latency_ms: float
+
+
+class SearchBatchResponse(BaseModel):
+    """Batch search response with per-query and fused results."""
+
+    queries: list[QueryResults]
+    fused: list[SearchResult] | None = None
+    optimizations_used: list[str]
+    embed_time_ms: float
+    total_time_ms: float
+    setup_time_ms: float = 0.0
+
+
+class FederatedSearchInput(BaseModel):
+    """Input for federated (multi-table) search."""
+
+    query: str = Field(description="Search query")
+    db_path: str = Field(default="./lancedb", description="LanceDB database path")
+    tables: list[Literal["text_chunks", "code_chunks", "image_chunks"]] = Field(
+        default=["text_chunks", "code_chunks", "image_chunks"],
+        min_length=1,
+        description="Tables to search (missing tables are skipped)",
+    )
+    weights: dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-table RRF weights, e.g. {\"code_chunks\": 2.0} (default 1.0)",
+    )
+    limit: int = Field(default=10, ge=1, le=100, description="Number of fused results")
+    per_table_k: int = Field(
+        default=20, ge=1, le=100, description="Candidates retrieved from each table"
+    )
+    hybrid: bool = Field(
+        default=False, description="Use hybrid search (vector + BM25) per table"
+    )
+    rrf_k: int = Field(default=60, ge=1, description="RRF smoothing constant")
+
+
+class FederatedResult(BaseModel):
+    """Single fused result with the table it came from."""
+
+    content: str
+    source_file: str
+    score: float
+    chunk_id: str
+    table: str
+    table_rank: int = Field(description="1-based rank within its own table")
+    metadata: dict = Field(default_factory=dict)
+
+
+class FederatedSearchResponse(BaseModel):
+    """Federated search response with one fused ranking."""
+
+    results: list[FederatedResult]
+    query: str
+    tables_searched: list[str]
+    table_time_ms: dict[str, float] = Field(
+        description="Search latency per table (tables run concurrently)"
+    )
+    optimizations_used: list[str]
+    embed_time_ms: float
+    total_time_ms: float
+    setup_time_ms: float = 0.0
 
 
 class ImageSearchResult(BaseModel):
@@ -113,6 +327,38 @@ class ImageSearchResult(BaseModel):
     image_path: str
     source_paper: str
     score: float
+    matched_by: list[str] = Field(
+        default_factory=list, description="Vectors that found this image: text, visual"
+    )
+
+
+class CacheKindStats(BaseModel):
+    """Hit/miss counters for one kind of cached entry."""
+
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    hit_rate: float
+
+
+class VectorCacheStats(BaseModel):
+    """In-memory hot-table tier statistics."""
+
+    tables: list[dict] = Field(description="Pinned tables (db_path, table, rows, version)")
+    memory_mb: float
+    hits: int
+    misses: int
+
+
+class CacheStatsResponse(BaseModel):
+    """Response from cache_stats."""
+
+    enabled: bool
+    memory_entries: int
+    disk_path: str | None
+    embedding: CacheKindStats | None = None
+    hyde: CacheKindStats | None = None
+    hot_tables: VectorCacheStats | None = None
 
 
 class TableInfo(BaseModel):
@@ -130,6 +376,83 @@ class ListTablesResponse(BaseModel):
     tables: dict[str, TableInfo]
 
 
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _search_filter(input: SearchInput | SearchBatchInput) -> str | None:
+    """Build the pre-filter expression for a search request."""
+    return build_filter(
+        input.filter,
+        language=input.language,
+        source_type=input.source_type,
+        source_prefix=input.source_prefix,
+    )
+
+
+# Federated search: embedding domain and vector column per table. Image
+# chunks are searched on visual_vector with the OpenCLIP text tower when the
+# database holds CLIP image embeddings, otherwise (as listed here) through
+# the text embedding of their VLM description.
+_FEDERATED_TABLES: dict[str, tuple[str, str | None]] = {
+    "text_chunks": ("text", None),
+    "code_chunks": ("code", None),
+    "image_chunks": ("text", "text_vector"),
+}
+
+# Columns that are not surfaced in result metadata
+_HIDDEN_COLUMNS = [
+    "content",
+    "source_file",
+    "id",
+    "vector",
+    "text_vector",
+    "visual_vector",
+    "vector_binary",
+    "vector_int8",
+    "_distance",
+    "_relevance_score",
+    "_rrf_score",
+]
+
+
+def _domain_model(domain: str, config: RAGConfig) -> str:
+    """Get the Ollama model for a 'text' or 'code' embedding domain."""
+    from processor.embedders.profiles import EmbedderBackend, get_model_for_profile
+
+    profile_name = config.code_profile if domain == "code" else config.text_profile
+    profile, _ = get_model_for_profile(domain, profile_name, EmbedderBackend.OLLAMA)
+    return profile.ollama_model
+
+
+def _format_results(results: list[dict], limit: int) -> list[SearchResult]:
+    """Convert raw LanceDB rows into SearchResult models."""
+    search_results = []
+    for r in results[:limit]:
+        if "_rrf_score" in r:
+            score = r["_rrf_score"]
+        else:
+            # Convert distance to similarity score (0-1 range, higher is better)
+            distance = r.get("_distance", 0)
+            score = max(0, 1.0 - (distance / 2.0))  # Normalize L2 distance
+
+        search_results.append(
+            SearchResult(
+                content=r.get("content", "")[:2000],  # Truncate for response size
+                source_file=r.get("source_file", ""),
+                score=round(score, 4),
+                chunk_id=r.get("id", ""),
+                metadata={
+                    k: v
+                    for k, v in r.items()
+                    if k not in _HIDDEN_COLUMNS and v is not None
+                },
+            )
+        )
+    return search_results
+
+
 # =============================================================================
 # Tools
 # =============================================================================
@@ -152,14 +475,13 @@ async def search(input: SearchInput) -> SearchResponse:
     Example:
         search(query="how does caching work", hybrid=True, limit=10)
     """
-    import lancedb
-
-    from processor.embedders.ollama import OllamaEmbedder
     from processor.embedders.profiles import EmbedderBackend, get_model_for_profile
 
     start = time.time()
     optimizations_used = []
 
+    # Setup (config, pooled handles) is timed as setup_time_ms
+    setup_start = time.time()
     config = load_rag_config()
 
     # Validate database exists
@@ -169,18 +491,12 @@ async def search(input: SearchInput) -> SearchResponse:
             f"Create it with: uv run processor process ./input -o {input.db_path}"
         )
 
-    # Get query text (potentially transformed)
-    query_text = input.query
-
-    # HyDE transformation
-    if input.use_hyde:
-        from .optimizations.hyde import hyde_transform
-
-        query_text = await hyde_transform(input.query, config)
-        optimizations_used.append("hyde")
+    # Get pooled table handle (connection and table are reused across calls)
+    table = get_table(input.db_path, input.table, config)
 
     # Get embedder based on table type
-    if input.table == "code_chunks":
+    domain = "code" if input.table == "code_chunks" else "text"
+    if domain == "code":
         profile, backend = get_model_for_profile(
             "code", config.code_profile, EmbedderBackend.OLLAMA
         )
@@ -189,90 +505,128 @@ async def search(input: SearchInput) -> SearchResponse:
             "text", config.text_profile, EmbedderBackend.OLLAMA
         )
 
-    embedder = OllamaEmbedder(
-        model=profile.ollama_model,
-        host=config.ollama_host,
-    )
+    embedder = get_embedder(profile.ollama_model, config.ollama_host)
+    setup_ms = (time.time() - setup_start) * 1000
+    stage_times = {"setup": setup_ms}
 
-    # Embed query
-    query_embedding = await embedder.embed(query_text)
-    await embedder.close()
+    # Get query text (potentially transformed)
+    query_text = input.query
 
-    # Connect to database
-    db = lancedb.connect(input.db_path)
-    if input.table not in db.table_names():
-        available = ", ".join(db.table_names())
-        raise ValueError(
-            f"Table '{input.table}' not found. Available tables: {available}"
-        )
+    # HyDE transformation
+    if input.use_hyde:
+        stage_start = time.time()
+        query_text = await cached_hyde_transform(input.query, config)
+        stage_times["hyde"] = (time.time() - stage_start) * 1000
+        optimizations_used.append("hyde")
 
-    table = db.open_table(input.table)
+    # Embed query (cached per query text and model)
+    stage_start = time.time()
+    query_embedding = await cached_embed(embedder, query_text, config)
+    query_embedding = truncate_embedding(
+        query_embedding, get_truncate_dims(input.db_path, input.table, config)
+    )
+    stage_times["embed"] = (time.time() - stage_start) * 1000
 
     # Determine search count (more if reranking)
     search_k = input.rerank_top_k if input.rerank else input.limit
 
-    # Perform search
-    if input.hybrid:
-        # Hybrid search with RRF fusion
-        try:
-            results = (
-                table.search(query_type="hybrid")
-                .vector(query_embedding)
-                .text(input.query)  # Use original query for BM25
-                .limit(search_k)
-                .to_list()
-            )
-            optimizations_used.append("hybrid_rrf")
-        except Exception:
-            # Fall back to vector-only if hybrid not supported
-            results = table.search(query_embedding).limit(search_k).to_list()
+    # Metadata pre-filter
+    filter = _search_filter(input)
+    if filter:
+        optimizations_used.append("prefilter")
+
+    # ANN knobs: explicit values, else the table's tuned defaults
+    ann = get_ann_params(input.db_path, input.table, config)
+    nprobes = input.nprobes or ann.get("nprobes")
+    refine_factor = (
+        input.refine_factor if input.refine_factor is not None else ann.get("refine_factor")
+    )
+
+    # Plain vector searches of pinned tables are answered in memory
+    hot = None
+    quantized = None if input.hybrid else input.quantized
+    if not (input.hybrid or filter or input.adaptive_nprobes or quantized):
+        hot = get_hot_table(input.db_path, input.table, table, config)
+
+    # Perform search (hybrid falls back to vector-only without an FTS index)
+    stage_start = time.time()
+    if hot is not None:
+        results, hybrid_used = hot.search(query_embedding, search_k), False
+        optimizations_used.append("hot_cache")
+        nprobes = None  # Exact scan
+    elif quantized:
+        results, hybrid_used = (
+            await search_table_quantized_async(
+                table,
+                query_embedding,
+                search_k,
+                quantization=quantized,
+                filter=filter,
+                rescore_factor=input.rescore_factor,
+            ),
+            False,
+        )
+        optimizations_used.append(f"{quantized}_rescore")
+        nprobes = None  # No IVF-PQ index involved
+    elif input.adaptive_nprobes:
+        results, hybrid_used, nprobes_used = await search_table_adaptive_async(
+            table,
+            query_embedding,
+            search_k,
+            query_text=input.query,
+            hybrid=input.hybrid,
+            filter=filter,
+            nprobes=nprobes,
+            refine_factor=refine_factor,
+            max_nprobes=ann.get("max_nprobes"),
+            latency_budget_ms=input.latency_budget_ms,
+        )
+        if nprobes_used != (nprobes or DEFAULT_NPROBES):
+            optimizations_used.append("adaptive_nprobes")
+        nprobes = nprobes_used
     else:
-        # Pure vector search
-        results = table.search(query_embedding).limit(search_k).to_list()
+        results, hybrid_used = await search_table_async(
+            table,
+            query_embedding,
+            search_k,
+            query_text=input.query,  # Use original query for BM25
+            hybrid=input.hybrid,
+            filter=filter,
+            nprobes=nprobes,
+            refine_factor=refine_factor,
+        )
+    stage_times["search"] = (time.time() - stage_start) * 1000
+    if hybrid_used:
+        optimizations_used.append("hybrid_rrf")
 
     # Reranking
     if input.rerank and results:
         from .optimizations.reranker import rerank_results
 
+        stage_start = time.time()
         results = await rerank_results(input.query, results, input.limit, config)
+        stage_times["rerank"] = (time.time() - stage_start) * 1000
         optimizations_used.append("cross_encoder_rerank")
 
     # Parent expansion
     if input.expand_parents and results:
         from .optimizations.parent_expansion import expand_to_parents
 
+        stage_start = time.time()
         results = await expand_to_parents(results, table)
+        stage_times["parent_expansion"] = (time.time() - stage_start) * 1000
         optimizations_used.append("parent_expansion")
 
-    # Format results
-    search_results = []
-    for r in results[: input.limit]:
-        # Convert distance to similarity score (0-1 range, higher is better)
-        distance = r.get("_distance", 0)
-        score = max(0, 1.0 - (distance / 2.0))  # Normalize L2 distance
+    # Sibling expansion
+    if input.expand_siblings and results:
+        from .optimizations.parent_expansion import expand_with_siblings
 
-        search_results.append(
-            SearchResult(
-                content=r.get("content", "")[:2000],  # Truncate for response size
-                source_file=r.get("source_file", ""),
-                score=round(score, 4),
-                chunk_id=r.get("id", ""),
-                metadata={
-                    k: v
-                    for k, v in r.items()
-                    if k
-                    not in [
-                        "content",
-                        "source_file",
-                        "id",
-                        "vector",
-                        "_distance",
-                        "_relevance_score",
-                    ]
-                    and v is not None
-                },
-            )
-        )
+        stage_start = time.time()
+        results = await expand_with_siblings(results, table, window=input.sibling_window)
+        stage_times["sibling_expansion"] = (time.time() - stage_start) * 1000
+        optimizations_used.append("sibling_expansion")
+
+    search_results = _format_results(results, input.limit)
 
     elapsed_ms = (time.time() - start) * 1000
 
@@ -281,58 +635,404 @@ async def search(input: SearchInput) -> SearchResponse:
         query=input.query,
         optimizations_used=optimizations_used,
         total_time_ms=round(elapsed_ms, 2),
+        setup_time_ms=round(setup_ms, 2),
+        stage_times_ms={stage: round(ms, 2) for stage, ms in stage_times.items()},
+        nprobes=nprobes,
     )
 
 
+@mcp.tool()
+async def search_batch(input: SearchBatchInput) -> SearchBatchResponse:
+    """Search the RAG database with several queries at once.
+
+    Use this when a question fans out into several sub-queries. All
+    queries are embedded in one batched embedder call and searched
+    concurrently against a shared table handle, which is much faster
+    than issuing the same number of separate search calls.
+
+    Args:
+        input: Batch search configuration with queries and flags
+
+    Returns:
+        Per-query results with latencies, plus optional RRF-fused results
+
+    Example:
+        search_batch(queries=["hdf5 chunking", "hdf5 compression"], fuse=True)
+    """
+    start = time.time()
+    optimizations_used = ["batch_embedding"]
+
+    # Setup (config, pooled handles) is timed as setup_time_ms
+    setup_start = time.time()
+    config = load_rag_config()
+
+    if not Path(input.db_path).exists():
+        raise ValueError(
+            f"Database not found at {input.db_path}. "
+            f"Create it with: uv run processor process ./input -o {input.db_path}"
+        )
+
+    table = get_table(input.db_path, input.table, config)
+    ann = get_ann_params(input.db_path, input.table, config)
+    domain = "code" if input.table == "code_chunks" else "text"
+    embedder = get_embedder(_domain_model(domain, config), config.ollama_host)
+    setup_ms = (time.time() - setup_start) * 1000
+
+    filter = _search_filter(input)
+    if filter:
+        optimizations_used.append("prefilter")
+
+    # One embedder call for all (uncached) queries
+    embed_start = time.time()
+    vectors = await cached_embed_many(embedder, input.queries, config)
+    truncate_dims = get_truncate_dims(input.db_path, input.table, config)
+    vectors = [truncate_embedding(v, truncate_dims) for v in vectors]
+    embed_ms = (time.time() - embed_start) * 1000
+
+    hot = None
+    if not (input.hybrid or filter):
+        hot = get_hot_table(input.db_path, input.table, table, config)
+        if hot is not None:
+            optimizations_used.append("hot_cache")
+
+    async def timed_search(query: str, vector: list[float]) -> tuple[list[dict], bool, float]:
+        query_start = time.time()
+        if hot is not None:
+            return hot.search(vector, input.limit), False, (time.time() - query_start) * 1000
+        results, hybrid_used = await search_table_async(
+            table,
+            vector,
+            input.limit,
+            query_text=query,
+            hybrid=input.hybrid,
+            filter=filter,
+            nprobes=ann.get("nprobes"),
+            refine_factor=ann.get("refine_factor"),
+        )
+        return results, hybrid_used, (time.time() - query_start) * 1000
+
+    outcomes = await asyncio.gather(
+        *(timed_search(q, v) for q, v in zip(input.queries, vectors, strict=True))
+    )
+
+    if any(hybrid_used for _, hybrid_used, _ in outcomes):
+        optimizations_used.append("hybrid_rrf")
+
+    query_results = [
+        QueryResults(
+            query=query,
+            results=_format_results(results, input.limit),
+            latency_ms=round(latency_ms, 2),
+        )
+        for query, (results, _, latency_ms) in zip(input.queries, outcomes, strict=True)
+    ]
+
+    fused = None
+    if input.fuse:
+        fused_rows = reciprocal_rank_fusion(
+            [results for results, _, _ in outcomes], k=input.rrf_k
+        )
+        fused = _format_results(fused_rows, input.limit)
+        optimizations_used.append("multi_query_rrf")
+
+    elapsed_ms = (time.time() - start) * 1000
+
+    return SearchBatchResponse(
+        queries=query_results,
+        fused=fused,
+        optimizations_used=optimizations_used,
+        embed_time_ms=round(embed_ms, 2),
+        total_time_ms=round(elapsed_ms, 2),
+        setup_time_ms=round(setup_ms, 2),
+    )
+
+
+@mcp.tool()
+async def search_federated(input: FederatedSearchInput) -> FederatedSearchResponse:
+    """Search text, code and image tables at once and fuse the rankings.
+
+    Use this when a question may be answered by papers/docs, source code
+    or figures and you don't know which. The query is embedded with every
+    required model concurrently (text profile, code profile, and the
+    OpenCLIP text tower for images when available), all tables
+    are searched in parallel, and the rankings are fused with weighted
+    Reciprocal Rank Fusion. Each result records the table it came from.
+
+    Args:
+        input: Federated search configuration with query, tables and weights
+
+    Returns:
+        One fused ranking with per-table provenance and latencies
+
+    Example:
+        search_federated(query="chunk cache eviction", weights={"code_chunks": 2.0})
+    """
+    start = time.time()
+    optimizations_used = ["federated_rrf"]
+
+    # Setup (config, pooled handles) is timed as setup_time_ms
+    setup_start = time.time()
+    config = load_rag_config()
+
+    if not Path(input.db_path).exists():
+        raise ValueError(
+            f"Database not found at {input.db_path}. "
+            f"Create it with: uv run processor process ./input -o {input.db_path}"
+        )
+
+    available = set(get_connection(input.db_path).table_names())
+    table_names = [t for t in dict.fromkeys(input.tables) if t in available]
+    if not table_names:
+        raise ValueError(
+            f"None of {', '.join(input.tables)} found. "
+            f"Available tables: {', '.join(sorted(available))}"
+        )
+
+    tables = {name: get_table(input.db_path, name, config) for name in table_names}
+    ann = {name: get_ann_params(input.db_path, name, config) for name in table_names}
+    models = {name: _domain_model(_FEDERATED_TABLES[name][0], config) for name in table_names}
+    columns = {name: _FEDERATED_TABLES[name][1] for name in table_names}
+    embedders: dict[str, Any] = {
+        model: get_embedder(model, config.ollama_host) for model in set(models.values())
+    }
+    if "image_chunks" in table_names:
+        clip = await _get_clip_embedder(get_connection(input.db_path), config)
+        if clip is not None:
+            models["image_chunks"] = f"clip:{clip.model_name}"
+            embedders[models["image_chunks"]] = clip
+            columns["image_chunks"] = "visual_vector"
+    setup_ms = (time.time() - setup_start) * 1000
+
+    # One embedding per distinct model, all models concurrently
+    embed_start = time.time()
+    model_names = list(embedders)
+    vectors = await asyncio.gather(
+        *(cached_embed(embedders[m], input.query, config) for m in model_names)
+    )
+    query_vectors = dict(zip(model_names, vectors, strict=True))
+    embed_ms = (time.time() - embed_start) * 1000
+
+    async def timed_search(name: str) -> tuple[list[dict], bool, float]:
+        table_start = time.time()
+        vector_column = columns[name]
+        dims = get_truncate_dims(input.db_path, name, config, vector_column or "vector")
+        results, hybrid_used = await search_table_async(
+            tables[name],
+            truncate_embedding(query_vectors[models[name]], dims),
+            input.per_table_k,
+            query_text=input.query,
+            hybrid=input.hybrid,
+            vector_column_name=vector_column,
+            nprobes=ann[name].get("nprobes"),
+            refine_factor=ann[name].get("refine_factor"),
+        )
+        return results, hybrid_used, (time.time() - table_start) * 1000
+
+    outcomes = await asyncio.gather(*(timed_search(name) for name in table_names))
+
+    if any(hybrid_used for _, hybrid_used, _ in outcomes):
+        optimizations_used.append("hybrid_rrf")
+
+    # Tag provenance; ids are only unique within a table
+    ranked_lists = []
+    for name, (results, _, _) in zip(table_names, outcomes, strict=True):
+        ranked = []
+        for rank, r in enumerate(results, 1):
+            row = r.copy()
+            row["_table"] = name
+            row["_table_rank"] = rank
+            row["_fused_id"] = f"{name}:{r.get('id', rank)}"
+            ranked.append(row)
+        ranked_lists.append(ranked)
+
+    fused = reciprocal_rank_fusion(
+        ranked_lists,
+        k=input.rrf_k,
+        weights=[input.weights.get(name, 1.0) for name in table_names],
+        key="_fused_id",
+    )
+
+    results = [
+        FederatedResult(
+            content=(
+                r.get("content")
+                or r.get("vlm_description")
+                or r.get("caption")
+                or ""
+            )[:2000],
+            source_file=r.get("source_file") or r.get("source_paper") or "",
+            score=round(r["_rrf_score"], 6),
+            chunk_id=r.get("id", ""),
+            table=r["_table"],
+            table_rank=r["_table_rank"],
+            metadata={
+                k: v
+                for k, v in r.items()
+                if k not in _HIDDEN_COLUMNS
+                and k not in ("_table", "_table_rank", "_fused_id")
+                and v is not None
+            },
+        )
+        for r in fused[: input.limit]
+    ]
+
+    elapsed_ms = (time.time() - start) * 1000
+
+    return FederatedSearchResponse(
+        results=results,
+        query=input.query,
+        tables_searched=table_names,
+        table_time_ms={
+            name: round(latency_ms, 2)
+            for name, (_, _, latency_ms) in zip(table_names, outcomes, strict=True)
+        },
+        optimizations_used=optimizations_used,
+        embed_time_ms=round(embed_ms, 2),
+        total_time_ms=round(elapsed_ms, 2),
+        setup_time_ms=round(setup_ms, 2),
+    )
+
+
+def _clip_model(db, config: RAGConfig) -> tuple[str, str] | None:
+    """OpenCLIP (model, pretrained) that produced the image table's visual_vector.
+
+    Read from ``_metadata`` (recorded by the processor), falling back to
+    ``config.multimodal_profile``. Returns None when the database records
+    that visual_vector holds text embeddings (OpenCLIP was unavailable at
+    processing time), since CLIP queries would then be meaningless.
+    """
+    from processor.embedders.profiles import EmbedderBackend, get_model_for_profile
+
+    metadata: dict[str, str] = {}
+    if "_metadata" in db.table_names():
+        keys = [
+            "visual_vector_source",
+            "multimodal_open_clip_model",
+            "multimodal_open_clip_pretrained",
+        ]
+        metadata = {
+            row["key"]: row["value"]
+            for row in fetch_rows(db.open_table("_metadata"), "key", keys)
+        }
+
+    if metadata.get("visual_vector_source") == "text":
+        return None
+    if metadata.get("multimodal_open_clip_model"):
+        return (
+            metadata["multimodal_open_clip_model"],
+            metadata.get("multimodal_open_clip_pretrained", ""),
+        )
+
+    profile, _ = get_model_for_profile(
+        "multimodal", config.multimodal_profile, EmbedderBackend.TRANSFORMERS
+    )
+    return profile.open_clip_model, profile.open_clip_pretrained
+
+
+async def _get_clip_embedder(db, config: RAGConfig):
+    """Get the pooled OpenCLIP embedder for the image table, or None if unusable."""
+    model = _clip_model(db, config)
+    if model is None:
+        return None
+    try:
+        embedder = get_clip_embedder(*model, device=config.clip_device)
+    except ImportError:
+        return None
+    return embedder if await embedder.is_available() else None
+
+
 @mcp.tool()
 async def search_images(
-    query: str,
+    query: str = "",
     db_path: str = "./lancedb",
     limit: int = 5,
+    mode: Literal["fused", "text", "visual"] = "fused",
+    image_path: str | None = None,
 ) -> list[ImageSearchResult]:
     """Search for relevant images/figures.
 
-    Searches the image_chunks table using text embeddings of VLM
-    descriptions. Useful for finding figures, charts, and diagrams
-    from processed papers.
+    Each image has two vectors: text_vector (its VLM description, embedded
+    with the text model) and visual_vector (the image itself, embedded
+    with OpenCLIP). In the default "fused" mode the query is embedded with
+    both the text model and the OpenCLIP text tower, both vectors are
+    searched concurrently and the two rankings are fused with RRF.
+    "text" and "visual" search one vector only.
+
+    Pass image_path instead of a query to find images that look like a
+    given image (searches visual_vector with the OpenCLIP image tower).
 
     Args:
         query: Text description to search for
         db_path: LanceDB database path
         limit: Number of results
+        mode: "fused" (both vectors), "text" (descriptions) or "visual" (CLIP)
+        image_path: Query image (query-by-image mode)
 
     Returns:
-        Image results with captions and file paths
+        Image results with captions, file paths and the vectors that matched
     """
-    import lancedb
-
-    from processor.embedders.ollama import OllamaEmbedder
     from processor.embedders.profiles import EmbedderBackend, get_model_for_profile
 
     config = load_rag_config()
 
     if not Path(db_path).exists():
         raise ValueError(f"Database not found at {db_path}")
+    if not query and not image_path:
+        raise ValueError("Provide a query or an image_path")
 
-    db = lancedb.connect(db_path)
+    db = get_connection(db_path)
     if "image_chunks" not in db.table_names():
         return []
 
-    # Get text embedder for query
-    profile, _ = get_model_for_profile(
-        "text", config.text_profile, EmbedderBackend.OLLAMA
-    )
-    embedder = OllamaEmbedder(model=profile.ollama_model, host=config.ollama_host)
-    query_embedding = await embedder.embed(query)
-    await embedder.close()
+    table = get_table(db_path, "image_chunks", config)
+    clip = await _get_clip_embedder(db, config) if image_path or mode != "text" else None
+
+    if clip is None and (image_path or mode == "visual"):
+        raise ValueError(
+            "Visual search needs OpenCLIP (uv sync --extra multimodal) and a database "
+            "whose visual_vector was embedded with it"
+        )
+
+    # Query vectors per searched column
+    vectors: dict[str, list[float]] = {}
+    if image_path:
+        vectors["visual_vector"] = await clip.embed_image(image_path)
+    else:
+        embeds = {}
+        if mode != "visual":
+            profile, _ = get_model_for_profile(
+                "text", config.text_profile, EmbedderBackend.OLLAMA
+            )
+            embedder = get_embedder(profile.ollama_model, config.ollama_host)
+            embeds["text_vector"] = cached_embed(embedder, query, config)
+        if clip is not None:
+            embeds["visual_vector"] = cached_embed(clip, query, config)
+        vectors = dict(zip(embeds, await asyncio.gather(*embeds.values()), strict=True))
+        if "text_vector" in vectors:
+            vectors["text_vector"] = truncate_embedding(
+                vectors["text_vector"], get_truncate_dims(db_path, "image_chunks", config, "text_vector")
+            )
 
-    # Search text embeddings
-    table = db.open_table("image_chunks")
-    results = (
-        table.search(query_embedding, vector_column_name="text_vector")
-        .limit(limit)
-        .to_list()
+    # Search both vectors concurrently; fetch extra candidates for fusion
+    k = limit * 2 if len(vectors) > 1 else limit
+    outcomes = await asyncio.gather(
+        *(
+            search_table_async(table, vector, k, vector_column_name=column)
+            for column, vector in vectors.items()
+        )
     )
+    ranked = {
+        column: results for column, (results, _) in zip(vectors, outcomes, strict=True)
+    }
+    if len(ranked) > 1:
+        results = reciprocal_rank_fusion(list(ranked.values()))[:limit]
+    else:
+        results = next(iter(ranked.values()))[:limit]
+
+    matched = {
+        column: {r.get("id") for r in column_results}
+        for column, column_results in ranked.items()
+    }
 
     return [
         ImageSearchResult(
@@ -341,7 +1041,15 @@ async def search_images(
             vlm_description=(r.get("vlm_description", "") or "")[:500],
             image_path=r.get("image_path", "") or "",
             source_paper=r.get("source_paper", "") or "",
-            score=round(1.0 - r.get("_distance", 0) / 2.0, 4),
+            score=round(
+                r["_rrf_score"] if "_rrf_score" in r else 1.0 - r.get("_distance", 0) / 2.0,
+                4,
+            ),
+            matched_by=[
+                column.removesuffix("_vector")
+                for column, ids in matched.items()
+                if r.get("id") in ids
+            ],
         )
         for r in results
     ]
@@ -360,18 +1068,17 @@ async def list_tables(db_path: str = "./lancedb") -> ListTablesResponse:
     Returns:
         Table information including searchable status
     """
-    import lancedb
-
     if not Path(db_path).exists():
         raise ValueError(f"Database not found at {db_path}")
 
-    db = lancedb.connect(db_path)
+    config = load_rag_config()
+    db = get_connection(db_path)
     tables = {}
 
     for name in db.table_names():
         if name.startswith("_"):
             continue  # Skip metadata tables
-        table = db.open_table(name)
+        table = get_table(db_path, name, config)
         tables[name] = TableInfo(
             name=name,
             row_count=table.count_rows(),
@@ -381,6 +1088,47 @@ async def list_tables(db_path: str = "./lancedb") -> ListTablesResponse:
     return ListTablesResponse(db_path=db_path, tables=tables)
 
 
+@mcp.tool()
+async def cache_stats(clear: bool = False) -> CacheStatsResponse:
+    """Show query-embedding and HyDE cache hit rates.
+
+    Repeated queries reuse cached embeddings and HyDE documents. Use this
+    to check how effective the cache is for the current workload. When the
+    in-memory vector cache is enabled, its pinned tables are listed too.
+
+    Args:
+        clear: Drop all cached entries after reporting
+
+    Returns:
+        Hit/miss counters and hit rate per cache kind
+    """
+    config = load_rag_config()
+    cache = get_query_cache(config)
+    hot_tables = (
+        VectorCacheStats(**vector_cache_stats()) if config.vector_cache.enabled else None
+    )
+
+    if cache is None:
+        return CacheStatsResponse(
+            enabled=False, memory_entries=0, disk_path=None, hot_tables=hot_tables
+        )
+
+    stats = cache.stats()
+    response = CacheStatsResponse(
+        enabled=True,
+        memory_entries=cache.memory_entries,
+        disk_path=cache.disk_path,
+        embedding=CacheKindStats(**stats["embedding"]),
+        hyde=CacheKindStats(**stats["hyde"]),
+        hot_tables=hot_tables,
+    )
+
+    if clear:
+        cache.clear()
+
+    return response
+
+
 @mcp.tool()
 async def generate_config(output_path: str = "./rag_config.yaml") -> str:
     """Generate a template RAG configuration file.
@@ -435,6 +1183,13 @@ def main():
     if config_path:
         load_rag_config(config_path)
 
+    # Handle --evaluate flag: run the evaluation harness instead of the server
+    if "--evaluate" in sys.argv:
+        from .evaluation import main as evaluate_main
+
+        evaluate_main(sys.argv[1:])
+        return
+
     mcp.run()
 
 
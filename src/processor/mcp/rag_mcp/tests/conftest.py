@@ -0,0 +1,79 @@
+"""Shared fixtures for RAG MCP tests."""
+
+from collections.abc import Iterator, Sequence
+
+import pytest
+
+from rag_mcp import server
+from rag_mcp.cache import reset_query_cache
+from rag_mcp.config import RAGConfig
+from rag_mcp.pool import reset_pools
+from rag_mcp.vector_cache import reset_vector_cache
+
+
+class FakeEmbedder:
+    """Embedder stand-in returning a fixed vector and counting calls."""
+
+    def __init__(self, model_name: str = "fake", vector: Sequence[float] = (1.0, 0.0)) -> None:
+        self.model_name = model_name
+        self.vector = list(vector)
+        self.calls = 0
+
+    async def embed(self, text: str) -> list[float]:
+        self.calls += 1
+        return list(self.vector)
+
+
+class FakeClipEmbedder(FakeEmbedder):
+    """OpenCLIP stand-in whose text and image towers point at [0, 1]."""
+
+    def __init__(self, model_name: str, pretrained: str = "openai") -> None:
+        super().__init__(model_name, vector=(0.0, 1.0))
+        self.pretrained = pretrained
+        self.images: list[str] = []
+
+    async def is_available(self) -> bool:
+        return True
+
+    async def embed_image(self, image_path: str) -> list[float]:
+        self.images.append(image_path)
+        return list(self.vector)
+
+
+@pytest.fixture(autouse=True)
+def clean_state() -> Iterator[None]:
+    """Reset pools, query caches and pinned tables around each test."""
+    reset_pools()
+    reset_query_cache()
+    reset_vector_cache()
+    yield
+    reset_pools()
+    reset_query_cache()
+    reset_vector_cache()
+
+
+@pytest.fixture
+def embedders(monkeypatch: pytest.MonkeyPatch) -> dict[str, FakeEmbedder]:
+    """Serve the default config and one fake text embedder per model."""
+    embedders: dict[str, FakeEmbedder] = {}
+
+    def get_embedder(model: str, host: str) -> FakeEmbedder:
+        return embedders.setdefault(model, FakeEmbedder(model))
+
+    monkeypatch.setattr(server, "load_rag_config", lambda: RAGConfig())
+    monkeypatch.setattr(server, "get_embedder", get_embedder)
+    return embedders
+
+
+@pytest.fixture
+def clip_embedders(monkeypatch: pytest.MonkeyPatch) -> dict[tuple[str, str], FakeClipEmbedder]:
+    """Serve one fake CLIP embedder per (model, pretrained) pair."""
+    clips: dict[tuple[str, str], FakeClipEmbedder] = {}
+
+    def get_clip_embedder(
+        model_name: str, pretrained: str, device: str = "auto"
+    ) -> FakeClipEmbedder:
+        return clips.setdefault((model_name, pretrained), FakeClipEmbedder(model_name, pretrained))
+
+    monkeypatch.setattr(server, "get_clip_embedder", get_clip_embedder)
+    return clips
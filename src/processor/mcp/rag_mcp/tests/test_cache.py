@@ -0,0 +1,169 @@
+"""Unit tests for RAG MCP query caches."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from rag_mcp.cache import (
+    QueryCache,
+    cached_embed,
+    cached_hyde_transform,
+    config_fingerprint,
+    get_query_cache,
+)
+from rag_mcp.config import RAGConfig
+from rag_mcp.tests.conftest import FakeClipEmbedder, FakeEmbedder
+
+
+class TestQueryCache:
+    """Test the two-level cache."""
+
+    def test_memory_hit(self) -> None:
+        """Test values are served from memory after put."""
+        cache = QueryCache(fingerprint="fp")
+        cache.put("embedding", ("q", "m"), [0.1, 0.2])
+
+        assert cache.get("embedding", ("q", "m")) == [0.1, 0.2]
+        assert cache.stats()["embedding"]["memory_hits"] == 1
+
+    def test_miss_counted(self) -> None:
+        """Test misses are counted and reflected in hit rate."""
+        cache = QueryCache(fingerprint="fp")
+        assert cache.get("hyde", ("q",)) is None
+        cache.put("hyde", ("q",), "doc")
+        cache.get("hyde", ("q",))
+
+        stats = cache.stats()["hyde"]
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_lru_eviction(self) -> None:
+        """Test the oldest entry is evicted when memory is full."""
+        cache = QueryCache(fingerprint="fp", max_entries=2)
+        cache.put("embedding", ("a",), [1.0])
+        cache.put("embedding", ("b",), [2.0])
+        cache.get("embedding", ("a",))  # a is now most recent
+        cache.put("embedding", ("c",), [3.0])
+
+        assert cache.memory_entries == 2
+        assert cache.get("embedding", ("b",)) is None
+        assert cache.get("embedding", ("a",)) == [1.0]
+
+    def test_disk_level(self, tmp_path: Path) -> None:
+        """Test entries survive in the on-disk store."""
+        disk = str(tmp_path / "cache.sqlite")
+        first = QueryCache(fingerprint="fp", disk_path=disk)
+        first.put("embedding", ("q", "m"), [0.5])
+        first.close()
+
+        second = QueryCache(fingerprint="fp", disk_path=disk)
+        assert second.get("embedding", ("q", "m")) == [0.5]
+        assert second.stats()["embedding"]["disk_hits"] == 1
+
+    def test_disk_ttl_expiry(self, tmp_path: Path) -> None:
+        """Test expired on-disk entries miss."""
+        disk = str(tmp_path / "cache.sqlite")
+        first = QueryCache(fingerprint="fp", disk_path=disk, ttl_seconds=-1)
+        first.put("embedding", ("q", "m"), [0.5])
+        first.close()
+
+        second = QueryCache(fingerprint="fp", disk_path=disk, ttl_seconds=-1)
+        assert second.get("embedding", ("q", "m")) is None
+
+    def test_fingerprint_isolates_entries(self, tmp_path: Path) -> None:
+        """Test entries written under another config fingerprint miss."""
+        disk = str(tmp_path / "cache.sqlite")
+        QueryCache(fingerprint="old", disk_path=disk).put("hyde", ("q",), "doc")
+
+        assert QueryCache(fingerprint="new", disk_path=disk).get("hyde", ("q",)) is None
+
+    async def test_async_disk_off_loop(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test async lookups read and write SQLite in a worker thread, once per batch."""
+        disk = str(tmp_path / "cache.sqlite")
+        first = QueryCache(fingerprint="fp", disk_path=disk)
+        await first.aput_many("embedding", [(("a", "m"), [1.0]), (("b", "m"), [2.0])])
+        first.close()
+
+        second = QueryCache(fingerprint="fp", disk_path=disk)
+        threads: list[str] = []
+        read_disk = second._read_disk
+
+        def record(keys: list[str]) -> dict:
+            threads.append(threading.current_thread().name)
+            return read_disk(keys)
+
+        monkeypatch.setattr(second, "_read_disk", record)
+        values = await second.aget_many("embedding", [("a", "m"), ("b", "m"), ("c", "m")])
+        again = await second.aget("embedding", ("a", "m"))
+
+        assert values == [[1.0], [2.0], None]
+        assert again == [1.0]  # Promoted to memory, no second disk read
+        assert len(threads) == 1 and threads[0] != threading.current_thread().name
+        assert second.stats()["embedding"]["disk_hits"] == 2
+
+
+class TestGlobalCache:
+    """Test config-driven cache lifecycle."""
+
+    def test_disabled(self) -> None:
+        """Test no cache is returned when disabled."""
+        config = RAGConfig(cache={"enabled": False})
+        assert get_query_cache(config) is None
+
+    def test_invalidated_on_config_change(self) -> None:
+        """Test a config change produces a fresh cache."""
+        config = RAGConfig()
+        cache = get_query_cache(config)
+        cache.put("embedding", ("q", "m"), [1.0])
+
+        changed = RAGConfig(text_profile="high")
+        assert config_fingerprint(changed) != config_fingerprint(config)
+        assert get_query_cache(changed).get("embedding", ("q", "m")) is None
+
+    async def test_cached_embed(self) -> None:
+        """Test repeated queries only hit the embedder once."""
+        config = RAGConfig()
+        embedder = FakeEmbedder()
+
+        first = await cached_embed(embedder, "what is hdf5", config)
+        second = await cached_embed(embedder, "what is hdf5", config)
+
+        assert first == second
+        assert embedder.calls == 1
+
+    async def test_clip_keyed_on_pretrained(self) -> None:
+        """Test CLIP weight sets of one architecture get separate entries."""
+        config = RAGConfig()
+        openai = FakeClipEmbedder("ViT-B-32", "openai")
+        laion = FakeClipEmbedder("ViT-B-32", "laion2b_s34b_b79k")
+        laion.vector = [1.0, 0.0]
+
+        await cached_embed(openai, "a chart", config)
+        vector = await cached_embed(laion, "a chart", config)
+        await cached_embed(laion, "a chart", config)
+
+        assert vector == [1.0, 0.0]
+        assert (openai.calls, laion.calls) == (1, 1)
+
+    async def test_cached_hyde(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test HyDE documents are cached, failures are not."""
+        from rag_mcp.optimizations import hyde
+
+        calls: list[str] = []
+
+        async def fake_transform(query: str, config: RAGConfig) -> str:
+            calls.append(query)
+            return query if query == "fails" else f"passage about {query}"
+
+        monkeypatch.setattr(hyde, "hyde_transform", fake_transform)
+        config = RAGConfig()
+
+        assert await cached_hyde_transform("caching", config) == "passage about caching"
+        await cached_hyde_transform("caching", config)
+        await cached_hyde_transform("fails", config)
+        await cached_hyde_transform("fails", config)
+
+        assert calls == ["caching", "fails", "fails"]
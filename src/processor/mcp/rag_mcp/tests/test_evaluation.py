@@ -0,0 +1,182 @@
+"""Unit tests for the RAG MCP evaluation harness."""
+
+import json
+from pathlib import Path
+
+import lancedb
+import pytest
+
+from rag_mcp import server
+from rag_mcp.config import RAGConfig
+from rag_mcp.evaluation import (
+    QueryCase,
+    evaluate,
+    flag_combinations,
+    load_query_set,
+    ndcg_at_k,
+    recall_at_k,
+    reciprocal_rank,
+)
+from rag_mcp.optimizations import hyde, reranker
+from rag_mcp.optimizations.reranker import clear_reranker_cache
+from rag_mcp.tests.conftest import FakeEmbedder
+
+# Stand-in embedding space: queries mentioning a topic land on its axis
+_TOPICS = ["cache", "index", "query"]
+
+
+class TopicEmbedder(FakeEmbedder):
+    """Embedder stand-in mapping topic words to axis vectors."""
+
+    async def embed(self, text: str) -> list[float]:
+        return [1.0 if topic in text else 0.0 for topic in _TOPICS]
+
+
+class FakeCrossEncoder:
+    """Cross-encoder stand-in preferring documents that say 'best'."""
+
+    def predict(self, pairs: list[list[str]], batch_size: int = 32) -> list[float]:
+        return [1.0 if "best" in doc else 0.0 for _, doc in pairs]
+
+
+async def fake_hyde(query: str, config: RAGConfig) -> str:
+    """HyDE stand-in that rewrites every query towards the index topic."""
+    return "index"
+
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch: pytest.MonkeyPatch):
+    """Use stand-in embedder, reranker and HyDE; reset the reranker cache."""
+    clear_reranker_cache()
+    monkeypatch.setattr(server, "load_rag_config", lambda: RAGConfig())
+    monkeypatch.setattr(server, "get_embedder", lambda model, host: TopicEmbedder())
+    monkeypatch.setattr(reranker, "_load_model", lambda config: FakeCrossEncoder())
+    monkeypatch.setattr(hyde, "hyde_transform", fake_hyde)
+    yield
+    clear_reranker_cache()
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    """Create a table where reranking fixes the vector ranking."""
+    path = str(tmp_path / "lancedb")
+    db = lancedb.connect(path)
+    db.create_table(
+        "text_chunks",
+        [
+            {"id": "c1", "content": "cache notes", "parent_id": "", "vector": [1.0, 0.0, 0.0]},
+            {"id": "c2", "content": "best cache", "parent_id": "", "vector": [0.9, 0.1, 0.0]},
+            {"id": "i1", "content": "index notes", "parent_id": "", "vector": [0.0, 1.0, 0.0]},
+        ],
+    )
+    return path
+
+
+class TestMetrics:
+    """Test ranking metrics."""
+
+    def test_recall(self) -> None:
+        """Test recall counts relevant ids in the top k."""
+        ranked = [{"a"}, {"x"}, {"b"}]
+        assert recall_at_k(ranked, {"a": 1, "b": 1}, k=2) == 0.5
+        assert recall_at_k(ranked, {"a": 1, "b": 1}, k=3) == 1.0
+
+    def test_reciprocal_rank(self) -> None:
+        """Test MRR uses the first relevant rank."""
+        assert reciprocal_rank([{"x"}, {"a"}], {"a": 1}, k=5) == 0.5
+        assert reciprocal_rank([{"x"}, {"a"}], {"a": 1}, k=1) == 0.0
+
+    def test_ndcg(self) -> None:
+        """Test ideal orderings score 1 and swapped grades score less."""
+        relevant = {"a": 2, "b": 1}
+        assert ndcg_at_k([{"a"}, {"b"}], relevant, k=2) == pytest.approx(1.0)
+        assert ndcg_at_k([{"b"}, {"a"}], relevant, k=2) < 1.0
+
+    def test_expanded_ids_credited_once(self) -> None:
+        """Test a parent covering two relevant chunks is not double counted."""
+        ranked = [{"parent", "a", "b"}, {"a"}]
+        assert recall_at_k(ranked, {"a": 1, "b": 1}, k=2) == 1.0
+        assert ndcg_at_k(ranked, {"a": 1, "b": 1}, k=2) < 1.0
+
+
+class TestQuerySet:
+    """Test query set loading."""
+
+    def test_jsonl(self, tmp_path: Path) -> None:
+        """Test id lists become grade-1 labels."""
+        path = tmp_path / "queries.jsonl"
+        path.write_text(
+            json.dumps({"query": "q1", "relevant": ["a", "b"]})
+            + "\n\n"
+            + json.dumps({"query": "q2", "relevant": {"c": 2}, "table": "code_chunks"})
+        )
+
+        cases = load_query_set(path)
+
+        assert cases[0].relevant == {"a": 1.0, "b": 1.0}
+        assert cases[1].table == "code_chunks"
+
+    def test_yaml(self, tmp_path: Path) -> None:
+        """Test a YAML queries list is accepted."""
+        path = tmp_path / "queries.yaml"
+        path.write_text("queries:\n  - query: q\n    relevant: [a]\n")
+
+        assert load_query_set(path)[0].relevant == {"a": 1.0}
+
+
+class TestEvaluate:
+    """Test the combination runner."""
+
+    def test_combinations(self) -> None:
+        """Test every on/off combination is produced, baseline first."""
+        combos = flag_combinations(("hybrid", "rerank"))
+
+        assert len(combos) == 4
+        assert combos[0] == {"hybrid": False, "rerank": False}
+
+    async def test_report(self, db_path: str) -> None:
+        """Test quality and per-stage latency are reported per combination."""
+        queries = [QueryCase(query="cache", relevant=["c2"])]
+
+        report = await evaluate(
+            queries, db_path=db_path, k=1, flags=("use_hyde", "rerank"), repeat=2
+        )
+        by_flags = {tuple(r.flags.values()): r for r in report.results}
+
+        assert report.queries == 1
+        assert by_flags[(False, False)].recall == 0.0  # c1 is the nearest vector
+        assert by_flags[(False, True)].mrr == 1.0  # Reranking promotes c2
+        assert by_flags[(True, False)].recall == 0.0  # HyDE drifts to the index topic
+        assert "rerank" in by_flags[(False, True)].latency_ms
+        assert "hyde" in by_flags[(True, False)].latency_ms
+        assert "hyde" not in by_flags[(False, False)].latency_ms
+        latency = by_flags[(False, False)].latency_ms["total"]
+        assert latency.p50 <= latency.p95 <= latency.p99
+
+        table = report.to_markdown()
+        assert "use_hyde+rerank" in table
+        assert "recall@1" in table
+
+    async def test_rerank_scores_not_shared(
+        self, db_path: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test each combination scores with the model instead of the previous one's cache."""
+        model = FakeCrossEncoder()
+        batches: list[int] = []
+        predict = model.predict
+
+        def counting_predict(pairs: list[list[str]], batch_size: int = 32) -> list[float]:
+            batches.append(len(pairs))
+            return predict(pairs, batch_size)
+
+        monkeypatch.setattr(model, "predict", counting_predict)
+        monkeypatch.setattr(reranker, "_load_model", lambda config: model)
+
+        await evaluate(
+            [QueryCase(query="cache", relevant=["c2"])],
+            db_path=db_path,
+            k=1,
+            flags=("expand_parents", "rerank"),
+        )
+
+        assert len(batches) == 2  # Once per combination with rerank on
@@ -0,0 +1,121 @@
+"""Unit tests for RAG MCP federated search."""
+
+from pathlib import Path
+
+import lancedb
+import pytest
+
+from rag_mcp import server
+from rag_mcp.server import FederatedSearchInput, search_federated
+from rag_mcp.tests.conftest import FakeClipEmbedder
+
+
+@pytest.fixture(autouse=True)
+def no_clip(embedders: dict, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use fake text embedders and leave OpenCLIP unavailable."""
+
+    def get_clip_embedder(model_name: str, pretrained: str, device: str = "auto"):
+        raise ImportError("open_clip")
+
+    monkeypatch.setattr(server, "get_clip_embedder", get_clip_embedder)
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    """Create text, code and image tables with overlapping ids."""
+    path = str(tmp_path / "lancedb")
+    db = lancedb.connect(path)
+    db.create_table(
+        "text_chunks",
+        [
+            {"id": "1", "content": "text near", "source_file": "a.md", "vector": [1.0, 0.0]},
+            {"id": "2", "content": "text far", "source_file": "b.md", "vector": [0.0, 1.0]},
+        ],
+    )
+    db.create_table(
+        "code_chunks",
+        [{"id": "1", "content": "code near", "source_file": "a.py", "vector": [0.9, 0.1]}],
+    )
+    db.create_table(
+        "image_chunks",
+        [
+            {
+                "id": "img",
+                "vlm_description": "a chart",
+                "source_paper": "paper-1",
+                "text_vector": [1.0, 0.0],
+                "visual_vector": [0.5, 0.5],
+            }
+        ],
+    )
+    return path
+
+
+class TestSearchFederated:
+    """Test multi-table search with RRF fusion."""
+
+    async def test_fuses_all_tables(self, db_path: str, embedders: dict) -> None:
+        """Test every table contributes, with provenance and shared embedders."""
+        response = await search_federated(FederatedSearchInput(query="q", db_path=db_path))
+
+        assert response.tables_searched == ["text_chunks", "code_chunks", "image_chunks"]
+        assert set(response.table_time_ms) == set(response.tables_searched)
+        assert {(r.table, r.chunk_id) for r in response.results} == {
+            ("text_chunks", "1"),
+            ("text_chunks", "2"),
+            ("code_chunks", "1"),
+            ("image_chunks", "img"),
+        }
+        image = next(r for r in response.results if r.table == "image_chunks")
+        assert image.content == "a chart"
+        assert image.source_file == "paper-1"
+        # Text and image tables share the text-profile embedder
+        assert len(embedders) == 2
+
+    async def test_images_searched_with_clip(
+        self, db_path: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test image chunks are matched on visual_vector with the CLIP text tower."""
+        db = lancedb.connect(db_path)
+        db.open_table("image_chunks").add(
+            [
+                {
+                    "id": "photo",
+                    "vlm_description": "a photo",
+                    "source_paper": "paper-2",
+                    "text_vector": [0.0, 1.0],
+                    "visual_vector": [0.0, 1.0],
+                }
+            ]
+        )
+        clip = FakeClipEmbedder("ViT-B-32")
+        monkeypatch.setattr(server, "get_clip_embedder", lambda *args, **kwargs: clip)
+
+        response = await search_federated(
+            FederatedSearchInput(query="q", db_path=db_path, tables=["image_chunks"])
+        )
+
+        # The text model's [1, 0] query would rank "img" first on text_vector
+        assert [r.chunk_id for r in response.results] == ["photo", "img"]
+
+    async def test_weights(self, db_path: str) -> None:
+        """Test table weights decide between equally ranked hits."""
+        response = await search_federated(
+            FederatedSearchInput(
+                query="q",
+                db_path=db_path,
+                tables=["text_chunks", "code_chunks"],
+                weights={"code_chunks": 2.0},
+            )
+        )
+
+        assert response.results[0].table == "code_chunks"
+        assert response.results[0].table_rank == 1
+
+    async def test_missing_tables_skipped(self, db_path: str) -> None:
+        """Test tables absent from the database are skipped."""
+        lancedb.connect(db_path).drop_table("image_chunks")
+
+        response = await search_federated(FederatedSearchInput(query="q", db_path=db_path))
+
+        assert "image_chunks" not in response.tables_searched
@@ -0,0 +1,89 @@
+"""Unit tests for RAG MCP dual-vector image search."""
+
+from pathlib import Path
+
+import lancedb
+import pytest
+
+from rag_mcp.server import search_images
+
+pytestmark = pytest.mark.usefixtures("embedders", "clip_embedders")
+
+
+def make_db(tmp_path: Path, visual_source: str = "openclip") -> str:
+    """Create an image table where text and visual rankings disagree."""
+    path = str(tmp_path / "lancedb")
+    db = lancedb.connect(path)
+    db.create_table(
+        "image_chunks",
+        [
+            {
+                "id": "chart",
+                "figure_id": "1",
+                "vlm_description": "a bar chart",
+                "text_vector": [1.0, 0.0],
+                "visual_vector": [0.6, 0.4],
+            },
+            {
+                "id": "photo",
+                "figure_id": "2",
+                "vlm_description": "a photo",
+                "text_vector": [0.0, 1.0],
+                "visual_vector": [0.0, 1.0],
+            },
+        ],
+    )
+    db.create_table(
+        "_metadata",
+        [
+            {"key": "visual_vector_source", "value": visual_source},
+            {"key": "multimodal_open_clip_model", "value": "ViT-B-32"},
+            {"key": "multimodal_open_clip_pretrained", "value": "openai"},
+        ],
+    )
+    return path
+
+
+class TestSearchImages:
+    """Test text, visual and fused image search."""
+
+    async def test_fused(self, tmp_path: Path, clip_embedders: dict) -> None:
+        """Test both vectors are searched and fused, with provenance."""
+        results = await search_images("bar chart", db_path=make_db(tmp_path), limit=2)
+
+        assert {r.figure_id for r in results} == {"1", "2"}
+        assert all(set(r.matched_by) == {"text", "visual"} for r in results)
+        assert list(clip_embedders) == [("ViT-B-32", "openai")]  # Model read from _metadata
+
+    async def test_single_vector_modes(self, tmp_path: Path) -> None:
+        """Test text and visual modes rank by their own vector."""
+        db_path = make_db(tmp_path)
+
+        text = await search_images("q", db_path=db_path, limit=1, mode="text")
+        visual = await search_images("q", db_path=db_path, limit=1, mode="visual")
+
+        assert (text[0].figure_id, text[0].matched_by) == ("1", ["text"])
+        assert (visual[0].figure_id, visual[0].matched_by) == ("2", ["visual"])
+
+    async def test_query_by_image(self, tmp_path: Path, clip_embedders: dict) -> None:
+        """Test an input image is embedded and matched against visual_vector."""
+        results = await search_images(db_path=make_db(tmp_path), limit=1, image_path="q.png")
+
+        assert results[0].figure_id == "2"
+        assert results[0].matched_by == ["visual"]
+        assert clip_embedders[("ViT-B-32", "openai")].images == ["q.png"]
+
+    async def test_text_visual_vectors(self, tmp_path: Path) -> None:
+        """Test databases without CLIP visual vectors fall back to text search."""
+        db_path = make_db(tmp_path, visual_source="text")
+
+        results = await search_images("q", db_path=db_path, limit=2)
+
+        assert all(r.matched_by == ["text"] for r in results)
+        with pytest.raises(ValueError, match="OpenCLIP"):
+            await search_images("q", db_path=db_path, mode="visual")
+
+    async def test_requires_query_or_image(self, tmp_path: Path) -> None:
+        """Test a query or image is required."""
+        with pytest.raises(ValueError, match="query or an image_path"):
+            await search_images(db_path=make_db(tmp_path))
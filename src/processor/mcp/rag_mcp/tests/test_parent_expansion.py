@@ -0,0 +1,113 @@
+"""Unit tests for RAG MCP parent and sibling expansion."""
+
+from pathlib import Path
+from typing import Any
+
+import lancedb
+import pytest
+
+from rag_mcp.optimizations.parent_expansion import (
+    expand_to_parents,
+    expand_with_siblings,
+    get_parent_content,
+)
+
+
+def row(id: str, source_file: str, start_line: int, parent_id: str | None = None) -> dict:
+    """Build a chunk row."""
+    return {
+        "id": id,
+        "content": f"content {id}",
+        "source_file": source_file,
+        "start_line": start_line,
+        "end_line": start_line + 9,
+        "parent_id": parent_id,
+        "vector": [float(start_line), 1.0],
+    }
+
+
+@pytest.fixture
+def table(tmp_path: Path) -> Any:
+    """Create a table with two files, one parent section and scalar indexes."""
+    db = lancedb.connect(str(tmp_path / "lancedb"))
+    table = db.create_table(
+        "text_chunks",
+        [
+            row("sec", "a.md", 0),
+            row("a1", "a.md", 10, parent_id="sec"),
+            row("a2", "a.md", 20, parent_id="sec"),
+            row("a3", "a.md", 30),
+            row("b1", "b.md", 0),
+            row("b2", "b.md", 10),
+        ],
+    )
+    for column in ("id", "source_file", "parent_id"):
+        table.create_scalar_index(column)
+    return table
+
+
+class TestExpandToParents:
+    """Test parent expansion."""
+
+    async def test_replaced_by_parent(self, table: Any) -> None:
+        """Test chunks sharing a parent collapse into the parent record."""
+        results = [
+            {**row("a2", "a.md", 20, "sec"), "_distance": 0.1},
+            {**row("a1", "a.md", 10, "sec"), "_distance": 0.2},
+            {**row("b1", "b.md", 0), "_distance": 0.3},
+        ]
+
+        expanded = await expand_to_parents(results, table)
+
+        assert [r["id"] for r in expanded] == ["sec", "b1"]
+        assert expanded[0]["content"] == "content sec"
+        assert expanded[0]["_distance"] == 0.1
+        assert expanded[0]["_expanded_from"] == ["a2", "a1"]
+        assert "vector" not in expanded[0]
+
+    async def test_missing_parent_kept(self, table: Any) -> None:
+        """Test chunks whose parent is not stored are kept as-is."""
+        results = [row("x", "c.md", 0, parent_id="missing")]
+
+        expanded = await expand_to_parents(results, table)
+
+        assert [r["id"] for r in expanded] == ["x"]
+
+    async def test_parent_content(self, table: Any) -> None:
+        """Test parent content lookup by id."""
+        assert await get_parent_content(["sec", "nope"], table) == {"sec": "content sec"}
+
+
+class TestExpandWithSiblings:
+    """Test sibling expansion."""
+
+    async def test_adjacent_chunks_stitched(self, table: Any) -> None:
+        """Test neighbours from the same file are stitched around the hit."""
+        expanded = await expand_with_siblings([row("a2", "a.md", 20, "sec")], table)
+
+        doc = expanded[0]
+        assert doc["content"] == "content a1\ncontent a2\ncontent a3"
+        assert doc["start_line"] == 10
+        assert doc["end_line"] == 39
+        assert doc["_sibling_ids"] == ["a1", "a3"]
+
+    async def test_file_boundaries(self, table: Any) -> None:
+        """Test siblings never cross into other files."""
+        expanded = await expand_with_siblings([row("b1", "b.md", 0)], table, window=2)
+
+        assert expanded[0]["_sibling_ids"] == ["b2"]
+
+    async def test_unknown_rows_kept(self, table: Any) -> None:
+        """Test results that are not in the table are returned unchanged."""
+        result = row("zz", "z.md", 0)
+
+        assert await expand_with_siblings([result], table) == [result]
+
+    async def test_window_bounds_lookup(self, table: Any) -> None:
+        """Test only chunks near the hit are read, not the whole file."""
+        table.add([row("far", "a.md", 500)])
+
+        expanded = await expand_with_siblings([row("a3", "a.md", 30)], table)
+
+        assert expanded[0]["_sibling_ids"] == ["a2"]
+        assert expanded[0]["end_line"] == 39
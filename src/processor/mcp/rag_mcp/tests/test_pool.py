@@ -0,0 +1,168 @@
+"""Unit tests for RAG MCP resource pools."""
+
+import asyncio
+from pathlib import Path
+
+import lancedb
+import pyarrow as pa
+import pytest
+
+from rag_mcp.config import RAGConfig
+from rag_mcp.pool import (
+    get_ann_params,
+    get_connection,
+    get_embedder,
+    get_table,
+    get_truncate_dims,
+    pool_stats,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> str:
+    """Create a small LanceDB database with one table."""
+    path = tmp_path / "lancedb"
+    db = lancedb.connect(str(path))
+    db.create_table(
+        "text_chunks",
+        [{"id": "a", "content": "alpha", "vector": [0.1, 0.2]}],
+    )
+    return str(path)
+
+
+class TestConnectionPool:
+    """Test pooled connections."""
+
+    def test_connection_reused(self, db_path: str) -> None:
+        """Test the same connection is returned for the same path."""
+        assert get_connection(db_path) is get_connection(db_path)
+        assert pool_stats()["connections"] == 1
+
+
+class TestTablePool:
+    """Test pooled table handles."""
+
+    def test_table_reused(self, db_path: str) -> None:
+        """Test table handles are reused between calls."""
+        config = RAGConfig()
+        first = get_table(db_path, "text_chunks", config)
+        second = get_table(db_path, "text_chunks", config)
+
+        assert first is second
+        assert pool_stats()["tables"] == 1
+
+    def test_missing_table(self, db_path: str) -> None:
+        """Test missing tables raise a helpful error."""
+        with pytest.raises(ValueError, match="Available tables: text_chunks"):
+            get_table(db_path, "code_chunks", RAGConfig())
+
+    def test_refresh_on_new_version(self, db_path: str) -> None:
+        """Test pooled tables pick up rows written by another handle."""
+        config = RAGConfig(table_refresh_interval=0.0)
+        table = get_table(db_path, "text_chunks", config)
+        assert table.count_rows() == 1
+
+        writer = lancedb.connect(db_path).open_table("text_chunks")
+        writer.add([{"id": "b", "content": "beta", "vector": [0.3, 0.4]}])
+
+        refreshed = get_table(db_path, "text_chunks", config)
+        assert refreshed.count_rows() == 2
+
+    def test_no_refresh_within_interval(self, db_path: str) -> None:
+        """Test version checks are skipped within the refresh interval."""
+        config = RAGConfig(table_refresh_interval=3600.0)
+        table = get_table(db_path, "text_chunks", config)
+        version = table.version
+
+        writer = lancedb.connect(db_path).open_table("text_chunks")
+        writer.add([{"id": "b", "content": "beta", "vector": [0.3, 0.4]}])
+
+        assert get_table(db_path, "text_chunks", config).version == version
+
+
+class TestEmbedderPool:
+    """Test pooled embedders."""
+
+    async def test_embedder_reused(self) -> None:
+        """Test embedders are reused for the same model and host."""
+        first = get_embedder("qwen3-embedding:0.6b", "http://localhost:11434")
+        second = get_embedder("qwen3-embedding:0.6b", "http://localhost:11434")
+        other = get_embedder("other-model", "http://localhost:11434")
+
+        assert first is second
+        assert first is not other
+        assert pool_stats()["embedders"] == 2
+
+    async def test_closed_with_server(self) -> None:
+        """Test the server lifespan closes pooled embedders on shutdown."""
+        from rag_mcp.server import lifespan, mcp
+
+        async with lifespan(mcp):
+            embedder = get_embedder("qwen3-embedding:0.6b", "http://localhost:11434")
+            client = embedder._get_client()
+
+        assert client.is_closed
+        assert pool_stats()["embedders"] == 0
+
+    def test_closed_loop_dropped(self) -> None:
+        """Test embedders of closed event loops are not reused or kept."""
+
+        async def embedder():
+            return get_embedder("qwen3-embedding:0.6b", "http://localhost:11434")
+
+        first = asyncio.run(embedder())
+        second = asyncio.run(embedder())
+
+        assert first is not second
+        assert pool_stats()["embedders"] == 1
+
+
+class TestAnnParamsPool:
+    """Test cached tuned ANN parameters."""
+
+    def test_read_from_metadata(self, db_path: str) -> None:
+        """Test tuned values are read from _metadata and cached."""
+        db = lancedb.connect(db_path)
+        db.create_table(
+            "_metadata",
+            [
+                {"key": "text_chunks_nprobes", "value": "12"},
+                {"key": "text_chunks_refine_factor", "value": "5"},
+                {"key": "code_chunks_nprobes", "value": "40"},
+            ],
+        )
+        config = RAGConfig(table_refresh_interval=60)
+
+        assert get_ann_params(db_path, "text_chunks", config) == {
+            "nprobes": 12,
+            "refine_factor": 5,
+        }
+
+        db.drop_table("_metadata")
+        assert get_ann_params(db_path, "text_chunks", config)["nprobes"] == 12
+
+    def test_no_metadata(self, db_path: str) -> None:
+        """Test databases without tuned values give no defaults."""
+        assert get_ann_params(db_path, "text_chunks", RAGConfig()) == {}
+
+
+class TestTruncateDimsPool:
+    """Test Matryoshka truncation follows the searched table's vectors."""
+
+    def test_read_from_schema(self, db_path: str) -> None:
+        """Test the dimension comes from the table, not from ``_metadata``."""
+        db = lancedb.connect(db_path)
+        db.create_table("_metadata", [{"key": "text_truncate_dims", "value": "256"}])
+        config = RAGConfig(table_refresh_interval=60)
+
+        assert get_truncate_dims(db_path, "text_chunks", config) == 2
+
+    def test_variable_length_column(self, db_path: str) -> None:
+        """Test columns without a fixed size give no truncation."""
+        db = lancedb.connect(db_path)
+        schema = pa.schema([("id", pa.string()), ("text_vector", pa.list_(pa.float32()))])
+        db.create_table(
+            "image_chunks", [{"id": "a", "text_vector": [0.1, 0.2, 0.3]}], schema=schema
+        )
+
+        assert get_truncate_dims(db_path, "image_chunks", RAGConfig(), "text_vector") is None
@@ -0,0 +1,162 @@
+"""Unit tests for the RAG MCP reranking worker."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from rag_mcp.config import RAGConfig
+from rag_mcp.optimizations import reranker
+from rag_mcp.optimizations.reranker import (
+    RerankWorker,
+    clear_reranker_cache,
+    rerank_results,
+    reranker_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_reranker():
+    """Reset the worker and score cache around each test."""
+    clear_reranker_cache()
+    yield
+    clear_reranker_cache()
+
+
+class FakeCrossEncoder:
+    """Cross-encoder stand-in scoring by document length."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.calls: list[int] = []
+        self.thread_names: list[str] = []
+
+    def predict(self, pairs: list[list[str]], batch_size: int = 32) -> list[float]:
+        self.calls.append(len(pairs))
+        self.thread_names.append(threading.current_thread().name)
+        time.sleep(self.delay)
+        return [float(len(doc)) for _, doc in pairs]
+
+
+@pytest.fixture
+def model(monkeypatch: pytest.MonkeyPatch) -> FakeCrossEncoder:
+    """Install a fake cross-encoder as the worker's model."""
+    fake = FakeCrossEncoder()
+    monkeypatch.setattr(reranker, "_load_model", lambda config: fake)
+    return fake
+
+
+def candidates(*contents: str) -> list[dict]:
+    """Build candidate rows."""
+    return [{"id": c, "content": c, "content_hash": f"h-{c}"} for c in contents]
+
+
+class TestRerankWorker:
+    """Test the background scoring thread."""
+
+    async def test_scores_off_event_loop(self) -> None:
+        """Test inference runs on the worker thread, not the loop thread."""
+        model = FakeCrossEncoder()
+        worker = RerankWorker(lambda: model, batch_window_ms=0)
+
+        scores = await worker.score([["q", "ab"], ["q", "abcd"]])
+        worker.close()
+
+        assert scores == [2.0, 4.0]
+        assert model.thread_names == ["rerank-worker"]
+
+    async def test_concurrent_requests_share_batch(self) -> None:
+        """Test pairs from concurrent requests are scored in one model call."""
+        model = FakeCrossEncoder()
+        worker = RerankWorker(lambda: model, batch_window_ms=50)
+
+        first, second = await asyncio.gather(
+            worker.score([["q1", "a"], ["q1", "bb"]]),
+            worker.score([["q2", "ccc"]]),
+        )
+        worker.close()
+
+        assert first == [1.0, 2.0]
+        assert second == [3.0]
+        assert model.calls == [3]
+
+    async def test_event_loop_not_blocked(self) -> None:
+        """Test the loop keeps running while the model scores."""
+        worker = RerankWorker(lambda: FakeCrossEncoder(delay=0.2), batch_window_ms=0)
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            for _ in range(10):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        await asyncio.gather(worker.score([["q", "doc"]]), ticker())
+        worker.close()
+
+        assert ticks == 10
+
+    async def test_load_error_propagates(self) -> None:
+        """Test model load failures are raised to callers."""
+
+        def fail() -> None:
+            raise ImportError("no sentence-transformers")
+
+        worker = RerankWorker(fail, batch_window_ms=0)
+        with pytest.raises(ImportError):
+            await worker.score([["q", "doc"]])
+        worker.close()
+
+    def test_survives_closed_caller_loop(self, model: FakeCrossEncoder) -> None:
+        """Test a caller loop closed mid-batch does not kill the worker."""
+        model.delay = 0.2
+        config = RAGConfig()
+        config.reranker.batch_window_ms = 0
+        worker = reranker._get_worker(config)
+
+        loop = asyncio.new_event_loop()
+        task = loop.create_task(worker.score([["q", "doc"]]))
+        loop.run_until_complete(asyncio.sleep(0.05))  # Request is being scored
+        task.cancel()
+        loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+        loop.close()
+        time.sleep(0.3)  # Batch finishes and hands off to the closed loop
+
+        assert worker.is_alive()
+        results = asyncio.run(
+            rerank_results("q", candidates("a", "ccc", "bb"), top_n=1, config=config)
+        )
+        assert [r["id"] for r in results] == ["ccc"]
+        assert reranker._get_worker(config) is worker
+
+
+class TestRerankResults:
+    """Test reranking through the global worker."""
+
+    async def test_orders_by_score(self, model: FakeCrossEncoder) -> None:
+        """Test results are ordered by cross-encoder score."""
+        results = await rerank_results(
+            "q", candidates("a", "ccc", "bb"), top_n=2, config=RAGConfig()
+        )
+
+        assert [r["id"] for r in results] == ["ccc", "bb"]
+        assert results[0]["_rerank_score"] == 3.0
+
+    async def test_scores_cached(self, model: FakeCrossEncoder) -> None:
+        """Test previously scored (query, content) pairs skip the model."""
+        config = RAGConfig()
+        await rerank_results("q", candidates("a", "bb"), top_n=1, config=config)
+        await rerank_results("q", candidates("a", "bb", "ccc"), top_n=1, config=config)
+
+        assert model.calls == [2, 1]
+        assert reranker_stats()["cached_scores"] == 3
+
+    async def test_score_cache_disabled(self, model: FakeCrossEncoder) -> None:
+        """Test a zero-size score cache always scores."""
+        config = RAGConfig(reranker={"score_cache_size": 0})
+        await rerank_results("q", candidates("a", "bb"), top_n=1, config=config)
+        await rerank_results("q", candidates("a", "bb"), top_n=1, config=config)
+
+        assert model.calls == [2, 2]
+        assert reranker_stats()["cached_scores"] == 0
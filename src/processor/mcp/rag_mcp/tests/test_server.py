@@ -1,9 +1,13 @@
 """Unit tests for RAG MCP server."""
 
 
+import pytest
+from pydantic import ValidationError
+
 from rag_mcp.server import (
     ImageSearchResult,
     ListTablesResponse,
+    SearchBatchInput,
     SearchInput,
     SearchResponse,
     SearchResult,
@@ -27,6 +31,22 @@ class TestSearchInput:
         assert input.rerank is False
         assert input.rerank_top_k == 20
         assert input.expand_parents is False
+        assert input.expand_siblings is False
+        assert input.filter is None
+        assert input.language is None
+        assert input.source_prefix is None
+        assert input.nprobes is None
+        assert input.refine_factor is None
+        assert input.adaptive_nprobes is False
+        assert input.latency_budget_ms is None
+        assert input.quantized is None
+        assert input.rescore_factor is None
+
+    def test_quantized_modes(self) -> None:
+        """Test only binary and int8 quantized searches are accepted."""
+        assert SearchInput(query="q", quantized="int8", rescore_factor=20).quantized == "int8"
+        with pytest.raises(ValidationError):
+            SearchInput(query="q", quantized="pq")
 
     def test_custom_values(self) -> None:
         """Test custom input values."""
@@ -199,6 +219,26 @@ class TestListTablesResponse:
         assert response.tables["text_chunks"].row_count == 1000
 
 
+class TestSearchBatchInput:
+    """Test SearchBatchInput model."""
+
+    def test_default_values(self) -> None:
+        """Test default batch search values."""
+        input = SearchBatchInput(queries=["a", "b"])
+
+        assert input.table == "text_chunks"
+        assert input.limit == 5
+        assert input.fuse is False
+        assert input.rrf_k == 60
+        assert input.language is None
+        assert input.filter is None
+
+    def test_requires_queries(self) -> None:
+        """Test an empty query list is rejected."""
+        with pytest.raises(ValidationError):
+            SearchBatchInput(queries=[])
+
+
 class TestMCPTools:
     """Test MCP tool registration."""
 
@@ -214,10 +254,14 @@ class TestMCPTools:
         from rag_mcp.server import (
             list_tables,
             search,
+            search_batch,
+            search_federated,
             search_images,
         )
 
         assert search is not None
+        assert search_batch is not None
+        assert search_federated is not None
         assert search_images is not None
         assert list_tables is not None
 
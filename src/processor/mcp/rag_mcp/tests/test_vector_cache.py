@@ -0,0 +1,139 @@
+"""Unit tests for the RAG MCP in-memory vector tier."""
+
+from pathlib import Path
+from typing import Any
+
+import lancedb
+import numpy as np
+import pytest
+
+from rag_mcp import server
+from rag_mcp.config import RAGConfig, VectorCacheConfig
+from rag_mcp.server import SearchInput, search
+from rag_mcp.tests.conftest import FakeEmbedder
+from rag_mcp.vector_cache import (
+    get_hot_table,
+    reset_vector_cache,
+    vector_cache_stats,
+    warm_hot_table,
+)
+
+
+def cache_config(**settings: Any) -> RAGConfig:
+    """RAG config with the vector tier enabled."""
+    return RAGConfig(vector_cache=VectorCacheConfig(enabled=True, **settings))
+
+
+@pytest.fixture
+def db(tmp_path: Path) -> Any:
+    """Create a database with a random text table."""
+    rng = np.random.default_rng(0)
+    db = lancedb.connect(str(tmp_path / "lancedb"))
+    db.create_table(
+        "text_chunks",
+        [
+            {"id": f"c{i}", "content": f"chunk {i}", "vector": v.astype("float32")}
+            for i, v in enumerate(rng.normal(size=(50, 4)))
+        ],
+    )
+    return db
+
+
+class TestHotTable:
+    """Test loading and exact search."""
+
+    async def test_matches_lancedb(self, db: Any) -> None:
+        """Test ranking and distances equal LanceDB's exact search."""
+        table = db.open_table("text_chunks")
+        hot = await warm_hot_table(db.uri, "text_chunks", table, cache_config())
+        query = [0.3, -1.0, 0.5, 0.2]
+
+        expected = table.search(query).limit(5).to_list()
+        results = hot.search(query, 5)
+
+        assert [r["id"] for r in results] == [r["id"] for r in expected]
+        assert [r["_distance"] for r in results] == pytest.approx(
+            [r["_distance"] for r in expected], rel=1e-4
+        )
+        assert "vector" not in results[0]
+
+    async def test_reloads_new_version(self, db: Any) -> None:
+        """Test a changed table is not served until it has been reloaded."""
+        config = cache_config()
+        table = db.open_table("text_chunks")
+        await warm_hot_table(db.uri, "text_chunks", table, config)
+
+        table.add([{"id": "new", "content": "new", "vector": [9.0, 9.0, 9.0, 9.0]}])
+
+        assert get_hot_table(db.uri, "text_chunks", table, config) is None
+        hot = await warm_hot_table(db.uri, "text_chunks", table, config)
+        assert hot.search([9.0, 9.0, 9.0, 9.0], 1)[0]["id"] == "new"
+
+    async def test_mmap(self, db: Any, tmp_path: Path) -> None:
+        """Test matrices can be memory-mapped instead of held in RAM."""
+        config = cache_config(mmap_dir=str(tmp_path / "mmap"))
+        table = db.open_table("text_chunks")
+
+        hot = await warm_hot_table(db.uri, "text_chunks", table, config)
+
+        assert hot.mmapped
+        assert len(list((tmp_path / "mmap").glob("*.npy"))) == 1
+        assert hot.search([1.0, 0.0, 0.0, 0.0], 3)
+
+
+class TestEligibility:
+    """Test which tables get pinned."""
+
+    async def test_disabled(self, db: Any) -> None:
+        """Test nothing is pinned unless enabled."""
+        table = db.open_table("text_chunks")
+
+        assert await warm_hot_table(db.uri, "text_chunks", table, RAGConfig()) is None
+
+    async def test_limits(self, db: Any) -> None:
+        """Test table allowlist, row limit and memory budget are enforced."""
+        table = db.open_table("text_chunks")
+
+        for config in (
+            cache_config(tables=["code_chunks"]),
+            cache_config(max_rows=10),
+            cache_config(memory_budget_mb=0.0001),
+        ):
+            reset_vector_cache()
+            assert await warm_hot_table(db.uri, "text_chunks", table, config) is None
+
+    async def test_lru_eviction(self, db: Any) -> None:
+        """Test the least recently used table is evicted to stay in budget."""
+        config = cache_config()
+        table = db.open_table("text_chunks")
+        db.create_table("code_chunks", table.to_arrow())
+        code = db.open_table("code_chunks")
+
+        hot = await warm_hot_table(db.uri, "text_chunks", table, config)
+        budget_mb = hot.nbytes * 1.5 / (1024 * 1024)
+        config = cache_config(memory_budget_mb=budget_mb)
+        await warm_hot_table(db.uri, "code_chunks", code, config)
+
+        assert [t["table"] for t in vector_cache_stats()["tables"]] == ["code_chunks"]
+
+
+class TestSearchIntegration:
+    """Test the search tool uses pinned tables."""
+
+    async def test_search_uses_hot_table(self, db: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test plain vector searches are served in memory once pinned."""
+        config = cache_config()
+        monkeypatch.setattr(server, "load_rag_config", lambda: config)
+        monkeypatch.setattr(
+            server, "get_embedder", lambda model, host: FakeEmbedder(vector=[1.0, 0.0, 0.0, 0.0])
+        )
+
+        first = await search(SearchInput(query="q", db_path=db.uri, limit=3))
+        await warm_hot_table(db.uri, "text_chunks", db.open_table("text_chunks"), config)
+        second = await search(SearchInput(query="q", db_path=db.uri, limit=3))
+        filtered = await search(SearchInput(query="q", db_path=db.uri, limit=3, filter="id != ''"))
+
+        assert "hot_cache" not in first.optimizations_used
+        assert "hot_cache" in second.optimizations_used
+        assert "hot_cache" not in filtered.optimizations_used
+        assert [r.chunk_id for r in second.results] == [r.chunk_id for r in first.results]
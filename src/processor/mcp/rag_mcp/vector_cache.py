@@ -0,0 +1,261 @@
+"""In-memory vector search tier for hot tables.
+
+Small and medium databases do not need LanceDB's disk path (and tables
+under 256 rows have no vector index at all). When enabled, a searched
+table is loaded once into a contiguous float32 matrix, optionally
+memory-mapped from ``mmap_dir``, with its non-vector columns kept as an
+Arrow table. Unfiltered vector searches are then answered by an exact,
+vectorised dot-product scan:
+
+    ||q - x||^2 = ||x||^2 - 2 q.x + ||q||^2
+
+which gives the same squared-L2 ``_distance`` as LanceDB. Row norms are
+precomputed, so a query costs one matrix-vector product plus a partial
+sort. At ~100k rows of 1024 dims that is a few milliseconds; small tables
+answer in well under one.
+
+Loading happens in the background on the first search of a table (which
+LanceDB answers meanwhile). A table whose dataset version changed is not
+served until it has been reloaded. Pinned tables share one memory budget;
+the least recently used table is evicted to make room, and tables that do
+not fit at all (or exceed ``max_rows``) are never pinned. Memory-mapped
+matrices are paged by the OS and do not count against the budget.
+
+Filtered and hybrid searches always go to LanceDB.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+
+from .config import RAGConfig, VectorCacheConfig
+from .pool import _db_key
+
+VECTOR_COLUMN = "vector"
+
+
+class HotTable:
+    """A table's vectors as a float32 matrix, plus its other columns."""
+
+    def __init__(self, version: int, matrix: np.ndarray, rows: pa.Table, mmapped: bool = False):
+        """Wrap loaded table data.
+
+        Args:
+            version: Dataset version the data was read at
+            matrix: (rows, dims) float32 vectors
+            rows: Non-vector columns, aligned with matrix rows
+            mmapped: Whether matrix is memory-mapped from disk
+        """
+        self.version = version
+        self.matrix = matrix
+        self.norms = np.einsum("ij,ij->i", matrix, matrix)
+        self.rows = rows
+        self.mmapped = mmapped
+        self.loaded_at = time.time()
+
+    @property
+    def nbytes(self) -> int:
+        """Memory counted against the budget."""
+        matrix_bytes = 0 if self.mmapped else self.matrix.nbytes
+        return matrix_bytes + self.norms.nbytes + self.rows.nbytes
+
+    def search(self, query_vector: list[float], limit: int) -> list[dict]:
+        """Exact top-k by squared L2 distance.
+
+        Args:
+            query_vector: Query embedding
+            limit: Number of results
+
+        Returns:
+            Rows (without vectors) with ``_distance``, nearest first
+        """
+        query = np.asarray(query_vector, dtype=np.float32)
+        distances = self.norms - 2.0 * (self.matrix @ query) + float(query @ query)
+
+        k = min(limit, len(distances))
+        if k <= 0:
+            return []
+        top = np.argpartition(distances, k - 1)[:k] if k < len(distances) else np.arange(k)
+        top = top[np.argsort(distances[top], kind="stable")]
+
+        results = self.rows.take(pa.array(top)).to_pylist()
+        for row, distance in zip(results, distances[top], strict=True):
+            row["_distance"] = max(float(distance), 0.0)
+        return results
+
+
+def load_hot_table(table: Any, mmap_path: Path | None = None) -> HotTable:
+    """Read a table's vectors and columns into memory.
+
+    Args:
+        table: LanceDB table with a ``vector`` column
+        mmap_path: Save the matrix here and memory-map it (None keeps it in RAM)
+
+    Returns:
+        HotTable at the version that was read
+    """
+    import pyarrow.compute as pc
+
+    version = table.version
+    data = table.to_arrow()
+    data = data.filter(pc.is_valid(data.column(VECTOR_COLUMN)))
+
+    vectors = data.column(VECTOR_COLUMN).combine_chunks()
+    dims = vectors.type.list_size
+    matrix = vectors.flatten().to_numpy(zero_copy_only=False).astype(np.float32).reshape(-1, dims)
+
+    mmapped = False
+    if mmap_path is not None:
+        np.save(mmap_path, matrix)
+        matrix = np.load(mmap_path, mmap_mode="r")
+        mmapped = True
+
+    vector_columns = [f.name for f in data.schema if pa.types.is_fixed_size_list(f.type)]
+    return HotTable(version, matrix, data.drop_columns(vector_columns), mmapped=mmapped)
+
+
+class VectorCache:
+    """Pinned hot tables under a shared memory budget (LRU eviction)."""
+
+    def __init__(self):
+        self._tables: OrderedDict[tuple[str, str], HotTable] = OrderedDict()
+        self._loading: dict[tuple[str, str], asyncio.Task] = {}
+        self._skipped: dict[tuple[str, str], int] = {}  # Table version not to retry
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        """Memory used by pinned tables (counted against the budget)."""
+        return sum(hot.nbytes for hot in self._tables.values())
+
+    def get(self, db_path: str, table_name: str, table: Any, config: RAGConfig) -> HotTable | None:
+        """Get a table's in-memory copy if it is current.
+
+        Schedules a background (re)load when the table is not pinned yet
+        or its dataset version changed.
+
+        Args:
+            db_path: LanceDB database path
+            table_name: Table name
+            table: Pooled LanceDB table handle (at its latest known version)
+            config: RAG configuration
+
+        Returns:
+            HotTable, or None if this search must go to LanceDB
+        """
+        settings = config.vector_cache
+        if not settings.enabled or (settings.tables and table_name not in settings.tables):
+            return None
+
+        key = (_db_key(db_path), table_name)
+        version = table.version
+        hot = self._tables.get(key)
+        if hot is not None and hot.version == version:
+            self._tables.move_to_end(key)
+            self.hits += 1
+            return hot
+
+        self.misses += 1
+        if self._skipped.get(key) != version and key not in self._loading:
+            self._loading[key] = asyncio.create_task(self._load(key, table, version, settings))
+        return None
+
+    async def warm(
+        self, db_path: str, table_name: str, table: Any, config: RAGConfig
+    ) -> HotTable | None:
+        """Load a table now (if eligible) and return its in-memory copy."""
+        if self.get(db_path, table_name, table, config) is None:
+            task = self._loading.get((_db_key(db_path), table_name))
+            if task is not None:
+                await task
+        key = (_db_key(db_path), table_name)
+        hot = self._tables.get(key)
+        return hot if hot is not None and hot.version == table.version else None
+
+    async def _load(
+        self, key: tuple[str, str], table: Any, version: int, settings: VectorCacheConfig
+    ) -> None:
+        """Load a table and pin it, evicting least recently used tables."""
+        try:
+            if VECTOR_COLUMN not in table.schema.names or table.count_rows() > settings.max_rows:
+                self._skipped[key] = version
+                return
+
+            mmap_path = self._mmap_path(key, version, settings)
+            hot = await asyncio.to_thread(load_hot_table, table, mmap_path)
+
+            budget = settings.memory_budget_mb * 1024 * 1024
+            if hot.nbytes > budget:
+                self._skipped[key] = hot.version
+                return
+
+            self._tables.pop(key, None)
+            while self._tables and self.memory_bytes + hot.nbytes > budget:
+                self._tables.popitem(last=False)
+            self._tables[key] = hot
+        except Exception:
+            self._skipped[key] = version
+        finally:
+            self._loading.pop(key, None)
+
+    @staticmethod
+    def _mmap_path(key: tuple[str, str], version: int, settings: VectorCacheConfig) -> Path | None:
+        """Matrix file for a table version; older versions' files are removed."""
+        if not settings.mmap_dir:
+            return None
+        directory = Path(settings.mmap_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        prefix = f"{hashlib.sha256(key[0].encode()).hexdigest()[:12]}-{key[1]}-v"
+        for old in directory.glob(f"{prefix}*.npy"):
+            with contextlib.suppress(OSError):
+                old.unlink()
+        return directory / f"{prefix}{version}.npy"
+
+    def stats(self) -> dict[str, Any]:
+        """Pinned tables, memory use and hit counters."""
+        return {
+            "tables": [
+                {"db_path": db, "table": name, "rows": hot.rows.num_rows, "version": hot.version}
+                for (db, name), hot in self._tables.items()
+            ],
+            "memory_mb": round(self.memory_bytes / (1024 * 1024), 2),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Global cache (lazy populated)
+_cache = VectorCache()
+
+
+def get_hot_table(db_path: str, table_name: str, table: Any, config: RAGConfig) -> HotTable | None:
+    """Get a table's current in-memory copy (see VectorCache.get)."""
+    return _cache.get(db_path, table_name, table, config)
+
+
+async def warm_hot_table(
+    db_path: str, table_name: str, table: Any, config: RAGConfig
+) -> HotTable | None:
+    """Pin a table now instead of on its first search."""
+    return await _cache.warm(db_path, table_name, table, config)
+
+
+def vector_cache_stats() -> dict[str, Any]:
+    """Get pinned tables, memory use and hit counters."""
+    return _cache.stats()
+
+
+def reset_vector_cache() -> None:
+    """Drop all pinned tables. Useful for testing."""
+    global _cache
+    for task in _cache._loading.values():
+        task.cancel()
+    _cache = VectorCache()
@@ -3,6 +3,7 @@
 from .adapters import LlamaIndexCodeAdapter, LlamaIndexMarkdownAdapter, MarkdownCodeBlockExtractor
 from .base import BaseChunker
 from .factory import ChunkerFactory
+from .sizing import ChunkSizer
 
 __all__ = [
     "BaseChunker",
@@ -10,4 +11,5 @@ __all__ = [
     "LlamaIndexMarkdownAdapter",
     "MarkdownCodeBlockExtractor",
     "ChunkerFactory",
+    "ChunkSizer",
 ]
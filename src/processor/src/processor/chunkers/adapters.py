@@ -3,9 +3,6 @@
 from pathlib import Path
 from typing import Any
 
-from llama_index.core import Document
-from llama_index.core.node_parser import CodeSplitter, MarkdownNodeParser
-
 from ..types import Chunk, ContentType
 from .base import BaseChunker
 
@@ -119,6 +116,10 @@ class LlamaIndexCodeAdapter(BaseChunker):
         language = self.LANGUAGE_MAP.get(ext, "python")
 
         try:
+            # LlamaIndex (and tree-sitter) load on first use, not at import
+            from llama_index.core import Document
+            from llama_index.core.node_parser import CodeSplitter
+
             # Create AST-based splitter
             splitter = CodeSplitter(
                 language=language,
@@ -431,6 +432,9 @@ class LlamaIndexMarkdownAdapter(BaseChunker):
 
         # Then, process the text content (including code blocks as text for context)
         try:
+            from llama_index.core import Document
+            from llama_index.core.node_parser import MarkdownNodeParser
+
             # Create LlamaIndex document
             doc = Document(text=content, metadata={"source": str(source_file)})
 
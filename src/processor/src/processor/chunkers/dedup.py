@@ -0,0 +1,194 @@
+"""Near-duplicate chunk detection with MinHash and LSH banding.
+
+Exact duplicates share a ``content_hash``, but crawled docs and vendored
+code are full of chunks that differ by a version number or a single
+line. ``NearDuplicateDetector`` drops them before embedding:
+
+1. Each chunk becomes a set of shingles (runs of ``shingle_size`` word
+   or punctuation tokens, lowercased) hashed with CRC32.
+2. A MinHash signature of ``num_perm`` values estimates the Jaccard
+   similarity of two shingle sets as the fraction of equal values.
+3. Signatures are cut into bands; chunks sharing a band land in the same
+   bucket. Each chunk is compared only with the first chunk of its
+   buckets and joined to its cluster when the estimated similarity
+   reaches the threshold.
+
+The work is one signature per chunk plus one dict lookup per band, so it
+grows linearly with the corpus. The first chunk of a cluster (in input
+order) is kept; the others are returned as ``ChunkAlias`` records that
+point to it. Code and text chunks are never clustered together.
+
+Detection is scoped to one run: chunks are only compared with the other
+chunks being processed, not with ones an earlier (e.g. incremental) run
+already loaded.
+"""
+
+import re
+import zlib
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from ..types import Chunk
+
+# Smallest prime above 2**32: (a * x + b) % _PRIME is a universal hash of
+# 32-bit shingle hashes, and a * x + b cannot overflow uint64
+_PRIME = np.uint64(4294967311)
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+
+
+@dataclass
+class ChunkAlias:
+    """A dropped near-duplicate and the chunk kept in its place."""
+
+    id: str
+    representative_id: str
+    source_file: str
+    source_type: str
+    start_line: int | None
+    end_line: int | None
+    similarity: float  # Estimated Jaccard similarity to the representative
+
+
+@dataclass
+class DedupResult:
+    """Chunks left after near-duplicate removal."""
+
+    chunks: list[Chunk]
+    aliases: list[ChunkAlias] = field(default_factory=list)
+    clusters: int = 0  # Clusters with at least one alias
+
+    @property
+    def removed(self) -> int:
+        """Number of chunks dropped."""
+        return len(self.aliases)
+
+
+def lsh_params(threshold: float, num_perm: int) -> tuple[int, int]:
+    """Bands and rows per band for a similarity threshold.
+
+    Two chunks share a bucket with probability 1 - (1 - s^r)^b, which rises
+    steeply around s = (1/b)^(1/r); this picks the split putting that
+    point closest to the threshold.
+
+    Args:
+        threshold: Target Jaccard similarity
+        num_perm: Signature length
+
+    Returns:
+        Tuple of (bands, rows)
+    """
+    best = (1, num_perm)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class NearDuplicateDetector:
+    """Clusters near-duplicate chunks and keeps one per cluster."""
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        num_perm: int = 128,
+        shingle_size: int = 5,
+        seed: int = 1,
+    ):
+        """Initialize detector.
+
+        Args:
+            threshold: Estimated Jaccard similarity at which chunks are duplicates
+            num_perm: MinHash signature length (more: better estimates, slower)
+            shingle_size: Tokens per shingle
+            seed: Seed of the hash permutations
+        """
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = max(shingle_size, 1)
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2**32, size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, 2**32, size=(num_perm, 1), dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray | None:
+        """MinHash signature of a text (None if it has no tokens)."""
+        tokens = _TOKEN.findall(text.lower())
+        if not tokens:
+            return None
+        k = self.shingle_size
+        shingles = {" ".join(tokens[i : i + k]) for i in range(max(len(tokens) - k + 1, 1))}
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles)
+        )
+        signature: np.ndarray = ((self._a * hashes + self._b) % _PRIME).min(axis=1)
+        return signature
+
+    def deduplicate(self, chunks: list[Chunk]) -> DedupResult:
+        """Drop near-duplicate chunks.
+
+        Args:
+            chunks: Chunks in a stable order (the first of a cluster is kept)
+
+        Returns:
+            Kept chunks in input order, and an alias per dropped chunk
+        """
+        signatures = [self.signature(chunk.content) for chunk in chunks]
+        parent = list(range(len(chunks)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for band in range(self.bands):
+            lo, hi = band * self.rows, (band + 1) * self.rows
+            buckets: dict[tuple[bool, bytes], tuple[int, np.ndarray]] = {}
+            for i, sig in enumerate(signatures):
+                if sig is None:
+                    continue
+                key = (chunks[i].source_type.value.startswith("code_"), sig[lo:hi].tobytes())
+                first, first_sig = buckets.setdefault(key, (i, sig))
+                if first == i:
+                    continue
+                root_first, root_i = find(first), find(i)
+                if root_first == root_i:
+                    continue
+                if self.similarity(first_sig, sig) >= self.threshold:
+                    # The earliest chunk stays the root, i.e. the representative
+                    parent[max(root_first, root_i)] = min(root_first, root_i)
+
+        result = DedupResult(chunks=[])
+        representatives = set()
+        for i, chunk in enumerate(chunks):
+            root = find(i)
+            if root == i:
+                result.chunks.append(chunk)
+                continue
+            representatives.add(root)
+            kept = chunks[root]
+            kept_sig, sig = signatures[root], signatures[i]
+            # Only chunks with a signature are ever bucketed and joined
+            assert kept_sig is not None and sig is not None
+            result.aliases.append(
+                ChunkAlias(
+                    id=chunk.id,
+                    representative_id=kept.id,
+                    source_file=chunk.source_file,
+                    source_type=chunk.source_type.value,
+                    start_line=chunk.start_line,
+                    end_line=chunk.end_line,
+                    similarity=round(self.similarity(kept_sig, sig), 4),
+                )
+            )
+        result.clusters = len(representatives)
+        return result
+
+    @staticmethod
+    def similarity(first: np.ndarray, second: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return float(np.mean(first == second))
@@ -13,6 +13,9 @@ class ChunkerFactory:
     Uses LlamaIndex-based chunkers:
     - Code: LlamaIndexCodeAdapter with tree-sitter AST parsing
     - Everything else: LlamaIndexMarkdownAdapter with header-aware parsing
+
+    Chunkers work in characters (about 4 per token). ``ChunkSizer`` then
+    measures the chunks in model tokens and splits any over the budget.
     """
 
     def __init__(self, config: ChunkingConfig | None = None):
@@ -58,9 +61,13 @@ class ChunkerFactory:
             return LlamaIndexCodeAdapter(
                 chunk_size=self.config.code_chunk_size * 4,  # Convert tokens to chars
             )
+        elif chunker_type == "paper":
+            return LlamaIndexMarkdownAdapter(
+                chunk_size=self.config.paper_chunk_size * 4,
+            )
         else:
-            # Header-aware markdown chunking for all text content
-            # (papers, markdown, websites, books, youtube, text)
+            # Header-aware markdown chunking for all other text content
+            # (markdown, websites, books, youtube, text)
             return LlamaIndexMarkdownAdapter(
                 chunk_size=self.config.markdown_chunk_size * 4,
             )
@@ -69,6 +76,8 @@ class ChunkerFactory:
         """Map ContentType to chunker type string."""
         if content_type.value.startswith("code_"):
             return "code"
+        elif content_type == ContentType.PAPER:
+            return "paper"
         else:
             # All non-code content uses markdown chunker
             return "markdown"
@@ -0,0 +1,185 @@
+"""Token-accurate chunk sizing.
+
+The chunkers work in characters (tree-sitter and header-aware parsing),
+and ``MarkdownNodeParser`` keeps a whole section as one node however long
+it is. ``ChunkSizer`` runs after chunking and measures every chunk in
+tokens of the model that will embed it. It fills ``Chunk.token_count``
+and splits chunks over the budget, which is the configured chunk size
+for the content type, capped at the model's context length:
+
+- Text: at paragraph, then line, then sentence, then word boundaries
+- Code: at top-level statements (lines starting in column 0, i.e. the
+  boundaries of the AST's top-level nodes), then blank lines, then lines
+
+Units are packed greedily back into pieces that fit, and a piece that
+still does not fit (a single huge line) is cut into token windows. Pieces
+keep the chunk's metadata and all of its text; ``parent_id`` points at the
+id the unsplit chunk would have had, so parent/sibling expansion treats
+them as one section.
+"""
+
+import re
+from dataclasses import fields
+
+from ..config import ChunkingConfig, EmbeddingConfig
+from ..embedders.profiles import get_model_for_profile
+from ..embedders.tokenizer import TokenCounter, get_token_counter
+from ..types import Chunk, ContentType
+
+# Split points per level, coarsest first (zero-width, so no text is lost)
+TEXT_BOUNDARIES = [
+    re.compile(r"(?<=\n\n)"),  # Paragraphs
+    re.compile(r"(?<=\n)"),  # Lines
+    re.compile(r"(?<=[.!?]\s)"),  # Sentences
+    re.compile(r"(?<=\s)(?=\S)"),  # Words
+]
+CODE_BOUNDARIES = [
+    re.compile(r"(?<=\n)(?=\S)"),  # Top-level statements
+    re.compile(r"(?<=\n\n)"),  # Blank lines
+    re.compile(r"(?<=\n)"),  # Lines
+]
+
+# Chunk fields recomputed for each piece
+_PIECE_FIELDS = {"id", "content", "content_hash", "source_file", "source_type"}
+
+
+class ChunkSizer:
+    """Counts chunk tokens and splits chunks over the model's budget."""
+
+    def __init__(
+        self,
+        config: ChunkingConfig | None = None,
+        embedding: EmbeddingConfig | None = None,
+    ):
+        """Initialize sizer.
+
+        Args:
+            config: Chunk sizes in tokens per content type
+            embedding: Embedding profiles whose tokenizers count the tokens
+        """
+        self.config = config or ChunkingConfig()
+        self.embedding = embedding or EmbeddingConfig()
+        self._budgets: dict[str, tuple[TokenCounter, int]] = {}
+
+    def budget(self, content_type: ContentType) -> tuple[TokenCounter, int]:
+        """Token counter and maximum tokens per chunk of a content type."""
+        code = content_type.value.startswith("code_")
+        kind = "code" if code else "paper" if content_type == ContentType.PAPER else "text"
+        if kind not in self._budgets:
+            domain = "code" if code else "text"
+            profile, _ = get_model_for_profile(
+                domain, getattr(self.embedding, f"{domain}_profile")
+            )
+            size = {
+                "code": self.config.code_chunk_size,
+                "paper": self.config.paper_chunk_size,
+                "text": self.config.markdown_chunk_size,
+            }[kind]
+            counter = get_token_counter(profile.huggingface_id)
+            self._budgets[kind] = (counter, max(min(size, profile.context_length), 1))
+        return self._budgets[kind]
+
+    def size(self, chunks: list[Chunk]) -> list[Chunk]:
+        """Fill token counts and split oversize chunks.
+
+        Args:
+            chunks: Chunks of one or more files
+
+        Returns:
+            Chunks that all fit their budget, in input order
+        """
+        sized: list[Chunk] = []
+        for chunk in chunks:
+            counter, budget = self.budget(chunk.source_type)
+            chunk.token_count = counter.count(chunk.content)
+            if chunk.token_count <= budget:
+                sized.append(chunk)
+                continue
+
+            code = chunk.source_type.value.startswith("code_")
+            boundaries = CODE_BOUNDARIES if code else TEXT_BOUNDARIES
+            pieces = split_text(chunk.content, counter, budget, boundaries)
+            sized.extend(self._piece_chunks(chunk, pieces, counter))
+        return sized
+
+    def _piece_chunks(
+        self, chunk: Chunk, pieces: list[str], counter: TokenCounter
+    ) -> list[Chunk]:
+        """Build chunks for the pieces of a split chunk."""
+        metadata = {f.name: getattr(chunk, f.name) for f in fields(chunk)}
+        for name in _PIECE_FIELDS:
+            metadata.pop(name)
+        metadata["parent_id"] = chunk.parent_id or chunk.id
+
+        result = []
+        offset = 0
+        for piece in pieces:
+            start = offset
+            offset += len(piece)
+            content = piece.strip()
+            if not content:
+                continue
+
+            lead = start + len(piece) - len(piece.lstrip())
+            line = None
+            if chunk.start_line is not None:
+                line = chunk.start_line + chunk.content.count("\n", 0, lead)
+            char = None if chunk.start_char is None else chunk.start_char + lead
+            metadata.update(
+                start_line=line,
+                end_line=None if line is None else line + content.count("\n"),
+                start_char=char,
+                end_char=None if char is None else char + len(content),
+                token_count=counter.count(content),
+            )
+            result.append(
+                Chunk.create(content, chunk.source_file, chunk.source_type, **metadata)
+            )
+        return result
+
+
+def split_text(
+    text: str,
+    counter: TokenCounter,
+    budget: int,
+    boundaries: list[re.Pattern[str]],
+) -> list[str]:
+    """Split text into consecutive pieces of at most ``budget`` tokens.
+
+    Joining the pieces gives back the text.
+
+    Args:
+        text: Text to split
+        counter: Token counter of the embedding model
+        budget: Maximum tokens per piece
+        boundaries: Split points to try, coarsest first
+
+    Returns:
+        Pieces in order
+    """
+    if counter.count(text) <= budget:
+        return [text]
+    if not boundaries:
+        return list(counter.windows(text, budget))
+
+    units = [unit for unit in boundaries[0].split(text) if unit]
+    pieces: list[str] = []
+    current, current_tokens = "", 0
+    for unit, tokens in zip(units, counter.count_many(units), strict=True):
+        # An oversize unit is split further with what precedes it, so a
+        # heading stays with the start of its section
+        if current and current_tokens + tokens > budget and tokens <= budget:
+            pieces.append(current)
+            current, current_tokens = "", 0
+        current += unit
+        current_tokens += tokens
+    if current:
+        pieces.append(current)
+
+    if len(pieces) == 1:
+        return split_text(text, counter, budget, boundaries[1:])
+
+    result = []
+    for piece in pieces:
+        result.extend(split_text(piece, counter, budget, boundaries))
+    return result
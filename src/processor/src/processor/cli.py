@@ -8,10 +8,13 @@ from rich.console import Console
 from rich.table import Table
 
 from . import __version__
-from .config import load_config
 
 console = Console()
 
+# Heavy subsystems (LlamaIndex, tree-sitter, LanceDB, httpx, pydantic
+# config) are imported inside the commands that use them, so each command
+# only pays for its own imports (see processor.startup).
+
 
 @click.group()
 @click.version_option(version=__version__)
@@ -180,6 +183,23 @@ def setup(ctx: click.Context, skip_download: bool, minimal: bool) -> None:
     default=False,
     help="Delete output database before processing (fresh start)",
 )
+@click.option(
+    "--near-duplicates/--no-near-duplicates",
+    default=None,
+    help="Drop near-duplicate chunks before embedding (MinHash/LSH)",
+)
+@click.option(
+    "--near-duplicate-threshold",
+    type=click.FloatRange(0.0, 1.0),
+    default=None,
+    help="Estimated Jaccard similarity of near-duplicates (default 0.9)",
+)
+@click.option(
+    "--shard",
+    type=str,
+    default=None,
+    help="Process only shard i/n of the files (0-based), into OUTPUT/shard-i-of-n",
+)
 @click.pass_context
 def process(
     ctx: click.Context,
@@ -198,11 +218,19 @@ def process(
     content_type: str,
     chunk_only: bool,
     clean: bool,
+    near_duplicates: bool | None,
+    near_duplicate_threshold: float | None,
+    shard: str | None,
 ) -> None:
     """Process files through chunking, embedding, and loading.
 
     INPUT_PATH can be a file or directory.
 
+    \b
+    Sharded processing (one worker per process or machine):
+      processor process ./corpus -o ./lancedb --shard 0/4   # ... up to 3/4
+      processor merge ./lancedb -o ./lancedb_merged
+
     \b
     Backend options:
       --embedder ollama       Ollama with GGUF models (default)
@@ -217,8 +245,19 @@ def process(
       --multimodal-profile low|high --table-mode unified
     """
     import shutil
+
+    from .config import load_config
+    from .core.sharding import parse_shard, shard_path
     from .pipeline.processor import Pipeline
 
+    shard_index, shard_count = 0, 1
+    if shard:
+        try:
+            shard_index, shard_count = parse_shard(shard)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--shard") from e
+        output = str(shard_path(Path(output), shard_index, shard_count))
+
     # Clean output directory if requested
     if clean:
         output_path = Path(output)
@@ -244,10 +283,21 @@ def process(
             incremental=incremental,
             verbose=ctx.obj.get("verbose", False),
             chunk_only=chunk_only,
+            near_duplicates=near_duplicates,
+            near_duplicate_threshold=near_duplicate_threshold,
         )
+        if shard_count > 1:
+            # Workers share a working directory: keep each shard's state in its database
+            Path(output).mkdir(parents=True, exist_ok=True)
+            config.processing.shard_index = shard_index
+            config.processing.shard_count = shard_count
+            config.processing.state_file = Path(output) / ".processor_state.json"
+            config.processing.manifest_file = Path(output) / ".processor_manifest.json"
 
         console.print(f"[bold]Processing: {input_path}[/bold]")
         console.print(f"  Output: {output}")
+        if shard_count > 1:
+            console.print(f"  Shard: {shard_index}/{shard_count}")
         console.print(f"  Backend: {embedder}")
         console.print(f"  Table mode: {table_mode}")
         console.print(f"  Incremental: {incremental}")
@@ -261,6 +311,8 @@ def process(
         console.print("\n[bold green]Processing complete![/bold green]")
         console.print(f"  Files processed: {result.get('files_processed', 0)}")
         console.print(f"  Chunks created: {result.get('chunks_created', 0)}")
+        if config.chunking.near_duplicates:
+            console.print(f"  Near-duplicates removed: {result.get('duplicates_removed', 0)}")
         console.print(f"  Images processed: {result.get('images_processed', 0)}")
         console.print(f"  Errors: {result.get('errors', 0)}")
 
@@ -391,6 +443,8 @@ def stats(db_path: str, table: str | None) -> None:
     """Show database statistics."""
     import lancedb
 
+    from .database.fts import check_fts_index, fts_status
+
     db = lancedb.connect(db_path)
     tables = db.table_names()
 
@@ -400,6 +454,7 @@ def stats(db_path: str, table: str | None) -> None:
     stats_table = Table(title="Table Statistics")
     stats_table.add_column("Table", style="cyan")
     stats_table.add_column("Rows", justify="right")
+    stats_table.add_column("FTS index")
     stats_table.add_column("Schema", style="dim")
 
     for tbl_name in tables:
@@ -411,7 +466,22 @@ def stats(db_path: str, table: str | None) -> None:
         schema_str = ", ".join(schema_cols)
         if len(tbl.schema) > 4:
             schema_str += f", ... (+{len(tbl.schema) - 4})"
-        stats_table.add_row(tbl_name, str(row_count), schema_str)
+
+        # FTS coverage of the hybrid search column
+        column = "content" if "content" in tbl.schema.names else "vlm_description"
+        fts_str = "-"
+        if column in tbl.schema.names:
+            fts = fts_status(tbl, column)
+            if fts.index_name is None:
+                fts_str = "[yellow]missing[/yellow]"
+            else:
+                fts_str = f"{fts.segments} segment(s)"
+                if fts.unindexed_rows:
+                    fts_str += f", {fts.unindexed_rows} unindexed"
+                if check_fts_index(tbl, column) is not None:
+                    fts_str = f"[red]inconsistent[/red] ({fts_str})"
+
+        stats_table.add_row(tbl_name, str(row_count), fts_str, schema_str)
 
     console.print(stats_table)
 
@@ -554,6 +624,62 @@ def import_db(export_path: str, output: str, tables: tuple[str, ...]) -> None:
     console.print(stats_table)
 
 
+@main.command()
+@click.argument("sources", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option("-o", "--output", required=True, type=click.Path(), help="Merged database path")
+@click.option("--config", "config_path", type=click.Path(exists=True), help="Config YAML file")
+@click.option("--allow-partial", is_flag=True, help="Merge even if some shards are missing")
+def merge(
+    sources: tuple[str, ...], output: str, config_path: str | None, allow_partial: bool
+) -> None:
+    """Merge shard databases from `process --shard i/n` into one database.
+
+    SOURCES are shard databases or the output path given to the workers
+    (its shard-i-of-n databases are used). Duplicate ids are resolved and
+    vector, FTS and scalar indexes are rebuilt on the merged tables.
+
+    \b
+    Examples:
+      processor merge ./lancedb -o ./lancedb_merged
+      processor merge /mnt/a/shard-0-of-2 /mnt/b/shard-1-of-2 -o ./lancedb_merged
+    """
+    from .config import load_config
+    from .database.merge import merge_shards
+
+    config = load_config(Path(config_path) if config_path else None)
+
+    console.print(f"[bold]Merging into: {output}[/bold]")
+    try:
+        result = asyncio.run(
+            merge_shards(
+                [Path(s) for s in sources],
+                Path(output),
+                config=config.database,
+                allow_partial=allow_partial,
+            )
+        )
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise SystemExit(1) from e
+
+    for shard in result.shards:
+        console.print(f"  [dim]{shard}[/dim]")
+    if result.missing_shards:
+        missing = ", ".join(map(str, result.missing_shards))
+        console.print(f"[yellow]Missing shards: {missing}[/yellow]")
+
+    stats_table = Table(title="Merged Tables")
+    stats_table.add_column("Table", style="cyan")
+    stats_table.add_column("Rows", justify="right")
+    stats_table.add_column("Duplicates dropped", justify="right")
+
+    for table_name, row_count in result.rows.items():
+        stats_table.add_row(table_name, str(row_count), str(result.duplicates[table_name]))
+
+    stats_table.add_row("[bold]Total[/bold]", f"[bold]{sum(result.rows.values())}[/bold]", "")
+    console.print(stats_table)
+
+
 @main.command()
 @click.argument("db_path", type=click.Path(exists=True))
 @click.option("--port", type=int, default=8000, help="Port for web viewer")
@@ -648,20 +774,142 @@ def deploy(db_path: str, port: int, host: str) -> None:
 
 @main.command()
 @click.argument("db_path", type=click.Path(exists=True))
-@click.argument("query", type=str)
+@click.argument("query", type=str, required=False)
 @click.option("--table", type=str, default="text_chunks", help="Table to search")
 @click.option("-k", "--limit", type=int, default=5, help="Number of results")
 @click.option("--hybrid", is_flag=True, help="Use hybrid search (vector + BM25)")
 @click.option("--text-profile", type=click.Choice(["low", "medium", "high"]), help="Text embedding profile (overrides config)")
 @click.option("--code-profile", type=click.Choice(["low", "high"]), help="Code embedding profile (overrides config)")
-def search(db_path: str, query: str, table: str, limit: int, hybrid: bool, text_profile: str | None, code_profile: str | None) -> None:
-    """Test search against the database."""
+@click.option(
+    "--queries-file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="File with one query per line (batch mode)",
+)
+@click.option("--fuse", is_flag=True, help="Fuse batch results across queries with RRF")
+@click.option("--filter", "filter_expr", type=str, help="SQL filter, e.g. \"start_line > 100\"")
+@click.option("--language", type=str, help="Only chunks in this language (e.g. cpp)")
+@click.option("--source-type", type=str, help="Only chunks of this source type (e.g. paper)")
+@click.option("--source-prefix", type=str, help="Only chunks whose source file starts with this")
+@click.option("--nprobes", type=int, help="IVF partitions to probe (default: tuned value)")
+@click.option(
+    "--refine-factor", type=int, help="Re-rank k * factor candidates exactly (0 = off)"
+)
+@click.option(
+    "--adaptive-nprobes", is_flag=True, help="Raise nprobes when the top-k looks unreliable"
+)
+@click.option(
+    "--latency-budget-ms", type=float, help="Time allowed for adaptive nprobes escalation"
+)
+@click.option(
+    "--quantized",
+    type=click.Choice(["binary", "int8"]),
+    help="Search quantized vectors first, then rescore exactly (not with --hybrid)",
+)
+@click.option(
+    "--rescore-factor", type=int, help="Quantized candidates rescored per result (default 10)"
+)
+def search(
+    db_path: str,
+    query: str | None,
+    table: str,
+    limit: int,
+    hybrid: bool,
+    text_profile: str | None,
+    code_profile: str | None,
+    queries_file: str | None,
+    fuse: bool,
+    filter_expr: str | None,
+    language: str | None,
+    source_type: str | None,
+    source_prefix: str | None,
+    nprobes: int | None,
+    refine_factor: int | None,
+    adaptive_nprobes: bool,
+    latency_budget_ms: float | None,
+    quantized: str | None,
+    rescore_factor: int | None,
+) -> None:
+    """Test search against the database.
+
+    \b
+    Batch mode (--queries-file) embeds all queries in one embedder call
+    and runs the searches concurrently:
+      processor search ./lancedb --queries-file queries.txt --fuse
+
+    \b
+    Filters are applied before the vector search (using scalar indexes):
+      processor search ./lancedb "allocator" --table code_chunks --language cpp
+
+    \b
+    nprobes and refine factor default to the values tuned when the vector
+    index was built; --adaptive-nprobes raises nprobes per query as needed:
+      processor search ./lancedb "query" --adaptive-nprobes --latency-budget-ms 50
+
+    \b
+    Tables loaded with database.quantization can be searched over their
+    binary or int8 copies, rescoring the candidates with full vectors:
+      processor search ./lancedb "query" --quantized binary --rescore-factor 20
+    """
+    from .database.quantization import QUANTIZED_COLUMNS
+    from .database.search import (
+        build_filter,
+        read_ann_params,
+        read_truncate_dims,
+        reciprocal_rank_fusion,
+        search_table_adaptive_async,
+        search_table_async,
+        search_table_quantized_async,
+    )
+    from .embedders.matryoshka import truncate_embedding
     from .embedders.ollama import OllamaEmbedder
     from .embedders.profiles import EmbeddingProfiles
 
+    search_filter = build_filter(
+        filter_expr,
+        language=language,
+        source_type=source_type,
+        source_prefix=source_prefix,
+    )
+
+    if queries_file:
+        queries = [
+            line.strip()
+            for line in Path(queries_file).read_text(encoding="utf-8").splitlines()
+            if line.strip()
+        ]
+        if query:
+            queries.insert(0, query)
+    elif query:
+        queries = [query]
+    else:
+        raise click.UsageError("Provide QUERY or --queries-file")
+
+    if not queries:
+        raise click.UsageError(f"No queries found in {queries_file}")
+
+    def print_results(results: list[dict]) -> None:
+        for i, r in enumerate(results, 1):
+            score = r.get("_rrf_score", r.get("_distance", r.get("score", "N/A")))
+            label = "rrf" if "_rrf_score" in r else "distance"
+            if isinstance(score, float):
+                score = f"{score:.4f}"
+
+            console.print(f"[bold cyan]Result {i}[/bold cyan] ({label}: {score})")
+            console.print(f"  Source: {r.get('source_file', 'unknown')}")
+
+            content = r.get("content", "")
+            if len(content) > 200:
+                content = content[:200] + "..."
+            console.print(f"  Content: {content}")
+            console.print()
+
     async def run() -> None:
+        import time
+
         import lancedb
 
+        from .config import load_config
+
         # Get query embedding with correct model based on table
         config = load_config()
 
@@ -677,15 +925,25 @@ def search(db_path: str, query: str, table: str, limit: int, hybrid: bool, text_
 
         embedder = OllamaEmbedder(model=model_name, host=config.embedding.ollama_host)
 
-        console.print(f"[bold]Searching: {query}[/bold]\n")
+        if len(queries) == 1:
+            console.print(f"[bold]Searching: {queries[0]}[/bold]\n")
+        else:
+            console.print(f"[bold]Searching {len(queries)} queries[/bold]\n")
         console.print(f"Using model: {model_name}")
         console.print("Generating query embedding...")
 
+        start = time.time()
         try:
-            query_embedding = await embedder.embed(query)
+            if len(queries) == 1:
+                query_embeddings = [await embedder.embed(queries[0])]
+            else:
+                query_embeddings = await embedder.embed_texts(queries)
         except Exception as e:
             console.print(f"[red]Failed to generate embedding: {e}[/red]")
             return
+        finally:
+            await embedder.close()
+        embed_ms = (time.time() - start) * 1000
 
         # Search database
         db = lancedb.connect(db_path)
@@ -697,38 +955,218 @@ def search(db_path: str, query: str, table: str, limit: int, hybrid: bool, text_
 
         tbl = db.open_table(table)
 
-        if hybrid:
-            console.print("Using hybrid search (vector + FTS)...")
-            results = (
-                tbl.search(query_type="hybrid")
-                .vector(query_embedding)
-                .text(query)
-                .limit(limit)
-                .to_list()
+        quantization = None if hybrid else quantized  # Hybrid search is not quantized
+        if quantization and QUANTIZED_COLUMNS[quantization] not in tbl.schema.names:
+            console.print(
+                f"[red]Table '{table}' has no {quantization} vectors "
+                "(set database.quantization and reprocess)[/red]"
             )
+            return
+
+        if quantization:
+            console.print(f"Using {quantization} quantized search with exact rescoring...")
+        elif hybrid:
+            console.print("Using hybrid search (vector + FTS)...")
         else:
             console.print("Using vector search...")
-            results = tbl.search(query_embedding).limit(limit).to_list()
+        if search_filter:
+            console.print(f"Pre-filter: {search_filter}")
+
+        # Cut query vectors like the stored ones (Matryoshka truncation)
+        truncate_dims = read_truncate_dims(tbl)
+        if truncate_dims and any(len(v) > truncate_dims for v in query_embeddings):
+            query_embeddings = [truncate_embedding(v, truncate_dims) for v in query_embeddings]
+            console.print(f"Query vectors truncated to {truncate_dims} dims")
+
+        ann = read_ann_params(db, table)
+        probes = nprobes or ann.get("nprobes")
+        refine = refine_factor if refine_factor is not None else ann.get("refine_factor")
+        if (probes or refine) and not quantization:
+            console.print(f"nprobes: {probes or 'default'}, refine factor: {refine or 'off'}")
+
+        async def run_search(q: str, vector: list[float]) -> list[dict]:
+            if quantization:
+                return await search_table_quantized_async(
+                    tbl,
+                    vector,
+                    limit,
+                    quantization=quantization,
+                    filter=search_filter,
+                    rescore_factor=rescore_factor,
+                )
+            if not adaptive_nprobes:
+                results, _ = await search_table_async(
+                    tbl,
+                    vector,
+                    limit,
+                    query_text=q,
+                    hybrid=hybrid,
+                    filter=search_filter,
+                    nprobes=probes,
+                    refine_factor=refine,
+                )
+                return results
+
+            results, _, probes_used = await search_table_adaptive_async(
+                tbl,
+                vector,
+                limit,
+                query_text=q,
+                hybrid=hybrid,
+                filter=search_filter,
+                nprobes=probes,
+                refine_factor=refine,
+                max_nprobes=ann.get("max_nprobes"),
+                latency_budget_ms=latency_budget_ms,
+            )
+            console.print(f"[dim]Adaptive nprobes: {probes_used}[/dim]")
+            return results
 
-        console.print(f"\n[bold]Results ({len(results)}):[/bold]\n")
+        if len(queries) == 1:
+            results = await run_search(queries[0], query_embeddings[0])
+            console.print(f"\n[bold]Results ({len(results)}):[/bold]\n")
+            print_results(results)
+            return
 
-        for i, r in enumerate(results, 1):
-            score = r.get("_distance", r.get("score", "N/A"))
-            if isinstance(score, float):
-                score = f"{score:.4f}"
+        async def timed_search(q: str, vector: list[float]) -> tuple[list[dict], float]:
+            query_start = time.time()
+            results = await run_search(q, vector)
+            return results, (time.time() - query_start) * 1000
 
-            console.print(f"[bold cyan]Result {i}[/bold cyan] (distance: {score})")
-            console.print(f"  Source: {r.get('source_file', 'unknown')}")
+        outcomes = await asyncio.gather(
+            *(timed_search(q, v) for q, v in zip(queries, query_embeddings, strict=True))
+        )
+        total_ms = (time.time() - start) * 1000
 
-            content = r.get("content", "")
-            if len(content) > 200:
-                content = content[:200] + "..."
-            console.print(f"  Content: {content}")
-            console.print()
+        for q, (results, latency_ms) in zip(queries, outcomes, strict=True):
+            console.print(
+                f"\n[bold]Query: {q}[/bold] ({len(results)} results, {latency_ms:.1f} ms)\n"
+            )
+            print_results(results)
+
+        if fuse:
+            fused = reciprocal_rank_fusion([results for results, _ in outcomes])[:limit]
+            console.print(f"\n[bold]Fused results ({len(fused)}):[/bold]\n")
+            print_results(fused)
+
+        console.print(
+            f"[dim]Embedding: {embed_ms:.1f} ms, total: {total_ms:.1f} ms "
+            f"for {len(queries)} queries[/dim]"
+        )
 
     asyncio.run(run())
 
 
+@main.command(name="benchmark-search")
+@click.argument("db_path", type=click.Path(exists=True))
+@click.option("--table", type=str, default="text_chunks", help="Table to benchmark")
+@click.option("--sample-size", type=int, default=100, help="Sample queries (table vectors)")
+@click.option("-k", type=int, default=10, help="Recall cutoff / result count")
+@click.option(
+    "--rescore-factor", type=int, help="Quantized candidates rescored per result (default 10)"
+)
+def benchmark_search(
+    db_path: str, table: str, sample_size: int, k: int, rescore_factor: int | None
+) -> None:
+    """Compare recall@k and latency of IVF-PQ and quantized search.
+
+    Queries are a sample of the table's own vectors; exact (flat) search
+    is the ground truth. IVF-PQ uses the table's tuned nprobes and refine
+    factor. Quantized modes need a table loaded with database.quantization.
+
+    \b
+    Example:
+      processor benchmark-search ./lancedb --table text_chunks --rescore-factor 20
+    """
+    import lancedb
+
+    from .database.search import benchmark_quantization, read_ann_params
+
+    db = lancedb.connect(db_path)
+    if table not in db.table_names():
+        console.print(f"[red]Table '{table}' not found[/red]")
+        return
+
+    tbl = db.open_table(table)
+    ann = read_ann_params(db, table)
+    console.print(f"[bold]Benchmarking {table}[/bold] ({tbl.count_rows()} rows)\n")
+    report = benchmark_quantization(
+        tbl,
+        sample_size=sample_size,
+        k=k,
+        rescore_factor=rescore_factor,
+        nprobes=ann.get("nprobes"),
+        refine_factor=ann.get("refine_factor"),
+    )
+
+    results_table = Table(title=f"Recall@{k} and latency per query")
+    results_table.add_column("Mode", style="cyan")
+    results_table.add_column(f"Recall@{k}", justify="right")
+    results_table.add_column("p50 (ms)", justify="right")
+    results_table.add_column("p95 (ms)", justify="right")
+    for mode, result in report.items():
+        results_table.add_row(
+            mode, f"{result['recall']:.3f}", f"{result['p50_ms']:.2f}", f"{result['p95_ms']:.2f}"
+        )
+    console.print(results_table)
+
+
+@main.command(name="benchmark-startup")
+@click.option("--probe", "probes", multiple=True, help="Entry point to measure (repeatable)")
+@click.option("--runs", type=int, default=5, help="Warm runs per entry point (median)")
+@click.option("--budget-scale", type=float, default=1.0, help="Multiply every budget (slow CI)")
+def benchmark_startup(probes: tuple[str, ...], runs: int, budget_scale: float) -> None:
+    """Measure cold and warm import time of commands and MCP servers.
+
+    Each entry point's imports run in a fresh interpreter: once with an
+    empty bytecode cache (cold), then --runs times reusing it (warm).
+    Exits with status 1 if a warm median exceeds its budget or an entry
+    point loads a heavy module it should only load lazily.
+
+    \b
+    Example:
+      processor benchmark-startup --probe cli --probe rag-mcp --runs 10
+    """
+    from .startup import STARTUP_PROBES, measure_startup
+
+    unknown = [p for p in probes if p not in STARTUP_PROBES]
+    if unknown:
+        raise click.UsageError(f"Unknown probe(s) {unknown}; choose from {list(STARTUP_PROBES)}")
+
+    report = measure_startup(list(probes) or None, runs=runs, budget_scale=budget_scale)
+
+    results_table = Table(title="Import time per entry point")
+    results_table.add_column("Entry point", style="cyan")
+    results_table.add_column("Cold (ms)", justify="right")
+    results_table.add_column("Warm (ms)", justify="right")
+    results_table.add_column("Budget (ms)", justify="right")
+    results_table.add_column("Heavy modules")
+    results_table.add_column("Status")
+    for name, result in report.items():
+        heavy = ", ".join(
+            f"[red]{m}[/red]" if m in result["forbidden"] else m
+            for m in dict.fromkeys(result["heavy"] + result["forbidden"])
+        )
+        if result["ok"]:
+            status = "[green]ok[/green]"
+        elif result["forbidden"]:
+            status = "[red]eager import[/red]"
+        else:
+            status = "[red]over budget[/red]"
+        results_table.add_row(
+            name,
+            f"{result['cold_ms']:.0f}",
+            f"{result['warm_ms']:.0f}",
+            f"{result['budget_ms']:.0f}",
+            heavy or "-",
+            status,
+        )
+    console.print(results_table)
+
+    if not all(result["ok"] for result in report.values()):
+        raise SystemExit(1)
+
+
 @main.command(name="test-e2e")
 @click.option(
     "--input",
@@ -769,6 +1207,7 @@ def test_e2e(
 
     import lancedb
 
+    from .config import load_config
     from .pipeline.processor import Pipeline
 
     async def run() -> None:
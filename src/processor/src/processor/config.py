@@ -25,6 +25,16 @@ class ChunkingConfig(BaseModel):
     # Website/markdown chunking - header-aware
     markdown_chunk_size: int = Field(default=1024, description="Token size for markdown chunks")
 
+    # Near-duplicate removal (MinHash + LSH) before embedding
+    near_duplicates: bool = Field(
+        default=False, description="Drop near-duplicate chunks, keeping one per cluster"
+    )
+    near_duplicate_threshold: float = Field(
+        default=0.9, description="Estimated Jaccard similarity of duplicate chunks"
+    )
+    minhash_permutations: int = Field(default=128, description="MinHash signature length")
+    shingle_size: int = Field(default=5, description="Tokens per shingle")
+
 
 class EmbeddingConfig(BaseModel):
     """Embedding generation configuration."""
@@ -46,6 +56,20 @@ class EmbeddingConfig(BaseModel):
         default="low", description="Multimodal embedding profile: low, high"
     )
 
+    # Matryoshka truncation and storage precision
+    text_truncate_dims: int | None = Field(
+        default=None,
+        description="Truncate text vectors to this many dims and re-normalise (None: full width)",
+    )
+    code_truncate_dims: int | None = Field(
+        default=None,
+        description="Truncate code vectors to this many dims and re-normalise (None: full width)",
+    )
+    vector_dtype: str = Field(
+        default="float32",
+        description="Storage type of vectors in new tables: float32, float16",
+    )
+
     # Ollama server URL
     ollama_host: str = Field(
         default="http://localhost:11434", description="Ollama server URL"
@@ -58,7 +82,10 @@ class EmbeddingConfig(BaseModel):
 
     # Batch processing
     batch_size: int = Field(default=32, description="Batch size for embedding")
-    max_concurrent: int = Field(default=4, description="Max concurrent embedding requests")
+    max_concurrent: int = Field(
+        default=4,
+        description="Max concurrent embedding requests per Ollama host/device (shared by jobs)",
+    )
 
     # Retry configuration
     max_retries: int = Field(default=3, description="Max retries on failure")
@@ -81,11 +108,23 @@ class DatabaseConfig(BaseModel):
     code_table: str = Field(default="code_chunks", description="Table for code chunks")
     image_table: str = Field(default="image_chunks", description="Table for image chunks")
     unified_table: str = Field(default="chunks", description="Unified table name")
+    alias_table: str = Field(
+        default="chunk_aliases", description="Near-duplicate chunks and their representatives"
+    )
 
     # Indexing
     create_vector_index: bool = Field(default=True, description="Create IVF-PQ index")
     create_fts_index: bool = Field(default=True, description="Create full-text search index")
     ivf_partitions: int = Field(default=256, description="IVF partitions for vector index")
+    fts_max_segments: int = Field(
+        default=8, description="FTS index segments before a background merge"
+    )
+
+    # Quantized vector copies for compressed first-stage search
+    quantization: list[str] = Field(
+        default_factory=list,
+        description="Quantized vector columns to store: binary, int8 (new tables only)",
+    )
 
 
 class ProcessingConfig(BaseModel):
@@ -99,10 +138,28 @@ class ProcessingConfig(BaseModel):
     state_file: Path = Field(
         default=Path(".processor_state.json"), description="State file path"
     )
+    manifest_file: Path = Field(
+        default=Path(".processor_manifest.json"),
+        description="Corpus manifest from the last scan (diffed by incremental runs)",
+    )
+
+    # Sharded runs (processor process --shard i/n)
+    shard_index: int = Field(default=0, description="Worker index in 0..shard_count-1")
+    shard_count: int = Field(
+        default=1, description="Workers splitting the corpus by relative-path hash"
+    )
 
     # Concurrency
     max_concurrent_files: int = Field(default=5, description="Max files to process concurrently")
 
+    # Background jobs (processor-mcp start_processing)
+    jobs_dir: Path = Field(
+        default=Path(".processor_jobs"), description="Directory of persisted job records"
+    )
+    max_concurrent_jobs: int = Field(
+        default=2, description="Jobs running at once (jobs on the same database always queue)"
+    )
+
 
 class ContentMappingConfig(BaseModel):
     """Content type mapping from directory names."""
@@ -159,6 +216,8 @@ class ProcessorConfig(BaseModel):
             "incremental": ("processing", "incremental"),
             "verbose": ("verbose",),
             "chunk_only": ("chunk_only",),
+            "near_duplicates": ("chunking", "near_duplicates"),
+            "near_duplicate_threshold": ("chunking", "near_duplicate_threshold"),
         }
 
         for cli_key, config_path in cli_mappings.items():
@@ -1,6 +1,17 @@
 """Core processing utilities."""
 
 from .detector import ContentDetector
+from .manifest import CorpusManifest, scan_corpus
 from .router import ContentRouter
+from .sharding import find_shard_databases, parse_shard, shard_of, shard_path
 
-__all__ = ["ContentDetector", "ContentRouter"]
+__all__ = [
+    "ContentDetector",
+    "ContentRouter",
+    "CorpusManifest",
+    "scan_corpus",
+    "parse_shard",
+    "shard_of",
+    "shard_path",
+    "find_shard_databases",
+]
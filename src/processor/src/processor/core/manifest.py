@@ -0,0 +1,245 @@
+"""Single-pass corpus scan shared by the chunking and image stages.
+
+``scan_corpus`` walks the input tree once with ``os.scandir`` and records
+everything later stages need:
+
+- processable text/code files (with size and mtime)
+- standalone image files (with size and mtime)
+- directories holding ``figures.json`` or an ``img/`` folder (paper
+  directory candidates)
+
+Directories in ``SKIP_DIRECTORIES`` (.git, node_modules, ...) and
+directory symlinks are not descended into. The manifest is saved next to the processing state so
+the next incremental run can diff against it: files whose size and mtime
+are unchanged are skipped without being read or hashed.
+"""
+
+import json
+import os
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+
+from .detector import SKIP_DIRECTORIES
+from .sharding import shard_of
+
+# Supported image extensions (standalone images and figures)
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp"}
+
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class FileEntry:
+    """Stat data of a scanned file."""
+
+    size: int
+    mtime_ns: int
+
+
+@dataclass
+class ManifestDiff:
+    """Changes between two scans (paths relative to the root)."""
+
+    added: list[str] = field(default_factory=list)
+    modified: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+
+
+@dataclass
+class CorpusManifest:
+    """Result of one corpus scan.
+
+    All paths are relative to ``root`` and use forward slashes.
+    """
+
+    root: str
+    files: dict[str, FileEntry] = field(default_factory=dict)
+    images: dict[str, FileEntry] = field(default_factory=dict)
+    figure_dirs: list[str] = field(default_factory=list)  # Has figures.json or img/
+    figures_json_dirs: list[str] = field(default_factory=list)
+    scanned_at: str = ""
+
+    @property
+    def root_path(self) -> Path:
+        """Scan root as a Path."""
+        return Path(self.root)
+
+    def file_paths(self) -> list[Path]:
+        """Paths of processable files (joined to the root), sorted."""
+        return [self.root_path / rel for rel in sorted(self.files)]
+
+    def relative(self, path: Path) -> str | None:
+        """Manifest key of a path, or None if it lies outside the root."""
+        try:
+            return Path(path).relative_to(self.root_path).as_posix()
+        except ValueError:
+            return None
+
+    def has_image(self, path: Path) -> bool:
+        """Whether an image file exists (checked against the scan when it covers the path)."""
+        rel = self.relative(path)
+        if (
+            rel is None
+            or not self._scanned(rel)
+            or Path(rel).suffix.lower() not in IMAGE_EXTENSIONS
+        ):
+            # Not covered by the scan (other root, skipped directory, other extension)
+            return Path(path).exists()
+        return rel in self.images
+
+    @staticmethod
+    def _scanned(rel: str) -> bool:
+        """Whether the scan descended to a relative path."""
+        parts = rel.split("/")
+        return ".." not in parts and not any(part in SKIP_DIRECTORIES for part in parts[:-1])
+
+    @cached_property
+    def _images_by_dir(self) -> dict[str, list[str]]:
+        """Image keys grouped by parent directory ('.' for the root)."""
+        grouped: dict[str, list[str]] = {}
+        for rel in sorted(self.images):
+            parent, _, _ = rel.rpartition("/")
+            grouped.setdefault(parent or ".", []).append(rel)
+        return grouped
+
+    def images_in(self, directory: Path) -> list[Path]:
+        """Image files directly inside a directory, sorted."""
+        rel_dir = self.relative(directory)
+        return [self.root_path / rel for rel in self._images_by_dir.get(rel_dir or "", [])]
+
+    def shard(self, index: int, count: int) -> "CorpusManifest":
+        """Part of the scan owned by one of ``count`` workers.
+
+        Files and paper directories are assigned by the hash of their
+        relative path (see ``core.sharding``). Images are kept whole: they
+        are only looked up for the paper directories the shard owns.
+
+        Args:
+            index: Shard index in 0..count-1
+            count: Number of shards
+
+        Returns:
+            Manifest with the shard's files and paper directories
+        """
+        if count <= 1:
+            return self
+        return CorpusManifest(
+            root=self.root,
+            files={rel: e for rel, e in self.files.items() if shard_of(rel, count) == index},
+            images=self.images,
+            figure_dirs=[d for d in self.figure_dirs if shard_of(d, count) == index],
+            figures_json_dirs=[
+                d for d in self.figures_json_dirs if shard_of(d, count) == index
+            ],
+            scanned_at=self.scanned_at,
+        )
+
+    def diff(self, previous: "CorpusManifest | None") -> ManifestDiff:
+        """Compare processable files against an earlier scan of the same root.
+
+        A file counts as modified when its size or mtime changed.
+        """
+        result = ManifestDiff()
+        old = previous.files if previous is not None and previous.root == self.root else {}
+        for rel, entry in self.files.items():
+            before = old.get(rel)
+            if before is None:
+                result.added.append(rel)
+            elif before != entry:
+                result.modified.append(rel)
+            else:
+                result.unchanged.append(rel)
+        result.removed = sorted(set(old) - set(self.files))
+        return result
+
+    def save(self, path: Path) -> None:
+        """Write the manifest as JSON."""
+        data = asdict(self)
+        data["version"] = MANIFEST_VERSION
+        Path(path).write_text(json.dumps(data, separators=(",", ":")))
+
+    @classmethod
+    def load(cls, path: Path) -> "CorpusManifest | None":
+        """Read a saved manifest (None if missing, unreadable or outdated)."""
+        try:
+            data = json.loads(Path(path).read_text())
+        except (OSError, ValueError):
+            return None
+        if data.pop("version", None) != MANIFEST_VERSION:
+            return None
+        try:
+            data["files"] = {k: FileEntry(**v) for k, v in data["files"].items()}
+            data["images"] = {k: FileEntry(**v) for k, v in data["images"].items()}
+            return cls(**data)
+        except (KeyError, TypeError):
+            return None
+
+
+def scan_corpus(input_path: Path, should_process: Callable[[Path], bool]) -> CorpusManifest:
+    """Walk the input tree once and build its manifest.
+
+    Args:
+        input_path: Input directory (or a single file)
+        should_process: Predicate selecting processable text/code files
+
+    Returns:
+        Manifest of the tree
+    """
+    input_path = Path(input_path)
+    scanned_at = datetime.now().isoformat()
+
+    if input_path.is_file():
+        root = input_path.parent
+        manifest = CorpusManifest(root=str(root), scanned_at=scanned_at)
+        if should_process(input_path):
+            stat = input_path.stat()
+            manifest.files[input_path.name] = FileEntry(stat.st_size, stat.st_mtime_ns)
+        return manifest
+
+    manifest = CorpusManifest(root=str(input_path), scanned_at=scanned_at)
+    pending = [(input_path, "")]
+    while pending:
+        directory, prefix = pending.pop()
+        has_figures = has_img = False
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+
+        for entry in entries:
+            rel = prefix + entry.name
+            try:
+                if entry.is_dir():
+                    if entry.name == "img":
+                        has_img = True
+                    # Like rglob, do not descend into directory symlinks (they may loop)
+                    if entry.name not in SKIP_DIRECTORIES and not entry.is_symlink():
+                        pending.append((Path(entry.path), rel + "/"))
+                    continue
+                if not entry.is_file():
+                    continue
+                if entry.name == "figures.json":
+                    has_figures = True
+
+                path = Path(entry.path)
+                is_image = path.suffix.lower() in IMAGE_EXTENSIONS
+                is_text = not is_image and should_process(path)
+                if is_image or is_text:
+                    stat = entry.stat()
+                    target = manifest.images if is_image else manifest.files
+                    target[rel] = FileEntry(stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                continue  # Vanished or unreadable entry
+
+        if has_figures or has_img:
+            manifest.figure_dirs.append(prefix.rstrip("/") or ".")
+        if has_figures:
+            manifest.figures_json_dirs.append(prefix.rstrip("/") or ".")
+
+    manifest.figure_dirs.sort()
+    manifest.figures_json_dirs.sort()
+    return manifest
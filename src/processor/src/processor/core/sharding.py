@@ -0,0 +1,76 @@
+"""Deterministic partitioning of a corpus across worker processes.
+
+``processor process --shard i/n`` runs worker ``i`` (0-based) of ``n``.
+Every worker scans the whole input tree and keeps the files whose
+relative path hashes to its index, so workers on different machines agree
+on the partition without talking to each other; they only need to see
+the same input tree (e.g. on a shared filesystem). Each worker writes its
+own database, ``<output>/shard-<i>-of-<n>``, together with its incremental
+state, and ``processor merge`` combines the shard databases.
+
+The hash is BLAKE2b of the POSIX relative path, so the partition does not
+depend on the machine, the Python hash seed or the scan order.
+"""
+
+import hashlib
+import re
+from pathlib import Path
+
+SHARD_DIR_PATTERN = re.compile(r"^shard-(\d+)-of-(\d+)$")
+
+
+def parse_shard(spec: str) -> tuple[int, int]:
+    """Parse an ``i/n`` shard spec.
+
+    Args:
+        spec: Worker index and worker count, e.g. '0/4'
+
+    Returns:
+        Tuple of (index, count)
+
+    Raises:
+        ValueError: If the spec is malformed or the index is out of range
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", spec)
+    if not match:
+        raise ValueError(f"Shard must look like i/n, got {spec!r}")
+    index, count = int(match.group(1)), int(match.group(2))
+    if count < 1 or index >= count:
+        raise ValueError(f"Shard index must be in 0..{count - 1}, got {spec!r}")
+    return index, count
+
+
+def shard_of(relative_path: str, count: int) -> int:
+    """Shard owning a file.
+
+    Args:
+        relative_path: Path relative to the corpus root, with forward slashes
+        count: Number of shards
+
+    Returns:
+        Shard index in 0..count-1
+    """
+    digest = hashlib.blake2b(relative_path.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % count
+
+
+def shard_path(output: Path, index: int, count: int) -> Path:
+    """Database directory of a shard under the output path."""
+    return Path(output) / f"shard-{index}-of-{count}"
+
+
+def find_shard_databases(path: Path) -> list[Path]:
+    """Shard databases directly under a directory, in shard order.
+
+    Args:
+        path: Output path the workers were given
+
+    Returns:
+        Shard database directories (empty if there are none)
+    """
+    shards = []
+    for child in Path(path).iterdir() if Path(path).is_dir() else []:
+        match = SHARD_DIR_PATTERN.match(child.name)
+        if match and child.is_dir():
+            shards.append((int(match.group(2)), int(match.group(1)), child))
+    return [child for _, _, child in sorted(shards)]
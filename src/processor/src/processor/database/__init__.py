@@ -1,11 +1,65 @@
-"""LanceDB database operations."""
+"""LanceDB database operations.
 
-from .loader import LanceDBLoader
+``LanceDBLoader`` imports lancedb and is loaded on first access, so the
+search helpers can be imported without paying for it.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from .fts import FtsStatus, check_fts_index, fts_status, merge_fts_index, update_fts_index
 from .schemas import CodeChunkSchema, TextChunkSchema, UnifiedChunkSchema
+from .search import (
+    benchmark_quantization,
+    build_filter,
+    fetch_rows,
+    in_filter,
+    read_ann_params,
+    read_truncate_dims,
+    reciprocal_rank_fusion,
+    search_table,
+    search_table_adaptive,
+    search_table_adaptive_async,
+    search_table_async,
+    search_table_quantized,
+    search_table_quantized_async,
+    tune_ann_params,
+)
+
+if TYPE_CHECKING:
+    from .loader import LanceDBLoader
+
+
+def __getattr__(name: str) -> Any:
+    """Load LanceDBLoader lazily."""
+    if name == "LanceDBLoader":
+        from .loader import LanceDBLoader
+
+        return LanceDBLoader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "TextChunkSchema",
     "CodeChunkSchema",
     "UnifiedChunkSchema",
     "LanceDBLoader",
+    "search_table",
+    "search_table_async",
+    "search_table_adaptive",
+    "search_table_adaptive_async",
+    "search_table_quantized",
+    "search_table_quantized_async",
+    "benchmark_quantization",
+    "read_ann_params",
+    "read_truncate_dims",
+    "tune_ann_params",
+    "reciprocal_rank_fusion",
+    "build_filter",
+    "fetch_rows",
+    "in_filter",
+    "FtsStatus",
+    "fts_status",
+    "update_fts_index",
+    "merge_fts_index",
+    "check_fts_index",
 ]
@@ -0,0 +1,163 @@
+"""Incremental maintenance of full-text (BM25) indexes.
+
+Hybrid search needs an FTS index on ``content`` (``vlm_description`` for
+images). LanceDB refuses to create an index that already exists, so each
+load after the first used to leave its rows out of the index, and a full
+rebuild costs more than embedding a small batch. Instead:
+
+- ``update_fts_index`` creates the index on a new table, and otherwise
+  indexes only the unindexed (newly appended or updated) rows as a new
+  index segment. This needs the ``pylance`` package; without it the rows
+  stay unindexed until the next merge.
+- ``merge_fts_index`` merges segments once there are more than
+  ``max_segments`` and folds in any rows left unindexed. The loader runs
+  it in a background thread.
+- ``check_fts_index`` verifies that the index plus its unindexed rows
+  cover the whole table. It also checks that a BM25 query finds the most
+  recently appended row. LanceDB searches unindexed rows exhaustively,
+  so queries see fresh rows while a merge is pending.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any
+
+# Probe words must survive the default tokenizer (max_token_length=40)
+_PROBE_WORD = re.compile(r"[A-Za-z]{4,40}")
+
+
+@dataclass
+class FtsStatus:
+    """Coverage of a column's FTS index."""
+
+    column: str
+    index_name: str | None = None
+    indexed_rows: int = 0
+    unindexed_rows: int = 0
+    total_rows: int = 0
+    segments: int = 0
+
+    @property
+    def consistent(self) -> bool:
+        """Whether indexed and unindexed rows add up to the table."""
+        return (
+            self.index_name is not None
+            and self.indexed_rows + self.unindexed_rows == self.total_rows
+        )
+
+
+def fts_status(table: Any, column: str) -> FtsStatus:
+    """Describe the FTS index of a column.
+
+    Args:
+        table: LanceDB table
+        column: Indexed text column
+
+    Returns:
+        Index coverage (index_name None when the column has no FTS index)
+    """
+    status = FtsStatus(column=column, total_rows=table.count_rows())
+    for index in table.list_indices():
+        if index.index_type == "FTS" and list(index.columns) == [column]:
+            stats = table.index_stats(index.name)
+            status.index_name = index.name
+            status.indexed_rows = stats.num_indexed_rows
+            status.unindexed_rows = stats.num_unindexed_rows
+            status.segments = getattr(stats, "num_indices", None) or 1
+            break
+    return status
+
+
+def _lance_dataset(table: Any) -> Any | None:
+    """The table's Lance dataset, or None without the pylance package."""
+    try:
+        return table.to_lance()
+    except ImportError:
+        return None
+
+
+def update_fts_index(table: Any, column: str) -> str:
+    """Bring a column's FTS index up to date with appended rows.
+
+    Args:
+        table: LanceDB table
+        column: Text column to index
+
+    Returns:
+        'created' (new index), 'appended' (new rows indexed as a segment),
+        'deferred' (left to the next merge) or 'current' (nothing to do)
+    """
+    status = fts_status(table, column)
+    if status.index_name is None:
+        table.create_fts_index(column)
+        return "created"
+    if status.unindexed_rows == 0:
+        return "current"
+
+    dataset = _lance_dataset(table)
+    if dataset is None:
+        return "deferred"
+    dataset.optimize.optimize_indices(index_names=[status.index_name], num_indices_to_merge=0)
+    table.checkout_latest()
+    return "appended"
+
+
+def merge_fts_index(table: Any, column: str, max_segments: int = 8) -> bool:
+    """Merge FTS index segments and index any remaining unindexed rows.
+
+    Args:
+        table: LanceDB table
+        column: Indexed text column
+        max_segments: Segments tolerated before merging
+
+    Returns:
+        True if the index was merged
+    """
+    status = fts_status(table, column)
+    if status.index_name is None:
+        return False
+    if status.segments <= max_segments and status.unindexed_rows == 0:
+        return False
+
+    dataset = _lance_dataset(table)
+    if dataset is not None:
+        dataset.optimize.optimize_indices(
+            index_names=[status.index_name], num_indices_to_merge=status.segments
+        )
+        table.checkout_latest()
+    else:
+        # Without pylance, optimize() compacts and folds new rows into every index
+        table.optimize()
+    return True
+
+
+def check_fts_index(table: Any, column: str, key: str = "id") -> FtsStatus | None:
+    """Check that BM25 queries see every row, including the newest.
+
+    Args:
+        table: LanceDB table
+        column: Indexed text column
+        key: Unique id column used to target the probe query
+
+    Returns:
+        None if consistent, otherwise the status that failed the check
+    """
+    status = fts_status(table, column)
+    if not status.consistent:
+        return status
+    if status.total_rows == 0:
+        return None
+
+    newest = table.take_offsets([status.total_rows - 1]).select([key, column]).to_list()[0]
+    words = _PROBE_WORD.findall(newest[column] or "")
+    if not words:
+        return None  # Nothing a BM25 query could match
+    word = max(words, key=len)
+    row_id = str(newest[key]).replace("'", "''")
+    hits = (
+        table.search(word, query_type="fts", fts_columns=column)
+        .where(f"{key} = '{row_id}'", prefilter=True)
+        .limit(1)
+        .to_list()
+    )
+    return None if hits else status
@@ -1,14 +1,37 @@
 """LanceDB loading and indexing."""
 
+import asyncio
 import contextlib
 import json
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import lancedb
+import pyarrow as pa
 
 from ..config import DatabaseConfig
 from ..types import Chunk, ContentType, ImageChunk
+from .fts import check_fts_index, merge_fts_index, update_fts_index
+from .quantization import QUANTIZED_COLUMNS, quantized_table, vector_table
+from .search import in_filter, tune_ann_params
+
+if TYPE_CHECKING:
+    from ..chunkers.dedup import ChunkAlias
+
+# Near-duplicate chunks dropped before embedding (see chunkers.dedup)
+ALIAS_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("representative_id", pa.string()),
+        ("source_file", pa.string()),
+        ("source_type", pa.string()),
+        ("start_line", pa.int32()),
+        ("end_line", pa.int32()),
+        ("similarity", pa.float32()),
+    ]
+)
 
 
 class LanceDBLoader:
@@ -21,6 +44,23 @@ class LanceDBLoader:
 
     METADATA_TABLE = "_metadata"
 
+    # Vector indexes are rebuilt (and their search parameters re-tuned) only
+    # once a table has grown by this fraction since the last build; rows
+    # added in between are searched exactly alongside the index.
+    INDEX_REBUILD_GROWTH = 0.5
+
+    # Scalar indexes for lookups and metadata pre-filtering. BTREE suits
+    # high-cardinality columns, BITMAP the low-cardinality categorical ones.
+    SCALAR_INDEXES = {
+        "id": "BTREE",
+        "source_file": "BTREE",
+        "parent_id": "BTREE",
+        "source_type": "BITMAP",
+        "content_type": "BITMAP",
+        "language": "BITMAP",
+        "symbol_type": "BITMAP",
+    }
+
     def __init__(
         self,
         uri: str = "./lancedb",
@@ -28,12 +68,17 @@ class LanceDBLoader:
         code_table: str = "code_chunks",
         image_table: str = "image_chunks",
         unified_table: str = "chunks",
+        alias_table: str = "chunk_aliases",
         table_mode: str = "separate",
         text_dims: int = 1024,
         code_dims: int = 768,
         image_text_dims: int = 1024,
         image_visual_dims: int = 1024,
         input_root: Path | None = None,
+        embedding_metadata: dict[str, str] | None = None,
+        quantization: list[str] | None = None,
+        vector_dtype: str = "float32",
+        fts_max_segments: int = 8,
     ):
         """Initialize loader.
 
@@ -43,37 +88,56 @@ class LanceDBLoader:
             code_table: Name for code chunks table
             image_table: Name for image chunks table
             unified_table: Name for unified chunks table
+            alias_table: Name for the near-duplicate alias table
             table_mode: 'separate', 'unified', or 'both'
             text_dims: Dimensions for text embeddings
             code_dims: Dimensions for code embeddings
             image_text_dims: Dimensions for image text embeddings
             image_visual_dims: Dimensions for image visual embeddings
             input_root: Root directory for relative path calculation (portability)
+            embedding_metadata: Embedding profiles/models recorded in _metadata
+                (lets consumers embed queries with the same models)
+            quantization: Quantized vector copies to store in new text, code
+                and unified tables ('binary', 'int8'; see quantization module)
+            vector_dtype: Storage type of float vectors in new tables
+                ('float32' or 'float16')
+            fts_max_segments: FTS index segments tolerated before a
+                background merge (see fts module)
         """
         self.uri = uri
         self.text_table_name = text_table
         self.code_table_name = code_table
         self.image_table_name = image_table
         self.unified_table_name = unified_table
+        self.alias_table_name = alias_table
         self.table_mode = table_mode
         self.text_dims = text_dims
         self.code_dims = code_dims
         self.image_text_dims = image_text_dims
         self.image_visual_dims = image_visual_dims
         self.input_root = input_root
+        self.embedding_metadata = embedding_metadata or {}
+        self.quantization = [q for q in quantization or [] if q in QUANTIZED_COLUMNS]
+        self.vector_dtype = vector_dtype
+        self.fts_max_segments = fts_max_segments
         self._db: lancedb.DBConnection | None = None
+        self._maintenance: list[asyncio.Task] = []
 
     @classmethod
     def from_config(
         cls,
         config: DatabaseConfig,
         input_root: Path | None = None,
+        embedding_metadata: dict[str, str] | None = None,
+        vector_dtype: str = "float32",
     ) -> "LanceDBLoader":
         """Create loader from config.
 
         Args:
             config: Database configuration
             input_root: Root directory for relative path calculation (portability)
+            embedding_metadata: Embedding profiles/models recorded in _metadata
+            vector_dtype: Storage type of float vectors in new tables
 
         Returns:
             Configured LanceDBLoader instance
@@ -84,8 +148,13 @@ class LanceDBLoader:
             code_table=config.code_table,
             image_table=getattr(config, "image_table", "image_chunks"),
             unified_table=config.unified_table,
+            alias_table=getattr(config, "alias_table", "chunk_aliases"),
             table_mode=config.table_mode,
             input_root=input_root,
+            embedding_metadata=embedding_metadata,
+            quantization=config.quantization,
+            vector_dtype=vector_dtype,
+            fts_max_segments=config.fts_max_segments,
         )
 
     def connect(self) -> lancedb.DBConnection:
@@ -122,22 +191,38 @@ class LanceDBLoader:
 
     def _save_metadata(self) -> None:
         """Save database metadata for portability."""
+        self.update_metadata(
+            {
+                "input_root": str(self.input_root) if self.input_root else "",
+                "created_at": datetime.utcnow().isoformat(),
+                "processor_version": "1.0.0",
+                **self.embedding_metadata,
+            }
+        )
+
+    def update_metadata(self, values: dict[str, str]) -> None:
+        """Add or overwrite database metadata entries.
+
+        Args:
+            values: Metadata key-value pairs to set
+        """
         db = self.connect()
+        records = [{"key": key, "value": value} for key, value in values.items()]
+        if not records:
+            return
 
-        metadata_records = [
-            {"key": "input_root", "value": str(self.input_root) if self.input_root else ""},
-            {"key": "created_at", "value": datetime.utcnow().isoformat()},
-            {"key": "processor_version", "value": "1.0.0"},
-        ]
+        if self.METADATA_TABLE not in db.table_names():
+            db.create_table(self.METADATA_TABLE, records)
+            return
 
-        if self.METADATA_TABLE in db.table_names():
-            # Update existing metadata
+        # Upsert in place: readers never see the table missing or half-written
+        (
             db.open_table(self.METADATA_TABLE)
-            # Replace all records
-            db.drop_table(self.METADATA_TABLE)
-            db.create_table(self.METADATA_TABLE, metadata_records)
-        else:
-            db.create_table(self.METADATA_TABLE, metadata_records)
+            .merge_insert("key")
+            .when_matched_update_all()
+            .when_not_matched_insert_all()
+            .execute(records)
+        )
 
     def get_metadata(self) -> dict[str, str]:
         """Get database metadata.
@@ -151,8 +236,7 @@ class LanceDBLoader:
             return {}
 
         table = db.open_table(self.METADATA_TABLE)
-        records = table.to_pandas()
-        return dict(zip(records["key"], records["value"], strict=False))
+        return {row["key"]: row["value"] for row in table.to_arrow().to_pylist()}
 
     async def load_chunks(
         self,
@@ -168,6 +252,17 @@ class LanceDBLoader:
         Returns:
             Dictionary with counts per table
         """
+        # Table writes are synchronous; keep them off the event loop
+        result = await asyncio.to_thread(self._load_chunks, chunks)
+
+        # Create indices
+        if create_index:
+            await self.create_indices()
+
+        return result
+
+    def _load_chunks(self, chunks: list[Chunk]) -> dict[str, int]:
+        """Write chunks to their tables (see ``load_chunks``)."""
         db = self.connect()
 
         # Save metadata on first load (for path portability)
@@ -203,48 +298,87 @@ class LanceDBLoader:
                 count = self._load_unified_chunks(db, all_chunks)
                 result["unified_chunks"] = count
 
-        # Create indices
-        if create_index:
-            await self.create_indices()
-
         return result
 
     def _load_text_chunks(self, db: lancedb.DBConnection, chunks: list[Chunk]) -> int:
         """Load text chunks into text table."""
         records = [self._chunk_to_text_record(c) for c in chunks]
-
-        if self.text_table_name in db.table_names():
-            table = db.open_table(self.text_table_name)
-            table.add(records)
-        else:
-            db.create_table(self.text_table_name, records)
-
-        return len(records)
+        return self._write_records(db, self.text_table_name, records)
 
     def _load_code_chunks(self, db: lancedb.DBConnection, chunks: list[Chunk]) -> int:
         """Load code chunks into code table."""
         records = [self._chunk_to_code_record(c) for c in chunks]
-
-        if self.code_table_name in db.table_names():
-            table = db.open_table(self.code_table_name)
-            table.add(records)
-        else:
-            db.create_table(self.code_table_name, records)
-
-        return len(records)
+        return self._write_records(db, self.code_table_name, records)
 
     def _load_unified_chunks(self, db: lancedb.DBConnection, chunks: list[Chunk]) -> int:
         """Load all chunks into unified table."""
         records = [self._chunk_to_unified_record(c) for c in chunks]
+        return self._write_records(db, self.unified_table_name, records)
 
-        if self.unified_table_name in db.table_names():
-            table = db.open_table(self.unified_table_name)
-            table.add(records)
+    def _write_records(self, db: lancedb.DBConnection, table_name: str, records: list[dict]) -> int:
+        """Create or append to a table, adding quantized vector columns.
+
+        New tables get the columns of ``self.quantization`` and vectors of
+        ``self.vector_dtype``; existing tables keep the quantized columns and
+        vector type they were created with (LanceDB casts appended rows).
+        """
+        table = db.open_table(table_name) if table_name in db.table_names() else None
+        if table is None:
+            modes = self.quantization
         else:
-            db.create_table(self.unified_table_name, records)
+            modes = [m for m, col in QUANTIZED_COLUMNS.items() if col in table.schema.names]
+
+        if modes:
+            data = quantized_table(records, modes, self.vector_dtype if table is None else "float32")
+        elif table is None and self.vector_dtype != "float32":
+            data = vector_table(records, ["vector"], self.vector_dtype)
+        else:
+            data = records
+
+        if table is None:
+            db.create_table(table_name, data)
+        else:
+            table.add(data)
 
         return len(records)
 
+    def load_aliases(
+        self, aliases: list["ChunkAlias"], source_files: list[str] | None = None
+    ) -> int:
+        """Record near-duplicate chunks dropped in favour of a representative.
+
+        Duplicates are detected within one run only (see ``chunkers.dedup``),
+        so the alias rows of every file the run reprocessed are replaced:
+        rows for ``source_files`` and the files of ``aliases`` are deleted
+        before the new ones are added.
+
+        Args:
+            aliases: Aliases from ``NearDuplicateDetector``
+            source_files: Files processed in this run (their old aliases go)
+
+        Returns:
+            Number of alias rows written
+        """
+        db = self.connect()
+        files = {self._to_relative_path(f) for f in source_files or []}
+        files.update(self._to_relative_path(alias.source_file) for alias in aliases)
+        if files and self.alias_table_name in db.table_names():
+            db.open_table(self.alias_table_name).delete(in_filter("source_file", sorted(files)))
+
+        if not aliases:
+            return 0
+
+        records = [
+            {**asdict(alias), "source_file": self._to_relative_path(alias.source_file)}
+            for alias in aliases
+        ]
+        data = pa.Table.from_pylist(records, schema=ALIAS_SCHEMA)
+        if self.alias_table_name in db.table_names():
+            db.open_table(self.alias_table_name).add(data)
+        else:
+            db.create_table(self.alias_table_name, data)
+        return len(records)
+
     async def load_image_chunks(
         self,
         image_chunks: list[ImageChunk],
@@ -263,40 +397,53 @@ class LanceDBLoader:
         Returns:
             Dictionary with counts
         """
-        db = self.connect()
         result = {"image_chunks": 0}
 
         if not image_chunks:
             return result
 
-        # Load into image table (always separate, images have dual embeddings)
+        result["image_chunks"] = await asyncio.to_thread(self._write_image_records, image_chunks)
+
+        # Create indices
+        if create_index:
+            await self._create_image_indices()
+
+        return result
+
+    def _write_image_records(self, image_chunks: list[ImageChunk]) -> int:
+        """Create or append to the image table (always separate, images have dual embeddings)."""
+        db = self.connect()
         records = [self._image_chunk_to_record(c) for c in image_chunks]
 
         if self.image_table_name in db.table_names():
             table = db.open_table(self.image_table_name)
             table.add(records)
+        elif self.vector_dtype != "float32":
+            data = vector_table(records, ["text_vector", "visual_vector"], self.vector_dtype)
+            db.create_table(self.image_table_name, data)
         else:
             db.create_table(self.image_table_name, records)
 
-        result["image_chunks"] = len(records)
-
-        # Create indices
-        if create_index and len(records) >= 256:
-            await self._create_image_indices()
-
-        return result
+        return len(records)
 
     async def _create_image_indices(self) -> None:
-        """Create indices on image table (both vectors)."""
+        """Update the FTS index on image descriptions and create vector indices."""
         db = self.connect()
 
         if self.image_table_name not in db.table_names():
             return
 
+        await self.wait_for_maintenance()
         table = db.open_table(self.image_table_name)
+        await asyncio.to_thread(self._index_image_table, table)
+        self._schedule_fts_merge(table, "vlm_description")
+
+    def _index_image_table(self, table: lancedb.table.Table) -> None:
+        """Update the image table's FTS index and build its vector indices."""
+        self._update_fts(table, "vlm_description")
         row_count = table.count_rows()
 
-        if row_count < 256:
+        if not self._needs_vector_index(table.name, row_count):
             return
 
         # Create IVF-PQ index on text_vector
@@ -317,9 +464,7 @@ class LanceDBLoader:
                 vector_column_name="visual_vector",
             )
 
-        # Create FTS index on VLM description
-        with contextlib.suppress(Exception):
-            table.create_fts_index("vlm_description")
+        self.update_metadata({f"{table.name}_indexed_rows": str(row_count)})
 
     def _image_chunk_to_record(self, chunk: ImageChunk) -> dict:
         """Convert ImageChunk to image table record.
@@ -430,27 +575,101 @@ class LanceDBLoader:
         self,
         ivf_partitions: int = 256,
     ) -> None:
-        """Create vector and FTS indices on tables."""
+        """Create vector and FTS indices on tables.
+
+        The FTS index is updated incrementally; segment merges run in the
+        background (see ``wait_for_maintenance``).
+        """
         db = self.connect()
+        await self.wait_for_maintenance()
 
         for table_name in [self.text_table_name, self.code_table_name, self.unified_table_name]:
             if table_name not in db.table_names():
                 continue
 
             table = db.open_table(table_name)
-            row_count = table.count_rows()
+            # Index builds are synchronous; keep them off the event loop
+            await asyncio.to_thread(self._index_table, table, ivf_partitions)
+            self._schedule_fts_merge(table, "content")
+
+    def _index_table(self, table: lancedb.table.Table, ivf_partitions: int) -> None:
+        """Update a chunk table's FTS, vector and scalar indices."""
+        row_count = table.count_rows()
+
+        # FTS index on content (always, needed for hybrid search)
+        self._update_fts(table, "content")
+
+        # Create IVF-PQ vector index (only for larger tables), then tune
+        # the default nprobes/refine_factor searches use for it
+        if self._needs_vector_index(table.name, row_count):
+            num_partitions = min(ivf_partitions, row_count // 10)
+            try:
+                table.create_index(
+                    num_partitions=num_partitions,
+                    num_sub_vectors=96,
+                )
+            except Exception:
+                pass
+            else:
+                params = tune_ann_params(table, num_partitions)
+                params["indexed_rows"] = row_count
+                self.update_metadata(
+                    {f"{table.name}_{key}": str(value) for key, value in params.items()}
+                )
+
+        self._create_scalar_indices(table)
+
+    def _needs_vector_index(self, table_name: str, row_count: int) -> bool:
+        """Whether a table's vector index should be (re)built.
 
-            # Create FTS index on content (always, needed for hybrid search)
+        Tables under 256 rows are searched exactly. Larger ones are indexed
+        once, then rebuilt after growing by ``INDEX_REBUILD_GROWTH`` since
+        the row count recorded at the last build.
+        """
+        if row_count < 256:
+            return False
+        try:
+            indexed = int(self.get_metadata().get(f"{table_name}_indexed_rows", 0))
+        except ValueError:
+            indexed = 0
+        return row_count >= indexed * (1 + self.INDEX_REBUILD_GROWTH)
+
+    def _update_fts(self, table: lancedb.table.Table, column: str) -> None:
+        """Index new rows of a column, rebuilding the index if it fails its check."""
+        with contextlib.suppress(Exception):
+            update_fts_index(table, column)
+            if check_fts_index(table, column) is not None:
+                table.create_fts_index(column, replace=True)
+
+    def _schedule_fts_merge(self, table: lancedb.table.Table, column: str) -> None:
+        """Merge a table's FTS segments in a background thread."""
+
+        def merge() -> None:
             with contextlib.suppress(Exception):
-                table.create_fts_index("content")
-
-            # Create IVF-PQ vector index (only for larger tables)
-            if row_count >= 256:
-                with contextlib.suppress(Exception):
-                    table.create_index(
-                        num_partitions=min(ivf_partitions, row_count // 10),
-                        num_sub_vectors=96,
-                    )
+                merge_fts_index(table, column, self.fts_max_segments)
+
+        self._maintenance.append(asyncio.create_task(asyncio.to_thread(merge)))
+
+    async def wait_for_maintenance(self) -> None:
+        """Wait for background index merges to finish."""
+        tasks, self._maintenance = self._maintenance, []
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    def _create_scalar_indices(self, table: lancedb.table.Table) -> None:
+        """Create missing scalar indexes on lookup and filter columns.
+
+        Existing indexes are left alone; rows added later are still found
+        (LanceDB scans unindexed fragments) until the next optimize.
+        """
+        with contextlib.suppress(Exception):
+            indexed = {col for index in table.list_indices() for col in index.columns}
+            for column, index_type in self.SCALAR_INDEXES.items():
+                if column in table.schema.names and column not in indexed:
+                    with contextlib.suppress(Exception):
+                        table.create_scalar_index(
+                            column, replace=False, index_type=index_type
+                        )
 
     def get_stats(self) -> dict[str, int]:
         """Get row counts for all tables."""
@@ -0,0 +1,228 @@
+"""Merging shard databases written by ``processor process --shard i/n``.
+
+Each worker writes its own LanceDB database (see ``core.sharding``).
+``merge_shards`` copies their tables into one database:
+
+- Shards must have been built with the same embedding models, vector
+  type and shard count (checked against each shard's ``_metadata``);
+  a missing shard is an error unless ``allow_partial`` is set.
+- Chunk ids are ``filename:line:hash``, so two shards can hold rows with
+  the same id: files with equal names and content, or stale rows left in
+  a shard by a run with a different shard count. One row is kept per id,
+  preferring the shard that owns the row's ``source_file`` under the
+  current partition, then the lower shard index.
+- Tables are copied shard by shard (only the ``id`` and ``source_file``
+  columns are read to pick the winners), and vector, FTS and scalar
+  indexes are then built on the merged tables by the loader.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import lancedb
+import pyarrow as pa
+
+from ..config import DatabaseConfig
+from ..core.sharding import SHARD_DIR_PATTERN, find_shard_databases, parse_shard, shard_of
+from .search import ANN_PARAMS
+
+METADATA_TABLE = "_metadata"
+MERGE_BATCH_ROWS = 8192  # Rows per batch copied from a shard
+
+# Metadata that may differ between shards (not carried into the merge)
+_SHARD_LOCAL_KEYS = {"shard", "created_at", "input_root", "visual_vector_source"}
+
+# Per-table index keys (<table>_nprobes, ..., <table>_indexed_rows); the
+# merged database is indexed and tuned afresh
+_INDEX_KEYS = (*ANN_PARAMS, "indexed_rows")
+
+
+@dataclass
+class ShardDatabase:
+    """A shard database and what it says about itself."""
+
+    path: Path
+    index: int | None
+    count: int | None
+    metadata: dict[str, str]
+    tables: list[str]
+
+
+@dataclass
+class MergeResult:
+    """Outcome of merging shard databases."""
+
+    shards: list[str]
+    rows: dict[str, int] = field(default_factory=dict)  # Rows written per table
+    duplicates: dict[str, int] = field(default_factory=dict)  # Rows dropped per table
+    missing_shards: list[int] = field(default_factory=list)
+
+
+def _open_shard(path: Path) -> ShardDatabase:
+    """Read a shard's tables and metadata."""
+    db = lancedb.connect(str(path))
+    names = list(db.table_names())
+    metadata = {}
+    if METADATA_TABLE in names:
+        rows = db.open_table(METADATA_TABLE).to_arrow().to_pylist()
+        metadata = {row["key"]: row["value"] for row in rows}
+
+    index = count = None
+    if "shard" in metadata:
+        index, count = parse_shard(metadata["shard"])
+    elif match := SHARD_DIR_PATTERN.match(path.name):
+        index, count = int(match.group(1)), int(match.group(2))
+    return ShardDatabase(
+        path=path,
+        index=index,
+        count=count,
+        metadata=metadata,
+        tables=[name for name in names if name != METADATA_TABLE],
+    )
+
+
+def _check_shards(shards: list[ShardDatabase], allow_partial: bool) -> list[int]:
+    """Validate shard numbering and metadata; return missing shard indexes.
+
+    Raises:
+        ValueError: If shards are incompatible or (without allow_partial) missing
+    """
+    counts = {shard.count for shard in shards if shard.count is not None}
+    if len(counts) > 1:
+        raise ValueError(f"Shards come from runs with different shard counts: {sorted(counts)}")
+
+    indexes = [shard.index for shard in shards if shard.index is not None]
+    if len(indexes) != len(set(indexes)):
+        raise ValueError("The same shard index is given more than once")
+    missing = sorted(set(range(counts.pop())) - set(indexes)) if counts else []
+    if missing and not allow_partial:
+        raise ValueError(f"Missing shards: {', '.join(map(str, missing))}")
+
+    reference: ShardDatabase | None = None
+    for shard in shards:
+        if not shard.metadata:
+            continue  # Shard that had no files to load
+        if reference is None:
+            reference = shard
+            continue
+        for key in set(reference.metadata) | set(shard.metadata):
+            if key in _SHARD_LOCAL_KEYS or key.endswith(_INDEX_KEYS):
+                continue
+            if reference.metadata.get(key) != shard.metadata.get(key):
+                raise ValueError(
+                    f"Shards disagree on {key}: {reference.path.name}="
+                    f"{reference.metadata.get(key)!r}, {shard.path.name}="
+                    f"{shard.metadata.get(key)!r}"
+                )
+    return missing
+
+
+def _row_owners(shards: list[ShardDatabase], table_name: str) -> dict[str, int]:
+    """Position in ``shards`` of the row kept for each id of a table."""
+    best: dict[str, tuple[int, int]] = {}
+    for position, shard in enumerate(shards):
+        if table_name not in shard.tables:
+            continue
+        table = lancedb.connect(str(shard.path)).open_table(table_name)
+        columns = [c for c in ("id", "source_file") if c in table.schema.names]
+        data = table.search().select(columns).limit(None).to_arrow()
+        ids = data.column("id").to_pylist()
+        sources = (
+            data.column("source_file").to_pylist()
+            if "source_file" in columns
+            else [None] * len(ids)
+        )
+        for row_id, source in zip(ids, sources, strict=True):
+            owned = (
+                shard.index is not None
+                and source is not None
+                and not Path(source).is_absolute()
+                and shard_of(source, shard.count) == shard.index
+            )
+            rank = (0 if owned else 1, position)
+            if row_id not in best or rank < best[row_id]:
+                best[row_id] = rank
+    return {row_id: position for row_id, (_, position) in best.items()}
+
+
+async def merge_shards(
+    sources: list[Path],
+    output: Path,
+    config: DatabaseConfig | None = None,
+    allow_partial: bool = False,
+) -> MergeResult:
+    """Merge shard databases into one database with fresh indexes.
+
+    Args:
+        sources: Shard databases, or directories holding ``shard-<i>-of-<n>``
+            databases (the output path given to the workers)
+        output: Target database (must not contain tables yet)
+        config: Table names and index settings for the merged database
+        allow_partial: Merge even if some shards are missing
+
+    Returns:
+        Rows written and duplicate rows dropped per table
+
+    Raises:
+        ValueError: If there are no shards, shards are incompatible or
+            missing, or the output already has tables
+    """
+    from .loader import LanceDBLoader
+
+    paths: list[Path] = []
+    for source in sources:
+        paths.extend(find_shard_databases(Path(source)) or [Path(source)])
+    if not paths:
+        raise ValueError("No shard databases given")
+    shards = sorted(
+        (_open_shard(path) for path in paths),
+        key=lambda shard: (shard.index is None, shard.index or 0, str(shard.path)),
+    )
+    result = MergeResult(shards=[str(shard.path) for shard in shards])
+    result.missing_shards = _check_shards(shards, allow_partial)
+
+    target = lancedb.connect(str(output))
+    if list(target.table_names()):
+        raise ValueError(f"Output database already has tables: {output}")
+
+    table_names = sorted({name for shard in shards for name in shard.tables})
+    for table_name in table_names:
+        owners = _row_owners(shards, table_name)
+        written: set[str] = set()
+        merged: Any = None
+        for position, shard in enumerate(shards):
+            if table_name not in shard.tables:
+                continue
+            source = lancedb.connect(str(shard.path)).open_table(table_name)
+            if merged is None:
+                merged = target.create_table(table_name, schema=source.schema)
+            result.duplicates.setdefault(table_name, 0)
+            # Copy batch by batch so no shard is held in memory whole
+            for batch in source.search().limit(None).to_batches(MERGE_BATCH_ROWS):
+                keep = []
+                for row_id in batch.column("id").to_pylist():
+                    keep.append(owners.get(row_id) == position and row_id not in written)
+                    if keep[-1]:
+                        written.add(row_id)
+                data = batch.filter(pa.array(keep, type=pa.bool_()))
+                if data.num_rows:
+                    merged.add(pa.Table.from_batches([data]))
+                result.duplicates[table_name] += len(keep) - data.num_rows
+        result.rows[table_name] = len(written)
+
+    # Carry the shared metadata over; indexes are rebuilt and re-tuned below
+    metadata: dict[str, str] = {}
+    for shard in shards:
+        for key, value in shard.metadata.items():
+            if key != "shard" and not key.endswith(_INDEX_KEYS):
+                metadata.setdefault(key, value)
+    metadata["merged_shards"] = str(len(shards))
+
+    database = (config or DatabaseConfig()).model_copy(update={"uri": str(output)})
+    loader = LanceDBLoader.from_config(database)
+    loader.update_metadata(metadata)
+    await loader.create_indices()
+    await loader._create_image_indices()
+    await loader.wait_for_maintenance()
+    return result
@@ -0,0 +1,118 @@
+"""Quantized copies of embedding vectors for compressed first-stage search.
+
+Two encodings of the float32 ``vector`` column can be stored alongside it:
+
+- **binary** (``vector_binary``): one sign bit per dimension, packed into
+  ``dims / 8`` bytes (32x smaller). Searched by Hamming distance, which
+  LanceDB scans natively.
+- **int8** (``vector_int8``): each vector scaled so its largest component
+  maps to 127 (4x smaller). Searched by cosine similarity over the int8
+  codes; the per-vector scale cancels out, so no table-wide calibration
+  has to be stored.
+
+Both only approximate the float32 ranking. Searches take the top
+``limit * rescore_factor`` candidates from the quantized scan and rescore
+them with exact distances (see ``search.search_table_quantized``).
+
+Independently, the float vectors themselves can be stored as float16
+(``vector_dtype``), halving their size; LanceDB searches them directly.
+"""
+
+import numpy as np
+import pyarrow as pa
+
+BINARY_COLUMN = "vector_binary"
+INT8_COLUMN = "vector_int8"
+
+# Quantization mode -> column holding the quantized copy
+QUANTIZED_COLUMNS = {"binary": BINARY_COLUMN, "int8": INT8_COLUMN}
+
+
+def quantize_binary(vectors: np.ndarray) -> np.ndarray:
+    """Sign-bit quantize vectors.
+
+    Args:
+        vectors: (rows, dims) or (dims,) float vectors
+
+    Returns:
+        Packed sign bits as uint8, ``ceil(dims / 8)`` bytes per vector
+    """
+    return np.packbits(np.asarray(vectors) > 0, axis=-1)
+
+
+def quantize_int8(vectors: np.ndarray) -> np.ndarray:
+    """Scale each vector to the int8 range by its largest absolute component.
+
+    Args:
+        vectors: (rows, dims) or (dims,) float vectors
+
+    Returns:
+        int8 codes of the same shape
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    scale = np.abs(vectors).max(axis=-1, keepdims=True)
+    scale[scale == 0] = 1.0
+    return np.round(vectors * (127.0 / scale)).astype(np.int8)
+
+
+# Storage types for float vector columns
+VECTOR_DTYPES = {"float32": pa.float32(), "float16": pa.float16()}
+
+
+def _fixed_size(values: np.ndarray, arrow_type: pa.DataType) -> pa.Array:
+    """(rows, dims) array as a fixed-size-list Arrow array."""
+    flat = pa.array(values.reshape(-1), type=arrow_type)
+    return pa.FixedSizeListArray.from_arrays(flat, values.shape[1])
+
+
+def vector_table(
+    records: list[dict], vector_columns: list[str], vector_dtype: str = "float32"
+) -> pa.Table:
+    """Build an Arrow table from records with vector columns of a given type.
+
+    Arrow types are set explicitly: LanceDB would otherwise infer any
+    list column named like a vector as float32.
+
+    Args:
+        records: Table records
+        vector_columns: Float vector fields of the records
+        vector_dtype: Storage type ('float32' or 'float16')
+
+    Returns:
+        Arrow table with the vector columns last
+
+    Raises:
+        ValueError: If vector_dtype is unknown
+    """
+    if vector_dtype not in VECTOR_DTYPES:
+        raise ValueError(f"Unknown vector dtype: {vector_dtype} (use {', '.join(VECTOR_DTYPES)})")
+
+    table = pa.Table.from_pylist(
+        [{k: v for k, v in r.items() if k not in vector_columns} for r in records]
+    )
+    for column in vector_columns:
+        matrix = np.asarray([r[column] for r in records], dtype=np.float32)
+        table = table.append_column(column, _fixed_size(matrix, VECTOR_DTYPES[vector_dtype]))
+    return table
+
+
+def quantized_table(
+    records: list[dict], modes: list[str], vector_dtype: str = "float32"
+) -> pa.Table:
+    """Build an Arrow table from records with quantized vector columns added.
+
+    Args:
+        records: Table records with a float ``vector`` field
+        modes: Quantization modes to add ('binary', 'int8')
+        vector_dtype: Storage type of ``vector`` ('float32' or 'float16')
+
+    Returns:
+        Arrow table with ``vector`` and the requested columns
+    """
+    table = vector_table(records, ["vector"], vector_dtype)
+    matrix = np.asarray([r["vector"] for r in records], dtype=np.float32)
+    if "binary" in modes:
+        table = table.append_column(BINARY_COLUMN, _fixed_size(quantize_binary(matrix), pa.uint8()))
+    if "int8" in modes:
+        table = table.append_column(INT8_COLUMN, _fixed_size(quantize_int8(matrix), pa.int8()))
+    return table
@@ -4,11 +4,17 @@
 # Schema definitions as dictionaries for LanceDB
 # LanceDB will create tables with these columns
 
-def get_text_chunk_schema(vector_dims: int = 1024) -> dict:
+
+def _vector(dims: int, dtype: str) -> str:
+    """Vector column type; dims is the stored (possibly truncated) width."""
+    return f"vector[{dims}]" if dtype == "float32" else f"vector[{dims}, {dtype}]"
+
+def get_text_chunk_schema(vector_dims: int = 1024, vector_dtype: str = "float32") -> dict:
     """Get schema for text/paper chunks table.
 
     Args:
-        vector_dims: Dimension of embedding vectors
+        vector_dims: Dimension of embedding vectors (after Matryoshka truncation)
+        vector_dtype: Storage type of vectors ('float32' or 'float16')
 
     Returns:
         Schema dictionary for table creation
@@ -17,7 +23,7 @@ def get_text_chunk_schema(vector_dims: int = 1024) -> dict:
         "id": "string",
         "content": "string",
         "content_hash": "string",
-        "vector": f"vector[{vector_dims}]",
+        "vector": _vector(vector_dims, vector_dtype),
         "source_file": "string",
         "source_type": "string",
         "start_line": "int32",
@@ -32,11 +38,12 @@ def get_text_chunk_schema(vector_dims: int = 1024) -> dict:
     }
 
 
-def get_code_chunk_schema(vector_dims: int = 768) -> dict:
+def get_code_chunk_schema(vector_dims: int = 768, vector_dtype: str = "float32") -> dict:
     """Get schema for code chunks table.
 
     Args:
-        vector_dims: Dimension of embedding vectors
+        vector_dims: Dimension of embedding vectors (after Matryoshka truncation)
+        vector_dtype: Storage type of vectors ('float32' or 'float16')
 
     Returns:
         Schema dictionary for table creation
@@ -45,7 +52,7 @@ def get_code_chunk_schema(vector_dims: int = 768) -> dict:
         "id": "string",
         "content": "string",
         "content_hash": "string",
-        "vector": f"vector[{vector_dims}]",
+        "vector": _vector(vector_dims, vector_dtype),
         "source_file": "string",
         "source_type": "string",
         "language": "string",
@@ -61,7 +68,7 @@ def get_code_chunk_schema(vector_dims: int = 768) -> dict:
     }
 
 
-def get_unified_chunk_schema(vector_dims: int = 1024) -> dict:
+def get_unified_chunk_schema(vector_dims: int = 1024, vector_dtype: str = "float32") -> dict:
     """Get schema for unified chunks table.
 
     For multimodal unified tables, use CLIP/SigLIP dimensions (1024 or 1152)
@@ -69,6 +76,7 @@ def get_unified_chunk_schema(vector_dims: int = 1024) -> dict:
 
     Args:
         vector_dims: Dimension of embedding vectors (default 1024 for CLIP)
+        vector_dtype: Storage type of vectors ('float32' or 'float16')
 
     Returns:
         Schema dictionary for table creation
@@ -77,7 +85,7 @@ def get_unified_chunk_schema(vector_dims: int = 1024) -> dict:
         "id": "string",
         "content": "string",
         "content_hash": "string",
-        "vector": f"vector[{vector_dims}]",
+        "vector": _vector(vector_dims, vector_dtype),
         "source_file": "string",
         "source_type": "string",  # ContentType value
         "content_type": "string",  # 'text', 'code', 'paper', 'image'
@@ -97,6 +105,7 @@ def get_unified_chunk_schema(vector_dims: int = 1024) -> dict:
 def get_image_chunk_schema(
     text_vector_dims: int = 1024,
     visual_vector_dims: int = 1024,
+    vector_dtype: str = "float32",
 ) -> dict:
     """Get schema for image chunks table.
 
@@ -107,6 +116,7 @@ def get_image_chunk_schema(
     Args:
         text_vector_dims: Dimension of text embeddings (stella: 1024)
         visual_vector_dims: Dimension of visual embeddings (CLIP: 1024)
+        vector_dtype: Storage type of both vectors ('float32' or 'float16')
 
     Returns:
         Schema dictionary for table creation
@@ -120,8 +130,8 @@ def get_image_chunk_schema(
         "page": "int32",
         "image_path": "string",
         "source_paper": "string",
-        "text_vector": f"vector[{text_vector_dims}]",
-        "visual_vector": f"vector[{visual_vector_dims}]",
+        "text_vector": _vector(text_vector_dims, vector_dtype),
+        "visual_vector": _vector(visual_vector_dims, vector_dtype),
     }
 
 
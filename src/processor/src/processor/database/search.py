@@ -0,0 +1,733 @@
+"""Shared query helpers for LanceDB tables.
+
+Used by both the ``processor search`` CLI and the rag-mcp server so that
+vector/hybrid search and result fusion behave identically everywhere.
+
+IVF-PQ search knobs (``nprobes``, ``refine_factor``) default to values
+tuned per table when the loader builds the vector index (stored in the
+``_metadata`` table as ``{table}_nprobes`` etc., see ``tune_ann_params``).
+``search_table_adaptive`` raises nprobes for queries whose top-k looks
+unreliable, within an optional latency budget. ``search_table_quantized``
+runs the first stage over binary or int8 copies of the vectors instead
+(see ``quantization``) and rescores the candidates exactly.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+
+from .quantization import INT8_COLUMN, QUANTIZED_COLUMNS, quantize_binary, quantize_int8
+
+# LanceDB's default number of IVF partitions probed per query
+DEFAULT_NPROBES = 20
+
+# Quantized searches rescore limit * this many candidates by default
+DEFAULT_RESCORE_FACTOR = 10
+
+# Tuned ANN parameters stored per table in _metadata ("{table}_{param}")
+ANN_PARAMS = ("nprobes", "refine_factor", "max_nprobes")
+
+
+def _quote(value: str) -> str:
+    """Quote a string literal for a LanceDB SQL filter."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def build_filter(
+    expression: str | None = None,
+    language: str | None = None,
+    source_type: str | None = None,
+    content_type: str | None = None,
+    symbol_type: str | None = None,
+    source_prefix: str | None = None,
+) -> str | None:
+    """Combine a raw filter expression and metadata constraints.
+
+    Each constraint targets a column with a scalar index (see
+    ``LanceDBLoader.SCALAR_INDEXES``), so pre-filtering only touches
+    matching rows.
+
+    Args:
+        expression: Raw SQL filter expression (e.g. "start_line > 100")
+        language: Exact language (e.g. 'cpp')
+        source_type: Exact source type (e.g. 'code_python', 'paper')
+        content_type: Exact content type (unified table: 'text', 'code', ...)
+        symbol_type: Exact symbol type (code table: 'function', 'class', ...)
+        source_prefix: Source file path prefix (e.g. 'src/core/')
+
+    Returns:
+        Combined filter expression, or None when no constraint is given
+    """
+    clauses = []
+    if expression:
+        clauses.append(f"({expression})")
+    for column, value in (
+        ("language", language),
+        ("source_type", source_type),
+        ("content_type", content_type),
+        ("symbol_type", symbol_type),
+    ):
+        if value:
+            clauses.append(f"{column} = {_quote(value)}")
+    if source_prefix:
+        escaped = source_prefix.replace("%", "\\%").replace("_", "\\_")
+        clauses.append(f"source_file LIKE {_quote(escaped + '%')}")
+
+    return " AND ".join(clauses) if clauses else None
+
+
+def search_table(
+    table: Any,
+    query_vector: list[float],
+    limit: int,
+    query_text: str | None = None,
+    hybrid: bool = False,
+    vector_column_name: str | None = None,
+    filter: str | None = None,
+    nprobes: int | None = None,
+    refine_factor: int | None = None,
+) -> tuple[list[dict], bool]:
+    """Run a vector or hybrid search against a table.
+
+    Hybrid search falls back to pure vector search when the table has no
+    FTS index (or hybrid is otherwise unsupported). A filter is applied as
+    a pre-filter, so the top ``limit`` results all satisfy it.
+    ``nprobes`` and ``refine_factor`` only matter once the table has an
+    IVF-PQ index.
+
+    Args:
+        table: LanceDB table
+        query_vector: Query embedding
+        limit: Number of results
+        query_text: Raw query text for the BM25 half of hybrid search
+        hybrid: Use hybrid (vector + BM25) search with RRF fusion
+        vector_column_name: Vector column to search (default: table's only vector)
+        filter: SQL filter expression (see build_filter)
+        nprobes: IVF partitions to probe (default: LanceDB's)
+        refine_factor: Re-rank ``limit * refine_factor`` PQ candidates with
+            full-precision distances (default: no refine step)
+
+    Returns:
+        Tuple of (results, hybrid_used)
+    """
+    if hybrid and query_text:
+        try:
+            query = (
+                table.search(query_type="hybrid")
+                .vector(query_vector)
+                .text(query_text)
+                .limit(limit)
+            )
+            if filter:
+                query = query.where(filter, prefilter=True)
+            return _apply_ann(query, nprobes, refine_factor).to_list(), True
+        except Exception:
+            pass  # Fall back to vector-only if hybrid not supported
+
+    if vector_column_name:
+        query = table.search(query_vector, vector_column_name=vector_column_name)
+    else:
+        query = table.search(query_vector)
+    if filter:
+        query = query.where(filter, prefilter=True)
+    return _apply_ann(query, nprobes, refine_factor).limit(limit).to_list(), False
+
+
+def _apply_ann(query: Any, nprobes: int | None, refine_factor: int | None) -> Any:
+    """Set IVF-PQ knobs on a query builder (unset values keep LanceDB defaults)."""
+    if nprobes:
+        query = query.nprobes(nprobes)
+    if refine_factor:
+        query = query.refine_factor(refine_factor)
+    return query
+
+
+async def search_table_async(
+    table: Any,
+    query_vector: list[float],
+    limit: int,
+    query_text: str | None = None,
+    hybrid: bool = False,
+    vector_column_name: str | None = None,
+    filter: str | None = None,
+    nprobes: int | None = None,
+    refine_factor: int | None = None,
+) -> tuple[list[dict], bool]:
+    """Run search_table in a worker thread.
+
+    LanceDB queries are synchronous; running them in threads lets several
+    searches against the same table handle proceed concurrently without
+    blocking the event loop.
+    """
+    return await asyncio.to_thread(
+        search_table,
+        table,
+        query_vector,
+        limit,
+        query_text,
+        hybrid,
+        vector_column_name,
+        filter,
+        nprobes,
+        refine_factor,
+    )
+
+
+def unreliable_top_k(results: list[dict], limit: int, min_spread: float = 0.05) -> bool:
+    """Check whether a vector top-k looks unreliable.
+
+    PQ-compressed distances are coarse. When the k nearest candidates are
+    almost equidistant (relative spread below ``min_spread``), their order
+    is mostly quantization noise and closer neighbours may sit in
+    partitions that were not probed. Fewer than ``limit`` results (e.g.
+    a selective pre-filter) also means too few partitions were probed.
+
+    Args:
+        results: Vector search results (with ``_distance``)
+        limit: Requested number of results
+        min_spread: Minimum (d_k - d_1) / d_k for a trustworthy top-k
+
+    Returns:
+        True if probing more partitions is likely to change the results
+    """
+    if len(results) < limit:
+        return True
+    distances = [r["_distance"] for r in results if "_distance" in r]
+    if len(distances) < 2 or distances[-1] <= 0:
+        return False
+    return (distances[-1] - distances[0]) / distances[-1] < min_spread
+
+
+def search_table_adaptive(
+    table: Any,
+    query_vector: list[float],
+    limit: int,
+    query_text: str | None = None,
+    hybrid: bool = False,
+    vector_column_name: str | None = None,
+    filter: str | None = None,
+    nprobes: int | None = None,
+    refine_factor: int | None = None,
+    max_nprobes: int | None = None,
+    latency_budget_ms: float | None = None,
+    min_spread: float = 0.05,
+) -> tuple[list[dict], bool, int]:
+    """Vector search that probes more partitions only when needed.
+
+    Starts at ``nprobes`` and doubles it while the top-k is unreliable
+    (see ``unreliable_top_k``), up to ``max_nprobes``. Each escalation is
+    skipped if it would likely overrun ``latency_budget_ms`` (assuming
+    the next round costs twice the last one). Hybrid results are not
+    escalated.
+
+    Args:
+        table: LanceDB table
+        query_vector: Query embedding
+        limit: Number of results
+        query_text: Raw query text for hybrid search
+        hybrid: Use hybrid search
+        vector_column_name: Vector column to search
+        filter: SQL filter expression
+        nprobes: Initial partitions to probe (default: DEFAULT_NPROBES)
+        refine_factor: Full-precision re-rank factor for every round
+        max_nprobes: Upper bound for escalation (default: 8x initial)
+        latency_budget_ms: Total time allowed for all rounds
+        min_spread: Spread threshold passed to unreliable_top_k
+
+    Returns:
+        Tuple of (results, hybrid_used, nprobes_used)
+    """
+    probes = nprobes or DEFAULT_NPROBES
+    ceiling = max(max_nprobes or probes * 8, probes)
+    start = time.perf_counter()
+
+    while True:
+        round_start = time.perf_counter()
+        results, hybrid_used = search_table(
+            table,
+            query_vector,
+            limit,
+            query_text=query_text,
+            hybrid=hybrid,
+            vector_column_name=vector_column_name,
+            filter=filter,
+            nprobes=probes,
+            refine_factor=refine_factor,
+        )
+        now = time.perf_counter()
+
+        if hybrid_used or probes >= ceiling or not unreliable_top_k(results, limit, min_spread):
+            return results, hybrid_used, probes
+        if latency_budget_ms is not None:
+            elapsed_ms = (now - start) * 1000
+            next_round_ms = 2 * (now - round_start) * 1000
+            if elapsed_ms + next_round_ms > latency_budget_ms:
+                return results, hybrid_used, probes
+
+        probes = min(probes * 2, ceiling)
+
+
+async def search_table_adaptive_async(
+    table: Any,
+    query_vector: list[float],
+    limit: int,
+    **kwargs: Any,
+) -> tuple[list[dict], bool, int]:
+    """Run search_table_adaptive in a worker thread."""
+    return await asyncio.to_thread(search_table_adaptive, table, query_vector, limit, **kwargs)
+
+
+# Unfiltered int8 scans reuse the codes of recently searched table versions,
+# least recently used first out once the cached arrays exceed the byte budget.
+# Searches run in worker threads, so the cache is guarded by a lock.
+_INT8_CACHE_BYTES = 512 * 2**20
+_Int8Codes = tuple[np.ndarray, np.ndarray, np.ndarray]  # Row ids, codes, inverse norms
+_int8_codes: OrderedDict[tuple[str, int], _Int8Codes] = OrderedDict()
+_int8_codes_lock = threading.Lock()
+
+
+def _read_int8_codes(table: Any, filter: str | None) -> _Int8Codes:
+    """Row ids, int8 codes (as a matrix) and inverse code norms of a table."""
+    key = (str(getattr(table, "uri", id(table))), table.version)
+    if filter is None:
+        with _int8_codes_lock:
+            if key in _int8_codes:
+                _int8_codes.move_to_end(key)
+                return _int8_codes[key]
+
+    query = table.search().select([INT8_COLUMN]).with_row_id(True)
+    if filter:
+        query = query.where(filter)
+    data = query.limit(None).to_arrow()
+    column = data.column(INT8_COLUMN).combine_chunks()
+    codes = column.flatten().to_numpy(zero_copy_only=False).reshape(-1, column.type.list_size)
+    norms = np.sqrt(np.einsum("ij,ij->i", codes, codes, dtype=np.float32))
+    entry = (
+        data.column("_rowid").to_numpy(),
+        codes,
+        1.0 / np.maximum(norms, 1.0),
+    )
+
+    if filter is None and _nbytes(entry) <= _INT8_CACHE_BYTES:
+        with _int8_codes_lock:
+            _int8_codes[key] = entry
+            while sum(_nbytes(cached) for cached in _int8_codes.values()) > _INT8_CACHE_BYTES:
+                _int8_codes.popitem(last=False)
+    return entry
+
+
+def _nbytes(entry: _Int8Codes) -> int:
+    """Memory held by the arrays of a cached int8 entry."""
+    return sum(array.nbytes for array in entry)
+
+
+def _int8_candidates(
+    table: Any, query_vector: list[float], count: int, filter: str | None
+) -> list[int]:
+    """Row ids of the ``count`` most cosine-similar int8 codes."""
+    row_ids, codes, inv_norms = _read_int8_codes(table, filter)
+    if not len(row_ids):
+        return []
+
+    query = quantize_int8(np.asarray(query_vector, dtype=np.float32)).astype(np.float32)
+    scores = np.empty(len(row_ids), dtype=np.float32)
+    block = 16384  # Bounds the float32 copy of the codes
+    for start in range(0, len(row_ids), block):
+        scores[start : start + block] = codes[start : start + block].astype(np.float32) @ query
+    scores *= inv_norms
+
+    count = min(count, len(scores))
+    top = np.argpartition(-scores, count - 1)[:count] if count < len(scores) else slice(None)
+    return row_ids[top].tolist()
+
+
+def _binary_candidates(
+    table: Any, query_vector: list[float], count: int, filter: str | None
+) -> list[int]:
+    """Row ids of the ``count`` sign-bit codes nearest by Hamming distance."""
+    query = (
+        table.search(
+            quantize_binary(np.asarray(query_vector, dtype=np.float32)),
+            vector_column_name=QUANTIZED_COLUMNS["binary"],
+        )
+        .distance_type("hamming")
+        .with_row_id(True)
+        .select([])
+    )
+    if filter:
+        query = query.where(filter, prefilter=True)
+    return query.limit(count).to_arrow().column("_rowid").to_pylist()
+
+
+def search_table_quantized(
+    table: Any,
+    query_vector: list[float],
+    limit: int,
+    quantization: str = "binary",
+    filter: str | None = None,
+    rescore_factor: int | None = None,
+) -> list[dict]:
+    """Vector search over quantized codes with full-precision rescoring.
+
+    The first stage scans the table's binary (Hamming, in LanceDB) or
+    int8 (cosine, in NumPy) codes for ``limit * rescore_factor``
+    candidates; the second stage fetches just those rows by row id and
+    computes their exact L2 distances to the query from the float32
+    vectors. Results look like a plain vector search's (``_distance`` is
+    exact).
+
+    Args:
+        table: LanceDB table loaded with the matching quantized column
+        query_vector: Query embedding
+        limit: Number of results
+        quantization: 'binary' or 'int8'
+        filter: SQL filter expression, applied in the first stage
+        rescore_factor: Candidates per result (default: DEFAULT_RESCORE_FACTOR)
+
+    Returns:
+        Nearest rows with exact ``_distance``
+
+    Raises:
+        ValueError: If the table has no codes for the requested mode
+    """
+    column = QUANTIZED_COLUMNS.get(quantization)
+    if column is None:
+        raise ValueError(
+            f"Unknown quantization '{quantization}' (expected one of {list(QUANTIZED_COLUMNS)})"
+        )
+    if column not in table.schema.names:
+        raise ValueError(
+            f"Table has no '{column}' column; reload it with database.quantization "
+            f"including '{quantization}'"
+        )
+
+    count = limit * (rescore_factor or DEFAULT_RESCORE_FACTOR)
+    if quantization == "binary":
+        candidates = _binary_candidates(table, query_vector, count, filter)
+    else:
+        candidates = _int8_candidates(table, query_vector, count, filter)
+    return _rescore(table, query_vector, candidates, limit)
+
+
+def _rescore(table: Any, query_vector: list[float], row_ids: list[int], limit: int) -> list[dict]:
+    """Rank candidate rows by exact squared L2 distance to the query."""
+    if not row_ids:
+        return []
+
+    rows = table.take_row_ids(row_ids).to_arrow()
+    column = rows.column("vector").combine_chunks()
+    vectors = column.flatten().to_numpy(zero_copy_only=False).reshape(-1, column.type.list_size)
+    distances = np.sum((vectors - np.asarray(query_vector, dtype=np.float32)) ** 2, axis=1)
+
+    order = np.argsort(distances, kind="stable")[:limit]
+    results = rows.take(order).to_pylist()
+    for row, distance in zip(results, distances[order], strict=True):
+        row["_distance"] = float(distance)
+    return results
+
+
+async def search_table_quantized_async(
+    table: Any,
+    query_vector: list[float],
+    limit: int,
+    **kwargs: Any,
+) -> list[dict]:
+    """Run search_table_quantized in a worker thread."""
+    return await asyncio.to_thread(search_table_quantized, table, query_vector, limit, **kwargs)
+
+
+def benchmark_quantization(
+    table: Any,
+    sample_size: int = 32,
+    k: int = 10,
+    rescore_factor: int | None = None,
+    nprobes: int | None = None,
+    refine_factor: int | None = None,
+) -> dict[str, dict[str, float]]:
+    """Compare recall and latency of quantized search against IVF-PQ.
+
+    Uses a sample of the table's own vectors as queries, with exact
+    (flat) search as ground truth. Modes whose column or index is missing
+    are skipped.
+
+    Args:
+        table: LanceDB table
+        sample_size: Number of sample queries
+        k: Result count the recall is measured at
+        rescore_factor: Candidates per result for quantized modes
+        nprobes: IVF partitions probed in the IVF-PQ mode (default: LanceDB's)
+        refine_factor: IVF-PQ refine factor (default: none)
+
+    Returns:
+        Mode ('exact', 'ivf_pq', 'binary', 'int8') -> recall, p50_ms, p95_ms
+    """
+    queries = (
+        table.search()
+        .select(["vector"])
+        .limit(max(sample_size, 1))
+        .to_arrow()
+        .column("vector")
+        .to_pylist()
+    )
+
+    def flat(q: list[float]) -> list[dict]:
+        return table.search(q, vector_column_name="vector").bypass_vector_index().limit(k).to_list()
+
+    def ivf_pq(q: list[float]) -> list[dict]:
+        query = table.search(q, vector_column_name="vector")
+        return _apply_ann(query, nprobes, refine_factor).limit(k).to_list()
+
+    modes: dict[str, Any] = {"exact": flat}
+    if "vector" in {col for index in table.list_indices() for col in index.columns}:
+        modes["ivf_pq"] = ivf_pq
+    for mode, column in QUANTIZED_COLUMNS.items():
+        if column in table.schema.names:
+            modes[mode] = functools.partial(
+                search_table_quantized,
+                table,
+                limit=k,
+                quantization=mode,
+                rescore_factor=rescore_factor,
+            )
+
+    report: dict[str, dict[str, float]] = {}
+    truth: list[set[str]] = []
+    for mode, run in modes.items():
+        run(queries[0])  # Warm up caches
+        latencies, found = [], []
+        for q in queries:
+            start = time.perf_counter()
+            results = run(q)
+            latencies.append((time.perf_counter() - start) * 1000)
+            found.append({r["id"] for r in results})
+        if mode == "exact":
+            truth = found
+        hits = sum(len(f & t) for f, t in zip(found, truth, strict=True))
+        report[mode] = {
+            "recall": round(hits / max(sum(len(t) for t in truth), 1), 4),
+            "p50_ms": round(float(np.percentile(latencies, 50)), 3),
+            "p95_ms": round(float(np.percentile(latencies, 95)), 3),
+        }
+    return report
+
+
+def read_ann_params(db: Any, table_name: str) -> dict[str, int]:
+    """Read the tuned ANN parameters of a table from ``_metadata``.
+
+    Args:
+        db: LanceDB connection
+        table_name: Table the parameters were tuned for
+
+    Returns:
+        Mapping with any of ``nprobes``, ``refine_factor`` and ``max_nprobes``
+    """
+    if "_metadata" not in db.table_names():
+        return {}
+
+    keys = {f"{table_name}_{param}": param for param in ANN_PARAMS}
+    rows = fetch_rows(db.open_table("_metadata"), "key", list(keys))
+    params = {}
+    for row in rows:
+        try:
+            params[keys[row["key"]]] = int(row["value"])
+        except (TypeError, ValueError):
+            continue
+    return params
+
+
+def read_truncate_dims(table: Any, vector_column: str = "vector") -> int | None:
+    """Read the dimension query embeddings must be truncated to (Matryoshka).
+
+    Taken from the vector column of the table's schema, so it always matches
+    the vectors being searched: a longer query is cut to the stored prefix
+    (see ``embedders.matryoshka.truncate_embedding``), a query of the same
+    length is left as it is.
+
+    Args:
+        table: LanceDB table being searched
+        vector_column: Vector column being searched
+
+    Returns:
+        Stored vector dimension, or None if the column is not fixed-size
+    """
+    column_type = table.schema.field(vector_column).type
+    list_size = getattr(column_type, "list_size", -1)
+    return list_size if list_size > 0 else None
+
+
+def tune_ann_params(
+    table: Any,
+    num_partitions: int,
+    vector_column_name: str = "vector",
+    sample_size: int = 32,
+    k: int = 10,
+    target_recall: float = 0.95,
+) -> dict[str, int]:
+    """Find the cheapest nprobes/refine_factor reaching a target recall.
+
+    Uses a sample of the table's own vectors as queries and compares
+    IVF-PQ results against exact (flat) search. nprobes is doubled from
+    4 up to ``num_partitions``; at each step the plain search is tried
+    first, then a refine step (which corrects PQ distortion).
+
+    Args:
+        table: LanceDB table with an IVF-PQ index
+        num_partitions: Partitions in the index (upper bound for nprobes)
+        vector_column_name: Indexed vector column
+        sample_size: Number of sample queries
+        k: Result count the recall is measured at
+        target_recall: Recall@k to reach
+
+    Returns:
+        Mapping with ``nprobes``, ``refine_factor`` (0 = none) and ``max_nprobes``
+    """
+    sample = (
+        table.search()
+        .select([vector_column_name])
+        .limit(max(sample_size, 2))
+        .to_arrow()
+        .column(vector_column_name)
+        .to_pylist()
+    )
+    queries = np.asarray(sample, dtype=np.float32)
+
+    def top_k(nprobes: int | None = None, refine_factor: int = 0) -> list[set[int]]:
+        """Neighbour row ids per sample query (exact search when nprobes is None)."""
+        query = table.search(queries, vector_column_name=vector_column_name)
+        if nprobes is None:
+            query = query.bypass_vector_index()
+        query = _apply_ann(query, nprobes, refine_factor)
+        result = query.with_row_id(True).select([]).limit(k).to_arrow()
+        neighbours: list[set[int]] = [set() for _ in range(len(queries))]
+        for i, row_id in zip(
+            result.column("query_index").to_pylist(),
+            result.column("_rowid").to_pylist(),
+            strict=True,
+        ):
+            neighbours[i].add(row_id)
+        return neighbours
+
+    truth = top_k()
+
+    def recall(found: list[set[int]]) -> float:
+        hits = sum(len(f & t) for f, t in zip(found, truth, strict=True))
+        return hits / max(sum(len(t) for t in truth), 1)
+
+    nprobes = 4
+    while True:
+        nprobes = min(nprobes, num_partitions)
+        for refine_factor in (0, 10):
+            if recall(top_k(nprobes, refine_factor)) >= target_recall:
+                return {
+                    "nprobes": nprobes,
+                    "refine_factor": refine_factor,
+                    "max_nprobes": num_partitions,
+                }
+        if nprobes >= num_partitions:
+            return {"nprobes": num_partitions, "refine_factor": 10, "max_nprobes": num_partitions}
+        nprobes *= 2
+
+
+def in_filter(column: str, values: list[str]) -> str:
+    """Build a SQL ``IN`` predicate for string values.
+
+    Args:
+        column: Column name
+        values: String values to match (single quotes are escaped)
+
+    Returns:
+        Filter expression such as ``source_file IN ('a.py', 'b.py')``
+    """
+    quoted = ", ".join(_quote(v) for v in values)
+    return f"{column} IN ({quoted})"
+
+
+def fetch_rows(
+    table: Any,
+    column: str,
+    values: list[str],
+    columns: list[str] | None = None,
+) -> list[dict]:
+    """Fetch all rows whose ``column`` matches any of ``values``.
+
+    Runs as one filtered scan, which LanceDB serves from a scalar index on
+    ``column`` when one exists. Vectors are not returned unless requested.
+
+    Args:
+        table: LanceDB table
+        column: Column to match (e.g. 'id', 'source_file', 'parent_id')
+        values: Values to look up
+        columns: Columns to return (default: all non-vector columns)
+
+    Returns:
+        Matching rows
+    """
+    if not values:
+        return []
+
+    names = table.schema.names
+    if columns is None:
+        columns = [
+            n
+            for n in names
+            if n != "vector" and not n.endswith("_vector") and n not in QUANTIZED_COLUMNS.values()
+        ]
+    else:
+        columns = [c for c in columns if c in names]
+
+    return (
+        table.search()
+        .where(in_filter(column, sorted(set(values))))
+        .select(columns)
+        .limit(None)
+        .to_list()
+    )
+
+
+def reciprocal_rank_fusion(
+    result_lists: list[list[dict]],
+    k: int = 60,
+    weights: list[float] | None = None,
+    key: str = "id",
+) -> list[dict]:
+    """Fuse several ranked result lists with (weighted) Reciprocal Rank Fusion.
+
+    Each result contributes ``weight / (k + rank)`` to its document's score,
+    where rank starts at 1. Documents are identified by ``key``.
+
+    Args:
+        result_lists: Ranked result lists to fuse
+        k: RRF smoothing constant (60 is the value from the original paper)
+        weights: Optional per-list weights (default: 1.0 each)
+        key: Field identifying the same document across lists
+
+    Returns:
+        Fused results sorted by descending ``_rrf_score``
+    """
+    if weights is None:
+        weights = [1.0] * len(result_lists)
+
+    scores: dict[str, float] = {}
+    docs: dict[str, dict] = {}
+
+    for results, weight in zip(result_lists, weights, strict=True):
+        for rank, r in enumerate(results, 1):
+            doc_id = r.get(key)
+            if doc_id is None:
+                continue
+            scores[doc_id] = scores.get(doc_id, 0.0) + weight / (k + rank)
+            if doc_id not in docs:
+                docs[doc_id] = r.copy()
+
+    fused = []
+    for doc_id, doc in docs.items():
+        doc["_rrf_score"] = scores[doc_id]
+        fused.append(doc)
+
+    fused.sort(key=lambda d: d["_rrf_score"], reverse=True)
+    return fused
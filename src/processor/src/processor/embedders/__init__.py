@@ -6,8 +6,10 @@ Backends:
 - OpenCLIP: Multimodal CLIP/SigLIP for image+text embeddings (transformers backend)
 """
 
+from typing import TYPE_CHECKING, Any
+
 from .base import BaseEmbedder
-from .ollama import OllamaEmbedder
+from .matryoshka import MatryoshkaEmbedder, truncate_embedding
 from .profiles import (
     EmbedderBackend,
     EmbeddingProfiles,
@@ -15,6 +17,18 @@ from .profiles import (
     get_model_for_profile,
 )
 
+if TYPE_CHECKING:
+    from .ollama import OllamaEmbedder
+
+
+def __getattr__(name: str) -> Any:
+    """Load OllamaEmbedder (and httpx) on first access."""
+    if name == "OllamaEmbedder":
+        from .ollama import OllamaEmbedder
+
+        return OllamaEmbedder
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Lazy imports for optional backends
 def get_transformers_embedder():
@@ -33,6 +47,8 @@ def get_openclip_embedder():
 
 __all__ = [
     "BaseEmbedder",
+    "MatryoshkaEmbedder",
+    "truncate_embedding",
     "OllamaEmbedder",
     "EmbedderBackend",
     "EmbeddingProfiles",
@@ -0,0 +1,69 @@
+"""Matryoshka truncation of embedding vectors.
+
+Qwen3-Embedding and jina-code-embeddings are trained so that a prefix of
+each vector is itself a usable embedding. Keeping the first ``dims``
+components and re-normalising to unit length shrinks storage, index size
+and scan cost proportionally, for a small recall cost.
+
+Document and query vectors must be truncated identically. Searchers take
+the target dimension from the stored vector column's width (see
+``database.search.read_truncate_dims``); the processor also records it in
+``_metadata`` (``<domain>_truncate_dims``) for reference.
+"""
+
+import math
+
+from .base import BaseEmbedder
+
+
+def truncate_embedding(vector: list[float], dims: int | None) -> list[float]:
+    """Keep the first ``dims`` components of a vector and re-normalise.
+
+    Args:
+        vector: Embedding vector
+        dims: Target dimension (None, or not smaller than the vector, keeps it)
+
+    Returns:
+        Truncated unit-length vector
+    """
+    if dims is None or len(vector) <= dims:
+        return vector
+    prefix = [float(x) for x in vector[:dims]]
+    norm = math.sqrt(sum(x * x for x in prefix))
+    return [x / norm for x in prefix] if norm > 0 else prefix
+
+
+class MatryoshkaEmbedder(BaseEmbedder):
+    """Embedder wrapper that truncates every vector to a fixed dimension."""
+
+    def __init__(self, embedder: BaseEmbedder, dims: int):
+        """Wrap an embedder.
+
+        Args:
+            embedder: Embedder producing full-width vectors
+            dims: Target dimension
+        """
+        self.embedder = embedder
+        self.model_name = embedder.model_name
+        self.dimensions = dims
+
+    async def embed(self, text: str) -> list[float]:
+        """Generate a truncated embedding for a single text."""
+        return truncate_embedding(await self.embedder.embed(text), self.dimensions)
+
+    async def embed_batch(
+        self,
+        texts: list[str],
+        batch_size: int = 32,
+    ) -> list[list[float]]:
+        """Generate truncated embeddings for multiple texts."""
+        embeddings = await self.embedder.embed_batch(texts, batch_size=batch_size)
+        return [truncate_embedding(e, self.dimensions) for e in embeddings]
+
+    async def is_available(self) -> bool:
+        """Check if the wrapped embedder is available."""
+        return await self.embedder.is_available()
+
+    async def close(self) -> None:
+        """Close the wrapped embedder."""
+        await self.embedder.close()
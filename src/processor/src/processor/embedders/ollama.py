@@ -12,6 +12,12 @@ class OllamaEmbedder(BaseEmbedder):
 
     Uses Ollama's /api/embeddings endpoint for generating embeddings.
     Requires Ollama to be running with the specified model pulled.
+
+    Queries are cut to ``max_chars`` characters. The pipeline sizes chunks
+    in model tokens beforehand (see ``ChunkSizer``), so it disables the cut
+    and sets ``num_ctx`` instead: Ollama then allocates a context that
+    fits every chunk and rejects an input that does not fit, rather than
+    truncating it silently.
     """
 
     def __init__(
@@ -19,6 +25,8 @@ class OllamaEmbedder(BaseEmbedder):
         model: str = "qwen3-embedding:0.6b",
         host: str = "http://localhost:11434",
         timeout: float = 120.0,
+        max_chars: int | None = 8000,
+        num_ctx: int | None = None,
     ):
         """Initialize Ollama embedder.
 
@@ -26,10 +34,15 @@ class OllamaEmbedder(BaseEmbedder):
             model: Ollama model name (e.g., "qwen3-embedding:0.6b")
             host: Ollama server URL
             timeout: Request timeout in seconds
+            max_chars: Cut inputs to this many characters (None: never cut)
+            num_ctx: Context length in tokens to request; inputs longer than
+                this fail instead of being truncated (None: model default)
         """
         self.model_name = model
         self.host = host.rstrip("/")
         self.timeout = timeout
+        self.max_chars = max_chars
+        self.num_ctx = num_ctx
         self.dimensions = 0  # Will be set from first response
         self._client: httpx.AsyncClient | None = None
 
@@ -39,6 +52,19 @@ class OllamaEmbedder(BaseEmbedder):
             self._client = httpx.AsyncClient(timeout=self.timeout)
         return self._client
 
+    def _payload(self, inputs: str | list[str]) -> dict:
+        """Request body for /api/embed."""
+        if self.max_chars is not None:
+            if isinstance(inputs, str):
+                inputs = inputs[: self.max_chars]
+            else:
+                inputs = [t[: self.max_chars] for t in inputs]
+        payload: dict = {"model": self.model_name, "input": inputs}
+        if self.num_ctx is not None:
+            payload["truncate"] = False
+            payload["options"] = {"num_ctx": self.num_ctx}
+        return payload
+
     async def embed(self, text: str, max_retries: int = 3) -> list[float]:
         """Generate embedding for single text.
 
@@ -50,17 +76,13 @@ class OllamaEmbedder(BaseEmbedder):
             Embedding vector as list of floats
         """
         client = self._get_client()
-
-        # Truncate very long texts to avoid issues
-        max_chars = 8000  # ~2000 tokens
-        if len(text) > max_chars:
-            text = text[:max_chars]
+        payload = self._payload(text)
 
         for attempt in range(max_retries):
             try:
                 response = await client.post(
                     f"{self.host}/api/embed",
-                    json={"model": self.model_name, "input": text},
+                    json=payload,
                 )
                 response.raise_for_status()
                 data = response.json()
@@ -81,6 +103,51 @@ class OllamaEmbedder(BaseEmbedder):
         # Should never reach here due to raise, but satisfy mypy
         return []
 
+    async def embed_texts(
+        self,
+        texts: list[str],
+        max_retries: int = 3,
+    ) -> list[list[float]]:
+        """Generate embeddings for several texts in a single request.
+
+        Ollama's /api/embed endpoint accepts a list input, so short lists
+        such as a batch of search queries cost one round trip instead of
+        one per text.
+
+        Args:
+            texts: Texts to embed
+            max_retries: Number of retry attempts on failure
+
+        Returns:
+            Embedding vectors in input order
+        """
+        if not texts:
+            return []
+
+        client = self._get_client()
+        payload = self._payload(texts)
+
+        for attempt in range(max_retries):
+            try:
+                response = await client.post(
+                    f"{self.host}/api/embed",
+                    json=payload,
+                )
+                response.raise_for_status()
+                embeddings = response.json()["embeddings"]
+
+                if self.dimensions == 0 and embeddings:
+                    self.dimensions = len(embeddings[0])
+
+                return embeddings
+            except Exception:
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(1.0 * (attempt + 1))
+                else:
+                    raise
+
+        return []
+
     async def embed_batch(
         self,
         texts: list[str],
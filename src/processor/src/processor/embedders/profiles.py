@@ -31,6 +31,10 @@ class ModelProfile:
     - huggingface_id: Model ID for transformers/sentence-transformers
 
     For multimodal models, use open_clip_model and open_clip_pretrained instead.
+
+    Models trained with Matryoshka representation learning keep most of
+    their quality when vectors are cut to a prefix and re-normalised;
+    matryoshka_min_dims is the smallest such prefix (0: not supported).
     """
 
     name: str
@@ -49,6 +53,9 @@ class ModelProfile:
     open_clip_model: str = ""
     open_clip_pretrained: str = ""
 
+    # Matryoshka truncation (0: model was not trained for it)
+    matryoshka_min_dims: int = 0
+
     def supports_backend(self, backend: EmbedderBackend) -> bool:
         """Check if this model supports a given backend."""
         if backend == EmbedderBackend.OLLAMA:
@@ -57,6 +64,29 @@ class ModelProfile:
             return bool(self.huggingface_id) or bool(self.open_clip_model)
         return False
 
+    def storage_dims(self, truncate_dims: int | None) -> int:
+        """Width of stored vectors for an optional Matryoshka truncation.
+
+        Args:
+            truncate_dims: Target dimension, or None to keep full vectors
+
+        Returns:
+            Vector dimension to store
+
+        Raises:
+            ValueError: If the model cannot be truncated to that dimension
+        """
+        if truncate_dims is None or truncate_dims >= self.dimensions:
+            return self.dimensions
+        if not self.matryoshka_min_dims:
+            raise ValueError(f"{self.name} does not support Matryoshka truncation")
+        if truncate_dims < self.matryoshka_min_dims:
+            raise ValueError(
+                f"{self.name} supports truncation to {self.matryoshka_min_dims}"
+                f"-{self.dimensions} dims, got {truncate_dims}"
+            )
+        return truncate_dims
+
 
 class EmbeddingProfiles:
     """Embedding model profiles organized by domain and resource level.
@@ -79,6 +109,7 @@ class EmbeddingProfiles:
             huggingface_id="Qwen/Qwen3-Embedding-8B",
             dimensions=4096,
             context_length=32768,
+            matryoshka_min_dims=32,
             description="MTEB 70.58, #1 multilingual, 100+ languages",
         ),
         "medium": ModelProfile(
@@ -87,6 +118,7 @@ class EmbeddingProfiles:
             huggingface_id="Qwen/Qwen3-Embedding-4B",
             dimensions=2560,
             context_length=32768,
+            matryoshka_min_dims=32,
             description="Balanced 4B model, 32K context",
         ),
         "low": ModelProfile(
@@ -95,6 +127,7 @@ class EmbeddingProfiles:
             huggingface_id="Qwen/Qwen3-Embedding-0.6B",
             dimensions=1024,
             context_length=32768,
+            matryoshka_min_dims=32,
             description="Compact 0.6B, fast inference, 32K context",
         ),
     }
@@ -112,6 +145,7 @@ class EmbeddingProfiles:
             huggingface_id="jinaai/jina-code-embeddings-1.5b",
             dimensions=1536,
             context_length=32768,
+            matryoshka_min_dims=128,
             description="SOTA 79.04% code retrieval, 15+ languages",
         ),
         "low": ModelProfile(
@@ -120,6 +154,7 @@ class EmbeddingProfiles:
             huggingface_id="jinaai/jina-code-embeddings-0.5b",
             dimensions=896,
             context_length=32768,
+            matryoshka_min_dims=64,
             description="SOTA 78.41% code retrieval, compact 0.5B",
         ),
     }
@@ -162,6 +197,7 @@ class EmbeddingProfiles:
         huggingface_id="Qwen/Qwen3-Embedding-0.6B",
         dimensions=1024,
         context_length=32768,
+        matryoshka_min_dims=32,
         description="Lightweight fallback, 32K context",
     )
 
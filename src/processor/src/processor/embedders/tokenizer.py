@@ -0,0 +1,147 @@
+"""Token counting with an embedding model's own tokenizer.
+
+Chunk sizes in ``ChunkingConfig`` are in tokens of the model that embeds
+the chunk. ``get_token_counter`` loads the fast (Rust) tokenizer of a
+profile's HuggingFace model via the ``tokenizers`` package, which is
+installed with the transformers extra. Only ``tokenizer.json`` is
+fetched, and the HuggingFace cache keeps it for later runs. With
+``HF_HUB_OFFLINE`` set only the cache is read; otherwise the hub gets
+``HUB_TIMEOUT`` seconds to answer before the cached copy is used, so an
+offline run never blocks on the network.
+
+When the tokenizer cannot be loaded (package missing, not cached while
+offline, unknown model), counts fall back to a conservative estimate of
+one token per three UTF-8 bytes. English averages about four bytes per
+token, and CJK text about three, so estimated chunks err on the small side.
+
+Counters are cached per model for the life of the process, like the
+reranker and embedder pools.
+"""
+
+import math
+import os
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tokenizers import Tokenizer
+
+# Bytes per token assumed when the model's tokenizer is unavailable
+ESTIMATE_BYTES_PER_TOKEN = 3
+
+# Seconds to wait for the HuggingFace hub before falling back to the cache
+HUB_TIMEOUT = 5.0
+
+# Loaded counters per HuggingFace model id
+_counters: dict[str, "TokenCounter"] = {}
+
+
+class TokenCounter:
+    """Counts tokens of a model and cuts text into token windows."""
+
+    def __init__(self, name: str, tokenizer: "Tokenizer | None" = None):
+        """Initialize counter.
+
+        Args:
+            name: Model the counts refer to
+            tokenizer: ``tokenizers.Tokenizer`` instance (None: estimate)
+        """
+        self.name = name
+        self.tokenizer = tokenizer
+
+    @property
+    def exact(self) -> bool:
+        """Whether counts come from the model's tokenizer."""
+        return self.tokenizer is not None
+
+    def count(self, text: str) -> int:
+        """Number of tokens in a text (special tokens excluded)."""
+        if self.tokenizer is None:
+            return math.ceil(len(text.encode("utf-8")) / ESTIMATE_BYTES_PER_TOKEN)
+        return len(self.tokenizer.encode(text, add_special_tokens=False).ids)
+
+    def count_many(self, texts: list[str]) -> list[int]:
+        """Token counts of several texts (tokenized in parallel when exact)."""
+        if self.tokenizer is None:
+            return [self.count(text) for text in texts]
+        encodings = self.tokenizer.encode_batch(texts, add_special_tokens=False)
+        return [len(encoding.ids) for encoding in encodings]
+
+    def windows(self, text: str, max_tokens: int) -> Iterator[str]:
+        """Cut text into consecutive pieces of at most ``max_tokens`` tokens.
+
+        Pieces end on token boundaries, so joining them gives back the text.
+        """
+        if self.tokenizer is None:
+            # Cut on bytes, backing off to a character boundary
+            data = text.encode("utf-8")
+            step = max(max_tokens * ESTIMATE_BYTES_PER_TOKEN, 4)
+            start = 0
+            while start < len(data):
+                end = min(start + step, len(data))
+                while end < len(data) and (data[end] & 0xC0) == 0x80:
+                    end -= 1
+                yield data[start:end].decode("utf-8")
+                start = end
+            return
+
+        offsets = self.tokenizer.encode(text, add_special_tokens=False).offsets
+        start = 0
+        for i in range(max_tokens, len(offsets), max_tokens):
+            end = offsets[i][0]
+            if end > start:
+                yield text[start:end]
+                start = end
+        if start < len(text):
+            yield text[start:]
+
+
+def get_token_counter(huggingface_id: str) -> TokenCounter:
+    """Get the cached token counter of a model.
+
+    Args:
+        huggingface_id: HuggingFace model id of the embedding profile
+
+    Returns:
+        Counter using the model's tokenizer, or an estimating counter
+    """
+    if huggingface_id not in _counters:
+        tokenizer = None
+        if huggingface_id:
+            try:
+                tokenizer = _load_tokenizer(huggingface_id)
+            except Exception:
+                tokenizer = None
+        _counters[huggingface_id] = TokenCounter(huggingface_id, tokenizer)
+    return _counters[huggingface_id]
+
+
+def hub_offline() -> bool:
+    """Whether ``HF_HUB_OFFLINE`` (or ``TRANSFORMERS_OFFLINE``) is set."""
+    return any(
+        os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+        for name in ("HF_HUB_OFFLINE", "TRANSFORMERS_OFFLINE")
+    )
+
+
+def _load_tokenizer(huggingface_id: str) -> "Tokenizer":
+    """Load a model's fast tokenizer from the HuggingFace cache or hub."""
+    from huggingface_hub import hf_hub_download
+
+    path = hf_hub_download(
+        huggingface_id,
+        "tokenizer.json",
+        local_files_only=hub_offline(),
+        etag_timeout=HUB_TIMEOUT,
+    )
+
+    from tokenizers import Tokenizer
+
+    tokenizer = Tokenizer.from_file(path)
+    tokenizer.no_truncation()
+    return tokenizer
+
+
+def clear_token_counters() -> None:
+    """Drop cached counters. Useful for testing."""
+    _counters.clear()
@@ -4,13 +4,10 @@ import json
 import re
 from pathlib import Path
 
+from ..core.manifest import IMAGE_EXTENSIONS, CorpusManifest
 from ..types import ImageChunk, ImageProcessingResult
 
 
-# Supported image extensions
-IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp"}
-
-
 class ImageProcessor:
     """Process images from papers using figures.json metadata OR standalone images.
 
@@ -26,6 +23,10 @@ class ImageProcessor:
     This processor reads figures.json and creates ImageChunk objects
     that can be embedded using both text (VLM description) and visual
     (CLIP/SigLIP) embeddings.
+
+    Every discovery method accepts an optional CorpusManifest (see
+    ``core.manifest``); with one, directories are not listed or probed
+    again and image existence is checked against the scan.
     """
 
     # Classifications to skip (low-value figures)
@@ -45,11 +46,14 @@ class ImageProcessor:
         self.skip_logos = skip_logos
         self.process_standalone = process_standalone
 
-    def process_paper_images(self, paper_dir: Path) -> ImageProcessingResult:
+    def process_paper_images(
+        self, paper_dir: Path, manifest: CorpusManifest | None = None
+    ) -> ImageProcessingResult:
         """Process all images from a paper directory.
 
         Args:
             paper_dir: Path to the paper directory containing figures.json or img/
+            manifest: Corpus scan covering paper_dir (avoids filesystem probes)
 
         Returns:
             ImageProcessingResult with ImageChunks for each valid figure
@@ -58,9 +62,15 @@ class ImageProcessor:
         image_chunks: list[ImageChunk] = []
 
         figures_path = paper_dir / "figures.json"
+        if manifest is not None:
+            has_figures = manifest.relative(paper_dir) in manifest.figures_json_dirs
+            image_exists = manifest.has_image
+        else:
+            has_figures = figures_path.exists()
+            image_exists = Path.exists
 
         # Try figures.json first (preferred - has VLM descriptions)
-        if figures_path.exists():
+        if has_figures:
             # Load figures.json
             try:
                 figures_data = json.loads(figures_path.read_text(encoding="utf-8"))
@@ -91,7 +101,7 @@ class ImageProcessor:
                         continue
 
                     # Verify image file exists
-                    if not chunk.image_path.exists():
+                    if not image_exists(chunk.image_path):
                         errors.append(
                             f"Image file not found: {chunk.image_path} (figure {chunk.figure_id})"
                         )
@@ -106,9 +116,10 @@ class ImageProcessor:
         # Fallback: process standalone images from img/ folder
         elif self.process_standalone:
             img_dir = paper_dir / "img"
-            if img_dir.exists():
+            if manifest is not None or img_dir.exists():
+                image_files = manifest.images_in(img_dir) if manifest is not None else None
                 standalone_chunks, standalone_errors = self._process_standalone_images(
-                    img_dir, paper_dir.name
+                    img_dir, paper_dir.name, image_files
                 )
                 image_chunks.extend(standalone_chunks)
                 errors.extend(standalone_errors)
@@ -119,15 +130,35 @@ class ImageProcessor:
             errors=errors,
         )
 
-    def find_paper_directories(self, input_path: Path) -> list[Path]:
+    def find_paper_directories(
+        self, input_path: Path, manifest: CorpusManifest | None = None
+    ) -> list[Path]:
         """Find all paper directories containing figures.json or img/ folders.
 
+        Looks at the input path itself, its direct subdirectories and the
+        entries of its papers/ and pdfs/ subdirectories.
+
         Args:
             input_path: Root input path to search
+            manifest: Corpus scan of input_path (avoids listing directories)
 
         Returns:
             List of paths to paper directories with figures.json or img/
         """
+        if manifest is not None:
+            candidates = set(manifest.figure_dirs)
+            if "." in candidates:
+                return [input_path]
+            return [
+                input_path / rel
+                for rel in manifest.figure_dirs
+                if (parts := rel.split("/"))
+                and (
+                    (len(parts) == 2 and parts[0] in ("papers", "pdfs"))
+                    or (len(parts) == 1 and parts[0] not in ("papers", "pdfs"))
+                )
+            ]
+
         paper_dirs: list[Path] = []
 
         # Check if input_path itself is a paper directory
@@ -151,15 +182,21 @@ class ImageProcessor:
 
         return paper_dirs
 
-    def find_all_standalone_images(self, input_path: Path) -> list[Path]:
+    def find_all_standalone_images(
+        self, input_path: Path, manifest: CorpusManifest | None = None
+    ) -> list[Path]:
         """Recursively find all image files in a directory tree.
 
         Args:
             input_path: Root path to search
+            manifest: Corpus scan of input_path (avoids walking the tree)
 
         Returns:
             List of paths to image files
         """
+        if manifest is not None:
+            return [manifest.root_path / rel for rel in sorted(manifest.images)]
+
         image_files: list[Path] = []
 
         for file_path in input_path.rglob("*"):
@@ -169,13 +206,14 @@ class ImageProcessor:
         return sorted(image_files)
 
     def _process_standalone_images(
-        self, img_dir: Path, source_name: str
+        self, img_dir: Path, source_name: str, image_files: list[Path] | None = None
     ) -> tuple[list[ImageChunk], list[str]]:
         """Process standalone images from an img/ directory.
 
         Args:
             img_dir: Path to the img/ directory
             source_name: Name of the source (paper/folder name)
+            image_files: Images in img_dir, if already known (sorted)
 
         Returns:
             Tuple of (image_chunks, errors)
@@ -183,10 +221,11 @@ class ImageProcessor:
         image_chunks: list[ImageChunk] = []
         errors: list[str] = []
 
-        image_files = sorted(
-            f for f in img_dir.iterdir()
-            if f.is_file() and f.suffix.lower() in IMAGE_EXTENSIONS
-        )
+        if image_files is None:
+            image_files = sorted(
+                f for f in img_dir.iterdir()
+                if f.is_file() and f.suffix.lower() in IMAGE_EXTENSIONS
+            )
 
         for idx, img_path in enumerate(image_files, 1):
             try:
@@ -202,22 +241,26 @@ class ImageProcessor:
         return image_chunks, errors
 
     def process_all_papers(
-        self, input_path: Path, verbose: bool = False
+        self,
+        input_path: Path,
+        verbose: bool = False,
+        manifest: CorpusManifest | None = None,
     ) -> list[ImageProcessingResult]:
         """Process images from all papers in input directory.
 
         Args:
             input_path: Root input path containing papers
             verbose: Whether to print progress
+            manifest: Corpus scan of input_path (see find_paper_directories)
 
         Returns:
             List of ImageProcessingResult for each paper
         """
         results: list[ImageProcessingResult] = []
-        paper_dirs = self.find_paper_directories(input_path)
+        paper_dirs = self.find_paper_directories(input_path, manifest)
 
         for paper_dir in paper_dirs:
-            result = self.process_paper_images(paper_dir)
+            result = self.process_paper_images(paper_dir, manifest)
             results.append(result)
 
             if verbose and result.chunk_count > 0:
@@ -226,7 +269,10 @@ class ImageProcessor:
         return results
 
     def get_all_image_chunks(
-        self, input_path: Path, verbose: bool = False
+        self,
+        input_path: Path,
+        verbose: bool = False,
+        manifest: CorpusManifest | None = None,
     ) -> tuple[list[ImageChunk], list[str]]:
         """Get all image chunks from papers in input directory.
 
@@ -235,6 +281,7 @@ class ImageProcessor:
         Args:
             input_path: Root input path containing papers
             verbose: Whether to print progress
+            manifest: Corpus scan of input_path (see find_paper_directories)
 
         Returns:
             Tuple of (all_chunks, all_errors)
@@ -242,7 +289,7 @@ class ImageProcessor:
         all_chunks: list[ImageChunk] = []
         all_errors: list[str] = []
 
-        results = self.process_all_papers(input_path, verbose=verbose)
+        results = self.process_all_papers(input_path, verbose=verbose, manifest=manifest)
 
         for result in results:
             all_chunks.extend(result.image_chunks)
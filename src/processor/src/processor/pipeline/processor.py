@@ -1,6 +1,8 @@
 """Main processing pipeline."""
 
+import asyncio
 import json
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -8,34 +10,57 @@ from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 
 from ..chunkers.factory import ChunkerFactory
+from ..chunkers.sizing import ChunkSizer
 from ..config import ProcessorConfig
 from ..core.detector import ContentDetector
+from ..core.manifest import CorpusManifest, scan_corpus
 from ..core.router import ContentRouter
-from ..database.loader import LanceDBLoader
 from ..embedders.base import BaseEmbedder
-from ..embedders.ollama import OllamaEmbedder
+from ..embedders.matryoshka import MatryoshkaEmbedder
 from ..embedders.profiles import EmbedderBackend, get_model_for_profile
 from ..images.processor import ImageProcessor
-from ..types import Chunk, ContentType, ImageChunk, ProcessingResult, ProcessingState
+from ..types import (
+    Chunk,
+    ContentType,
+    ImageChunk,
+    PipelineProgress,
+    ProcessingResult,
+    ProcessingState,
+)
 
 console = Console()
 
+# (backend, model, host or device) -> shared embedder; `create` builds one on a miss
+EmbedderPool = Callable[[tuple[str, str, str], Callable[[], BaseEmbedder]], BaseEmbedder]
+
 
 class Pipeline:
     """Main processing pipeline orchestrating chunking, embedding, and loading."""
 
-    def __init__(self, config: ProcessorConfig):
+    def __init__(
+        self,
+        config: ProcessorConfig,
+        embedder_pool: EmbedderPool | None = None,
+        on_progress: Callable[[PipelineProgress], None] | None = None,
+    ):
         """Initialize pipeline with configuration.
 
         Args:
             config: Processor configuration
+            embedder_pool: Source of shared text/code embedders (the pipeline
+                then leaves closing them to the pool)
+            on_progress: Called with the running counters after each step
         """
         self.config = config
+        self.embedder_pool = embedder_pool
+        self.on_progress = on_progress
+        self.progress = PipelineProgress()
         self.detector = ContentDetector(
             directory_map=config.content_mapping.model_dump()
         )
         self.router = ContentRouter(self.detector)
         self.chunker_factory = ChunkerFactory(config.chunking)
+        self.sizer = ChunkSizer(config.chunking, config.embedding)
         self.image_processor = ImageProcessor(skip_logos=True)
         self.state = self._load_state()
 
@@ -51,6 +76,7 @@ class Pipeline:
         self._text_embedder: BaseEmbedder | None = None
         self._code_embedder: BaseEmbedder | None = None
         self._multimodal_embedder: Any | None = None  # OpenCLIPEmbedder
+        self._visual_vector_source: str | None = None  # "openclip" or "text" (fallback)
 
     def _load_state(self) -> ProcessingState:
         """Load processing state from file."""
@@ -79,7 +105,9 @@ class Pipeline:
             profile, backend = get_model_for_profile(
                 "text", self.config.embedding.text_profile, self._backend
             )
-            self._text_embedder = self._create_embedder(profile, backend)
+            self._text_embedder = self._create_embedder(
+                profile, backend, self.config.embedding.text_truncate_dims
+            )
         return self._text_embedder
 
     async def _get_code_embedder(self) -> BaseEmbedder:
@@ -88,7 +116,9 @@ class Pipeline:
             profile, backend = get_model_for_profile(
                 "code", self.config.embedding.code_profile, self._backend
             )
-            self._code_embedder = self._create_embedder(profile, backend)
+            self._code_embedder = self._create_embedder(
+                profile, backend, self.config.embedding.code_truncate_dims
+            )
         return self._code_embedder
 
     async def _get_multimodal_embedder(self) -> Any:
@@ -110,16 +140,48 @@ class Pipeline:
                 self._multimodal_embedder = None
         return self._multimodal_embedder
 
-    def _create_embedder(self, profile: Any, backend: EmbedderBackend) -> BaseEmbedder:
+    def _create_embedder(
+        self, profile: Any, backend: EmbedderBackend, truncate_dims: int | None = None
+    ) -> BaseEmbedder:
         """Create embedder for the given profile and backend.
 
         Args:
             profile: ModelProfile with model configuration
             backend: Selected backend to use
+            truncate_dims: Matryoshka target dimension (None keeps full vectors)
 
         Returns:
-            Configured embedder instance
+            Configured embedder instance (truncating if requested)
         """
+        if self.embedder_pool is not None:
+            endpoint = (
+                self.config.embedding.torch_device
+                if backend == EmbedderBackend.TRANSFORMERS
+                else self.config.embedding.ollama_host
+            )
+            key = (backend.value, profile.ollama_model or profile.name, endpoint)
+            embedder = self.embedder_pool(
+                key, lambda: self._create_backend_embedder(profile, backend)
+            )
+        else:
+            embedder = self._create_backend_embedder(profile, backend)
+        dims = profile.storage_dims(truncate_dims)
+        if dims < profile.dimensions:
+            return MatryoshkaEmbedder(embedder, dims)
+        return embedder
+
+    def _create_backend_embedder(self, profile: Any, backend: EmbedderBackend) -> BaseEmbedder:
+        """Create the embedder of a profile's model on the given backend."""
+        from ..embedders.ollama import OllamaEmbedder
+
+        # Chunks are already sized in tokens: give Ollama a context that fits
+        # the largest one (plus special tokens) instead of a character cut
+        chunking = self.config.chunking
+        largest = max(
+            chunking.code_chunk_size, chunking.paper_chunk_size, chunking.markdown_chunk_size
+        )
+        num_ctx = min(largest + 16, profile.context_length)
+
         if backend == EmbedderBackend.TRANSFORMERS:
             try:
                 from ..embedders import get_transformers_embedder
@@ -134,14 +196,57 @@ class Pipeline:
                 return OllamaEmbedder(
                     model=profile.ollama_model or profile.name,
                     host=self.config.embedding.ollama_host,
+                    max_chars=None,
+                    num_ctx=num_ctx,
                 )
         else:
             # Default: Ollama
             return OllamaEmbedder(
                 model=profile.ollama_model or profile.name,
                 host=self.config.embedding.ollama_host,
+                max_chars=None,
+                num_ctx=num_ctx,
             )
 
+    def _embedding_metadata(self) -> dict[str, str]:
+        """Describe the text/code embedding models for the _metadata table.
+
+        Consumers such as the lancedb-server use this to embed queries
+        with the same models the database was built with.
+        """
+        metadata = {"embedding_backend": self._backend.value}
+        for domain, profile_name in (
+            ("text", self.config.embedding.text_profile),
+            ("code", self.config.embedding.code_profile),
+        ):
+            profile, _ = get_model_for_profile(domain, profile_name, self._backend)
+            metadata[f"{domain}_profile"] = profile_name
+            metadata[f"{domain}_ollama_model"] = profile.ollama_model or profile.name
+            metadata[f"{domain}_huggingface_id"] = profile.huggingface_id
+            dims = profile.storage_dims(getattr(self.config.embedding, f"{domain}_truncate_dims"))
+            metadata[f"{domain}_dims"] = str(dims)
+            # Searchers cut query embeddings to the same prefix
+            metadata[f"{domain}_truncate_dims"] = str(dims) if dims < profile.dimensions else ""
+
+        profile, _ = get_model_for_profile(
+            "multimodal", self.config.embedding.multimodal_profile, EmbedderBackend.TRANSFORMERS
+        )
+        metadata["multimodal_profile"] = self.config.embedding.multimodal_profile
+        metadata["multimodal_open_clip_model"] = profile.open_clip_model
+        metadata["multimodal_open_clip_pretrained"] = profile.open_clip_pretrained
+        metadata["multimodal_dims"] = str(profile.dimensions)
+        metadata["vector_dtype"] = self.config.embedding.vector_dtype
+        return metadata
+
+    def _report(self, stage: str | None = None, **advance: int) -> None:
+        """Advance progress counters and notify the progress callback."""
+        if stage is not None:
+            self.progress.stage = stage
+        for name, amount in advance.items():
+            setattr(self.progress, name, getattr(self.progress, name) + amount)
+        if self.on_progress is not None:
+            self.on_progress(self.progress)
+
     async def process(
         self,
         input_path: Path,
@@ -156,14 +261,26 @@ class Pipeline:
         Returns:
             Processing statistics
         """
-        # Collect files to process
-        files = self._collect_files(input_path)
-        console.print(f"Found {len(files)} files to process")
+        # One scan feeds both text and image discovery. Scanning, chunking,
+        # image discovery and state writes are synchronous, so they run in
+        # worker threads to keep the event loop free for status and cancel.
+        self._report("scanning")
+        manifest = await asyncio.to_thread(scan_corpus, input_path, self.router.should_process)
+        shard_index = self.config.processing.shard_index
+        shard_count = self.config.processing.shard_count
+        if shard_count > 1:
+            manifest = manifest.shard(shard_index, shard_count)
+        files = manifest.file_paths()
+        if shard_count > 1:
+            console.print(f"Found {len(files)} files to process (shard {shard_index}/{shard_count})")
+        else:
+            console.print(f"Found {len(files)} files to process")
 
         # Filter by incremental state
         if self.config.processing.incremental:
-            files = [f for f in files if self.state.needs_processing(f)]
+            files = await asyncio.to_thread(self._filter_changed, manifest)
             console.print(f"Processing {len(files)} files (incremental mode)")
+        self._report("chunking", files_total=len(files))
 
         # Process files (text and code)
         all_chunks: list[Chunk] = []
@@ -180,44 +297,83 @@ class Pipeline:
                 task = progress.add_task("Processing files...", total=len(files))
 
                 for file_path in files:
+                    created = file_errors = 0
                     try:
                         result = await self._process_file(file_path, content_type)
                         if result.success:
+                            created = len(result.chunks)
                             all_chunks.extend(result.chunks)
                             self.state.mark_processed(file_path)
                         else:
-                            errors += 1
+                            file_errors = 1
                             if self.config.verbose:
                                 for error in result.errors:
                                     console.print(f"[red]Error in {file_path}: {error}[/red]")
                     except Exception as e:
-                        errors += 1
+                        file_errors = 1
                         if self.config.verbose:
                             console.print(f"[red]Error processing {file_path}: {e}[/red]")
 
+                    errors += file_errors
                     progress.update(task, advance=1)
+                    self._report(files_processed=1, chunks_created=created, errors=file_errors)
 
             console.print(f"Created {len(all_chunks)} chunks from {len(files)} files")
 
+        # Drop near-duplicates before any embedding compute is spent on them
+        aliases = []
+        chunks_created = len(all_chunks)
+        if all_chunks and self.config.chunking.near_duplicates:
+            from ..chunkers.dedup import NearDuplicateDetector
+
+            self._report("deduplicating")
+            chunking = self.config.chunking
+            detector = NearDuplicateDetector(
+                threshold=chunking.near_duplicate_threshold,
+                num_perm=chunking.minhash_permutations,
+                shingle_size=chunking.shingle_size,
+            )
+            dedup = await asyncio.to_thread(detector.deduplicate, all_chunks)
+            all_chunks, aliases = dedup.chunks, dedup.aliases
+            self._report(duplicates_removed=dedup.removed)
+            console.print(
+                f"Removed {dedup.removed} near-duplicate chunks ({dedup.clusters} clusters)"
+            )
+
         # Process images from papers
         image_chunks: list[ImageChunk] = []
         image_errors = 0
 
         console.print("Scanning for paper images...")
-        paper_image_chunks, paper_errors = self.image_processor.get_all_image_chunks(
-            input_path, verbose=self.config.verbose
+        paper_image_chunks, paper_errors = await asyncio.to_thread(
+            self.image_processor.get_all_image_chunks,
+            input_path,
+            verbose=self.config.verbose,
+            manifest=manifest,
         )
         image_chunks.extend(paper_image_chunks)
         image_errors += len(paper_errors)
+        self._report(images_total=len(image_chunks), errors=image_errors)
 
         if image_chunks:
             console.print(f"Found {len(image_chunks)} images from papers")
         elif paper_errors:
             console.print(f"[yellow]Image processing errors: {len(paper_errors)}[/yellow]")
 
-        # Initialize loader with input_root for portable paths
+        # Initialize loader with input_root for portable paths (imports lancedb)
+        from ..database.loader import LanceDBLoader
+
         input_root = input_path if input_path.is_dir() else input_path.parent
-        loader = LanceDBLoader.from_config(self.config.database, input_root=input_root)
+        metadata = self._embedding_metadata()
+        if shard_count > 1:
+            # Lets `processor merge` check that every shard is present
+            metadata["shard"] = f"{shard_index}/{shard_count}"
+        loader = LanceDBLoader.from_config(
+            self.config.database,
+            input_root=input_root,
+            embedding_metadata=metadata,
+            vector_dtype=self.config.embedding.vector_dtype,
+        )
 
         # Skip index creation in chunk-only mode (zero vectors are all duplicates)
         create_index = not self.config.chunk_only
@@ -229,10 +385,14 @@ class Pipeline:
                 all_chunks = self._set_zero_embeddings(all_chunks)
             else:
                 console.print(f"[cyan]Generating embeddings for {len(all_chunks)} chunks...[/cyan]")
+                self._report("embedding")
                 all_chunks = await self._embed_chunks(all_chunks)
 
             console.print("Loading text/code into LanceDB...")
+            self._report("loading")
             counts = await loader.load_chunks(all_chunks, create_index=create_index)
+            await asyncio.to_thread(loader.load_aliases, aliases, [str(f) for f in files])
+            self._report(chunks_loaded=len(all_chunks))
             console.print(f"[green]✓[/green] Loaded: text={counts['text_chunks']}, code={counts['code_chunks']}, unified={counts['unified_chunks']}")
 
         # Embed image chunks (dual embeddings)
@@ -242,47 +402,80 @@ class Pipeline:
                 image_chunks = self._set_zero_image_embeddings(image_chunks)
             else:
                 console.print(f"[cyan]Generating embeddings for {len(image_chunks)} images...[/cyan]")
+                self._report("images")
                 image_chunks = await self._embed_image_chunks(image_chunks)
 
             console.print("Loading images into LanceDB...")
+            self._report("loading")
             image_counts = await loader.load_image_chunks(image_chunks, create_index=create_index)
+            self._report(images_loaded=len(image_chunks))
             console.print(f"[green]✓[/green] Loaded: images={image_counts['image_chunks']}")
 
+            # Tell searchers whether visual_vector is in CLIP space
+            if self._visual_vector_source is not None:
+                await asyncio.to_thread(
+                    loader.update_metadata, {"visual_vector_source": self._visual_vector_source}
+                )
+
+        # Let background FTS merges finish before recording the run
+        await loader.wait_for_maintenance()
+
         # Save state
         from datetime import datetime
         self.state.last_run = datetime.now().isoformat()
-        self._save_state()
+        await asyncio.to_thread(self._save_state)
+        await asyncio.to_thread(manifest.save, self.config.processing.manifest_file)
 
         # Close embedders
         await self._close_embedders()
+        self._report("done")
 
         return {
             "files_processed": len(files),
-            "chunks_created": len(all_chunks),
+            "chunks_created": chunks_created,
+            "duplicates_removed": len(aliases),
             "images_processed": len(image_chunks),
             "errors": errors + image_errors,
         }
 
     def _collect_files(self, input_path: Path) -> list[Path]:
         """Collect all processable files from input path."""
-        if input_path.is_file():
-            if self.router.should_process(input_path):
-                return [input_path]
-            return []
+        return scan_corpus(input_path, self.router.should_process).file_paths()
 
-        files = []
-        for file_path in input_path.rglob("*"):
-            if file_path.is_file() and self.router.should_process(file_path):
-                files.append(file_path)
+    def _filter_changed(self, manifest: CorpusManifest) -> list[Path]:
+        """Files that need (re)processing in incremental mode.
 
-        return sorted(files)
+        Files whose size and mtime match the previous run's manifest (and
+        that were processed successfully) are skipped without being read.
+        Everything else falls back to the content-hash check.
+        """
+        previous = CorpusManifest.load(self.config.processing.manifest_file)
+        diff = manifest.diff(previous)
+        if previous is not None:
+            console.print(
+                f"Manifest diff: {len(diff.added)} added, {len(diff.modified)} modified, "
+                f"{len(diff.removed)} removed"
+            )
+
+        unchanged = set(diff.unchanged)
+        files = []
+        for rel, path in zip(sorted(manifest.files), manifest.file_paths(), strict=True):
+            if rel in unchanged and str(path) in self.state.processed_files:
+                continue
+            if self.state.needs_processing(path):
+                files.append(path)
+        return files
 
     async def _process_file(
         self,
         file_path: Path,
         force_type: str | None = None,
     ) -> ProcessingResult:
-        """Process a single file into chunks."""
+        """Process a single file into chunks (in a worker thread)."""
+        return await asyncio.to_thread(self._chunk_file, file_path, force_type)
+
+    def _chunk_file(self, file_path: Path, force_type: str | None = None) -> ProcessingResult:
+        """Read, detect, chunk and size one file."""
         try:
             # Read file content
             content = file_path.read_text(encoding="utf-8", errors="ignore")
@@ -301,8 +494,8 @@ class Pipeline:
             # Get appropriate chunker
             chunker = self.chunker_factory.get_chunker_for_content_type(content_type)
 
-            # Chunk content
-            chunks = chunker.chunk(content, file_path)
+            # Chunk content, then fit chunks to the embedding model's token budget
+            chunks = self.sizer.size(chunker.chunk(content, file_path))
 
             return ProcessingResult(
                 source_file=str(file_path),
@@ -371,13 +564,32 @@ class Pipeline:
             Chunks with embeddings set
         """
         texts = [c.content for c in chunks]
-        embeddings = await embedder.embed_batch(texts, batch_size=batch_size)
+        embeddings = await self._embed_texts(embedder, texts, batch_size, "chunks_embedded")
 
         for chunk, embedding in zip(chunks, embeddings, strict=False):
             chunk.embedding = embedding
 
         return chunks
 
+    async def _embed_texts(
+        self,
+        embedder: BaseEmbedder,
+        texts: list[str],
+        batch_size: int,
+        counter: str,
+    ) -> list[list[float]]:
+        """Embed texts one batch per request, advancing a progress counter.
+
+        Per-batch requests let jobs sharing a pooled embedder interleave
+        instead of one job holding the backend for its whole corpus.
+        """
+        embeddings: list[list[float]] = []
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start : start + batch_size]
+            embeddings.extend(await embedder.embed_batch(batch, batch_size=batch_size))
+            self._report(**{counter: len(batch)})
+        return embeddings
+
     async def _embed_image_chunks(
         self,
         image_chunks: list[ImageChunk],
@@ -404,8 +616,8 @@ class Pipeline:
         if self.config.verbose:
             console.print(f"  Embedding {len(texts)} image descriptions...")
 
-        text_embeddings = await text_embedder.embed_batch(
-            texts, batch_size=self.config.embedding.batch_size
+        text_embeddings = await self._embed_texts(
+            text_embedder, texts, self.config.embedding.batch_size, "images_embedded"
         )
 
         for chunk, embedding in zip(image_chunks, text_embeddings, strict=False):
@@ -424,16 +636,19 @@ class Pipeline:
 
                 for chunk, embedding in zip(image_chunks, visual_embeddings, strict=False):
                     chunk.visual_embedding = embedding
+                self._visual_vector_source = "openclip"
             except Exception as e:
                 console.print(f"[yellow]Visual embedding failed: {e}[/yellow]")
                 # Set visual embeddings to None (or same as text)
                 for chunk in image_chunks:
                     chunk.visual_embedding = chunk.text_embedding
+                self._visual_vector_source = "text"
         else:
             # No CLIP available - use text embedding for both
             console.print("[yellow]No multimodal embedder, using text embeddings for visual[/yellow]")
             for chunk in image_chunks:
                 chunk.visual_embedding = chunk.text_embedding
+            self._visual_vector_source = "text"
 
         return image_chunks
 
@@ -465,6 +680,10 @@ class Pipeline:
             chunk.visual_embedding = [0.0] * 1024
         return image_chunks
 
+    async def close(self) -> None:
+        """Close embedders (e.g. after a cancelled run). Safe to call twice."""
+        await self._close_embedders()
+
     async def _close_embedders(self) -> None:
         """Close embedder connections."""
         if self._text_embedder:
@@ -473,3 +692,4 @@ class Pipeline:
             await self._code_embedder.close()
         if self._multimodal_embedder and hasattr(self._multimodal_embedder, 'close'):
             await self._multimodal_embedder.close()
+        self._text_embedder = self._code_embedder = self._multimodal_embedder = None
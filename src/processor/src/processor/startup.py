@@ -0,0 +1,161 @@
+"""Import-time benchmark for CLI commands and MCP servers.
+
+Each probe imports what one entry point loads before doing any work, in
+a fresh interpreter:
+
+- **cold**: the first run with an empty bytecode cache
+  (``PYTHONPYCACHEPREFIX`` pointing at a new directory), as after install
+- **warm**: the median of further runs reusing that cache
+
+Heavy subsystems are loaded lazily at module boundaries (LlamaIndex and
+tree-sitter on first chunk, LanceDB on first database access, httpx on
+first embedder), so each probe also lists the heavy modules it must not
+load. A probe fails when its warm median exceeds its budget or it loads
+a forbidden module; ``processor benchmark-startup`` exits non-zero then.
+
+Budgets are wall-clock milliseconds on a developer laptop; scale them
+for slower machines with ``budget_scale``. Probes that need LanceDB are
+dominated by ``import lancedb`` itself.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass, field
+
+# Modules that must only load when an entry point actually needs them
+HEAVY_MODULES = ("llama_index.core", "tree_sitter", "lancedb", "httpx", "torch")
+
+
+@dataclass
+class StartupProbe:
+    """Modules an entry point imports, with its warm budget."""
+
+    modules: list[str]
+    budget_ms: float
+    forbidden: list[str] = field(default_factory=list)
+
+
+STARTUP_PROBES: dict[str, StartupProbe] = {
+    # processor --help / --version, and every command before its body runs
+    "cli": StartupProbe(
+        ["processor.cli"],
+        budget_ms=400,
+        forbidden=["llama_index.core", "tree_sitter", "lancedb", "httpx", "pydantic"],
+    ),
+    "stats": StartupProbe(
+        ["processor.cli", "lancedb"],
+        budget_ms=4000,
+        forbidden=["llama_index.core", "tree_sitter", "httpx"],
+    ),
+    "export": StartupProbe(
+        ["processor.cli", "processor.database.exporter"],
+        budget_ms=4000,
+        forbidden=["llama_index.core", "tree_sitter", "httpx"],
+    ),
+    "search": StartupProbe(
+        [
+            "processor.cli",
+            "processor.config",
+            "processor.database.search",
+            "processor.embedders.ollama",
+            "lancedb",
+        ],
+        budget_ms=4500,
+        forbidden=["llama_index.core", "tree_sitter"],
+    ),
+    # LlamaIndex, LanceDB and httpx load once chunking/embedding/loading starts
+    "process": StartupProbe(
+        ["processor.cli", "processor.config", "processor.pipeline.processor"],
+        budget_ms=800,
+        forbidden=["llama_index.core", "tree_sitter", "lancedb", "httpx"],
+    ),
+    # Server start (tool listing); LanceDB loads on the first search
+    "rag-mcp": StartupProbe(
+        ["rag_mcp.server"],
+        budget_ms=2000,
+        forbidden=["llama_index.core", "tree_sitter", "lancedb", "torch"],
+    ),
+    "processor-mcp": StartupProbe(
+        ["processor_mcp.server"],
+        budget_ms=1800,
+        forbidden=["llama_index.core", "tree_sitter", "lancedb", "torch"],
+    ),
+}
+
+_PROBE_SCRIPT = """
+import importlib, json, sys, time
+start = time.perf_counter()
+for name in sys.argv[1:]:
+    importlib.import_module(name)
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({"ms": elapsed, "loaded": sorted(m for m in sys.modules if "." not in m)}))
+"""
+
+
+def _run_probe(modules: list[str], pycache_prefix: str) -> tuple[float, set[str]]:
+    """Import modules in a fresh interpreter; return (ms, loaded top-level modules)."""
+    env = {**os.environ, "PYTHONPYCACHEPREFIX": pycache_prefix}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE_SCRIPT, *modules],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    return result["ms"], set(result["loaded"])
+
+
+def _is_loaded(module: str, loaded: set[str]) -> bool:
+    """Whether a (possibly dotted) module was loaded, judged by its top-level package."""
+    return module.split(".")[0] in loaded
+
+
+def measure_startup(
+    probes: list[str] | None = None,
+    runs: int = 5,
+    budget_scale: float = 1.0,
+) -> dict[str, dict]:
+    """Measure cold and warm import time of entry points.
+
+    Args:
+        probes: Probe names (default: all of STARTUP_PROBES)
+        runs: Warm runs per probe (median reported)
+        budget_scale: Multiplier applied to every budget
+
+    Returns:
+        Mapping of probe name to cold_ms, warm_ms, budget_ms, the heavy and
+        forbidden modules it loaded, and ok (within budget, nothing forbidden)
+
+    Raises:
+        ValueError: If a probe name is unknown
+    """
+    names = probes or list(STARTUP_PROBES)
+    unknown = [n for n in names if n not in STARTUP_PROBES]
+    if unknown:
+        raise ValueError(f"Unknown startup probes: {unknown} (use {', '.join(STARTUP_PROBES)})")
+
+    report = {}
+    for name in names:
+        probe = STARTUP_PROBES[name]
+        with tempfile.TemporaryDirectory(prefix="pycache-") as prefix:
+            cold_ms, loaded = _run_probe(probe.modules, prefix)
+            warm = [_run_probe(probe.modules, prefix)[0] for _ in range(max(runs, 1))]
+
+        warm_ms = statistics.median(warm)
+        budget_ms = probe.budget_ms * budget_scale
+        forbidden = [m for m in probe.forbidden if _is_loaded(m, loaded)]
+        report[name] = {
+            "cold_ms": round(cold_ms, 1),
+            "warm_ms": round(warm_ms, 1),
+            "budget_ms": round(budget_ms, 1),
+            "heavy": [m for m in HEAVY_MODULES if _is_loaded(m, loaded)],
+            "forbidden": forbidden,
+            "ok": warm_ms <= budget_ms and not forbidden,
+        }
+    return report
@@ -158,6 +158,23 @@ class ProcessingState:
         return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
 
 
+@dataclass
+class PipelineProgress:
+    """Running counters of a pipeline run (reported to progress callbacks)."""
+
+    stage: str = "pending"  # scanning, chunking, deduplicating, embedding, loading, images, done
+    files_total: int = 0
+    files_processed: int = 0
+    chunks_created: int = 0
+    duplicates_removed: int = 0
+    chunks_embedded: int = 0
+    chunks_loaded: int = 0
+    images_total: int = 0
+    images_embedded: int = 0
+    images_loaded: int = 0
+    errors: int = 0
+
+
 @dataclass
 class ImageChunk:
     """Represents an image from a paper with VLM metadata.
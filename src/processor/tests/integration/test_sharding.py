@@ -0,0 +1,151 @@
+"""Integration tests for sharded processing and shard merging."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import lancedb
+import pytest
+
+from processor.core.sharding import find_shard_databases, parse_shard, shard_of
+from processor.database import merge
+from processor.database.merge import merge_shards
+
+
+def write_corpus(root: Path, count: int = 12) -> None:
+    """Markdown files in a couple of directories."""
+    for i in range(count):
+        directory = root / ("notes" if i % 2 else "guides")
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"doc{i}.md").write_text(
+            f"# Document {i}\n\nParagraph about subject {i} and nothing else.\n"
+        )
+
+
+def run_shards(corpus: Path, output: Path, count: int, cwd: Path) -> None:
+    """Run all workers of a sharded chunk-only process concurrently."""
+    workers = [
+        subprocess.Popen(
+            [
+                sys.executable, "-m", "processor.cli", "process", str(corpus),
+                "-o", str(output), "--shard", f"{i}/{count}", "--chunk-only",
+            ],
+            cwd=cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        for i in range(count)
+    ]
+    for worker in workers:
+        _, stderr = worker.communicate(timeout=300)
+        assert worker.returncode == 0, stderr.decode()
+
+
+def shard_rows(path: Path, table: str, id_prefix: str, sources: list[str]) -> None:
+    """Create a shard database with one row per source file."""
+    db = lancedb.connect(str(path))
+    db.create_table(
+        table,
+        [
+            {"id": f"{id_prefix}{s}", "content": f"text of {s}", "source_file": s,
+             "vector": [1.0, 0.0]}
+            for s in sources
+        ],
+    )
+
+
+class TestSharding:
+    """Test the shard spec and partition."""
+
+    def test_parse_shard(self) -> None:
+        """Test valid and invalid shard specs."""
+        assert parse_shard("2/4") == (2, 4)
+        for spec in ("4/4", "1", "a/b", "0/0"):
+            with pytest.raises(ValueError):
+                parse_shard(spec)
+
+    def test_partition_is_stable(self) -> None:
+        """Test every path lands in exactly one shard, the same each time."""
+        paths = [f"dir{i % 7}/file{i}.md" for i in range(200)]
+        owners = [shard_of(p, 4) for p in paths]
+
+        assert owners == [shard_of(p, 4) for p in paths]
+        assert set(owners) == {0, 1, 2, 3}
+
+
+class TestMergeShards:
+    """Test merging shard databases."""
+
+    async def test_workers_then_merge(self, tmp_path: Path) -> None:
+        """Test concurrent worker processes produce a merge equal to a single run."""
+        corpus = tmp_path / "corpus"
+        write_corpus(corpus)
+        run_shards(corpus, tmp_path / "sharded", 3, cwd=tmp_path)
+        run_shards(corpus, tmp_path / "single", 1, cwd=tmp_path)
+
+        shards = find_shard_databases(tmp_path / "sharded")
+        result = await merge_shards([tmp_path / "sharded"], tmp_path / "merged")
+
+        single = lancedb.connect(str(tmp_path / "single" / "shard-0-of-1"))
+        merged = lancedb.connect(str(tmp_path / "merged"))
+        expected = set(single.open_table("text_chunks").to_arrow().column("id").to_pylist())
+        ids = merged.open_table("text_chunks").to_arrow().column("id").to_pylist()
+        assert len(shards) == 3
+        assert len(ids) == len(set(ids)) == result.rows["text_chunks"]
+        assert set(ids) == expected
+        assert result.duplicates["text_chunks"] == 0
+        assert merged.open_table("text_chunks").search("subject", query_type="fts").to_list()
+
+    async def test_duplicate_ids_prefer_owner(self, tmp_path: Path) -> None:
+        """Test a duplicated id keeps the row of the shard owning its file."""
+        sources = [f"f{i}.md" for i in range(10)]
+        for i in range(2):
+            # Both shards hold every file (as after a change of shard count)
+            shard_rows(tmp_path / "out" / f"shard-{i}-of-2", "text_chunks", "", sources)
+        db = lancedb.connect(str(tmp_path / "out" / "shard-1-of-2"))
+        db.create_table("_metadata", [{"key": "shard", "value": "1/2"}])
+
+        result = await merge_shards([tmp_path / "out"], tmp_path / "merged")
+
+        rows = lancedb.connect(str(tmp_path / "merged")).open_table("text_chunks")
+        assert rows.count_rows() == 10
+        assert result.duplicates["text_chunks"] == 10
+
+    async def test_copied_in_batches(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test shards larger than one copy batch are merged whole, without duplicates."""
+        monkeypatch.setattr(merge, "MERGE_BATCH_ROWS", 3)
+        sources = [f"f{i}.md" for i in range(10)]
+        shard_rows(tmp_path / "out" / "shard-0-of-2", "text_chunks", "", sources)
+        shard_rows(tmp_path / "out" / "shard-1-of-2", "text_chunks", "", sources[5:])
+
+        result = await merge_shards([tmp_path / "out"], tmp_path / "merged")
+
+        rows = lancedb.connect(str(tmp_path / "merged")).open_table("text_chunks")
+        assert sorted(rows.to_arrow().column("id").to_pylist()) == sorted(sources)
+        assert result.duplicates["text_chunks"] == 5
+
+    async def test_index_metadata_not_carried(self, tmp_path: Path) -> None:
+        """Test per-shard index bookkeeping neither blocks nor leaks into the merge."""
+        for i, rows in enumerate(("300", "400")):
+            path = tmp_path / "out" / f"shard-{i}-of-2"
+            shard_rows(path, "text_chunks", f"s{i}", [f"f{i}.md"])
+            lancedb.connect(str(path)).create_table(
+                "_metadata",
+                [{"key": "shard", "value": f"{i}/2"}, {"key": "text_chunks_indexed_rows", "value": rows}],
+            )
+
+        await merge_shards([tmp_path / "out"], tmp_path / "merged")
+
+        metadata = lancedb.connect(str(tmp_path / "merged")).open_table("_metadata")
+        assert "text_chunks_indexed_rows" not in metadata.to_arrow().column("key").to_pylist()
+
+    async def test_missing_shard(self, tmp_path: Path) -> None:
+        """Test a missing shard fails the merge unless partial merges are allowed."""
+        shard_rows(tmp_path / "out" / "shard-0-of-2", "text_chunks", "a", ["x.md"])
+
+        with pytest.raises(ValueError, match="Missing shards: 1"):
+            await merge_shards([tmp_path / "out"], tmp_path / "merged")
+        result = await merge_shards([tmp_path / "out"], tmp_path / "merged", allow_partial=True)
+
+        assert result.missing_shards == [1]
+        assert result.rows == {"text_chunks": 1}
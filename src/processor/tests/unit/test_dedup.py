@@ -0,0 +1,94 @@
+"""Unit tests for near-duplicate chunk detection."""
+
+from pathlib import Path
+
+import lancedb
+
+from processor.chunkers.dedup import NearDuplicateDetector, lsh_params
+from processor.database.loader import LanceDBLoader
+from processor.types import Chunk, ContentType
+
+
+def page(version: str, extra: str = "") -> str:
+    """An API reference page that differs only by version."""
+    body = " ".join(f"The parameter p{i} controls option {i} of the client." for i in range(40))
+    return f"# Client API {version}\n\n{body}{extra}"
+
+
+def chunk(content: str, name: str, content_type: ContentType = ContentType.MARKDOWN) -> Chunk:
+    """Chunk of a file."""
+    return Chunk.create(content, name, content_type, start_line=1)
+
+
+class TestNearDuplicateDetector:
+    """Test clustering and representative selection."""
+
+    def test_versioned_pages_clustered(self) -> None:
+        """Test near-identical pages collapse to the first one, distinct ones stay."""
+        chunks = [
+            chunk(page("v1"), "v1/api.md"),
+            chunk("A guide to installing the package on Linux and macOS.", "install.md"),
+            chunk(page("v2"), "v2/api.md"),
+            chunk(page("v3", " Added in v3."), "v3/api.md"),
+        ]
+
+        result = NearDuplicateDetector(threshold=0.8).deduplicate(chunks)
+
+        assert [c.source_file for c in result.chunks] == ["v1/api.md", "install.md"]
+        assert result.removed == 2 and result.clusters == 1
+        assert {a.representative_id for a in result.aliases} == {chunks[0].id}
+        assert all(a.similarity >= 0.8 for a in result.aliases)
+
+    def test_code_and_text_kept_apart(self) -> None:
+        """Test identical content is not merged across code and text."""
+        source = "def add(a, b):\n    return a + b\n" * 5
+        chunks = [
+            chunk(source, "notes.md"),
+            chunk(source, "math.py", ContentType.CODE_PYTHON),
+            chunk(source, "copy.py", ContentType.CODE_PYTHON),
+        ]
+
+        result = NearDuplicateDetector().deduplicate(chunks)
+
+        assert [c.source_file for c in result.chunks] == ["notes.md", "math.py"]
+        assert result.aliases[0].similarity == 1.0
+
+    def test_lsh_params(self) -> None:
+        """Test the banding threshold lands near the requested similarity."""
+        bands, rows = lsh_params(0.9, 128)
+
+        assert bands * rows <= 128
+        assert abs((1 / bands) ** (1 / rows) - 0.9) < 0.02
+
+
+class TestAliasTable:
+    """Test aliases are recorded in the database."""
+
+    def test_load_aliases(self, tmp_path: Path) -> None:
+        """Test aliases are written with paths relative to the input root."""
+        chunks = [chunk(page(v), str(tmp_path / f"{v}.md")) for v in ("v1", "v2")]
+        result = NearDuplicateDetector().deduplicate(chunks)
+        loader = LanceDBLoader(uri=str(tmp_path / "db"), input_root=tmp_path)
+
+        assert loader.load_aliases(result.aliases) == 1
+
+        table = lancedb.connect(str(tmp_path / "db")).open_table("chunk_aliases")
+        [row] = table.to_arrow().to_pylist()
+        assert row["source_file"] == "v2.md"
+        assert row["representative_id"] == chunks[0].id
+
+    def test_reload_replaces_aliases(self, tmp_path: Path) -> None:
+        """Test reprocessed files replace their alias rows instead of piling up."""
+        chunks = [chunk(page(v), str(tmp_path / f"{v}.md")) for v in ("v1", "v2")]
+        result = NearDuplicateDetector().deduplicate(chunks)
+        loader = LanceDBLoader(uri=str(tmp_path / "db"), input_root=tmp_path)
+        files = [c.source_file for c in chunks]
+
+        db = lancedb.connect(str(tmp_path / "db"))
+
+        loader.load_aliases(result.aliases, files)
+        loader.load_aliases(result.aliases, files)
+        assert db.open_table("chunk_aliases").count_rows() == 1
+
+        loader.load_aliases([], files)  # v2.md no longer duplicates v1.md
+        assert db.open_table("chunk_aliases").count_rows() == 0
@@ -0,0 +1,94 @@
+"""Unit tests for incremental FTS index maintenance."""
+
+from pathlib import Path
+from typing import Any
+
+import lancedb
+import pytest
+
+from processor.database.fts import (
+    check_fts_index,
+    fts_status,
+    merge_fts_index,
+    update_fts_index,
+)
+from processor.database.loader import LanceDBLoader
+from processor.database.search import search_table
+
+
+def rows(start: int, count: int, word: str = "alpha") -> list[dict]:
+    """Text rows with distinct ids."""
+    return [
+        {"id": str(i), "content": f"{word} document number {i}", "vector": [1.0, 0.0]}
+        for i in range(start, start + count)
+    ]
+
+
+@pytest.fixture
+def table(tmp_path: Path) -> Any:
+    """Create a table with an FTS index on content."""
+    table = lancedb.connect(str(tmp_path / "lancedb")).create_table("text_chunks", rows(0, 20))
+    update_fts_index(table, "content")
+    return table
+
+
+class TestFtsMaintenance:
+    """Test create, incremental update, merge and the consistency check."""
+
+    def test_create_and_current(self, table: Any) -> None:
+        """Test a new index covers the table and repeat updates are no-ops."""
+        status = fts_status(table, "content")
+
+        assert status.index_name is not None
+        assert (status.indexed_rows, status.unindexed_rows, status.total_rows) == (20, 0, 20)
+        assert update_fts_index(table, "content") == "current"
+        assert check_fts_index(table, "content") is None
+
+    def test_fresh_rows_found_before_merge(self, table: Any) -> None:
+        """Test appended rows are searchable and consistent, then merged into the index."""
+        table.add(rows(20, 5, word="zebra"))
+
+        action = update_fts_index(table, "content")
+        hits = table.search("zebra", query_type="fts").limit(10).to_list()
+
+        assert action in ("appended", "deferred")
+        assert len(hits) == 5
+        assert check_fts_index(table, "content") is None
+
+        if action == "deferred":
+            assert merge_fts_index(table, "content", max_segments=8)
+        status = fts_status(table, "content")
+        assert (status.indexed_rows, status.unindexed_rows) == (25, 0)
+        assert not merge_fts_index(table, "content", max_segments=8)
+
+    def test_missing_index(self, tmp_path: Path) -> None:
+        """Test a table without an index fails the check."""
+        table = lancedb.connect(str(tmp_path / "db")).create_table("t", rows(0, 3))
+
+        status = check_fts_index(table, "content")
+
+        assert status is not None and status.index_name is None
+
+
+class TestLoaderFts:
+    """Test the loader keeps the FTS index in step with appends."""
+
+    async def test_incremental_loads(self, tmp_path: Path) -> None:
+        """Test hybrid search finds rows from every load without a rebuild."""
+        loader = LanceDBLoader(uri=str(tmp_path / "lancedb"))
+        db = loader.connect()
+
+        loader._write_records(db, "text_chunks", rows(0, 10))
+        await loader.create_indices()
+        loader._write_records(db, "text_chunks", rows(10, 3, word="zebra"))
+        await loader.create_indices()
+        await loader.wait_for_maintenance()
+
+        table = db.open_table("text_chunks")
+        _, hybrid_used = search_table(table, [1.0, 0.0], limit=3, query_text="zebra", hybrid=True)
+        hits = table.search("zebra", query_type="fts").limit(5).to_list()
+        status = fts_status(table, "content")
+        assert hybrid_used
+        assert {r["id"] for r in hits} == {"10", "11", "12"}
+        assert status.total_rows == 13 and status.unindexed_rows == 0
+        assert check_fts_index(table, "content") is None
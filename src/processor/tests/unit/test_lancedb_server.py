@@ -0,0 +1,332 @@
+"""Unit tests for the LanceDB REST server (docker/lancedb-server)."""
+
+import asyncio
+import base64
+import importlib.util
+import json
+import re
+import warnings
+from datetime import timedelta
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import httpx
+import lancedb
+import numpy as np
+import pyarrow as pa
+import pytest
+
+pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient  # noqa: E402
+
+SERVER_PATH = Path(__file__).parents[2] / "docker" / "lancedb-server" / "server.py"
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+
+
+def row(i: int) -> dict[str, Any]:
+    """Table row whose vector is nearest to queries with second component i."""
+    return {"id": f"r{i:02d}", "content": f"chunk {i}", "vector": [1.0, float(i), 0.0, 0.0]}
+
+
+class FakeOllama:
+    """Ollama /api/embed stand-in embedding a text as [1, len(text), 0, 0]."""
+
+    def __init__(self) -> None:
+        self.requests: list[list[str]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        texts = json.loads(request.content)["input"]
+        self.requests.append(texts)
+        return httpx.Response(
+            200, json={"embeddings": [[1.0, float(len(t)), 0.0, 0.0] for t in texts]}
+        )
+
+
+@pytest.fixture
+def ollama() -> FakeOllama:
+    """Record the embedding requests of the server."""
+    return FakeOllama()
+
+
+@pytest.fixture
+def server(tmp_path: Path, ollama: FakeOllama, monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    """Load the server against a database of 12 rows in 3 fragments."""
+    spec = importlib.util.spec_from_file_location("lancedb_server", SERVER_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    db = lancedb.connect(str(tmp_path / "db"))
+    table = db.create_table("text_chunks", [row(i) for i in range(4)])
+    table.add([row(i) for i in range(4, 8)])
+    table.add([row(i) for i in range(8, 12)])
+    db.create_table("_metadata", [{"key": "text_ollama_model", "value": "qwen3-embedding"}])
+
+    embedder = module.QueryEmbedder("http://ollama", batch_window_ms=50, max_batch=64)
+    embedder._client = httpx.AsyncClient(transport=httpx.MockTransport(ollama))
+    monkeypatch.setattr(module, "db", db)
+    monkeypatch.setattr(module, "embedder", embedder)
+    return module
+
+
+@pytest.fixture
+def client(server: ModuleType) -> TestClient:
+    """HTTP client for the server (without the warm-up lifespan)."""
+    return TestClient(server.app)
+
+
+class TestSearchOutput:
+    """Test projection and response encodings of vector search."""
+
+    def test_vectors_hidden_by_default(self, client: TestClient) -> None:
+        """Test results omit vector columns unless requested."""
+        response = client.post(
+            "/tables/text_chunks/search", json={"query_vector": [1, 3, 0, 0], "limit": 2}
+        )
+
+        results = response.json()["results"]
+        assert [r["id"] for r in results] == ["r03", "r02"]
+        assert "vector" not in results[0] and results[0]["content"] == "chunk 3"
+
+    def test_projection(self, client: TestClient) -> None:
+        """Test only the requested columns (plus the distance) are returned."""
+        response = client.post(
+            "/tables/text_chunks/search",
+            json={"query_vector": [1, 3, 0, 0], "limit": 1, "columns": ["id"]},
+        )
+        unknown = client.post(
+            "/tables/text_chunks/search",
+            json={"query_vector": [1, 3, 0, 0], "columns": ["nope"]},
+        )
+
+        assert set(response.json()["results"][0]) == {"id", "_distance"}
+        assert unknown.status_code == 400
+
+    def test_base64_vectors(self, client: TestClient) -> None:
+        """Test base64 float32 query vectors in and result vectors out."""
+        query = base64.b64encode(np.array([1, 5, 0, 0], dtype="<f4").tobytes()).decode()
+        response = client.post(
+            "/tables/text_chunks/search",
+            json={
+                "query_vector_b64": query,
+                "limit": 1,
+                "include_vectors": True,
+                "vector_encoding": "base64",
+            },
+        )
+
+        [result] = response.json()["results"]
+        vector = np.frombuffer(base64.b64decode(result["vector"]), dtype="<f4")
+        assert result["id"] == "r05"
+        assert vector.tolist() == [1.0, 5.0, 0.0, 0.0]
+
+    def test_arrow_format(self, client: TestClient) -> None:
+        """Test results can be returned as an Arrow IPC stream."""
+        response = client.post(
+            "/tables/text_chunks/search",
+            json={"query_vector": [1, 7, 0, 0], "limit": 3, "format": "arrow"},
+        )
+
+        result = pa.ipc.open_stream(response.content).read_all()
+        assert response.headers["content-type"] == ARROW_STREAM
+        assert result.column("id").to_pylist()[0] == "r07"
+        assert "vector" not in result.schema.names
+
+
+class TestBatchSearch:
+    """Test multi-query search with JSON and Arrow bodies."""
+
+    def test_json_body(self, client: TestClient) -> None:
+        """Test one result list per query vector."""
+        response = client.post(
+            "/tables/text_chunks/search/batch",
+            json={"query_vectors": [[1, 0, 0, 0], [1, 11, 0, 0]], "limit": 2},
+        )
+
+        body = response.json()
+        assert body["count"] == [2, 2]
+        assert [[r["id"] for r in group] for group in body["results"]] == [
+            ["r00", "r01"],
+            ["r11", "r10"],
+        ]
+
+    def test_arrow_body(self, client: TestClient) -> None:
+        """Test query vectors sent as an Arrow stream, options in the query string."""
+        vectors = [[1, 2, 0, 0], [1, 8, 0, 0], [1, 11, 0, 0]]
+        queries = pa.table({"query_vector": pa.array(vectors, pa.list_(pa.float32(), 4))})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, queries.schema) as writer:
+            writer.write_table(queries)
+
+        response = client.post(
+            "/tables/text_chunks/search/batch?limit=1&columns=id",
+            content=sink.getvalue().to_pybytes(),
+            headers={"content-type": ARROW_STREAM},
+        )
+
+        results = response.json()["results"]
+        assert [[r["id"] for r in group] for group in results] == [["r02"], ["r08"], ["r11"]]
+
+    def test_malformed_body(self, client: TestClient) -> None:
+        """Test unparseable JSON and Arrow bodies are client errors."""
+        bad_json = client.post(
+            "/tables/text_chunks/search/batch",
+            content=b"{not json",
+            headers={"content-type": "application/json"},
+        )
+        bad_arrow = client.post(
+            "/tables/text_chunks/search/batch",
+            content=b"not arrow",
+            headers={"content-type": ARROW_STREAM},
+        )
+
+        assert bad_json.status_code == 400
+        assert bad_arrow.status_code == 400
+
+
+class TestTextQuery:
+    """Test server-side query embedding."""
+
+    async def test_concurrent_queries_coalesced(
+        self, server: ModuleType, ollama: FakeOllama
+    ) -> None:
+        """Test concurrent text queries share one Ollama call."""
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.gather(
+                *(
+                    client.post(
+                        "/tables/text_chunks/search/text-query",
+                        json={"query": "x" * n, "limit": 1},
+                    )
+                    for n in (2, 6, 9)
+                )
+            )
+            stats = (await client.get("/embedder")).json()
+
+        assert [r.json()["results"][0]["id"] for r in responses] == ["r02", "r06", "r09"]
+        assert responses[0].json()["model"] == "qwen3-embedding"
+        assert [sorted(texts, key=len) for texts in ollama.requests] == [["xx", "x" * 6, "x" * 9]]
+        assert stats["batches"] == 1 and stats["texts"] == 3
+        assert stats["text_model"] == "qwen3-embedding"
+
+    def test_truncated_to_column(self, server: ModuleType, client: TestClient) -> None:
+        """Test query embeddings are cut to the width of the stored vectors."""
+        server.db.create_table(
+            "short", [{"id": f"s{i}", "vector": [1.0, float(i)]} for i in range(4)]
+        )
+
+        response = client.post(
+            "/tables/short/search/text-query", json={"query": "xx", "limit": 1}
+        )
+
+        assert response.json()["results"][0]["id"] == "s1"
+
+    def test_batch_endpoint(self, client: TestClient, ollama: FakeOllama) -> None:
+        """Test the batch endpoint embeds all queries in one call."""
+        response = client.post(
+            "/tables/text_chunks/search/text-query/batch",
+            json={"queries": ["abc", "abcd"], "limit": 1},
+        )
+
+        assert [g[0]["id"] for g in response.json()["results"]] == ["r03", "r04"]
+        assert len(ollama.requests) == 1
+
+
+class TestRows:
+    """Test cursor pagination of /rows."""
+
+    @staticmethod
+    def walk(client: TestClient, cursor: str | None = None, **params: Any) -> list[str]:
+        """Collect the ids of every page from a cursor to the end of the table."""
+        ids: list[str] = []
+        while True:
+            query = {**params, **({"cursor": cursor} if cursor else {})}
+            body = client.get("/tables/text_chunks/rows", params=query).json()
+            ids += [r["id"] for r in body["rows"]]
+            cursor = body["next_cursor"]
+            if cursor is None:
+                return ids
+
+    def test_walk_to_end(self, client: TestClient) -> None:
+        """Test pages cover every row once and the last page has no cursor."""
+        first = client.get("/tables/text_chunks/rows", params={"limit": 5}).json()
+
+        assert len(first["rows"]) == 5 and "vector" not in first["rows"][0]
+        assert "_rowid" in first["rows"][0]
+        ids = [r["id"] for r in first["rows"]] + self.walk(
+            client, first["next_cursor"], limit=5
+        )
+        assert sorted(ids) == [f"r{i:02d}" for i in range(12)]
+
+    def test_compaction_between_pages(self, server: ModuleType, client: TestClient) -> None:
+        """Test a walk spanning writes and compaction neither skips nor repeats rows."""
+        first = client.get("/tables/text_chunks/rows", params={"limit": 5}).json()
+        table = server.db.open_table("text_chunks")
+        table.add([row(12)])
+        table.optimize()
+
+        ids = [r["id"] for r in first["rows"]] + self.walk(
+            client, first["next_cursor"], limit=5
+        )
+
+        assert sorted(ids) == [f"r{i:02d}" for i in range(12)]
+        assert len(self.walk(client, limit=5)) == 13  # A new walk sees the new row
+
+    def test_expired_cursor(self, server: ModuleType, client: TestClient) -> None:
+        """Test a cursor whose table version was cleaned up is rejected."""
+        first = client.get("/tables/text_chunks/rows", params={"limit": 5}).json()
+        table = server.db.open_table("text_chunks")
+        table.add([row(12)])
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            table.optimize(cleanup_older_than=timedelta(0))
+
+        expired = client.get(
+            "/tables/text_chunks/rows", params={"cursor": first["next_cursor"]}
+        )
+        malformed = client.get("/tables/text_chunks/rows", params={"cursor": "123"})
+
+        assert expired.status_code == 410
+        assert malformed.status_code == 400
+
+    def test_ndjson_stream(self, client: TestClient) -> None:
+        """Test streamed pages carry the next cursor in a header."""
+        response = client.get(
+            "/tables/text_chunks/rows",
+            params={"limit": 10, "columns": "id", "format": "ndjson"},
+        )
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        last = client.get(
+            "/tables/text_chunks/rows",
+            params={"cursor": response.headers["X-Next-Cursor"], "format": "ndjson"},
+        )
+
+        assert len(rows) == 10 and set(rows[0]) == {"id", "_rowid"}
+        assert len(last.text.splitlines()) == 2
+        assert last.headers["X-Next-Cursor"] == ""
+
+    def test_arrow_stream(self, client: TestClient) -> None:
+        """Test a page streamed as Arrow record batches."""
+        response = client.get(
+            "/tables/text_chunks/rows", params={"limit": 5, "columns": "id", "format": "arrow"}
+        )
+        page = pa.ipc.open_stream(response.content).read_all()
+
+        assert page.column("id").to_pylist() == [f"r{i:02d}" for i in range(5)]
+        assert response.headers["X-Next-Cursor"].endswith(f":{1 << 32}")
+
+    def test_cursor_page_reads_only_its_rows(self, server: ModuleType) -> None:
+        """Test a page past the first fragment reads no column data before the cursor."""
+        table = server.db.open_table("text_chunks")
+        after = (1 << 32) + 1  # Second row of the second fragment
+        query = server.page_query(table, None, after, None).select(["id", "content"]).limit(2)
+
+        plan = query.analyze_plan()
+        [data] = [line for line in plan.splitlines() if "projection=[id, content]" in line]
+        [row_ids] = [line for line in plan.splitlines() if "projection=[]" in line]
+
+        assert query.to_arrow().column("id").to_pylist() == ["r06", "r07"]
+        assert re.search(r"fragments_scanned=1,.*rows_scanned=2,", data)
+        assert re.search(r"bytes_read=0,", row_ids)
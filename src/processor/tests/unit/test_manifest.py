@@ -0,0 +1,140 @@
+"""Unit tests for the corpus manifest."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from processor.core.detector import ContentDetector
+from processor.core.manifest import CorpusManifest, scan_corpus
+from processor.images.processor import ImageProcessor
+
+
+def should_process(path: Path) -> bool:
+    """Processability check used by the pipeline."""
+    return ContentDetector().is_processable(path)
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> Path:
+    """Create a small corpus with papers, code, images and skipped dirs."""
+    root = tmp_path / "input"
+    paper = root / "papers" / "paper1"
+    (paper / "img").mkdir(parents=True)
+    (paper / "paper1.md").write_text("# Paper\n\nText.")
+    (paper / "figures.json").write_text(
+        json.dumps([{"figure_id": 1, "caption": "Fig 1", "image_path": "./img/f1.png"}])
+    )
+    (paper / "img" / "f1.png").write_bytes(b"img")
+
+    code = root / "codebases" / "repo"
+    code.mkdir(parents=True)
+    (code / "main.py").write_text("print('hi')\n")
+    (code / "diagram.png").write_bytes(b"img")
+    (code / ".git").mkdir()
+    (code / ".git" / "config.py").write_text("x = 1\n")
+    (code / "node_modules" / "pkg").mkdir(parents=True)
+    (code / "node_modules" / "pkg" / "index.js").write_text("x\n")
+    return root
+
+
+class TestScanCorpus:
+    """Test the single-pass scan."""
+
+    def test_contents(self, corpus: Path) -> None:
+        """Test files, images and figure dirs are recorded; skip dirs are pruned."""
+        manifest = scan_corpus(corpus, should_process)
+
+        assert sorted(manifest.files) == ["codebases/repo/main.py", "papers/paper1/paper1.md"]
+        assert sorted(manifest.images) == [
+            "codebases/repo/diagram.png",
+            "papers/paper1/img/f1.png",
+        ]
+        assert manifest.figures_json_dirs == ["papers/paper1"]
+        assert manifest.file_paths()[0] == corpus / "codebases" / "repo" / "main.py"
+        assert manifest.images_in(corpus / "codebases" / "repo") == [
+            corpus / "codebases" / "repo" / "diagram.png"
+        ]
+
+    def test_single_file(self, corpus: Path) -> None:
+        """Test a single file input."""
+        path = corpus / "codebases" / "repo" / "main.py"
+
+        assert scan_corpus(path, should_process).file_paths() == [path]
+
+    def test_symlink_loop(self, tmp_path: Path) -> None:
+        """Test directory symlinks are not followed, so a loop is scanned once."""
+        root = tmp_path / "input"
+        (root / "a").mkdir(parents=True)
+        (root / "a" / "x.md").write_text("# X\n")
+        (root / "a" / "loop").symlink_to("..", target_is_directory=True)
+
+        manifest = scan_corpus(root, should_process)
+
+        assert sorted(manifest.files) == ["a/x.md"]
+
+    def test_has_image(self, corpus: Path) -> None:
+        """Test images the scan did not record fall back to the filesystem."""
+        repo = corpus / "codebases" / "repo"
+        (repo / "figure.svg").write_text("<svg/>")
+        (repo / "node_modules" / "pkg" / "logo.png").write_bytes(b"img")
+        manifest = scan_corpus(corpus, should_process)
+
+        assert manifest.has_image(repo / "diagram.png")
+        assert not manifest.has_image(repo / "missing.png")
+        assert manifest.has_image(repo / "figure.svg")
+        assert manifest.has_image(repo / "node_modules" / "pkg" / "logo.png")
+        assert not manifest.has_image(repo / "node_modules" / "pkg" / "gone.png")
+
+
+class TestManifestDiff:
+    """Test persistence and diffing."""
+
+    def test_round_trip_and_diff(self, corpus: Path, tmp_path: Path) -> None:
+        """Test a saved manifest diffs by size and mtime against a new scan."""
+        manifest_file = tmp_path / "manifest.json"
+        scan_corpus(corpus, should_process).save(manifest_file)
+        previous = CorpusManifest.load(manifest_file)
+
+        main = corpus / "codebases" / "repo" / "main.py"
+        main.write_text("print('changed')\n")
+        os.utime(main, ns=(0, 0))
+        (corpus / "papers" / "paper1" / "paper1.md").unlink()
+        (corpus / "codebases" / "repo" / "util.py").write_text("y = 2\n")
+
+        diff = scan_corpus(corpus, should_process).diff(previous)
+
+        assert diff.added == ["codebases/repo/util.py"]
+        assert diff.modified == ["codebases/repo/main.py"]
+        assert diff.removed == ["papers/paper1/paper1.md"]
+        assert diff.unchanged == []
+
+    def test_load_invalid(self, tmp_path: Path) -> None:
+        """Test missing or outdated manifests load as None."""
+        outdated = tmp_path / "old.json"
+        outdated.write_text(json.dumps({"version": 0, "root": "x"}))
+
+        assert CorpusManifest.load(tmp_path / "missing.json") is None
+        assert CorpusManifest.load(outdated) is None
+
+
+class TestImageDiscovery:
+    """Test image discovery from a manifest matches discovery from disk."""
+
+    def test_same_results(self, corpus: Path) -> None:
+        """Test paper dirs, standalone images and chunks agree."""
+        processor = ImageProcessor()
+        manifest = scan_corpus(corpus, should_process)
+
+        assert processor.find_paper_directories(
+            corpus, manifest=manifest
+        ) == processor.find_paper_directories(corpus)
+        assert processor.find_all_standalone_images(
+            corpus, manifest=manifest
+        ) == processor.find_all_standalone_images(corpus)
+
+        with_manifest, _ = processor.get_all_image_chunks(corpus, manifest=manifest)
+        from_disk, _ = processor.get_all_image_chunks(corpus)
+        assert [c.id for c in with_manifest] == [c.id for c in from_disk]
+        assert with_manifest
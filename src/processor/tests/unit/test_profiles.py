@@ -1,6 +1,11 @@
 """Unit tests for embedding profiles and backend selection."""
 
+import math
 
+import pytest
+
+from processor.embedders.base import BaseEmbedder
+from processor.embedders.matryoshka import MatryoshkaEmbedder, truncate_embedding
 from processor.embedders.profiles import (
     EmbedderBackend,
     EmbeddingProfiles,
@@ -297,3 +302,59 @@ class TestGetModelForProfile:
         )
         assert backend == EmbedderBackend.TRANSFORMERS
         assert profile.is_multimodal is True
+
+
+class FakeEmbedder(BaseEmbedder):
+    """Embedder stand-in returning fixed 4-dim vectors."""
+
+    model_name = "fake"
+    dimensions = 4
+
+    async def embed(self, text: str) -> list[float]:
+        return [3.0, 4.0, 1.0, 1.0]
+
+    async def embed_batch(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
+        return [await self.embed(t) for t in texts]
+
+    async def is_available(self) -> bool:
+        return True
+
+    async def close(self) -> None:
+        pass
+
+
+class TestMatryoshka:
+    """Test Matryoshka truncation."""
+
+    def test_storage_dims(self) -> None:
+        """Test truncation targets are validated against the profile."""
+        text = EmbeddingProfiles.get_text_profile("low")
+        clip = EmbeddingProfiles.get_multimodal_profile("low")
+
+        assert text.storage_dims(None) == 1024
+        assert text.storage_dims(256) == 256
+        assert text.storage_dims(4096) == 1024
+        with pytest.raises(ValueError, match="supports truncation"):
+            text.storage_dims(16)
+        with pytest.raises(ValueError, match="does not support"):
+            clip.storage_dims(256)
+
+    def test_truncate_embedding(self) -> None:
+        """Test vectors are cut to a prefix and re-normalised."""
+        vector = truncate_embedding([3.0, 4.0, 12.0], 2)
+
+        assert vector == pytest.approx([0.6, 0.8])
+        assert truncate_embedding([3.0, 4.0], None) == [3.0, 4.0]
+        assert truncate_embedding([3.0, 4.0], 8) == [3.0, 4.0]
+
+    async def test_embedder_wrapper(self) -> None:
+        """Test the wrapper truncates single and batch embeddings."""
+        embedder = MatryoshkaEmbedder(FakeEmbedder(), 2)
+
+        single = await embedder.embed("x")
+        batch = await embedder.embed_batch(["x", "y"])
+
+        assert embedder.dimensions == 2
+        assert single == pytest.approx([0.6, 0.8])
+        assert batch == [single, single]
+        assert math.isclose(sum(x * x for x in single), 1.0)
@@ -0,0 +1,381 @@
+"""Unit tests for shared LanceDB search helpers."""
+
+from pathlib import Path
+from typing import Any
+
+import lancedb
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from processor.database import search
+from processor.database.loader import LanceDBLoader
+from processor.database.quantization import quantize_binary, quantize_int8
+from processor.database.search import (
+    benchmark_quantization,
+    build_filter,
+    fetch_rows,
+    in_filter,
+    read_ann_params,
+    read_truncate_dims,
+    reciprocal_rank_fusion,
+    search_table,
+    search_table_adaptive,
+    search_table_async,
+    search_table_quantized,
+    tune_ann_params,
+    unreliable_top_k,
+)
+
+
+@pytest.fixture
+def table(tmp_path: Path) -> Any:
+    """Create a small LanceDB table without an FTS index."""
+    db = lancedb.connect(str(tmp_path / "lancedb"))
+    return db.create_table(
+        "text_chunks",
+        [
+            {"id": "a", "content": "alpha", "language": "cpp", "vector": [1.0, 0.0]},
+            {"id": "b", "content": "beta", "language": "python", "vector": [0.0, 1.0]},
+            {"id": "c", "content": "gamma", "language": "python", "vector": [0.7, 0.7]},
+        ],
+    )
+
+
+class TestSearchTable:
+    """Test vector/hybrid search helper."""
+
+    def test_vector_search(self, table: Any) -> None:
+        """Test nearest rows come first."""
+        results, hybrid_used = search_table(table, [1.0, 0.0], limit=2)
+
+        assert [r["id"] for r in results] == ["a", "c"]
+        assert hybrid_used is False
+
+    def test_hybrid_falls_back_without_fts(self, table: Any) -> None:
+        """Test hybrid search degrades to vector search without an FTS index."""
+        results, hybrid_used = search_table(
+            table, [0.0, 1.0], limit=1, query_text="beta", hybrid=True
+        )
+
+        assert results[0]["id"] == "b"
+        assert hybrid_used is False
+
+    def test_prefilter(self, table: Any) -> None:
+        """Test filtered searches only return matching rows."""
+        results, _ = search_table(
+            table, [1.0, 0.0], limit=3, filter=build_filter(language="python")
+        )
+
+        assert [r["id"] for r in results] == ["c", "b"]
+
+    async def test_async_matches_sync(self, table: Any) -> None:
+        """Test the threaded variant returns the same results."""
+        sync_results, _ = search_table(table, [0.7, 0.7], limit=3)
+        async_results, _ = await search_table_async(table, [0.7, 0.7], limit=3)
+
+        assert [r["id"] for r in async_results] == [r["id"] for r in sync_results]
+
+
+class TestBuildFilter:
+    """Test filter expression building."""
+
+    def test_no_constraints(self) -> None:
+        """Test None is returned when nothing is filtered."""
+        assert build_filter() is None
+
+    def test_combined(self) -> None:
+        """Test raw expressions and metadata constraints are ANDed."""
+        assert build_filter("start_line > 10", language="cpp", source_type="code_cpp") == (
+            "(start_line > 10) AND language = 'cpp' AND source_type = 'code_cpp'"
+        )
+
+    def test_source_prefix_escapes_wildcards(self) -> None:
+        """Test LIKE wildcards in a path prefix match literally."""
+        assert build_filter(source_prefix="src/a_b/") == "source_file LIKE 'src/a\\_b/%'"
+
+
+class TestFetchRows:
+    """Test batched lookups."""
+
+    def test_in_filter_escapes_quotes(self) -> None:
+        """Test single quotes in values are escaped."""
+        assert in_filter("source_file", ["a.py", "it's.md"]) == (
+            "source_file IN ('a.py', 'it''s.md')"
+        )
+
+    def test_fetch_without_vectors(self, table: Any) -> None:
+        """Test matching rows are returned without the vector column."""
+        rows = fetch_rows(table, "id", ["a", "c", "missing"])
+
+        assert sorted(r["id"] for r in rows) == ["a", "c"]
+        assert "vector" not in rows[0]
+
+    def test_fetch_empty(self, table: Any) -> None:
+        """Test no query is issued for an empty lookup."""
+        assert fetch_rows(table, "id", []) == []
+
+
+class TestReciprocalRankFusion:
+    """Test RRF fusion of ranked lists."""
+
+    def test_shared_documents_rank_first(self) -> None:
+        """Test documents found by several lists outrank single-list hits."""
+        fused = reciprocal_rank_fusion(
+            [
+                [{"id": "a"}, {"id": "b"}],
+                [{"id": "c"}, {"id": "b"}],
+            ]
+        )
+
+        assert fused[0]["id"] == "b"
+        assert fused[0]["_rrf_score"] == pytest.approx(2 / 62)
+        assert {r["id"] for r in fused} == {"a", "b", "c"}
+
+    def test_weights(self) -> None:
+        """Test list weights scale each contribution."""
+        fused = reciprocal_rank_fusion(
+            [[{"id": "a"}], [{"id": "b"}]],
+            weights=[1.0, 3.0],
+        )
+
+        assert [r["id"] for r in fused] == ["b", "a"]
+
+    def test_inputs_not_mutated(self) -> None:
+        """Test fused results are copies of the input rows."""
+        row = {"id": "a"}
+        reciprocal_rank_fusion([[row]])
+
+        assert "_rrf_score" not in row
+
+
+@pytest.fixture
+def indexed_table(tmp_path: Path) -> Any:
+    """Create a clustered table with a small IVF-PQ index."""
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(8, 8)) * 3
+    vectors = centers[rng.integers(0, 8, 512)] + rng.normal(size=(512, 8)) * 0.3
+    db = lancedb.connect(str(tmp_path / "lancedb"))
+    table = db.create_table(
+        "text_chunks",
+        [{"id": str(i), "vector": v.astype("float32")} for i, v in enumerate(vectors)],
+    )
+    table.create_index(num_partitions=8, num_sub_vectors=2)
+    return table
+
+
+class TestAnnParams:
+    """Test nprobes/refine_factor handling."""
+
+    def test_knobs_without_index(self, table: Any) -> None:
+        """Test ANN knobs are harmless on tables without a vector index."""
+        results, _ = search_table(table, [1.0, 0.0], limit=2, nprobes=4, refine_factor=5)
+
+        assert [r["id"] for r in results] == ["a", "c"]
+
+    def test_unreliable_top_k(self) -> None:
+        """Test flat or short top-k lists are flagged."""
+        spread = [{"_distance": 1.0}, {"_distance": 4.0}]
+        flat = [{"_distance": 4.0}, {"_distance": 4.1}]
+
+        assert unreliable_top_k(spread, limit=2) is False
+        assert unreliable_top_k(flat, limit=2) is True
+        assert unreliable_top_k(spread, limit=3) is True
+
+    def test_adaptive_escalates_to_ceiling(self, indexed_table: Any) -> None:
+        """Test nprobes doubles while the top-k stays unreliable."""
+        # Asking for more rows than the table holds keeps the top-k short
+        _, _, nprobes = search_table_adaptive(
+            indexed_table, [0.0] * 8, limit=600, nprobes=1, max_nprobes=8
+        )
+
+        assert nprobes == 8
+
+    def test_adaptive_respects_budget(self, indexed_table: Any) -> None:
+        """Test escalation stops when the latency budget would be exceeded."""
+        _, _, nprobes = search_table_adaptive(
+            indexed_table,
+            [0.0] * 8,
+            limit=600,
+            nprobes=1,
+            max_nprobes=8,
+            latency_budget_ms=1e-6,
+        )
+
+        assert nprobes == 1
+
+    def test_tune(self, indexed_table: Any) -> None:
+        """Test tuning returns parameters within the index bounds."""
+        params = tune_ann_params(indexed_table, num_partitions=8, sample_size=8)
+
+        assert 1 <= params["nprobes"] <= 8
+        assert params["refine_factor"] in (0, 10)
+        assert params["max_nprobes"] == 8
+
+    def test_read_params(self, tmp_path: Path) -> None:
+        """Test tuned values are read per table, ignoring malformed entries."""
+        db = lancedb.connect(str(tmp_path / "meta"))
+        db.create_table(
+            "_metadata",
+            [
+                {"key": "text_chunks_nprobes", "value": "16"},
+                {"key": "text_chunks_refine_factor", "value": "bad"},
+                {"key": "code_chunks_nprobes", "value": "32"},
+            ],
+        )
+
+        assert read_ann_params(db, "text_chunks") == {"nprobes": 16}
+        assert read_ann_params(db, "chunks") == {}
+
+    def test_update_metadata_in_place(self, tmp_path: Path) -> None:
+        """Test tuned values are upserted without recreating the table."""
+        loader = LanceDBLoader(uri=str(tmp_path / "meta"))
+        loader.update_metadata({"text_chunks_nprobes": "16", "created_at": "now"})
+        version = loader.connect().open_table("_metadata").version
+
+        loader.update_metadata({"text_chunks_nprobes": "32"})
+
+        assert loader.get_metadata() == {"text_chunks_nprobes": "32", "created_at": "now"}
+        assert loader.connect().open_table("_metadata").version == version + 1
+
+    def test_index_rebuilt_on_growth(self, tmp_path: Path) -> None:
+        """Test the vector index is rebuilt only once the table has grown enough."""
+        loader = LanceDBLoader(uri=str(tmp_path / "meta"))
+        assert loader._needs_vector_index("text_chunks", 255) is False
+        assert loader._needs_vector_index("text_chunks", 256) is True
+
+        loader.update_metadata({"text_chunks_indexed_rows": "1000"})
+
+        assert loader._needs_vector_index("text_chunks", 1400) is False
+        assert loader._needs_vector_index("text_chunks", 1500) is True
+
+
+@pytest.fixture
+def quantized_table(tmp_path: Path) -> Any:
+    """Load a random table with binary and int8 vector copies."""
+    rng = np.random.default_rng(1)
+    loader = LanceDBLoader(uri=str(tmp_path / "lancedb"), quantization=["binary", "int8"])
+    db = loader.connect()
+    records = [
+        {
+            "id": str(i),
+            "content": f"chunk {i}",
+            "language": "python" if i % 2 else "cpp",
+            "vector": v.tolist(),
+        }
+        for i, v in enumerate(rng.normal(size=(300, 32)))
+    ]
+    loader._write_records(db, "text_chunks", records[:200])
+    loader._write_records(db, "text_chunks", records[200:])  # Append keeps the columns
+    return db.open_table("text_chunks")
+
+
+class TestQuantizedSearch:
+    """Test binary/int8 first-stage search with exact rescoring."""
+
+    def test_codes(self) -> None:
+        """Test sign bits are packed and int8 codes use the full range."""
+        vectors = np.array([[0.5, -0.25, 0.0, 1.0, -1.0, 0.1, 0.2, -0.3, 0.4]])
+
+        assert quantize_binary(vectors).tolist() == [[0b10010110, 0b10000000]]
+        assert quantize_int8(vectors)[0, [0, 3, 4]].tolist() == [64, 127, -127]
+
+    def test_loader_columns(self, quantized_table: Any) -> None:
+        """Test the loader stores fixed-size binary and int8 columns."""
+        schema = quantized_table.schema
+
+        assert str(schema.field("vector_binary").type) == "fixed_size_list<item: uint8>[4]"
+        assert str(schema.field("vector_int8").type) == "fixed_size_list<item: int8>[32]"
+        assert quantized_table.count_rows() == 300
+
+    @pytest.mark.parametrize("mode", ["binary", "int8"])
+    def test_rescored_results(self, quantized_table: Any, mode: str) -> None:
+        """Test results carry exact distances and honour the filter."""
+        query = quantized_table.search().limit(1).to_list()[0]["vector"]
+        exact = (
+            quantized_table.search(query, vector_column_name="vector")
+            .where("language = 'cpp'", prefilter=True)
+            .limit(3)
+            .to_list()
+        )
+
+        results = search_table_quantized(
+            quantized_table, query, 3, quantization=mode, filter="language = 'cpp'"
+        )
+
+        assert results[0]["id"] == exact[0]["id"] == "0"
+        assert all(r["language"] == "cpp" for r in results)
+        assert results[1]["_distance"] == pytest.approx(
+            float(np.sum((np.array(results[1]["vector"]) - query) ** 2)), rel=1e-4
+        )
+
+    def test_int8_cache_bounded_by_bytes(
+        self, quantized_table: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test cached int8 codes are evicted once they exceed the byte budget."""
+        monkeypatch.setattr(search, "_int8_codes", search.OrderedDict())
+        query = [1.0] + [0.0] * 31
+
+        search_table_quantized(quantized_table, query, 3, quantization="int8")
+        [entry] = search._int8_codes.values()
+        monkeypatch.setattr(search, "_INT8_CACHE_BYTES", search._nbytes(entry) * 3 // 2)
+        quantized_table.add([{**quantized_table.search().limit(1).to_list()[0], "id": "new"}])
+        search_table_quantized(quantized_table, query, 3, quantization="int8")
+
+        # The new table version replaced the old one; both would not fit
+        [(_, version)] = search._int8_codes
+        assert version == quantized_table.version
+
+    def test_missing_column(self, table: Any) -> None:
+        """Test tables without codes are rejected with guidance."""
+        with pytest.raises(ValueError, match="database.quantization"):
+            search_table_quantized(table, [1.0, 0.0], 2, quantization="int8")
+
+    def test_benchmark(self, quantized_table: Any) -> None:
+        """Test exact search is the recall baseline for every mode."""
+        report = benchmark_quantization(quantized_table, sample_size=4, k=5, rescore_factor=50)
+
+        assert set(report) == {"exact", "binary", "int8"}
+        assert report["exact"]["recall"] == 1.0
+        assert report["int8"]["recall"] >= 0.9
+
+
+class TestReducedVectors:
+    """Test float16 storage and recorded Matryoshka truncation."""
+
+    def test_float16_tables(self, tmp_path: Path) -> None:
+        """Test new tables store float16 vectors that search like float32."""
+        rng = np.random.default_rng(2)
+        loader = LanceDBLoader(
+            uri=str(tmp_path / "lancedb"), quantization=["int8"], vector_dtype="float16"
+        )
+        db = loader.connect()
+        records = [
+            {"id": str(i), "content": f"chunk {i}", "vector": v.tolist()}
+            for i, v in enumerate(rng.normal(size=(20, 8)))
+        ]
+        loader._write_records(db, "text_chunks", records[:10])
+        loader._write_records(db, "text_chunks", records[10:])
+        loader._write_records(db, "code_chunks", records)  # Without quantized columns
+        text = db.open_table("text_chunks")
+
+        for name in ("text_chunks", "code_chunks"):
+            vector_type = db.open_table(name).schema.field("vector").type
+            assert str(vector_type) == "fixed_size_list<item: halffloat>[8]"
+        results, _ = search_table(text, records[13]["vector"], limit=1)
+        assert results[0]["id"] == "13"
+        assert search_table_quantized(text, records[13]["vector"], 1, "int8")[0]["id"] == "13"
+
+    def test_read_truncate_dims(self, tmp_path: Path) -> None:
+        """Test the truncation is the width of the searched vector column."""
+        db = lancedb.connect(str(tmp_path / "dims"))
+        fixed = db.create_table("fixed", [{"vector": [1.0, 0.0], "text_vector": [1.0, 0.0, 0.0]}])
+        ragged = db.create_table(
+            "ragged",
+            [{"vector": [1.0, 0.0]}],
+            schema=pa.schema([pa.field("vector", pa.list_(pa.float32()))]),
+        )
+
+        assert read_truncate_dims(fixed) == 2
+        assert read_truncate_dims(fixed, "text_vector") == 3
+        assert read_truncate_dims(ragged) is None
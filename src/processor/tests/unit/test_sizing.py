@@ -0,0 +1,123 @@
+"""Unit tests for token-accurate chunk sizing."""
+
+import sys
+from types import ModuleType
+
+import pytest
+
+from processor.chunkers import sizing
+from processor.chunkers.sizing import TEXT_BOUNDARIES, ChunkSizer, split_text
+from processor.config import ChunkingConfig
+from processor.embedders.tokenizer import TokenCounter, clear_token_counters, get_token_counter
+from processor.types import Chunk, ContentType
+
+
+@pytest.fixture(autouse=True)
+def estimated_counts(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Count with the estimate so tests never fetch tokenizers from the hub."""
+    monkeypatch.setattr(sizing, "get_token_counter", TokenCounter)
+
+
+def words(text: str) -> list[str]:
+    """Whitespace-separated words of a text."""
+    return text.split()
+
+
+class TestChunkSizer:
+    """Test token counts and splitting of oversize chunks."""
+
+    def test_small_chunk_kept(self) -> None:
+        """Test a chunk within budget is returned as-is with its token count."""
+        sizer = ChunkSizer(ChunkingConfig(markdown_chunk_size=100))
+        chunk = Chunk.create("# Title\n\nShort text.", "a.md", ContentType.MARKDOWN, start_line=1)
+
+        [sized] = sizer.size([chunk])
+
+        assert sized is chunk
+        assert sized.token_count and sized.token_count > 0
+
+    def test_long_section_split_at_sentences(self) -> None:
+        """Test a long section is split into fitting pieces without losing text."""
+        sizer = ChunkSizer(ChunkingConfig(markdown_chunk_size=40))
+        counter, budget = sizer.budget(ContentType.MARKDOWN)
+        paragraph = " ".join(f"Sentence number {i} talks about topic {i}." for i in range(30))
+        content = f"## Section\n\n{paragraph}\n\nClosing paragraph."
+        chunk = Chunk.create(
+            content, "doc.md", ContentType.MARKDOWN, start_line=10, section_path="Section"
+        )
+
+        pieces = sizer.size([chunk])
+
+        assert len(pieces) > 2
+        assert words(" ".join(p.content for p in pieces)) == words(content)
+        for piece in pieces:
+            assert piece.token_count == counter.count(piece.content) <= budget
+            assert piece.parent_id == chunk.id
+            assert piece.section_path == "Section"
+        assert all(p.content.endswith(".") for p in pieces)
+        assert pieces[0].start_line == 10
+        assert pieces[-1].start_line == 14  # "Closing paragraph." line
+        assert len({p.id for p in pieces}) == len(pieces)
+
+    def test_code_split_at_definitions(self) -> None:
+        """Test oversize code is split between top-level definitions."""
+        sizer = ChunkSizer(ChunkingConfig(code_chunk_size=60))
+        functions = [
+            f"def function_{i}(value):\n    total = value * {i}\n    return total + {i}\n"
+            for i in range(8)
+        ]
+        chunk = Chunk.create("\n".join(functions), "m.py", ContentType.CODE_PYTHON, start_line=1)
+
+        pieces = sizer.size([chunk])
+
+        assert len(pieces) > 1
+        assert all(p.content.startswith("def ") for p in pieces)
+        assert words(" ".join(p.content for p in pieces)) == words(chunk.content)
+        assert [p.start_line for p in pieces][0] == 1
+
+    def test_budget_capped_by_context_length(self) -> None:
+        """Test chunk sizes above the model's context use the context length."""
+        sizer = ChunkSizer(ChunkingConfig(paper_chunk_size=10**6))
+
+        _, budget = sizer.budget(ContentType.PAPER)
+
+        assert budget == 32768
+
+
+class TestSplitText:
+    """Test the splitting fallbacks."""
+
+    def test_unbroken_text_cut_into_windows(self) -> None:
+        """Test text without boundaries falls back to token windows, multibyte-safe."""
+        counter = TokenCounter("estimate")
+        text = "é" * 500 + "x" * 301
+
+        pieces = split_text(text, counter, 50, TEXT_BOUNDARIES)
+
+        assert "".join(pieces) == text
+        assert all(counter.count(p) <= 50 for p in pieces)
+
+
+class TestTokenCounter:
+    """Test loading model tokenizers."""
+
+    def test_offline_reads_cache_only(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test HF_HUB_OFFLINE loads from the cache only, falling back to the estimate."""
+        calls: list[dict] = []
+
+        def hf_hub_download(repo_id: str, filename: str, **kwargs: object) -> str:
+            calls.append({"repo_id": repo_id, "filename": filename, **kwargs})
+            raise FileNotFoundError("not cached")
+
+        hub = ModuleType("huggingface_hub")
+        hub.hf_hub_download = hf_hub_download  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "huggingface_hub", hub)
+        monkeypatch.setenv("HF_HUB_OFFLINE", "1")
+        clear_token_counters()
+
+        counter = get_token_counter("Qwen/Qwen3-Embedding-0.6B")
+        clear_token_counters()
+
+        assert not counter.exact
+        assert calls[0]["filename"] == "tokenizer.json"
+        assert calls[0]["local_files_only"] is True
@@ -0,0 +1,28 @@
+"""Unit tests for the startup import benchmark."""
+
+import pytest
+
+from processor.startup import measure_startup
+
+
+class TestStartupImports:
+    """Test entry points keep heavy subsystems lazy."""
+
+    def test_no_forbidden_imports(self) -> None:
+        """Test CLI, process and rag-mcp start without loading heavy modules."""
+        report = measure_startup(["cli", "process", "rag-mcp"], runs=1)
+
+        for name, result in report.items():
+            assert result["forbidden"] == [], name
+
+    @pytest.mark.slow
+    def test_within_budget(self) -> None:
+        """Test every entry point starts within a generous multiple of its budget."""
+        report = measure_startup(runs=3, budget_scale=3.0)
+
+        assert all(result["ok"] for result in report.values()), report
+
+    def test_unknown_probe(self) -> None:
+        """Test an unknown probe name is rejected."""
+        with pytest.raises(ValueError, match="Unknown startup probes"):
+            measure_startup(["nope"])